@@ -10,6 +10,7 @@ import numpy as np
 from random import random
 from fluids.numerics import normalize
 from thermo.eos_mix import *
+from thermo.eos_mix_methods import a_alpha_and_derivatives_quadratic_terms
 
 class BaseTimeSuite(object):
     def setup(self):
@@ -270,3 +271,809 @@ class EOSMIXTernaryTimeSuite(BaseTimeSuite):
     def time_eos_TV_numba_to(self, eos):
         return self.eos_instances_numba_PT[eos].to(V=.025, T=301.0, zs=self.zs2_np)
 
+
+
+class EOSMIX100PseudocomponentsTimeSuite(object):
+    '''Peng-Robinson and SRK with 100 pseudocomponents, with no `kijs`,
+    `kijs` only between three light components and the rest, and a dense
+    `kijs` matrix.
+    '''
+    params = (['zero', 'block', 'dense'], [PRMIX, SRKMIX])
+    param_names = ['kijs', 'eos']
+    N = 100
+
+    def setup(self, kij_type, eos):
+        N = self.N
+        Tcs = [300.0 + 4.0*i for i in range(N)]
+        Pcs = [4.5e6 - 3e4*i for i in range(N)]
+        omegas = [0.05 + 0.009*i for i in range(N)]
+        zs = normalize([1.0 + (i % 13) for i in range(N)])
+        kijs = [[0.0]*N for _ in range(N)]
+        if kij_type == 'block':
+            for i in range(3):
+                for j in range(N):
+                    if i != j:
+                        kijs[i][j] = kijs[j][i] = 0.02*(i + 1)
+        elif kij_type == 'dense':
+            kijs = [[0.0 if i == j else 1e-4*(i + j) for j in range(N)] for i in range(N)]
+        self.zs, self.zs_np = zs, np.array(zs)
+        self.eos = eos(T=500.0, P=3e6, Tcs=Tcs, Pcs=Pcs, omegas=omegas, zs=zs, kijs=kijs)
+        self.eos_np = eos(T=500.0, P=3e6, Tcs=np.array(Tcs), Pcs=np.array(Pcs),
+                          omegas=np.array(omegas), zs=self.zs_np, kijs=np.array(kijs))
+
+    def time_to_TP_zs_fast(self, kij_type, eos):
+        self.eos.to_TP_zs_fast(T=510.0, P=3e6, zs=self.zs)
+
+    def time_to_TP_zs_fast_numpy(self, kij_type, eos):
+        self.eos_np.to_TP_zs_fast(T=510.0, P=3e6, zs=self.zs_np)
+
+    def time_to_TP_zs_fast_no_derivatives(self, kij_type, eos):
+        self.eos.to_TP_zs_fast(T=510.0, P=3e6, zs=self.zs, full_alphas=False)
+
+    def time_a_alpha_and_derivatives_quadratic_terms(self, kij_type, eos):
+        e = self.eos
+        a_alpha_and_derivatives_quadratic_terms(e.a_alphas, e.a_alpha_roots, e.da_alpha_dTs,
+                                                e.d2a_alpha_dT2s, e.T, self.zs, e.kijs)
+
+
+def water_butanol_UNIFAC_flasher():
+    from thermo import (ChemicalConstantsPackage, PropertyCorrelationsPackage,
+                        VaporPressure, HeatCapacityGas, VolumeLiquid,
+                        GibbsExcessLiquid, IdealGas, FlashVLN)
+    from thermo.unifac import UNIFAC, LLEUFIP, LLEUFSG
+    T, P, zs = 298.15, 1e5, [0.8, 0.2]
+    constants = ChemicalConstantsPackage(Tcs=[647.14, 563.1], Pcs=[22048320.0, 4414000.0],
+                                         omegas=[0.344, 0.59], MWs=[18.01528, 74.1216],
+                                         CASs=['7732-18-5', '71-36-3'], names=['water', '1-butanol'])
+    VaporPressures = [VaporPressure(exp_poly_fit=(273.17, 647.086, [-2.8478502840358144e-21, 1.7295186670575222e-17, -4.034229148562168e-14, 5.0588958391215855e-11, -3.861625996277003e-08, 1.886271475957639e-05, -0.005928371869421494, 1.1494956887882308, -96.74302379151317])),
+                      VaporPressure(exp_poly_fit=(183.85, 563.1, [-1.369963570009104e-19, 4.601627231730426e-16, -6.744785620228449e-13, 5.655784279629317e-10, -2.986123576859473e-07, 0.00010278182137225028, -0.022995143239892296, 3.186560947413634, -210.12716900412732]))]
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [-3.787200194613107e-20, 1.7692887427654656e-16, -3.445247207129205e-13, 3.612771874320634e-10, -2.1953250181084466e-07, 7.707135849197655e-05, -0.014658388538054169, 1.5642629364740657, -7.614560475001724]))]
+    VolumeLiquids = [VolumeLiquid(poly_fit=(273.17, 637.096, [9.00307261049824e-24, -3.097008950027417e-20, 4.608271228765265e-17, -3.8726692841874345e-14, 2.0099220218891486e-11, -6.596204729785676e-09, 1.3368112879131157e-06, -0.00015298762503607717, 0.007589247005014652])),
+                     VolumeLiquid(poly_fit=(183.85, 534.945, [8.166268567991483e-24, -2.165718271472294e-20, 2.4731798748970672e-17, -1.5862095449169107e-14, 6.243674899388041e-12, -1.5433275010768489e-09, 2.3391927454003685e-07, -1.9817325459693386e-05, 0.0007969650387898196]))]
+    correlations = PropertyCorrelationsPackage(constants, VaporPressures=VaporPressures,
+                                               HeatCapacityGases=HeatCapacityGases,
+                                               VolumeLiquids=VolumeLiquids, skip_missing=True)
+    GE = UNIFAC.from_subgroups(T=T, xs=zs, chemgroups=[{17: 1}, {1: 1, 2: 3, 14: 1}],
+                               interaction_data=LLEUFIP, subgroups=LLEUFSG, version=0)
+    liq = GibbsExcessLiquid(VaporPressures=VaporPressures, HeatCapacityGases=HeatCapacityGases,
+                            VolumeLiquids=VolumeLiquids, GibbsExcessModel=GE, T=T, P=P, zs=zs)
+    gas = IdealGas(HeatCapacityGases=HeatCapacityGases, T=T, P=P, zs=zs)
+    return FlashVLN(constants, correlations, liquids=[liq, liq], gas=gas)
+
+
+class EquilibriumStreamVolumetricFlowTimeSuite(object):
+    '''Construction of water and 1-butanol streams specified by mole flows
+    and by volumetric flows at reference conditions; the reference molar
+    volumes are cached by the flasher, so after the first stream both cost
+    one flash.
+    '''
+    zs = [0.9, 0.1]
+
+    def setup(self):
+        self.flasher = water_butanol_UNIFAC_flasher()
+
+    def time_ns(self):
+        from thermo.stream import EquilibriumStream
+        EquilibriumStream(self.flasher, T=300.0, P=1e5, ns=[0.9, 0.1])
+
+    def time_Q_flashed_reference(self):
+        from thermo.stream import EquilibriumStream
+        EquilibriumStream(self.flasher, T=300.0, P=1e5, zs=self.zs, Q=1e-3,
+                          Q_TP=(288.15, 101325.0, ''))
+
+    def time_Q_liquid_reference(self):
+        from thermo.stream import EquilibriumStream
+        EquilibriumStream(self.flasher, T=300.0, P=1e5, zs=self.zs, Q=1e-3,
+                          Q_TP=(288.15, 101325.0, 'l'))
+
+
+class VirialGasFlashTimeSuite(object):
+    '''Low-pressure VL flashes of water and 1-butanol with a Pitzer-Curl
+    :obj:`thermo.phases.VirialGas`, with and without the temperature-keyed
+    cache of virial coefficient matrices.
+    '''
+    params = [0, 32]
+    param_names = ['cache_size']
+    zs = [0.8, 0.2]
+
+    def setup(self, cache_size):
+        import thermo.phases.virial_phase
+        from thermo import FlashVL
+        from thermo.phases import VirialGas, VirialCorrelationsPitzerCurl
+        base = water_butanol_UNIFAC_flasher()
+        constants = base.constants
+        model = VirialCorrelationsPitzerCurl(constants.Tcs, constants.Pcs, constants.omegas)
+        gas = VirialGas(model, HeatCapacityGases=base.correlations.HeatCapacityGases,
+                        T=298.15, P=1e5, zs=self.zs)
+        self.flasher = FlashVL(constants, base.correlations, liquid=base.liquids[0], gas=gas)
+        self.old_size = thermo.phases.virial_phase.VIRIAL_COEFFICIENTS_CACHE_SIZE
+        thermo.phases.virial_phase.VIRIAL_COEFFICIENTS_CACHE_SIZE = cache_size
+        thermo.phases.virial_phase._virial_coefficients_cache.clear()
+
+    def teardown(self, cache_size):
+        import thermo.phases.virial_phase
+        thermo.phases.virial_phase.VIRIAL_COEFFICIENTS_CACHE_SIZE = self.old_size
+        thermo.phases.virial_phase._virial_coefficients_cache.clear()
+
+    def time_TP_flash(self, cache_size):
+        self.flasher.flash(T=365.0, P=1e5, zs=self.zs)
+
+    def time_TP_flashes_same_T(self, cache_size):
+        flasher = self.flasher
+        for x in (0.6, 0.7, 0.8, 0.9):
+            flasher.flash(T=365.0, P=1e5, zs=[x, 1.0 - x])
+
+
+class IAPWS95TableTimeSuite(object):
+    '''P-H flashes of water with IAPWS-95 solved directly, and looked up in
+    a spline table (built, or loaded from the user data folder, in
+    `setup_cache`).
+    '''
+    params = ['IAPWS95', 'IAPWS95Table']
+    param_names = ['phases']
+    timeout = 600.0
+
+    def setup_cache(self):
+        from thermo.phases.iapws_phase import iapws95_spline_table
+        iapws95_spline_table()
+
+    def setup(self, phases):
+        from thermo import FlashPureVLS, iapws_constants, iapws_correlations
+        from thermo.phases import IAPWS95Gas, IAPWS95Liquid, IAPWS95TableGas, IAPWS95TableLiquid
+        from thermo.phases.iapws_phase import iapws95_spline_table
+        iapws95_spline_table()
+        if phases == 'IAPWS95':
+            gas, liquid = IAPWS95Gas(T=300.0, P=1e5), IAPWS95Liquid(T=300.0, P=1e5)
+        else:
+            gas, liquid = IAPWS95TableGas(T=300.0, P=1e5), IAPWS95TableLiquid(T=300.0, P=1e5)
+        self.flasher = FlashPureVLS(iapws_constants, iapws_correlations, gas, [liquid], [])
+        self.H_liquid = self.flasher.flash(T=400.0, P=3e6).H()
+        self.H_gas = self.flasher.flash(T=500.0, P=1e5).H()
+        self.H_two_phase = self.flasher.flash(P=1e5, VF=0.3).H()
+
+    def time_PH_liquid(self, phases):
+        self.flasher.flash(P=3e6, H=self.H_liquid)
+
+    def time_PH_gas(self, phases):
+        self.flasher.flash(P=1e5, H=self.H_gas)
+
+    def time_PH_two_phase(self, phases):
+        self.flasher.flash(P=1e5, H=self.H_two_phase)
+
+
+class FlashVLHSGUATimeSuite(object):
+    '''P-H and P-S flashes of methane-ethane-nitrogen with Peng-Robinson,
+    solved directly or by a 1D search over PT flashes, compared to the PT
+    flash of the same state.
+    '''
+    params = [True, False]
+    param_names = ['direct']
+
+    def setup(self, direct):
+        from thermo import (ChemicalConstantsPackage, PropertyCorrelationsPackage,
+                            HeatCapacityGas, CEOSGas, CEOSLiquid, PRMIX, FlashVL)
+        constants = ChemicalConstantsPackage(Tcs=[190.564, 305.32, 126.2], Pcs=[4599000.0, 4872000.0, 3394387.5],
+                                             omegas=[0.008, 0.098, 0.04], MWs=[16.04246, 30.06904, 28.0134],
+                                             CASs=['74-82-8', '74-84-0', '7727-37-9'])
+        HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7703235945157e-22, -2.496905487234175e-18, 3.141019468969792e-15, -8.82689677472949e-13, -1.3709202525543862e-09, 1.232839237674241e-06, -0.0002832018460361874, 0.022944239587055416, 32.67333514157593])),
+                             HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                             HeatCapacityGas(poly_fit=(50.0, 1000.0, [-6.496329615255804e-23, 2.1505678500404716e-19, -2.2204849352453665e-16, 1.7454757436517406e-14, 9.796496485269412e-11, -4.7671178529502835e-08, 8.384926355629239e-06, -0.0005955479316119903, 29.114778709934264]))]
+        correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+        kijs = [[0.0, -0.0059, 0.0289], [-0.0059, 0.0, 0.0533], [0.0289, 0.0533, 0.0]]
+        eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas, 'kijs': kijs}
+        gas = CEOSGas(PRMIX, eos_kwargs=eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        liquid = CEOSLiquid(PRMIX, eos_kwargs=eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        self.flasher = FlashVL(constants, correlations, liquid=liquid, gas=gas)
+        self.flasher.TPV_HSGUA_DIRECT = direct
+        self.zs = [0.965, 0.018, 0.017]
+        self.two_phase = self.flasher.flash(T=110.0, P=1e5, zs=self.zs)
+        self.gas = self.flasher.flash(T=200.0, P=1e6, zs=self.zs)
+
+    def time_PT_two_phase(self, direct):
+        self.flasher.flash(T=110.0, P=1e5, zs=self.zs)
+
+    def time_PH_two_phase(self, direct):
+        self.flasher.flash(H=self.two_phase.H(), P=1e5, zs=self.zs)
+
+    def time_PS_two_phase(self, direct):
+        self.flasher.flash(S=self.two_phase.S(), P=1e5, zs=self.zs)
+
+    def time_PT_gas(self, direct):
+        self.flasher.flash(T=200.0, P=1e6, zs=self.zs)
+
+    def time_PH_gas(self, direct):
+        self.flasher.flash(H=self.gas.H(), P=1e6, zs=self.zs)
+
+
+class FlashVLNDoubleCheckTimeSuite(object):
+    '''A grid of flashes of water-methane-octane with Peng-Robinson and
+    `DOUBLE_CHECK_2P`, searching all phase pairs at every point or only
+    where the cached phase split of a nearby point fails a tangent plane
+    distance check.
+    '''
+    params = [False, True]
+    param_names = ['reuse']
+
+    def setup(self, reuse):
+        from thermo import (ChemicalConstantsPackage, PropertyCorrelationsPackage,
+                            HeatCapacityGas, CEOSGas, CEOSLiquid, PRMIX, FlashVLN)
+        from fluids.numerics import linspace, logspace
+        Tcs, Pcs, omegas = [647.14, 190.564, 568.7], [22048320.0, 4599000.0, 2490000.0], [0.344, 0.008, 0.394]
+        kijs = [[0,0, 0],[0,0, 0.0496], [0,0.0496,0]]
+        HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759])),
+                             HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7703235945157e-22, -2.496905487234175e-18, 3.141019468969792e-15, -8.82689677472949e-13, -1.3709202525543862e-09, 1.232839237674241e-06, -0.0002832018460361874, 0.022944239587055416, 32.67333514157593])),
+                             HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.069661592422583e-22, -1.2992882995593864e-18, 8.808066659263286e-15, -2.1690080247294972e-11, 2.8519221306107026e-08, -2.187775092823544e-05, 0.009432620102532702, -1.5719488702446165, 217.60587499269303]))]
+        constants = ChemicalConstantsPackage(Tcs=Tcs, Pcs=Pcs, omegas=omegas, MWs=[18.01528, 16.04246, 114.22852],
+                                             CASs=['7732-18-5', '74-82-8', '111-65-9'])
+        properties = PropertyCorrelationsPackage(constants=constants, HeatCapacityGases=HeatCapacityGases)
+        eos_kwargs = dict(Tcs=Tcs, Pcs=Pcs, omegas=omegas, kijs=kijs)
+        gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        self.flasher = FlashVLN(constants, properties, liquids=[liq, liq], gas=gas)
+        self.flasher.DOUBLE_CHECK_2P = True
+        self.flasher.DOUBLE_CHECK_2P_REUSE = reuse
+        self.zs = [1.0/3.0]*3
+        self.Ts = linspace(280.0, 560.0, 15)
+        self.Ps = logspace(4.5, 7.0, 15)
+
+    def time_grid(self, reuse):
+        flasher, zs = self.flasher, self.zs
+        flasher.phase_split_cache.clear()
+        for P in self.Ps:
+            for T in self.Ts:
+                flasher.flash(T=T, P=P, zs=zs)
+
+
+class FlashVLSaturationCurveTimeSuite(object):
+    '''Bubble and dew point curves of methane-ethane-nitrogen with
+    Peng-Robinson over 50 pressures, as one curve or as one flash per point.
+    '''
+    params = [0.0, 1.0]
+    param_names = ['VF']
+
+    def setup(self, VF):
+        from thermo import (ChemicalConstantsPackage, PropertyCorrelationsPackage,
+                            HeatCapacityGas, CEOSGas, CEOSLiquid, PRMIX, FlashVL)
+        from fluids.numerics import logspace
+        constants = ChemicalConstantsPackage(Tcs=[190.564, 305.32, 126.2], Pcs=[4599000.0, 4872000.0, 3394387.5],
+                                             omegas=[0.008, 0.098, 0.04], MWs=[16.04246, 30.06904, 28.0134],
+                                             CASs=['74-82-8', '74-84-0', '7727-37-9'])
+        HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7703235945157e-22, -2.496905487234175e-18, 3.141019468969792e-15, -8.82689677472949e-13, -1.3709202525543862e-09, 1.232839237674241e-06, -0.0002832018460361874, 0.022944239587055416, 32.67333514157593])),
+                             HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                             HeatCapacityGas(poly_fit=(50.0, 1000.0, [-6.496329615255804e-23, 2.1505678500404716e-19, -2.2204849352453665e-16, 1.7454757436517406e-14, 9.796496485269412e-11, -4.7671178529502835e-08, 8.384926355629239e-06, -0.0005955479316119903, 29.114778709934264]))]
+        correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+        kijs = [[0.0, -0.0059, 0.0289], [-0.0059, 0.0, 0.0533], [0.0289, 0.0533, 0.0]]
+        eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas, 'kijs': kijs}
+        gas = CEOSGas(PRMIX, eos_kwargs=eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        liquid = CEOSLiquid(PRMIX, eos_kwargs=eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+        self.flasher = FlashVL(constants, correlations, liquid=liquid, gas=gas)
+        self.zs = [0.965, 0.018, 0.017]
+        self.Ps = logspace(5, 6.5, 50)
+
+    def time_saturation_curve(self, VF):
+        self.flasher.saturation_curve(self.zs, VF, Ps=self.Ps)
+
+    def time_point_flashes(self, VF):
+        for P in self.Ps:
+            self.flasher.flash(P=P, VF=VF, zs=self.zs)
+
+
+class HelmholtzEOSPropertiesTimeSuite(object):
+    '''Density solve plus Cp, speed of sound and Joule-Thomson coefficient of
+    IAPWS-95 water and Lemmon air, with the residual Helmholtz derivatives
+    evaluated in one fused pass or by one function per derivative.
+    '''
+    params = [['IAPWS95Gas', 'IAPWS95Liquid', 'DryAirLemmon'], [True, False]]
+    param_names = ['phase', 'fused']
+
+    def setup(self, phase, fused):
+        from thermo.phases import IAPWS95Gas, IAPWS95Liquid, DryAirLemmon
+        if phase == 'IAPWS95Gas':
+            cls, self.T, self.P = IAPWS95Gas, 500.0, 1e5
+        elif phase == 'IAPWS95Liquid':
+            cls, self.T, self.P = IAPWS95Liquid, 300.0, 1e5
+        else:
+            cls, self.T, self.P = DryAirLemmon, 300.0, 1e5
+        if not fused:
+            cls = type('Unfused' + cls.__name__, (cls,), {'_Ar_derivatives_func': None})
+        self.cls = cls
+
+    def time_TP(self, phase, fused):
+        self.cls(T=self.T, P=self.P, zs=[1])
+
+    def time_Cp(self, phase, fused):
+        self.cls(T=self.T, P=self.P, zs=[1]).Cp()
+
+    def time_speed_of_sound(self, phase, fused):
+        self.cls(T=self.T, P=self.P, zs=[1]).speed_of_sound()
+
+    def time_Joule_Thomson(self, phase, fused):
+        self.cls(T=self.T, P=self.P, zs=[1]).Joule_Thomson()
+
+    def time_Cp_w_JT(self, phase, fused):
+        new = self.cls(T=self.T, P=self.P, zs=[1])
+        new.Cp()
+        new.speed_of_sound()
+        new.Joule_Thomson()
+
+
+class HumidAirPsychrometricsTimeSuite(object):
+    '''Psychrometric properties of 100000 random humid air states from the
+    batched calculator, and the enthalpy of the first 1000 of them from one
+    `HumidAirRP1485` object per state.
+    '''
+    timeout = 600.0
+
+    def setup(self):
+        from thermo.phases import humid_air_psychrometrics
+        self.psy = psy = humid_air_psychrometrics()
+        rng = np.random.RandomState(0)
+        N = 100000
+        self.Ts = rng.uniform(280.0, 320.0, N)
+        self.Ps = rng.uniform(9e4, 1.1e5, N)
+        self.psi_ws = rng.uniform(0.1, 0.9, N)*psy.saturation(self.Ts, self.Ps)[0]
+
+    def time_H(self):
+        self.psy.H(self.Ts, self.Ps, self.psi_ws)
+
+    def time_H_HumidAirRP1485(self):
+        from thermo.phases import HumidAirRP1485
+        for T, P, psi_w in zip(self.Ts[:1000].tolist(), self.Ps[:1000].tolist(), self.psi_ws[:1000].tolist()):
+            HumidAirRP1485(T=T, P=P, zs=[1.0 - psi_w, psi_w]).H()
+
+    def time_saturation(self):
+        self.psy.saturation(self.Ts, self.Ps)
+
+    def time_dew_point(self):
+        self.psy.dew_point(self.Ps, self.psi_ws)
+
+    def time_wet_bulb(self):
+        self.psy.wet_bulb(self.Ts, self.Ps, self.psi_ws)
+
+
+def heater_train_flowsheet(flasher, heaters=48):
+    '''A mixer, a train of `heaters` heaters with known duties except the last
+    one, and a splitter returning a recycle of known flow to the mixer; the
+    product temperature is specified.
+    '''
+    from thermo.stream import StreamArgs, EnergyStream
+    feed = StreamArgs(pkg=flasher, T=300.0, P=1e5, ns=[1.0, 2.0])
+    recycle = StreamArgs(pkg=flasher, T=400.0, P=1e5, ns=[0.25, 0.75])
+    product = StreamArgs(pkg=flasher, T=400.0, P=1e5)
+    mixed = StreamArgs(pkg=flasher, P=1e5)
+    units = [([feed, recycle], [mixed])]
+    inlet = mixed
+    for i in range(heaters):
+        outlet = StreamArgs(pkg=flasher, P=1e5)
+        duty = EnergyStream(Q=None if i == heaters - 1 else 50.0)
+        units.append(([inlet, duty], [outlet]))
+        inlet = outlet
+    units.append(([inlet], [product, recycle]))
+    return units
+
+
+class FlowsheetBalanceTimeSuite(object):
+    '''Mole and energy balances of a 50 unit flowsheet with a recycle, solved
+    as one sparse system by :obj:`thermo.stream.flowsheet_balance` and unit by
+    unit by repeated :obj:`thermo.stream.mole_balance` and
+    :obj:`thermo.stream.energy_balance` calls.
+    '''
+    def setup(self):
+        from thermo import (ChemicalConstantsPackage, PropertyCorrelationsPackage,
+                            HeatCapacityGas, IdealGas, FlashVLN)
+        constants = ChemicalConstantsPackage(Tcs=[508.1, 536.2], Pcs=[4700000.0, 5330000.0],
+                                             omegas=[0.309, 0.216], MWs=[58.07914, 119.37764],
+                                             CASs=['67-64-1', '67-66-3'])
+        HeatCapacityGases = [HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.3320002425347943e-21, 6.4063345232664645e-18, -1.251025808150141e-14, 1.2265314167534311e-11, -5.535306305509636e-09, -4.32538332013644e-08, 0.0010438724775716248, -0.19650919978971002, 63.84239495676709])),
+                             HeatCapacityGas(poly_fit=(200.0, 1000.0, [1.5389278550737367e-21, -8.289631533963465e-18, 1.9149760160518977e-14, -2.470836671137373e-11, 1.9355882067011222e-08, -9.265600540761629e-06, 0.0024825718663005762, -0.21617464276832307, 48.149539665907696]))]
+        correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases,
+                                                   skip_missing=True)
+        gas = IdealGas(HeatCapacityGases=HeatCapacityGases, T=300.0, P=1e5, zs=[0.5, 0.5])
+        self.flasher = FlashVLN(constants, correlations, liquids=[], gas=gas)
+
+    def time_mole_balances(self):
+        from thermo.stream import flowsheet_balance
+        flowsheet_balance(heater_train_flowsheet(self.flasher), compounds=2, energy=False)
+
+    def mole_balances_unit_by_unit(self, units):
+        from thermo.stream import mole_balance
+        progress = True
+        while progress:
+            progress = False
+            for inlets, outlets in units:
+                inlets = [f for f in inlets if hasattr(f, 'specifications')]
+                progress = mole_balance(inlets, outlets, compounds=2) or progress
+
+    def time_mole_balances_unit_by_unit(self):
+        self.mole_balances_unit_by_unit(heater_train_flowsheet(self.flasher))
+
+    def time_mole_balances_unit_by_unit_reversed(self):
+        # Units listed downstream first need one pass per unit
+        self.mole_balances_unit_by_unit(heater_train_flowsheet(self.flasher)[::-1])
+
+    def time_mole_energy_balances_flash(self):
+        from thermo.stream import flowsheet_balance
+        flowsheet_balance(heater_train_flowsheet(self.flasher), compounds=2, flash=True)
+
+
+class PhaseIdentificationTimeSuite(object):
+    '''Identification and sorting of the phases of a butanol-water-ethanol
+    flash result with SRK; `identify_sort_phases` uses a cached
+    `PhaseIdentificationPlan`, while the reference path identifies, sorts, and
+    then looks up the phase fractions of each phase.
+    '''
+    params = (['PIP', 'Wilson'], [2, 3])
+    param_names = ['VL_ID', 'phase_count']
+
+    def setup(self, VL_ID, phase_count):
+        from thermo import (ChemicalConstantsPackage, PropertyCorrelationsPackage,
+                            HeatCapacityGas, CEOSGas, CEOSLiquid, SRKMIX, BulkSettings)
+        self.constants = constants = ChemicalConstantsPackage(Tcs=[563.0, 647.14, 514.0], Vcs=[0.000274, 5.6e-05, 0.000168], Pcs=[4414000.0, 22048320.0, 6137000.0],
+                                                              omegas=[0.59, 0.344, 0.635], MWs=[74.1216, 18.01528, 46.06844], CASs=['71-36-3', '7732-18-5', '64-17-5'])
+        HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [-3.787200194613107e-20, 1.7692887427654656e-16, -3.445247207129205e-13, 3.612771874320634e-10, -2.1953250181084466e-07, 7.707135849197655e-05, -0.014658388538054169, 1.5642629364740657, -7.614560475001724])),
+                             HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759])),
+                             HeatCapacityGas(poly_fit=(50.0, 1000.0, [-1.162767978165682e-20, 5.4975285700787494e-17, -1.0861242757337942e-13, 1.1582703354362728e-10, -7.160627710867427e-08, 2.5392014654765875e-05, -0.004732593693568646, 0.5072291035198603, 20.037826650765965]))]
+        self.correlations = PropertyCorrelationsPackage(constants=constants, skip_missing=True, HeatCapacityGases=HeatCapacityGases)
+        eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+        T, P = 361.0, 1e5
+        gas = CEOSGas(SRKMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases, T=T, P=P, zs=[0.2384009970908655, 0.5786839935180925, 0.1829150093910419])
+        liq = CEOSLiquid(SRKMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases, T=T, P=P, zs=[0.6793120076703771, 0.19699746328631124, 0.12369052904331178])
+        if phase_count == 2:
+            self.phases, self.betas = [liq, gas], [0.4, 0.6]
+        else:
+            liq0 = liq.to(T=T, P=P, zs=[7.619975052238032e-05, 0.9989622883894993, 0.0009615118599781474])
+            self.phases, self.betas = [liq, liq0, gas], [0.35814538138772367, 0.6139152961492583, 0.027939322463018015]
+        self.settings = BulkSettings(VL_ID=VL_ID)
+
+    def time_identify_sort_phases(self, VL_ID, phase_count):
+        from thermo.phase_identification import identify_sort_phases
+        for _ in range(100):
+            identify_sort_phases(self.phases, self.betas, self.constants, self.correlations,
+                                 settings=self.settings, skip_solids=True)
+
+    def time_identity_then_sort_reference(self, VL_ID, phase_count):
+        from thermo.phase_identification import identity_phase_states, sort_phases
+        phases, betas, settings = self.phases, self.betas, self.settings
+        for _ in range(100):
+            gas, liquids, solids = identity_phase_states(phases, self.constants, self.correlations,
+                                                         VL_method=VL_ID, skip_solids=True)
+            liquids, solids = sort_phases(liquids, solids, self.constants, settings)
+            ordered = ([gas] if gas is not None else []) + liquids
+            [betas[[i for i, p in enumerate(phases) if p is o][0]] for o in ordered]
+
+
+class FlashPureVLSSaturationTableTimeSuite(object):
+    '''Pure-component saturation and P-H flashes with and without the
+    saturation tables of FlashPureVLS, for a liquid and gas described by
+    different equations of state.
+    '''
+    params = [False, True]
+    param_names = ['VF_TABLES']
+
+    def setup(self, VF_TABLES):
+        from thermo import (ChemicalConstantsPackage, PropertyCorrelationsPackage,
+                            HeatCapacityGas, VaporPressure, CEOSGas, CEOSLiquid, PRMIX, SRKMIX, FlashPureVLS)
+        constants = ChemicalConstantsPackage(Tcs=[611.7], Pcs=[2110000.0], omegas=[0.49],
+                                             MWs=[142.28168], CASs=['124-18-5'])
+        HeatCapacityGases = [HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.702672546011891e-21, 6.6751002084997075e-18, -7.624102919104147e-15, -4.071140876082743e-12, 1.863822577724324e-08, -1.9741705032236747e-05, 0.009781408958916831, -1.6762677829939379, 252.8975930305735]))]
+        VaporPressures = [VaporPressure(exp_poly_fit=(243.51, 617.69, [-1.9653193622863184e-20, 8.32071200890499e-17, -1.5159284607404818e-13, 1.5658305222329732e-10, -1.0129531274368712e-07, 4.2609908802380584e-05, -0.01163326014833186, 1.962044867057741, -153.15601192906817]))]
+        correlations = PropertyCorrelationsPackage(constants=constants, skip_missing=True, HeatCapacityGases=HeatCapacityGases,
+                                                   VaporPressures=VaporPressures)
+        eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+        liquid = CEOSLiquid(PRMIX, HeatCapacityGases=HeatCapacityGases, eos_kwargs=eos_kwargs)
+        gas = CEOSGas(SRKMIX, HeatCapacityGases=HeatCapacityGases, eos_kwargs=eos_kwargs)
+        self.flasher = flasher = FlashPureVLS(constants, correlations, gas=gas, liquids=[liquid], solids=[])
+        self.P = 2e5
+        res = flasher.flash(P=self.P, VF=0.3)
+        self.T, self.H = res.T, res.H()
+        flasher.VF_TABLES = VF_TABLES
+        flasher.VF_TABLES_CACHE_DIR = ''
+        if VF_TABLES:
+            flasher.VF_table()
+
+    def time_flash_PVF(self, VF_TABLES):
+        self.flasher.flash(P=self.P, VF=0.3)
+
+    def time_flash_TVF(self, VF_TABLES):
+        self.flasher.flash(T=self.T, VF=0.3)
+
+    def time_flash_PH(self, VF_TABLES):
+        self.flasher.flash(P=self.P, H=self.H)
+
+
+class GibbsExcessLiquidManyTimeSuite(object):
+    '''Vapor pressures, Poynting factors and saturation fugacity
+    coefficients of a 10-component GibbsExcessLiquid over a 1000-point
+    temperature sweep, batched against one phase per temperature.
+    '''
+    def setup(self):
+        from thermo import VaporPressure, VolumeLiquid, GibbsExcessLiquid, PR
+        Tcs = [647.14, 190.56400000000002, 305.32, 611.7, 405.6, 126.2, 154.58, 512.5, 768.0, 33.2]
+        Pcs = [22048320.0, 4599000.0, 4872000.0, 2110000.0, 11277472.5, 3394387.5, 5042945.25, 8084000.0, 1070000.0, 1296960.0]
+        omegas = [0.344, 0.008, 0.098, 0.49, 0.25, 0.04, 0.021, 0.559, 0.8805, -0.22]
+        VaporPressures = [VaporPressure(exp_poly_fit=(273.17, 647.086, [-2.8478502840358144e-21, 1.7295186670575222e-17, -4.034229148562168e-14, 5.0588958391215855e-11, -3.861625996277003e-08, 1.886271475957639e-05, -0.005928371869421494, 1.1494956887882308, -96.74302379151317])),
+                          VaporPressure(exp_poly_fit=(90.8, 190.554, [1.2367137894255505e-16, -1.1665115522755316e-13, 4.4703690477414014e-11, -8.405199647262538e-09, 5.966277509881474e-07, 5.895879890001534e-05, -0.016577129223752325, 1.502408290283573, -42.86926854012409])),
+                          VaporPressure(exp_poly_fit=(90.4, 305.312, [-1.1908381885079786e-17, 2.1355746620587145e-14, -1.66363909858873e-11, 7.380706042464946e-09, -2.052789573477409e-06, 0.00037073086909253047, -0.04336716238170919, 3.1418840094903784, -102.75040650505277])),
+                          VaporPressure(exp_poly_fit=(243.51, 617.69, [-1.9653193622863184e-20, 8.32071200890499e-17, -1.5159284607404818e-13, 1.5658305222329732e-10, -1.0129531274368712e-07, 4.2609908802380584e-05, -0.01163326014833186, 1.962044867057741, -153.15601192906817])),
+                          VaporPressure(exp_poly_fit=(195.505, 405.39, [1.8775319752114198e-19, -3.2834459725160406e-16, 1.9723813042226462e-13, -1.3646182471796847e-11, -4.348131713052942e-08, 2.592796525478491e-05, -0.007322263143033041, 1.1431876410642319, -69.06950797691312])),
+                          VaporPressure(exp_poly_fit=(63.2, 126.18199999999999, [5.490876411024536e-15, -3.709517805130509e-12, 1.0593254238679989e-09, -1.6344291780087318e-07, 1.4129990091975526e-05, -0.0005776268289835264, -0.004489180523814208, 1.511854256824242, -36.95425216567675])),
+                          VaporPressure(exp_poly_fit=(54.370999999999995, 154.57100000000003, [-9.865296960381724e-16, 9.716055729011619e-13, -4.163287834047883e-10, 1.0193358930366495e-07, -1.57202974507404e-05, 0.0015832482627752501, -0.10389607830776562, 4.24779829961549, -74.89465804494587])),
+                          VaporPressure(exp_poly_fit=(175.7, 512.49, [-1.446088049406911e-19, 4.565038519454878e-16, -6.278051259204248e-13, 4.935674274379539e-10, -2.443464113936029e-07, 7.893819658700523e-05, -0.016615779444332356, 2.1842496316772264, -134.19766175812708])),
+                          VaporPressure(exp_poly_fit=(309.58, 768.0, [-7.623520807550015e-21, 3.692055956856486e-17, -7.843475114100242e-14, 9.586109955308152e-11, -7.420461759412686e-08, 3.766437656499104e-05, -0.012473026309766598, 2.5508091747355173, -247.8254681597346])),
+                          VaporPressure(exp_poly_fit=(13.967, 33.135000000000005, [2.447649824484286e-11, -1.9092317903068513e-09, -9.871694369510465e-08, 1.8738775057921993e-05, -0.0010528586872742638, 0.032004931729483245, -0.5840683278086365, 6.461815322744102, -23.604507906951046])),]
+        VolumeLiquids = [VolumeLiquid(poly_fit=(273.17, 637.096, [9.00307261049824e-24, -3.097008950027417e-20, 4.608271228765265e-17, -3.8726692841874345e-14, 2.0099220218891486e-11, -6.596204729785676e-09, 1.3368112879131157e-06, -0.00015298762503607717, 0.007589247005014652])),
+                         VolumeLiquid(poly_fit=(90.8, 180.564, [7.730541828225242e-20, -7.911042356530585e-17, 3.51935763791471e-14, -8.885734012624568e-12, 1.3922694980104743e-09, -1.3860056394382538e-07, 8.560110533953199e-06, -0.00029978743425740123, 0.004589555868318768])),
+                         VolumeLiquid(poly_fit=(90.4, 295.322, [8.94814934875547e-22, -1.2714020587822148e-18, 7.744406810864275e-16, -2.6371441222674234e-13, 5.484329710203708e-11, -7.125679072517415e-09, 5.646423685845822e-07, -2.487300046509999e-05, 0.0005100376035218567])),
+                         VolumeLiquid(poly_fit=(243.51, 607.7, [1.0056823442253386e-22, -3.2166293088353376e-19, 4.442027873447809e-16, -3.4574825216883073e-13, 1.6583965814129937e-10, -5.018203505211133e-08, 9.353680499788552e-06, -0.0009817356348626736, 0.04459313654596568])),
+                         VolumeLiquid(poly_fit=(195.505, 395.4, [5.103835649289192e-22, -1.1451165900302792e-18, 1.1154748069727923e-15, -6.160223429581022e-13, 2.1091176437184486e-10, -4.583765753427699e-08, 6.175086699295002e-06, -0.00047144103245914243, 0.015638233047208582])),
+                         VolumeLiquid(poly_fit=(63.2, 116.192, [9.50261462694019e-19, -6.351064785670885e-16, 1.8491415360234833e-13, -3.061531642102745e-11, 3.151588109585604e-09, -2.0650965261816766e-07, 8.411110954342014e-06, -0.00019458305886755787, 0.0019857193167955463])),
+                         VolumeLiquid(poly_fit=(54.370999999999995, 144.58100000000002, [6.457909929992152e-20, -4.7825644162085234e-17, 1.5319533644419177e-14, -2.7692511820542383e-12, 3.088256295705142e-10, -2.1749171236451626e-08, 9.448300475893009e-07, -2.3081894336450133e-05, 0.00026558114294435354])),
+                         VolumeLiquid(poly_fit=(175.7, 502.5, [3.5725079384600736e-23, -9.031033742820083e-20, 9.819637959370411e-17, -5.993173551565636e-14, 2.2442465416964825e-11, -5.27776114586072e-09, 7.610461006178106e-07, -6.148574498547711e-05, 0.00216398089328537])),
+                         VolumeLiquid(poly_fit=(309.58, 729.5999999999999, [7.45473064887452e-24, -2.89457102830013e-20, 4.867041417017972e-17, -4.6252122183399004e-14, 2.7157887108452537e-11, -1.0085443480134824e-08, 2.3130153268044497e-06, -0.0002992756488164552, 0.01705648133237398])),
+                         VolumeLiquid(poly_fit=(13.967, 29.3074, [1.338998655322118e-14, -2.2300738749278554e-12, 1.6125645123435388e-10, -6.603182508985557e-09, 1.6732222054898376e-07, -2.6846339878160216e-06, 2.6629092007736217e-05, -0.0001490816582989168, 0.0003852732680036591]))]
+        self.liquid = GibbsExcessLiquid(VaporPressures=VaporPressures, VolumeLiquids=VolumeLiquids, use_Poynting=True,
+                                        T=300.0, P=1e5, zs=[0.1]*10)
+        eoss = [PR(Tc=Tc, Pc=Pc, omega=omega, T=300.0, P=1e5) for Tc, Pc, omega in zip(Tcs, Pcs, omegas)]
+        self.liquid_phis = GibbsExcessLiquid(VaporPressures=VaporPressures, VolumeLiquids=VolumeLiquids, eos_pure_instances=eoss,
+                                             use_phis_sat=True, T=300.0, P=1e5, zs=[0.1]*10)
+        self.Ts = np.linspace(200.0, 500.0, 1000)
+        self.Ts_list = self.Ts.tolist()
+
+    def time_Psats_many(self):
+        self.liquid.Psats_many(self.Ts)
+
+    def time_Psats_scalar(self):
+        liquid = self.liquid
+        for T in self.Ts_list:
+            liquid.Psats_at(T)
+
+    def time_Poyntings_many(self):
+        self.liquid.Poyntings_many(self.Ts, 1e6)
+
+    def time_Poyntings_scalar(self):
+        liquid, zs = self.liquid, self.liquid.zs
+        for T in self.Ts_list:
+            liquid.to_TP_zs(T, 1e6, zs).Poyntings()
+
+    def time_phis_sat_many(self):
+        self.liquid_phis.phis_sat_many(self.Ts)
+
+    def time_phis_sat_scalar(self):
+        liquid = self.liquid_phis
+        for T in self.Ts_list:
+            liquid.phis_sat_at(T)
+
+
+class MixturePropertyManyTimeSuite(object):
+    # Air properties over a 100 temperature x 100 composition table
+    def setup(self):
+        from thermo.viscosity import ViscosityGas, ViscosityGasMixture, DIPPR_PERRY_8E, BROKAW
+        from thermo.thermal_conductivity import (ThermalConductivityGas, ThermalConductivityGasMixture,
+                                                 VDI_PPDS, LINDSAY_BROMLEY)
+        MWs = [28.0134, 39.948, 31.9988]
+        CASs = ['7727-37-9', '7440-37-1', '7782-44-7']
+        ViscosityGases = [
+            ViscosityGas(CASRN="7727-37-9", MW=28.0134, Tc=126.2, Pc=3394387.5, Zc=0.2895282296391198, dipole=0.0, extrapolation="linear", method=DIPPR_PERRY_8E),
+            ViscosityGas(CASRN="7440-37-1", MW=39.948, Tc=150.8, Pc=4873732.5, Zc=0.29114409080360165, dipole=0.0, extrapolation="linear", method=DIPPR_PERRY_8E),
+            ViscosityGas(CASRN="7782-44-7", MW=31.9988, Tc=154.58, Pc=5042945.25, Zc=0.2880002236716698, dipole=0.0, extrapolation="linear", method=DIPPR_PERRY_8E),
+        ]
+        ThermalConductivityGases = [
+            ThermalConductivityGas(CASRN="7727-37-9", MW=28.0134, Tb=77.355, Tc=126.2, Pc=3394387.5, Vc=8.95e-05, Zc=0.2895282296391198, omega=0.04, dipole=0.0, extrapolation="linear", method=VDI_PPDS),
+            ThermalConductivityGas(CASRN="7440-37-1", MW=39.948, Tb=87.302, Tc=150.8, Pc=4873732.5, Vc=7.49e-05, Zc=0.29114409080360165, omega=-0.004, dipole=0.0, extrapolation="linear", method=VDI_PPDS),
+            ThermalConductivityGas(CASRN="7782-44-7", MW=31.9988, Tb=90.188, Tc=154.58, Pc=5042945.25, Vc=7.34e-05, Zc=0.2880002236716698, omega=0.021, dipole=0.0, extrapolation="linear", method=VDI_PPDS),
+        ]
+        self.mu_mix = ViscosityGasMixture(MWs=MWs, molecular_diameters=[3.798, 3.542, 3.467], Stockmayers=[71.4, 93.3, 106.7],
+                                          CASs=CASs, ViscosityGases=ViscosityGases, correct_pressure_pure=False)
+        self.mu_mix.method = BROKAW
+        self.kg_mix = ThermalConductivityGasMixture(MWs=MWs, Tbs=[77.355, 87.302, 90.188], CASs=CASs, correct_pressure_pure=False,
+                                                    ThermalConductivityGases=ThermalConductivityGases, ViscosityGases=ViscosityGases)
+        self.kg_mix.method = LINDSAY_BROMLEY
+        zs = [normalize([0.78 - 0.001*i, 0.01, 0.21 + 0.001*i]) for i in range(100)]
+        self.Ts = np.repeat(np.linspace(250.0, 600.0, 100), 100)
+        self.zs_2d = np.array(zs*100)
+        self.states = [(T, zs) for T, zs in zip(self.Ts.tolist(), self.zs_2d.tolist())]
+
+    def time_viscosity_many(self):
+        self.mu_mix.mixture_property_many(self.Ts, 1e5, self.zs_2d)
+
+    def time_viscosity_scalar(self):
+        mu_mix = self.mu_mix
+        for T, zs in self.states:
+            mu_mix.mixture_property(T, 1e5, zs)
+
+    def time_thermal_conductivity_many(self):
+        self.kg_mix.mixture_property_many(self.Ts, 1e5, self.zs_2d)
+
+    def time_thermal_conductivity_scalar(self):
+        kg_mix = self.kg_mix
+        for T, zs in self.states:
+            kg_mix.mixture_property(T, 1e5, zs)
+
+
+class EquilibriumTransportManyTimeSuite(object):
+    # mu, k and sigma of 1000 VL flash results at 10 temperatures
+    def setup(self):
+        from thermo import (ChemicalConstantsPackage, PropertyCorrelationsPackage,
+                            CEOSGas, CEOSLiquid, PRMIX, FlashVL)
+        from fluids.numerics import linspace
+        from thermo.equilibrium import transport_properties_many
+        constants, correlations = ChemicalConstantsPackage.from_IDs(['ethane', 'propane', 'butane', 'decane'])
+        eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+        gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+        liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+        flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+        self.results = [flasher.flash(T=T, P=1e6, zs=normalize([1.0 + 0.01*i, 1.0, 1.0, 3.0 - 0.01*i]))
+                        for T in linspace(300.0, 400.0, 10) for i in range(100)]
+        self.transport_properties_many = transport_properties_many
+
+    def _clear(self):
+        for result in self.results:
+            for obj in [result.bulk] + result.phases:
+                obj.__dict__.pop('_mu', None)
+                obj.__dict__.pop('_k', None)
+                obj.__dict__.pop('_sigma', None)
+
+    def time_transport_properties_many(self):
+        self._clear()
+        self.transport_properties_many(self.results)
+
+    def time_transport_properties_scalar(self):
+        self._clear()
+        for result in self.results:
+            result.mu(), result.k(), result.sigma()
+
+
+class LaliberteManyTimeSuite(object):
+    # 1000 brine states of NaCl, KCl and CaCl2
+    def setup(self):
+        from thermo.electrochem import (Laliberte_viscosity, Laliberte_density, Laliberte_heat_capacity,
+                                        Laliberte_viscosity_many, Laliberte_density_many,
+                                        Laliberte_heat_capacity_many)
+        self.CASs = ['7647-14-5', '7447-40-7', '10043-52-4']
+        self.Ts = np.linspace(275.0, 360.0, 1000)
+        self.ws = np.array([[0.01 + 1e-5*i, 0.005, 0.02 - 1e-5*i] for i in range(1000)])
+        self.states = [(T, list(ws)) for T, ws in zip(self.Ts.tolist(), self.ws)]
+        self.Laliberte_viscosity = Laliberte_viscosity
+        self.Laliberte_density = Laliberte_density
+        self.Laliberte_heat_capacity = Laliberte_heat_capacity
+        self.Laliberte_viscosity_many = Laliberte_viscosity_many
+        self.Laliberte_density_many = Laliberte_density_many
+        self.Laliberte_heat_capacity_many = Laliberte_heat_capacity_many
+
+    def time_Laliberte_many(self):
+        self.Laliberte_viscosity_many(self.Ts, self.ws, self.CASs)
+        self.Laliberte_density_many(self.Ts, self.ws, self.CASs)
+        self.Laliberte_heat_capacity_many(self.Ts, self.ws, self.CASs)
+
+    def time_Laliberte_scalar(self):
+        CASs = self.CASs
+        for T, ws in self.states:
+            self.Laliberte_viscosity(T, ws, CASs)
+            self.Laliberte_density(T, ws, CASs)
+            self.Laliberte_heat_capacity(T, ws, CASs)
+
+
+class ActivityRegressionManyTimeSuite(object):
+    # NRTL regression of 20 binaries from UNIFAC, with 30 multistart guesses each
+    def setup(self):
+        from thermo import UNIFAC, NRTL
+        from fluids.numerics import linspace
+        xs_points = [[xi, 1-xi] for xi in linspace(0.01, 0.99, 10)]
+        groups = [{1: 1, 2: 1, 14: 1}, {16: 1}, {1: 2, 2: 4}, {1: 1, 18: 1}, {9: 6}]
+        self.datasets = []
+        for a in range(len(groups)):
+            for b in range(len(groups)):
+                if a != b:
+                    GE = UNIFAC.from_subgroups(T=298.15, xs=[.5, .5], chemgroups=[groups[a], groups[b]])
+                    self.datasets.append(dict(gammas=[GE.to_T_xs(T=GE.T, xs=xs).gammas() for xs in xs_points],
+                                              xs=xs_points))
+        self.NRTL = NRTL
+
+    def time_regress_multistart_serial(self):
+        self.NRTL.regress_binary_parameters_many(self.datasets, multistart=30, symmetric_alphas=True)
+
+    def time_regress_multistart_pool(self):
+        self.NRTL.regress_binary_parameters_many(self.datasets, processes=4, multistart=30, symmetric_alphas=True)
+
+
+class BubblePointFitTimeSuite(object):
+    # kij of Peng-Robinson CO2-propane from 200 bubble pressures
+    def setup(self):
+        from thermo import CEOSGas, CEOSLiquid, PRMIX
+        from thermo.fitting import fit_bubble_point
+        from thermo.flash.flash_utils import bubble_P_Michelsen_Mollerup
+        from fluids.numerics import linspace
+        eos_kwargs = dict(Tcs=[304.2, 369.83], Pcs=[7376460.0, 4248000.0], omegas=[0.2252, 0.152])
+        def phases(kij):
+            kwargs = dict(eos_kwargs, kijs=[[0.0, kij], [kij, 0.0]])
+            return CEOSLiquid(PRMIX, kwargs), CEOSGas(PRMIX, kwargs)
+        liq, gas = phases(0.13)
+        self.Ts, self.xs, self.Ps = [], [], []
+        for T in linspace(240.0, 280.0, 20):
+            for x0 in linspace(0.05, 0.5, 10):
+                self.Ts.append(T)
+                self.xs.append([x0, 1.0 - x0])
+                self.Ps.append(bubble_P_Michelsen_Mollerup(1e6, T, [x0, 1.0 - x0], liq, gas, xtol=1e-4)[0])
+        self.phases = phases
+        self.fit_bubble_point = fit_bubble_point
+
+    def time_fit_bubble_point_kij(self):
+        self.fit_bubble_point(self.phases, {'kij': 0.0}, self.xs, Ts=self.Ts, Ps=self.Ps)
+
+    def time_fit_bubble_point_kij_numerical_jac(self):
+        self.fit_bubble_point(self.phases, {'kij': 0.0}, self.xs, Ts=self.Ts, Ps=self.Ps, analytical_jac=False)
+
+
+class JobackManyTimeSuite(object):
+    # Joback estimates of 10000 molecules from their group counts
+    def setup(self):
+        from random import Random
+        from thermo.joback import Joback
+        rng = Random(0)
+        self.counts = [{rng.randint(1, 41): rng.randint(1, 4) for _ in range(rng.randint(1, 6))}
+                       for _ in range(10000)]
+        self.atom_counts = [rng.randint(3, 40) for _ in self.counts]
+        self.count_matrix = Joback.group_count_matrix(self.counts)
+        self.Joback = Joback
+
+    def time_estimate_many(self):
+        self.Joback.estimate_many(self.count_matrix, atom_counts=self.atom_counts)
+
+    def time_estimate_scalar(self):
+        J = self.Joback
+        for c, atom_count in zip(self.counts, self.atom_counts):
+            J.Tb(c), J.Tm(c), J.Tc(c), J.Pc(c, atom_count), J.Vc(c), J.Hf(c), J.Gf(c)
+            J.Hfus(c), J.Hvap(c), J.Cpig_coeffs(c), J.mul_coeffs(c)
+
+
+class CriticalPointManyTimeSuite(object):
+    # Critical locus of methane-ethane with the Peng-Robinson EOS
+    def setup(self):
+        from thermo.eos_mix import PRMIX
+        self.eos = PRMIX(Tcs=[190.56, 305.32], Pcs=[4599000.0, 4872000.0], omegas=[0.008, 0.098],
+                         zs=[0.5, 0.5], T=300.0, P=1e5)
+        self.zs_list = [[x, 1.0 - x] for x in linspace(0.01, 0.99, 50)]
+
+    def time_critical_point_many(self):
+        self.eos.critical_point_many(self.zs_list)
+
+    def time_critical_point_cold(self):
+        for zs in self.zs_list:
+            self.eos.critical_point(zs=zs)
+
+
+class MultiCheb1DManyTimeSuite(object):
+    # Piecewise Chebyshev approximation of water's vapor pressure at 10000 points
+    def setup(self):
+        from thermo.coolprop import MultiCheb1D
+        from thermo.vapor_pressure import VaporPressure
+        self.approx = MultiCheb1D.from_property(VaporPressure(CASRN='7732-18-5'), 300.0, 600.0)
+        self.Ts = linspace(300.0, 600.0, 10000)
+
+    def time_evaluate_many(self):
+        self.approx.evaluate_many(self.Ts)
+
+    def time_evaluate_scalar(self):
+        approx = self.approx
+        for T in self.Ts:
+            approx(T)
+
+
+class TabulateManyTimeSuite(object):
+    # Liquid datasheets of 10 chemicals at 20 temperatures
+    def setup(self):
+        from thermo import ChemicalConstantsPackage
+        from thermo.datasheet import tabulate_many, tabulate_liq
+        self.IDs = ['water', 'hexane', 'toluene', 'methanol', 'ethanol', 'acetone',
+                    'benzene', 'heptane', 'octane', 'pentane']
+        self.constants, self.correlations = ChemicalConstantsPackage.from_IDs(self.IDs)
+        self.tabulate_many = tabulate_many
+        self.tabulate_liq = tabulate_liq
+
+    def time_tabulate_many(self):
+        self.tabulate_many(self.correlations, Tmin=300.0, Tmax=350.0, pts=20)
+
+    def time_tabulate_liq(self):
+        for ID in self.IDs:
+            self.tabulate_liq(ID, Tmin=300.0, Tmax=350.0, pts=20)
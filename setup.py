@@ -20,7 +20,30 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
+import os
+import subprocess
+import sys
 from setuptools import setup
+from setuptools.command.build_py import build_py
+
+
+class build_py_unit_signatures(build_py):
+    # Store the parsed units of the classes wrapped by thermo.units in the
+    # built package, so they are not parsed from docstrings on first use.
+    # This needs thermo's dependencies; without them, thermo.units parses
+    # the docstrings as before.
+    def run(self):
+        build_py.run(self)
+        if self.dry_run:
+            return
+        build_lib = os.path.abspath(self.build_lib)
+        code = ('import thermo.units; thermo.units.generate_unit_signatures(%r)'
+                %(os.path.join(build_lib, 'thermo', 'unit_signatures.json'),))
+        try:
+            # Run from the build folder so the built thermo is imported
+            subprocess.check_call([sys.executable, '-c', code], cwd=build_lib)
+        except Exception as e:
+            print('Unit signatures for thermo.units were not generated: %s' %(e,))
 
 classifiers=[
     'Development Status :: 3 - Alpha',
@@ -74,6 +97,7 @@ setup(
   'combustion', 'environmental engineering', 'solubility', 'vapor pressure',
   'equation of state', 'molecule'],
   classifiers = classifiers,
+  cmdclass={'build_py': build_py_unit_signatures},
   package_data={'thermo': ['Critical Properties/*', 'Density/*',
   'Electrolytes/*', 'Environment/*', 'Heat Capacity/*', 'Identifiers/*',
   'Law/*', 'Misc/*', 'Phase Change/*', 'Reactions/*', 'Safety/*',
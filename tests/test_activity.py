@@ -28,7 +28,7 @@ from thermo.activity import GibbsExcess, IdealSolution
 from random import random
 import numpy as np
 from fluids.numerics import jacobian, hessian, derivative, normalize, assert_close, assert_close1d, assert_close2d
-from thermo.test_utils import check_np_output_activity
+from thermo.test_utils import check_np_output_activity, check_many_output_activity
 import pickle
 import json
 
@@ -85,6 +85,13 @@ def test_IdealSolution_numpy_output():
     assert model_pickle == model
 
 
+def test_IdealSolution_many_compositions():
+    model = IdealSolution(T=300.0, xs=[.1, .2, .3, .4])
+    modelnp = IdealSolution(T=300.0, xs=np.array([.1, .2, .3, .4]))
+    xs_matrix = [[.1, .2, .3, .4], [.25, .25, .25, .25], [.7, .1, .1, .1]]
+    check_many_output_activity(model, modelnp, 300.0, xs_matrix)
+    check_many_output_activity(model, modelnp, 350.0, xs_matrix)
+
 
 def test_IdealSolution():
     GE = IdealSolution(T=300.0, xs=[1])
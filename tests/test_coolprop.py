@@ -90,3 +90,59 @@ def test_CoolProp_T_dependent_property():
 #
 #
 #
+
+
+def test_MultiCheb1D_evaluate_many():
+    import numpy as np
+    from math import exp
+    from thermo.coolprop import MultiCheb1D, CP_fluid_approximator
+    from thermo.vapor_pressure import VaporPressure
+
+    approx = MultiCheb1D.from_function(exp, 0.0, 2.0, pieces=3, n=14)
+    xs = np.linspace(0.0, 2.0, 301)
+    assert_close1d(approx.evaluate_many(xs), [approx(x) for x in xs], rtol=1e-15)
+    assert_close1d(approx.evaluate_many(xs), np.exp(xs), rtol=1e-13)
+    # Segments of different lengths
+    approx = MultiCheb1D([0.0, 1.0, 2.0], [[1.0, 0.5, 0.25], [2.0, 0.1]])
+    assert_close1d(approx.evaluate_many(xs), [approx(x) for x in xs], rtol=1e-15)
+    with pytest.raises(ValueError):
+        approx.evaluate_many([1.0, 2.5])
+    with pytest.raises(ValueError):
+        approx.evaluate_many([-0.5, 1.0])
+
+    obj = VaporPressure(CASRN='7732-18-5')
+    approx = MultiCheb1D.from_property(obj, 300.0, 600.0)
+    Ts = np.linspace(300.0, 600.0, 200)
+    assert_close1d(approx.evaluate_many(Ts), [obj(T) for T in Ts], rtol=1e-12)
+
+    # Persist and use as an approximator without CoolProp
+    fluid = CP_fluid_approximator()
+    fluid.CAS = '7732-18-5'
+    fluid.Tc = 647.096
+    fluid.DMOLAR_l = MultiCheb1D.from_json(approx.as_json())
+    fluid = CP_fluid_approximator.from_json(fluid.as_json())
+    assert fluid.CAS == '7732-18-5'
+    assert_close1d(fluid.calculate_many(Ts, 'DMOLAR', 'l'),
+                   [fluid.calculate(T, 'DMOLAR', 'l') for T in Ts], rtol=1e-15)
+
+
+def test_MultiCheb1D_evaluate_many_short_series_and_scalar():
+    import numpy as np
+    from thermo.coolprop import MultiCheb1D
+
+    # Constant and empty coefficient sets
+    assert_close1d(MultiCheb1D.chebval_many(np.array([-0.5, 0.0, 0.5]), np.array([[3.0], [4.0], [5.0]])),
+                   [3.0, 4.0, 5.0], rtol=0.0)
+    assert_close1d(MultiCheb1D.chebval_many(np.array([-0.5, 0.5]), np.zeros((2, 0))), [0.0, 0.0], rtol=0.0)
+    approx = MultiCheb1D([0.0, 1.0, 2.0], [[3.0], [4.0]])
+    assert_close1d(approx.evaluate_many([0.0, 0.5, 1.5, 2.0]), [3.0, 3.0, 4.0, 4.0], rtol=0.0)
+
+    # A 0-d input gives a 0-d result, and other shapes are kept
+    approx = MultiCheb1D([0.0, 1.0, 2.0], [[1.0, 0.5, 0.25], [2.0, 0.1]])
+    value = approx.evaluate_many(1.5)
+    assert np.shape(value) == ()
+    assert_close(float(value), approx(1.5), rtol=1e-15)
+    xs = np.array([[0.0, 0.5], [1.5, 2.0]])
+    values = approx.evaluate_many(xs)
+    assert values.shape == (2, 2)
+    assert_close1d(values.ravel(), [approx(x) for x in xs.ravel()], rtol=1e-15)
@@ -58,3 +58,47 @@ from thermo.chemical import Chemical
 #    df = tabulate_constants(['hexane', 'toluene'], full=True, vertical=True)
 #    df_as_dict = {'hexane': {'Electrical conductivity, S/m': 1e-16, 'Global warming potential': None, 'InChI key': 'VLKZOEOYAKHREP-UHFFFAOYSA-N', 'Heat of vaporization at Tb, J/mol': 28862.311605415733, 'Time-weighted average exposure limit': "(50.0, 'ppm')", 'Tc, K': 507.6, 'Short-term exposure limit': 'None', 'Molecular Diameter, Angstrom': 5.61841, 'Formula': 'C6H14', 'InChI': 'C6H14/c1-3-5-6-4-2/h3-6H2,1-2H3', 'Parachor': 272.1972168105559, 'Heat of fusion, J/mol': 13080.0, 'Tb, K': 341.87, 'Stockmayer parameter, K': 434.76, 'IUPAC name': 'hexane', 'Refractive index': 1.3727, 'Tm, K': 178.075, 'solubility parameter, Pa^0.5': 14848.17694628013, 'Heat of formation, J/mol': -166950.0, 'Pc, Pa': 3025000.0, 'Lower flammability limit, fraction': 0.01, 'Vc, m^3/mol': 0.000368, 'Upper flammability limit, fraction': 0.08900000000000001, 'Dipole moment, debye': 0.0, 'MW, g/mol': 86.17536, 'Acentric factor': 0.2975, 'rhoC, kg/m^3': 234.17217391304345, 'Zc': 0.2637652305242204, 'Triple pressure, Pa': 1.1747772750450831, 'Autoignition temperature, K': 498.15, 'CAS': '110-54-3', 'smiles': 'CCCCCC', 'Flash temperature, K': 251.15, 'Ozone depletion potential': None, 'logP': 4.0, 'Heat of sublimation, J/mol': None, 'Triple temperature, K': 177.84}, 'toluene': {'Electrical conductivity, S/m': 1e-12, 'Global warming potential': None, 'InChI key': 'YXFVVABEGXRONW-UHFFFAOYSA-N', 'Heat of vaporization at Tb, J/mol': 33233.94544167449, 'Time-weighted average exposure limit': "(20.0, 'ppm')", 'Tc, K': 591.75, 'Short-term exposure limit': 'None', 'Molecular Diameter, Angstrom': 5.4545, 'Formula': 'C7H8', 'InChI': 'C7H8/c1-7-5-3-2-4-6-7/h2-6H,1H3', 'Parachor': 246.76008384965857, 'Heat of fusion, J/mol': 6639.9999999999991, 'Tb, K': 383.75, 'Stockmayer parameter, K': 350.74, 'IUPAC name': 'methylbenzene', 'Refractive index': 1.4941, 'Tm, K': 179.2, 'solubility parameter, Pa^0.5': 18242.232319337778, 'Heat of formation, J/mol': 50170.0, 'Pc, Pa': 4108000.0, 'Lower flammability limit, fraction': 0.01, 'Vc, m^3/mol': 0.00031600000000000004, 'Upper flammability limit, fraction': 0.078, 'Dipole moment, debye': 0.33, 'MW, g/mol': 92.13842, 'Acentric factor': 0.257, 'rhoC, kg/m^3': 291.5772784810126, 'Zc': 0.26384277925843774, 'Triple pressure, Pa': 0.04217711401906639, 'Autoignition temperature, K': 803.15, 'CAS': '108-88-3', 'smiles': 'CC1=CC=CC=C1', 'Flash temperature, K': 277.15, 'Ozone depletion potential': None, 'logP': 2.73, 'Heat of sublimation, J/mol': None, 'Triple temperature, K': 179.2}}
 #    pd.util.testing.assert_frame_equal(pd.DataFrame(df_as_dict), pd.DataFrame(df.to_dict()))
+
+
+def test_tabulate_many(tmpdir):
+    import numpy as np
+    from fluids.numerics import assert_close1d
+    from thermo import ChemicalConstantsPackage
+    constants, correlations = ChemicalConstantsPackage.from_IDs(['water', 'hexane', 'toluene'])
+    table = tabulate_many(correlations, Tmin=300.0, Tmax=350.0, pts=4)
+    assert table['CAS'] == ['7732-18-5']*4 + ['110-54-3']*4 + ['108-88-3']*4
+    Ts = np.linspace(300.0, 350.0, 4)
+    for i in range(3):
+        rows = slice(4*i, 4*i + 4)
+        assert_close1d(table['T, K'][rows], Ts)
+        assert_close1d(table['Saturation pressure, Pa'][rows],
+                       [correlations.VaporPressures[i](T) for T in Ts], rtol=1e-13)
+        assert_close1d(table['Density, kg/m^3'][rows],
+                       [constants.MWs[i]*1e-3/correlations.VolumeLiquids[i].T_dependent_property(T) for T in Ts], rtol=1e-13)
+        assert_close1d(table['Viscosity, Pa*s'][rows],
+                       [correlations.ViscosityLiquids[i].T_dependent_property(T) for T in Ts], rtol=1e-13)
+
+    # Default temperature ranges follow each chemical's limits
+    gas = tabulate_many(correlations, phase='g', pts=5)
+    assert_close1d(gas['T, K'][[0, 4, 5, 9]], [constants.Tms[0], constants.Tcs[0], constants.Tms[1], constants.Tcs[1]])
+
+    # Worker processes give the same table
+    path = str(tmpdir.join('liquids.csv'))
+    table_pool = tabulate_many(correlations, Tmin=300.0, Tmax=350.0, pts=4, processes=2, path=path)
+    assert table_pool['CAS'] == table['CAS']
+    for key in table:
+        if key not in ('CAS', 'Name'):
+            assert_close1d(table_pool[key], table[key], rtol=1e-15)
+    df = pd.read_csv(path)
+    assert list(df.columns) == list(table.keys())
+    assert_close1d(df['Surface tension, N/m'].values, table['Surface tension, N/m'])
+
+    path = str(tmpdir.join('solids.npz'))
+    solids = tabulate_many(correlations, phase='s', Tmin=200.0, Tmax=250.0, pts=2, path=path)
+    loaded = np.load(path)
+    assert_close1d(loaded['Density, kg/m^3'], solids['Density, kg/m^3'])
+
+    table = tabulate_constants_many(constants)
+    assert table['Name'] == ['water', 'hexane', 'toluene']
+    assert_close1d(table['Tb, K'], constants.Tbs)
+    assert_close1d(table['Pc, Pa'], constants.Pcs)
@@ -93,6 +93,38 @@ def test_Laliberte_heat_capacity_mix():
     Cp = Laliberte_heat_capacity_mix(T=278.15, ws=[0.00581, 0.002], a1s=[-0.0693559668993322, -0.103713247177424], a2s=[-0.0782134167486952, -0.0647453826944371], a3s=[3.84798479408635, 2.92191453087969], a4s=[-11.2762109247072, -5.48799065938436], a5s=[8.73187698542672, 2.41768600041476], a6s=[1.81245930472755, 1.32062411084408])
     assert_close(Cp, 4154.788562680796, rtol=1e-10)
 
+def test_Laliberte_many():
+    CASs = ['7647-14-5', '7447-40-7', '10043-52-4']
+    Ts = linspace(275.0, 400.0, 11)
+    ws = [[0.01 + 0.002*i, 0.005, 0.02 - 0.001*i] for i in range(len(Ts))]
+    mus = Laliberte_viscosity_many(Ts, ws, CASs)
+    rhos = Laliberte_density_many(Ts, ws, CASs)
+    Cps = Laliberte_heat_capacity_many(Ts, ws, CASs)
+    for i, T in enumerate(Ts):
+        assert_close(mus[i], Laliberte_viscosity(T, ws[i], CASs), rtol=1e-13)
+        assert_close(rhos[i], Laliberte_density(T, ws[i], CASs), rtol=1e-13)
+        assert_close(Cps[i], Laliberte_heat_capacity(T, ws[i], CASs), rtol=1e-13)
+
+    # A single composition row is broadcast over every temperature
+    mus = Laliberte_viscosity_many([273.15+5, 298.15], [[0.005810]], ['7647-14-5'])
+    assert_close1d(mus, [Laliberte_viscosity(273.15+5, [0.005810], ['7647-14-5']),
+                         Laliberte_viscosity(298.15, [0.005810], ['7647-14-5'])], rtol=1e-13)
+
+    rho_coeffs, mu_coeffs, Cp_coeffs = Laliberte_coefficients(CASs)
+    assert rho_coeffs.shape == (3, 5)
+    assert mu_coeffs.shape == (3, 6)
+    assert Cp_coeffs.shape == (3, 6)
+    assert_close(mu_coeffs[0][0], 16.221788633396)
+    with pytest.raises(KeyError):
+        Laliberte_coefficients(['50-00-0'])
+
+def test_Laliberte_no_pandas_import():
+    import subprocess, sys
+    code = ("import sys; from thermo.electrochem import Laliberte_viscosity; "
+            "Laliberte_viscosity(278.15, [0.005810], ['7647-14-5']); "
+            "assert 'pandas' not in sys.modules")
+    subprocess.check_call([sys.executable, '-c', code])
+
 @pytest.mark.scipy
 @pytest.mark.fuzz
 def test_Laliberte_heat_capacity_w():
@@ -286,6 +286,55 @@ def test_density_extrapolation():
 
 
 
+def test_critical_point():
+    eos = PRMIX(Tcs=[190.56, 305.32], Pcs=[4599000.0, 4872000.0], omegas=[0.008, 0.098],
+                zs=[0.5, 0.5], T=300.0, P=1e5)
+    T, P, V = eos.critical_point()
+    assert_close(T, 265.7598209565321, rtol=1e-7)
+    assert_close(P, 6820276.612422023, rtol=1e-6)
+    assert_close(V, 0.000116160965532237, rtol=1e-6)
+    # Both Heidemann-Khalil criteria are met
+    lambda_min, dns, _ = eos._critical_point_lambda_min(T, V, eos.zs)
+    assert abs(lambda_min) < 1e-8
+    assert abs(eos._critical_point_cubic_form(T, V, eos.zs, dns)) < 1e-5
+
+    # Pure component limits
+    T, P, V = eos.critical_point(zs=[1.0 - 1e-9, 1e-9])
+    assert_close(T, 190.56, rtol=1e-7)
+    assert_close(P, 4599000.0, rtol=1e-6)
+    T, P, V = eos.critical_point(zs=[1e-9, 1.0 - 1e-9])
+    assert_close(T, 305.32, rtol=1e-7)
+    assert_close(P, 4872000.0, rtol=1e-6)
+
+    # Ternary with an interaction parameter
+    kijs = [[0.0, 0.0, 0.1], [0.0, 0.0, 0.125], [0.1, 0.125, 0.0]]
+    eos = PRMIX(Tcs=[190.56, 305.32, 304.2], Pcs=[4599000.0, 4872000.0, 7376460.0],
+                omegas=[0.008, 0.098, 0.2252], kijs=kijs, zs=[0.3, 0.4, 0.3], T=300.0, P=1e5)
+    T, P, V = eos.critical_point()
+    lambda_min, dns, _ = eos._critical_point_lambda_min(T, V, eos.zs)
+    assert abs(lambda_min) < 1e-8
+    assert abs(eos._critical_point_cubic_form(T, V, eos.zs, dns)) < 1e-5
+    assert_close(P, eos.to(zs=eos.zs, T=T, V=V).P, rtol=1e-9)
+
+
+def test_critical_point_many():
+    eos = PRMIX(Tcs=[190.56, 305.32], Pcs=[4599000.0, 4872000.0], omegas=[0.008, 0.098],
+                zs=[0.5, 0.5], T=300.0, P=1e5)
+    zs_list = [[x, 1.0 - x] for x in np.linspace(0.05, 0.95, 10)]
+    Ts, Ps, Vs = eos.critical_point_many(zs_list)
+    for zs, T, P, V in zip(zs_list, Ts, Ps, Vs):
+        T_expect, P_expect, V_expect = eos.critical_point(zs=zs)
+        assert_close(T, T_expect, rtol=1e-7)
+        assert_close(P, P_expect, rtol=1e-6)
+        assert_close(V, V_expect, rtol=1e-6)
+    # Critical temperature falls monotonically towards methane
+    assert all(Ts[i] > Ts[i+1] for i in range(len(Ts) - 1))
+
+    # Only failures of the solution give NaN; other errors are raised
+    with pytest.raises(TypeError):
+        eos.critical_point_many([[0.5, 0.5], [0.5, 'x']])
+
+
 def test_mechanical_critical_point():
     '''Test from:
     Watson, Harry A. J., and Paul I. Barton. "Reliable Flash Calculations:
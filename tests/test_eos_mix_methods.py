@@ -94,6 +94,102 @@ def test_a_alpha_and_derivatives_quadratic_terms():
     assert_close1d(da_alpha_dT_j_rows, [-0.0006723873746135188, -0.0010642935017889568], rtol=1e-14)
 
 
+def test_a_alpha_quadratic_terms_sparse_dense():
+    N = 60
+    a_alphas = [0.1 + 0.05*i + 0.01*(i % 7) for i in range(N)]
+    a_alpha_roots = [i**0.5 for i in a_alphas]
+    da_alpha_dTs = [-1e-3*a*(1.0 + 0.01*(i % 5)) for i, a in enumerate(a_alphas)]
+    d2a_alpha_dT2s = [3e-6*a*(1.0 + 0.02*(i % 3)) for i, a in enumerate(a_alphas)]
+    zs = [1.0 + (i % 11) for i in range(N)]
+    zs = [z/sum(zs) for z in zs]
+
+    zero = [[0.0]*N for _ in range(N)]
+    block = [[0.0]*N for _ in range(N)]
+    for i in range(3):
+        for j in range(N):
+            if i != j:
+                block[i][j] = block[j][i] = 0.01*(i + 1)
+    dense = [[0.0 if i == j else 1e-3*(i + j) for j in range(N)] for i in range(N)]
+
+    assert a_alpha_kijs_sparsity(zero, N) == ([], [], [])
+    assert len(a_alpha_kijs_sparsity(block, N)[0]) == 3*N - 6
+    assert a_alpha_kijs_sparsity(dense, N) == (None, None, None)
+    assert a_alpha_kijs_sparsity([[0.1, 0.0], [0.0, 0.0]], 2) == (None, None, None)
+
+    for kijs in (zero, block):
+        kij_is, kij_js, kij_values = a_alpha_kijs_sparsity(kijs, N)
+        expect = a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, 299.0, zs, kijs)
+        calc = a_alpha_and_derivatives_quadratic_terms_sparse(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, 299.0, zs,
+                                                              kij_is, kij_js, kij_values)
+        for v0, v1 in zip(expect[:3], calc[:3]):
+            assert_close(v0, v1, rtol=1e-13)
+        assert_close1d(expect[3], calc[3], rtol=1e-13)
+        assert_close1d(expect[4], calc[4], rtol=1e-13)
+
+        a_alpha, a_alpha_j_rows = a_alpha_quadratic_terms_sparse(a_alphas, a_alpha_roots, 299.0, zs, kij_is, kij_js, kij_values)
+        assert_close(a_alpha, expect[0], rtol=1e-13)
+        assert_close1d(a_alpha_j_rows, expect[3], rtol=1e-13)
+
+    for kijs in (zero, block, dense):
+        expect = a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, 299.0, zs, kijs)
+        calc = a_alpha_and_derivatives_quadratic_terms_dense(np.array(a_alphas), np.array(a_alpha_roots), np.array(da_alpha_dTs),
+                                                             np.array(d2a_alpha_dT2s), 299.0, np.array(zs), 1.0 - np.array(kijs))
+        for v0, v1 in zip(expect[:3], calc[:3]):
+            assert_close(v0, v1, rtol=1e-13)
+        assert_close1d(expect[3], calc[3], rtol=1e-13)
+        assert_close1d(expect[4], calc[4], rtol=1e-13)
+
+
+@pytest.mark.parametrize("kij_type", ['zero', 'block', 'dense'])
+def test_PRMIX_many_components_mixing_rules(kij_type):
+    N = 60
+    Tcs = [400.0 + 5.0*i for i in range(N)]
+    Pcs = [4e6 - 3e4*i for i in range(N)]
+    omegas = [0.1 + 0.01*i for i in range(N)]
+    zs = [1.0 + (i % 11) for i in range(N)]
+    zs = [z/sum(zs) for z in zs]
+    kijs = [[0.0]*N for _ in range(N)]
+    if kij_type == 'block':
+        for i in range(3):
+            for j in range(N):
+                if i != j:
+                    kijs[i][j] = kijs[j][i] = 0.01*(i + 1)
+    elif kij_type == 'dense':
+        kijs = [[0.0 if i == j else 1e-4*(i + j) for j in range(N)] for i in range(N)]
+
+    for scalar in (True, False):
+        if scalar:
+            eos = PRMIX(T=500.0, P=3e6, Tcs=Tcs, Pcs=Pcs, omegas=omegas, zs=zs, kijs=kijs)
+        else:
+            eos = PRMIX(T=500.0, P=3e6, Tcs=np.array(Tcs), Pcs=np.array(Pcs), omegas=np.array(omegas), zs=np.array(zs), kijs=np.array(kijs))
+        a_alphas = list(eos.a_alphas)
+        expect = a_alpha_and_derivatives_quadratic_terms(a_alphas, [i**0.5 for i in a_alphas], list(eos.da_alpha_dTs),
+                                                         list(eos.d2a_alpha_dT2s), eos.T, zs, kijs)
+        assert_close(eos.a_alpha, expect[0], rtol=1e-13)
+        assert_close(eos.da_alpha_dT, expect[1], rtol=1e-13)
+        assert_close(eos.d2a_alpha_dT2, expect[2], rtol=1e-13)
+        assert_close1d(eos.a_alpha_j_rows, expect[3], rtol=1e-13)
+        assert_close1d(eos.da_alpha_dT_j_rows, expect[4], rtol=1e-13)
+        assert (type(eos.a_alpha_j_rows) is list) == scalar
+
+        # Detection is carried over to new states
+        new = eos.to_TP_zs_fast(T=520.0, P=2e6, zs=eos.zs, full_alphas=False)
+        if scalar:
+            assert new.kijs_sparse is eos.kijs_sparse
+        a_alphas = list(new.a_alphas)
+        expect = a_alpha_quadratic_terms(a_alphas, [i**0.5 for i in a_alphas], new.T, zs, kijs)
+        assert_close(new.a_alpha, expect[0], rtol=1e-13)
+        assert_close1d(new.a_alpha_j_rows, expect[1], rtol=1e-13)
+
+        # The cached sparsity is not part of the serialized or hashed state
+        eos.kijs_sparse, eos.one_minus_kijs
+        json_repr = eos.as_json()
+        assert '_kijs_sparse' not in json_repr and '_one_minus_kijs' not in json_repr
+        new = GCEOSMIX.from_json(json_repr)
+        assert '_kijs_sparse' not in new.__dict__ and '_one_minus_kijs' not in new.__dict__
+        assert hash(new) == hash(eos)
+
+
 def test_a_alpha_aijs_composition_independent():
     kijs = [[0,.083],[0.083,0]]
     a_alphas = [0.2491099357671155, 0.6486495863528039]
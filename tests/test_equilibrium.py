@@ -1041,4 +1041,36 @@ def test_thermodynamic_derivatives_named_settings():
     v, v2 = (58.05522195758289, 272.55436171551884)
     assert_close(res.speed_of_sound(), v, rtol=1e-8)
     assert_close(res.bulk.speed_of_sound(), v, rtol=1e-8)
-    assert_close(res.liquid_bulk.speed_of_sound(), v2)
\ No newline at end of file
+    assert_close(res.liquid_bulk.speed_of_sound(), v2)
+
+def test_transport_properties_many():
+    from thermo.equilibrium import transport_properties_many
+    constants, correlations = ChemicalConstantsPackage.from_IDs(['ethane', 'propane', 'water', 'decane'])
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    specs = [(280.0, 1e5, [.02, .02, .48, .48]), (280.0, 1e5, [.05, .05, .1, .8]), (350.0, 1e5, [.05, .05, .1, .8]),
+             (400.0, 1e5, [.25, .25, .25, .25]), (400.0, 1e7, [.05, .05, .1, .8]), (400.0, 1e5, [.2, .2, .1, .5])]
+    for settings in (BulkSettings(),
+                     BulkSettings(mu_VL=AS_ONE_GAS, k_VL=AS_ONE_LIQUID, mu_LL=AS_ONE_LIQUID, sigma_LL=AS_ONE_LIQUID),
+                     BulkSettings(mu_VL=MOLE_WEIGHTED, k_VL=AS_ONE_GAS, k_LL=AS_ONE_LIQUID)):
+        flasher = FlashVLN(constants, correlations, liquids=[liq, liq], gas=gas, settings=settings)
+        results = [flasher.flash(T=T, P=P, zs=zs) for T, P, zs in specs]
+        expect = [flasher.flash(T=T, P=P, zs=zs) for T, P, zs in specs]
+        assert set(r.phase for r in results) == {'V', 'L', 'VL', 'LL', 'VLL'}
+
+        mus, ks, sigmas = transport_properties_many(results)
+        assert_close1d(mus, [r.mu() for r in expect], rtol=1e-13)
+        assert_close1d(ks, [r.k() for r in expect], rtol=1e-13)
+        assert [s is None for s in sigmas] == [r.sigma() is None for r in expect]
+        for r, r_expect in zip(results, expect):
+            for phase, phase_expect in zip(r.phases, r_expect.phases):
+                assert_close(phase.mu(), phase_expect.mu(), rtol=1e-13)
+                assert_close(phase.k(), phase_expect.k(), rtol=1e-13)
+                sigma, sigma_expect = phase.sigma(), phase_expect.sigma()
+                assert (sigma is None) == (sigma_expect is None)
+                if sigma is not None:
+                    assert_close(sigma, sigma_expect, rtol=1e-13)
+            if r.liquid_count > 1:
+                assert_close(r.liquid_bulk.mu(), r_expect.liquid_bulk.mu(), rtol=1e-13)
+                assert_close(r.liquid_bulk.k(), r_expect.liquid_bulk.k(), rtol=1e-13)
@@ -139,3 +139,80 @@ def test_Twu91_check_params_Bell():
 
     for (c0, c1, c2) in zip(v[:, 2], v[:, 3], v[:, 4]):
         assert Twu91_check_params((c0, c1, c2))
+
+
+def test_latin_hypercube_samples():
+    bounds = [(0.0, 1.0), (-10.0, 10.0), (5.0, 6.0)]
+    samples = latin_hypercube_samples(bounds, 20, seed=3)
+    assert samples == latin_hypercube_samples(bounds, 20, seed=3)
+    for j, (low, high) in enumerate(bounds):
+        strata = sorted(int((s[j] - low)/(high - low)*20) for s in samples)
+        assert strata == list(range(20))
+
+
+def test_fit_bubble_point_PR_kij():
+    from thermo import CEOSGas, CEOSLiquid, PRMIX
+    from thermo.flash.flash_utils import bubble_P_Michelsen_Mollerup
+    # CO2-propane
+    eos_kwargs = dict(Tcs=[304.2, 369.83], Pcs=[7376460.0, 4248000.0], omegas=[0.2252, 0.152])
+    def phases(kij):
+        kwargs = dict(eos_kwargs, kijs=[[0.0, kij], [kij, 0.0]])
+        return CEOSLiquid(PRMIX, kwargs), CEOSGas(PRMIX, kwargs)
+
+    liq, gas = phases(0.13)
+    Ts, xs, Ps, ys = [], [], [], []
+    for T in linspace(240.0, 280.0, 5):
+        for x0 in linspace(0.05, 0.5, 6):
+            P, y = bubble_P_Michelsen_Mollerup(1e6, T, [x0, 1.0 - x0], liq, gas, xtol=1e-4)[0:2]
+            Ts.append(T)
+            xs.append([x0, 1.0 - x0])
+            Ps.append(P)
+            ys.append(y)
+
+    params, stats = fit_bubble_point(phases, {'kij': 0.0}, xs, Ts=Ts, Ps=Ps)
+    assert_close(params['kij'], 0.13, rtol=1e-6)
+    assert stats['MAE'] < 1e-8
+    assert_close1d(stats['calc'], Ps, rtol=1e-8)
+
+    # The finite difference jacobian gets to the same place
+    params = fit_bubble_point(phases, {'kij': 0.0}, xs, Ts=Ts, Ps=Ps, analytical_jac=False,
+                              do_statistics=False)
+    assert_close(params['kij'], 0.13, rtol=1e-5)
+
+    # Vapor compositions included in the objective
+    params, stats = fit_bubble_point(phases, {'kij': 0.0}, xs, Ts=Ts, Ps=Ps, ys=ys)
+    assert_close(params['kij'], 0.13, rtol=1e-6)
+    for y_calc, y in zip(stats['ys_calc'], ys):
+        assert_close1d(y_calc, y, atol=1e-7)
+
+    # Bubble temperatures at the pressures
+    params, stats = fit_bubble_point(phases, {'kij': 0.0}, xs, Ts=Ts, Ps=Ps, spec='T')
+    assert_close(params['kij'], 0.13, rtol=1e-6)
+    assert_close1d(stats['calc'], Ts, rtol=1e-8)
+
+    with pytest.raises(ValueError):
+        fit_bubble_point(phases, {'kij': 0.0}, xs, Ts=Ts, Ps=Ps, spec='V')
+
+
+def test_fit_bubble_point_NRTL():
+    from thermo import IdealGas, GibbsExcessLiquid, NRTL, VaporPressure
+    from thermo.flash.flash_utils import bubble_P_Michelsen_Mollerup
+    # methanol-water
+    VaporPressures = [VaporPressure(CASRN='67-56-1'), VaporPressure(CASRN='7732-18-5')]
+    def phases(tau12, tau21):
+        GE = NRTL(T=300.0, xs=[.5, .5], tau_as=[[0.0, tau12], [tau21, 0.0]], alpha_cs=[[0.0, .3], [.3, 0.0]])
+        liquid = GibbsExcessLiquid(VaporPressures=VaporPressures, GibbsExcessModel=GE, T=300.0, P=1e5, zs=[.5, .5])
+        return liquid, IdealGas(T=300.0, P=1e5, zs=[.5, .5])
+
+    liq, gas = phases(0.4, 0.7)
+    Ts, xs, Ps = [], [], []
+    for T in linspace(300.0, 340.0, 3):
+        for x0 in linspace(0.05, 0.95, 8):
+            Ts.append(T)
+            xs.append([x0, 1.0 - x0])
+            Ps.append(bubble_P_Michelsen_Mollerup(1e4, T, [x0, 1.0 - x0], liq, gas, xtol=1e-6)[0])
+
+    params, stats = fit_bubble_point(phases, {'tau12': 0.0, 'tau21': 0.0}, xs, Ts=Ts, Ps=Ps)
+    assert_close(params['tau12'], 0.4, rtol=1e-6)
+    assert_close(params['tau21'], 0.7, rtol=1e-6)
+    assert stats['MAE'] < 1e-9
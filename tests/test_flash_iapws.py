@@ -24,7 +24,8 @@ import pytest
 import thermo
 from thermo import *
 from thermo.coolprop import *
-from thermo.phases import IAPWS95Gas, IAPWS95Liquid
+from thermo.phases import IAPWS95Gas, IAPWS95Liquid, IAPWS95TableGas, IAPWS95TableLiquid
+from chemicals.iapws import iapws95_Tsat, iapws95_Tc, iapws95_Pc, iapws95_rhol_sat, iapws95_rhog_sat
 from thermo.chemical_package import iapws_correlations
 from fluids.numerics import *
 from thermo.test_utils import mark_plot_unsupported
@@ -98,6 +99,135 @@ def test_iapws95_basic_flashes_no_hacks():
     assert_close(new.T, base.T)
 
 
+def test_iapws95_spline_table(tmpdir):
+    from thermo.phases.iapws_phase import iapws95_spline_table, _iapws95_spline_tables
+    cache_dir = str(tmpdir)
+    table = iapws95_spline_table(n_P=20, n_T=20, rtol=1e-3, cache_dir=cache_dir)
+    assert table.max_error <= 1e-3
+    assert 0.7 < table.usable_fraction < 1.0
+    assert os.path.exists(os.path.join(cache_dir, 'IAPWS95SplineTable_2_20_20.npz'))
+
+    # Tighter tolerance loaded from the disk cache rejects more cells
+    strict = iapws95_spline_table(n_P=20, n_T=20, rtol=1e-5, cache_dir=cache_dir)
+    assert strict.usable_fraction < table.usable_fraction
+    assert strict.Tsats == table.Tsats
+    del _iapws95_spline_tables[(20, 20, 1e-5)]
+
+    R = IAPWS95.R
+    for T, P in [(300.0, 1e5), (500.0, 1e5), (400.0, 3e6), (900.0, 5e7), (280.0, 9e7),
+                 (600.0, 1e7), (1000.0, 3e7), (290.0, 1e3)]:
+        exact = IAPWS95(T=T, P=P)
+        rho_mass, H, S = table.TP(T, P)
+        assert_close(rho_mass, exact.rho_mass(), rtol=1e-3)
+        assert abs(H - exact.H()) < 1e-3*R*T
+        assert abs(S - exact.S()) < 1e-3*R
+        for sln in (table.PH(P, H), table.PS(P, S)):
+            assert_close(sln[0], T, rtol=1e-11)
+
+    # Two phase region
+    T, VF, liquid, gas = table.PH(1e5, 40000.0)
+    assert_close(T, iapws95_Tsat(1e5), rtol=1e-3)
+    assert 0.0 < VF < 1.0
+    assert_close(liquid[0], iapws95_rhol_sat(T), rtol=1e-3)
+    assert_close(gas[0], iapws95_rhog_sat(T), rtol=1e-3)
+    assert_close(liquid[1]*(1.0 - VF) + gas[1]*VF, 40000.0, rtol=1e-13)
+
+    # The tolerance holds between the check points of the accepted cells too
+    from thermo.phases.iapws_phase import _iapws95_table_state
+    ref = IAPWS95(T=300.0, P=1e5)
+    for r in range(3):
+        x0, hx = (table.x0_super, 1.0/table.inv_hx_super) if r == 2 else (table.x0_sub, 1.0/table.inv_hx_sub)
+        ok = table.regions[r][1]
+        for i in range(table.n_P - 1):
+            for j in range(table.n_T - 1):
+                if not ok[i*(table.n_T - 1) + j]:
+                    continue
+                for a, b in ((0.1, 0.4), (0.4, 0.9), (0.9, 0.6), (0.6, 0.1)):
+                    P = exp(x0 + (i + a)*hx)
+                    T, values = table._lookup_Pu(r, P, (j + b)/(table.n_T - 1))
+                    exact = _iapws95_table_state(ref, T, P)
+                    assert abs(exp(values[0] - exact[0]) - 1.0) < 1e-3
+                    assert abs(values[1] - exact[1]) < 1e-3*R*T
+                    assert abs(values[2] - exact[2]) < 1e-3*R
+
+    # Outside the table, and at the critical point
+    assert table.TP(250.0, 1e5) is None
+    assert table.TP(300.0, 2e8) is None
+    assert table.TP(iapws95_Tc, iapws95_Pc*(1.0 + 1e-9)) is None
+    assert table.PH(1e9, 1e4) is None
+
+
+def test_iapws95_table_not_built():
+    from thermo.phases.iapws_phase import _iapws95_spline_tables
+    kwargs = dict(zs=[1], table_n_P=7, table_n_T=9, table_rtol=1e-2)
+    # Without a table, the phases are plain IAPWS-95 and nothing is built
+    liquid = IAPWS95TableLiquid(T=300.0, P=1e5, **kwargs)
+    assert liquid.table is None
+    assert _iapws95_spline_tables[(7, 9, 1e-2)] is None
+    assert_close(liquid.rho_mass(), IAPWS95Liquid(T=300.0, P=1e5).rho_mass(), rtol=1e-13)
+    new = liquid.to(T=310.0, P=1e5, zs=[1])
+    assert_close(new.H(), IAPWS95Liquid(T=310.0, P=1e5).H(), rtol=1e-13)
+
+    gas = IAPWS95TableGas(**kwargs)
+    assert gas.table_n_P == 7
+    flasher = FlashPureVLS(iapws_constants, iapws_correlations, gas, [liquid], [])
+    res = flasher.flash(P=1e5, H=new.H())
+    assert_close(res.T, 310.0, rtol=1e-9)
+    del _iapws95_spline_tables[(7, 9, 1e-2)]
+
+
+def test_iapws95_table_flashes(tmpdir):
+    from thermo.phases.iapws_phase import iapws95_spline_table
+    iapws95_spline_table(n_P=20, n_T=20, rtol=1e-3, cache_dir=str(tmpdir))
+    kwargs = dict(zs=[1], table_n_P=20, table_n_T=20, table_rtol=1e-3)
+    liquid = IAPWS95TableLiquid(T=300, P=1e5, **kwargs)
+    gas = IAPWS95TableGas(T=300, P=1e5, **kwargs)
+    flasher = FlashPureVLS(iapws_constants, iapws_correlations, gas, [liquid], [])
+    assert flasher.VL_only_IAPWS95_table
+
+    exact_flasher = FlashPureVLS(iapws_constants, iapws_correlations, IAPWS95Gas(T=300, P=1e5, zs=[1]),
+                                 [IAPWS95Liquid(T=300, P=1e5, zs=[1])], [])
+
+    PT = flasher.flash(T=300, P=1e6)
+    assert isinstance(PT.liquid0, IAPWS95TableLiquid)
+    assert_close(PT.rho_mass(), 996.9600226949985, rtol=1e-3)
+    assert_close(PT.Cp(), exact_flasher.flash(T=300, P=1e6).Cp(), rtol=1e-3)
+
+    PH = flasher.flash(P=1e6, H=PT.H())
+    assert_close(PH.T, 300.0, rtol=1e-11)
+    assert PH.gas is None
+    PS = flasher.flash(P=1e6, S=PT.S())
+    assert_close(PS.T, 300.0, rtol=1e-11)
+
+    gas_state = flasher.flash(P=1e5, H=exact_flasher.flash(T=500.0, P=1e5).H())
+    assert_close(gas_state.T, 500.0, rtol=1e-5)
+    assert isinstance(gas_state.gas, IAPWS95TableGas)
+    assert not gas_state.liquids
+
+    VL = flasher.flash(P=1e5, H=exact_flasher.flash(P=1e5, VF=0.3).H())
+    assert_close(VL.VF, 0.3, rtol=1e-4)
+    assert_close(VL.T, iapws95_Tsat(1e5), rtol=1e-5)
+    assert isinstance(VL.gas, IAPWS95TableGas)
+    assert isinstance(VL.liquid0, IAPWS95TableLiquid)
+
+    # Near the critical point the table is not used
+    crit = flasher.flash(T=647.0, P=2.21e7)
+    assert_close(crit.rho_mass(), exact_flasher.flash(T=647.0, P=2.21e7).rho_mass(), rtol=1e-12)
+    crit_PH = flasher.flash(P=2.21e7, H=crit.H())
+    assert_close(crit_PH.T, 647.0, rtol=1e-9)
+
+    # Saturation and volume specifications use IAPWS-95 directly
+    TVF = flasher.flash(T=400.0, VF=1)
+    assert_close(TVF.P, 245769.3455657166, rtol=1e-13)
+    TV = flasher.flash(T=300, V=PT.V())
+    assert isinstance(TV.liquid0, IAPWS95TableLiquid)
+
+    phase = liquid.to(T=300.0, P=1e6, zs=[1.0])
+    new = Phase.from_json(json.loads(json.dumps(phase.as_json())))
+    assert new == phase
+    assert new.table is phase.table
+    assert phase.model_hash() != IAPWS95Liquid(T=300.0, P=1e6).model_hash()
+
 @pytest.mark.plot
 @pytest.mark.slow
 @pytest.mark.parametric
@@ -1983,4 +1983,49 @@ def test_VF_SF_spec_bound_0_1_and_negative_TPV():
         flasher.flash(T=300.0, P=0)
         
     with pytest.raises(ValueError):              
-        flasher.flash(T=300.0, V=0)
\ No newline at end of file
+        flasher.flash(T=300.0, V=0)
+
+def test_FlashPureVLS_VF_tables(tmp_path):
+    fluid_idx = pure_fluids.index('decane')
+    pure_const, pure_props = constants.subset([fluid_idx]), correlations.subset([fluid_idx])
+    eos_kwargs = dict(Tcs=pure_const.Tcs, Pcs=pure_const.Pcs, omegas=pure_const.omegas)
+    liquid = CEOSLiquid(PRMIX, HeatCapacityGases=pure_props.HeatCapacityGases, eos_kwargs=eos_kwargs)
+    gas = CEOSGas(SRKMIX, HeatCapacityGases=pure_props.HeatCapacityGases, eos_kwargs=eos_kwargs)
+    flasher = FlashPureVLS(pure_const, pure_props, gas=gas, liquids=[liquid], solids=[])
+    assert flasher.VF_tables_supported
+
+    Ps = [3e3, 2e5, 1e6]
+    refs = [flasher.flash(P=P, VF=0.3) for P in Ps]
+    Hs = [r.H() for r in refs]
+    refs_PH = [flasher.flash(P=P, H=H) for P, H in zip(Ps, Hs)]
+
+    flasher.VF_TABLES = True
+    flasher.VF_TABLES_PTS = 50
+    flasher.VF_TABLES_CACHE_DIR = str(tmp_path)
+    for P, H, ref, ref_PH in zip(Ps, Hs, refs, refs_PH):
+        res = flasher.flash(P=P, VF=0.3)
+        assert_close(res.T, ref.T, rtol=1e-9)
+        assert_close(res.H(), H, rtol=1e-8)
+
+        res = flasher.flash(T=ref.T, VF=0.3)
+        assert_close(res.P, P, rtol=1e-9)
+
+        res = flasher.flash(P=P, H=H)
+        assert_close(res.T, ref_PH.T, rtol=1e-9)
+        assert_close(res.VF, ref_PH.VF, rtol=1e-7)
+
+    table = flasher.VF_table()
+    assert table.T_min < refs[0].T < refs[-1].T < table.T_max
+    assert len(os.listdir(str(tmp_path))) == 1
+
+    # A new flasher with the same models loads the saved table instead of building it
+    thermo.flash.flash_pure_vls._VF_tables.clear()
+    flasher2 = FlashPureVLS(pure_const, pure_props, gas=gas, liquids=[liquid], solids=[])
+    flasher2.VF_TABLES = True
+    flasher2.VF_TABLES_PTS = 50
+    flasher2.VF_TABLES_CACHE_DIR = str(tmp_path)
+    def no_build():
+        raise AssertionError("Table should have been loaded")
+    flasher2.build_VF_table = no_build
+    assert_close1d(flasher2.VF_table().lnPs, table.lnPs, rtol=0)
+    assert_close(flasher2.flash(P=2e5, VF=0.3).T, refs[1].T, rtol=1e-9)
@@ -392,3 +392,112 @@ def test_flash_GibbsExcessLiquid_ideal_PsatPoynting():
     res = flasher.flash(T=15, P=1e5, zs=zs)
     assert res.phase_count == 1
     assert res.liquid_count == 1
+
+
+def test_flash_PH_PS_direct_vs_bisect():
+    constants = ChemicalConstantsPackage(Tcs=[190.56400000000002, 305.32, 126.2], Pcs=[4599000.0, 4872000.0, 3394387.5],
+                                         omegas=[0.008, 0.098, 0.04], MWs=[16.04246, 30.06904, 28.0134],
+                                         CASs=['74-82-8', '74-84-0', '7727-37-9'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7703235945157e-22, -2.496905487234175e-18, 3.141019468969792e-15, -8.82689677472949e-13, -1.3709202525543862e-09, 1.232839237674241e-06, -0.0002832018460361874, 0.022944239587055416, 32.67333514157593])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [-6.496329615255804e-23, 2.1505678500404716e-19, -2.2204849352453665e-16, 1.7454757436517406e-14, 9.796496485269412e-11, -4.7671178529502835e-08, 8.384926355629239e-06, -0.0005955479316119903, 29.114778709934264]))]
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+    kijs = [[0.0, -0.0059, 0.0289], [-0.0059, 0.0, 0.0533], [0.0289, 0.0533, 0.0]]
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas, 'kijs': kijs}
+    gas = CEOSGas(PRMIX, eos_kwargs=eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liquid = CEOSLiquid(PRMIX, eos_kwargs=eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liquid, gas=gas)
+    flasher_bisect = FlashVL(constants, correlations, liquid=liquid, gas=gas)
+    flasher_bisect.TPV_HSGUA_DIRECT = False
+    zs = [0.965, 0.018, 0.017]
+
+    # Liquid, two phase with both small and large vapor fractions, and gas
+    TP_flashes = []
+    def counted_flash_TP_stability_test(*args, **kwargs):
+        TP_flashes.append(args)
+        return FlashVL.flash_TP_stability_test(flasher, *args, **kwargs)
+    for T, P in [(95.0, 1e5), (110.0, 1e5), (125.0, 1e5), (160.0, 1e6), (200.0, 1e6), (175.0, 3e6)]:
+        PT = flasher.flash(T=T, P=P, zs=zs)
+        for spec in ('H', 'S'):
+            kwargs = {'P': P, 'zs': zs, spec: getattr(PT, spec)()}
+            # The direct solver works on the phases, without nested PT flashes
+            flasher.flash_TP_stability_test = counted_flash_TP_stability_test
+            try:
+                res = flasher.flash(**kwargs)
+            finally:
+                del flasher.flash_TP_stability_test
+            assert TP_flashes == []
+            res_bisect = flasher_bisect.flash(**kwargs)
+            assert_close(res.T, T, rtol=1e-6)
+            assert_close(res.T, res_bisect.T, rtol=1e-6)
+            assert res.phase_count == PT.phase_count
+            assert_close(res.VF, PT.VF, atol=1e-6)
+            assert_close(getattr(res, spec)(), kwargs[spec], rtol=1e-12)
+
+            # Two-phase solutions are finished with Newton's method, so they
+            # are in equilibrium to round-off; the PT flash which gave the
+            # spec converged only to PT_SS_TOL
+            if PT.phase_count == 2:
+                assert_close1d(res.liquid0.fugacities(), res.gas.fugacities(), rtol=1e-12)
+                assert_close(res.T, T, rtol=1e-8)
+            g, ls, _, betas, _ = flasher.solve_PT_HSGUA_direct(zs, P, kwargs[spec], spec=spec)
+            assert_close(ls[0].T, res.T, rtol=1e-13)
+            assert len(betas) == PT.phase_count
+
+    # A numerical failure of the direct solver falls back to the search over PT flashes
+    from thermo.flash import flash_vl
+    def zero_division(*args, **kwargs):
+        raise ZeroDivisionError("float division by zero")
+    T, P = 125.0, 1e5
+    H = flasher.flash(T=T, P=P, zs=zs).H()
+    res_bisect = flasher_bisect.flash(P=P, H=H, zs=zs)
+    direct_solver = flash_vl.sequential_substitution_2P_HSGUA_T
+    flash_vl.sequential_substitution_2P_HSGUA_T = zero_division
+    try:
+        with pytest.raises(ZeroDivisionError):
+            flasher.solve_PT_HSGUA_direct(zs, P, H, spec='H')
+        res = flasher.flash(P=P, H=H, zs=zs)
+    finally:
+        flash_vl.sequential_substitution_2P_HSGUA_T = direct_solver
+    assert res.phase_count == 2
+    assert_close(res.T, res_bisect.T, rtol=1e-13)
+    assert_close(res.VF, res_bisect.VF, rtol=1e-13)
+
+
+def test_saturation_curve_vs_point_flashes():
+    constants = ChemicalConstantsPackage(Tcs=[190.56400000000002, 305.32, 126.2], Pcs=[4599000.0, 4872000.0, 3394387.5],
+                                         omegas=[0.008, 0.098, 0.04], MWs=[16.04246, 30.06904, 28.0134],
+                                         CASs=['74-82-8', '74-84-0', '7727-37-9'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7703235945157e-22, -2.496905487234175e-18, 3.141019468969792e-15, -8.82689677472949e-13, -1.3709202525543862e-09, 1.232839237674241e-06, -0.0002832018460361874, 0.022944239587055416, 32.67333514157593])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [-6.496329615255804e-23, 2.1505678500404716e-19, -2.2204849352453665e-16, 1.7454757436517406e-14, 9.796496485269412e-11, -4.7671178529502835e-08, 8.384926355629239e-06, -0.0005955479316119903, 29.114778709934264]))]
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+    kijs = [[0.0, -0.0059, 0.0289], [-0.0059, 0.0, 0.0533], [0.0289, 0.0533, 0.0]]
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas, 'kijs': kijs}
+    gas = CEOSGas(PRMIX, eos_kwargs=eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liquid = CEOSLiquid(PRMIX, eos_kwargs=eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liquid, gas=gas)
+    zs = [0.965, 0.018, 0.017]
+
+    Ps = np.logspace(5, 6, 8).tolist()
+    Ts = np.linspace(110.0, 150.0, 8).tolist()
+    for VF in (0.0, 1.0):
+        values, xs, ys, iterations = flasher.saturation_curve(zs, VF, Ps=Ps)
+        for P, T, x, y in zip(Ps, values, xs, ys):
+            res = flasher.flash(P=P, VF=VF, zs=zs)
+            assert_close(T, res.T, rtol=1e-6)
+            # Both solvers stop with fugacities equal to ~1e-5, which is the
+            # resolution of the trace ethane in the incipient phase
+            assert_close1d(x, res.liquid0.zs, rtol=1e-4)
+            assert_close1d(y, res.gas.zs, rtol=1e-4)
+
+        values, xs, ys, iterations = flasher.saturation_curve(zs, VF, Ts=Ts)
+        for T, P in zip(Ts, values):
+            assert_close(P, flasher.flash(T=T, VF=VF, zs=zs).P, rtol=1e-6)
+        assert values.shape == (8,)
+        assert xs.shape == ys.shape == (8, 3)
+
+    with pytest.raises(ValueError):
+        flasher.saturation_curve(zs, 0.5, Ps=Ps)
+    with pytest.raises(ValueError):
+        flasher.saturation_curve(zs, 0.0, Ps=Ps, Ts=Ts)
@@ -156,6 +156,64 @@ def test_water_C1_C8():
 
 
 
+def test_water_C1_C8_double_check_2P_reuse():
+    T = 298.15
+    P = 101325.0
+    omegas = [0.344, 0.008, 0.394]
+    Tcs = [647.14, 190.564, 568.7]
+    Pcs = [22048320.0, 4599000.0, 2490000.0]
+    kijs=[[0,0, 0],[0,0, 0.0496], [0,0.0496,0]]
+    zs = [1.0/3.0]*3
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7703235945157e-22, -2.496905487234175e-18, 3.141019468969792e-15, -8.82689677472949e-13, -1.3709202525543862e-09, 1.232839237674241e-06, -0.0002832018460361874, 0.022944239587055416, 32.67333514157593])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.069661592422583e-22, -1.2992882995593864e-18, 8.808066659263286e-15, -2.1690080247294972e-11, 2.8519221306107026e-08, -2.187775092823544e-05, 0.009432620102532702, -1.5719488702446165, 217.60587499269303]))]
+    constants = ChemicalConstantsPackage(Tcs=Tcs, Pcs=Pcs, omegas=omegas, MWs=[18.01528, 16.04246, 114.22852],
+                                         CASs=['7732-18-5', '74-82-8', '111-65-9'])
+    properties = PropertyCorrelationsPackage(constants=constants, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = dict(Tcs=Tcs, Pcs=Pcs, omegas=omegas, kijs=kijs)
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases, T=T, P=P, zs=zs)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases, T=T, P=P, zs=zs)
+
+    flash_full = FlashVLN(constants, properties, liquids=[liq, liq], gas=gas)
+    flash_full.DOUBLE_CHECK_2P = True
+    flash_reuse = FlashVLN(constants, properties, liquids=[liq, liq], gas=gas)
+    flash_reuse.DOUBLE_CHECK_2P = True
+    flash_reuse.DOUBLE_CHECK_2P_REUSE = True
+
+    # A path from the three phase region through the two phase region and
+    # into the gas region
+    for T in linspace(300.0, 560.0, 14):
+        full = flash_full.flash(T=T, P=1e6, zs=zs)
+        reuse = flash_reuse.flash(T=T, P=1e6, zs=zs)
+        assert full.phase_count == reuse.phase_count
+        assert_close(full.G(), reuse.G(), rtol=1e-7)
+    # Keyed on composition and the temperature and pressure buckets
+    keys = list(flash_reuse.phase_split_cache.keys())
+    assert all(k[0] == tuple(zs) and k[2] == keys[0][2] for k in keys)
+    assert 1 < len(keys) < 14
+    assert flash_full.phase_split_cache == {}
+
+    # A cached split which is not stable at the current conditions fails the
+    # tangent plane check, so all phase pairs are searched
+    three_phase = flash_full.flash(T=300.0, P=1e6, zs=zs)
+    gas_only = flash_full.flash(T=560.0, P=1e6, zs=zs)
+    assert three_phase.phase_count == 3 and gas_only.phase_count == 1
+    res = flash_reuse.flash(T=300.0, P=1e6, zs=zs, hot_start=gas_only)
+    assert res.phase_count == 3
+    assert_close(res.G(), three_phase.G(), rtol=1e-7)
+
+    # Reference state provided by the user
+    hot = flash_full.flash(T=500.0, P=1e6, zs=zs)
+    res = flash_reuse.flash(T=501.0, P=1e6, zs=zs, hot_start=hot)
+    assert_close(res.G(), flash_full.flash(T=501.0, P=1e6, zs=zs).G(), rtol=1e-7)
+
+    # The cache is bounded
+    flash_reuse.DOUBLE_CHECK_2P_CACHE_SIZE = 2
+    for z0 in (0.2, 0.3, 0.4):
+        flash_reuse.flash(T=400.0, P=1e6, zs=normalize([z0, 0.5, 0.5]))
+    assert len(flash_reuse.phase_split_cache) == 2
+
+
 def test_C1_to_C5_water_gas():
     zs = normalize([.65, .13, .09, .05, .03, .03, .02, .003, 1e-6])
 #
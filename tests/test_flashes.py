@@ -455,6 +455,36 @@ def test_sequential_substitution_2P_ideal_conv_0iter():
     assert_close1d(liq.zs, xs, rtol=0, atol=0)
 
 
+def test_sequential_substitution_2P_HSGUA_T():
+    T, P, zs = 340.0, 2e6, [0.5, 0.5]
+    Tcs, Pcs, omegas = [305.32, 469.7], [4872000.0, 3370000.0], [0.098, 0.251]
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.537198394065234e-22, -4.946850205122326e-18, 1.4223747507170372e-14, -2.3451318313798008e-11, 2.4271676873997662e-08, -1.6055220805830093e-05, 0.006379734000450042, -1.0360272314628292, 141.84695243411866]))]
+    eos_kwargs = {'Pcs': Pcs, 'Tcs': Tcs, 'omegas': omegas}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases, T=T, P=P, zs=zs)
+    liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases, T=T, P=P, zs=zs)
+
+    # Reference two-phase point
+    VF, xs, ys, l, g, _, _ = sequential_substitution_2P(T, P, None, zs, xs_guess=[0.3, 0.7], ys_guess=[0.85, 0.15],
+                                                        liquid_phase=liquid, gas_phase=gas)
+    H = g.H()*VF + l.H()*(1.0 - VF)
+    S = g.S()*VF + l.S()*(1.0 - VF)
+
+    for spec, spec_val in (('H', H), ('S', S)):
+        sln = sequential_substitution_2P_HSGUA_T(T=320.0, P=P, zs=zs, xs_guess=[0.4, 0.6], ys_guess=[0.9, 0.1],
+                                                 liquid_phase=liquid, gas_phase=gas, spec_val=spec_val, spec=spec,
+                                                 V_over_F_guess=0.5, tol_spec=1e-12)
+        T_calc, VF_calc, xs_calc, ys_calc, l_calc, g_calc, iterations, err_eq, spec_err, spec_der = sln
+        assert_close(T_calc, T, rtol=1e-7)
+        assert spec_der > 0.0
+        assert_close(VF_calc, VF, rtol=1e-6)
+        assert_close1d(xs_calc, xs, rtol=1e-6)
+        assert_close1d(ys_calc, ys, rtol=1e-6)
+        assert err_eq < 1e-13
+        assert l_calc.T == g_calc.T == T_calc
+        assert iterations < 50
+
+
 def test_existence_3P_Michelsen_Mollerup_C1_C8_H2O():
     T = 298.15
     P = 101325.0
@@ -665,6 +665,24 @@ def test_HeatCapacityLiquidMixture():
         obj.test_method_validity(300.0, P=101325.0, zs=zs, ws=ws, method='BADMETHOD')
 
 
+def test_HeatCapacityLiquidMixture_many():
+    from thermo.heat_capacity import HeatCapacityLiquidMixture, LINEAR
+    MWs = [92.13842, 142.28168]
+    HeatCapacityLiquids = [HeatCapacityLiquid(CASRN="108-88-3", MW=92.13842, similarity_variable=0.16279853724428964, Tc=591.75, omega=0.257, extrapolation="linear", method="POLY_FIT", poly_fit=(162.0, 570.0, [7.171090290089724e-18, -1.8175720506858e-14, 1.9741936612209287e-11, -1.1980168324612502e-08, 4.438245228007343e-06, -0.0010295403891115538, 0.1475922271028815, -12.06203901868023, 565.3058820511594])),
+                           HeatCapacityLiquid(CASRN="124-18-5", MW=142.28168, similarity_variable=0.22490597524572384, Tc=611.7, omega=0.49, extrapolation="linear", method="POLY_FIT", poly_fit=(247.0, 462.4, [-1.0868671859366803e-16, 3.1665821629357415e-13, -4.003344986303024e-10, 2.8664283740244695e-07, -0.00012702231712595518, 0.03563345983140416, -6.170059527783799, 601.9757437895033, -25015.243163919513]))]
+    obj = HeatCapacityLiquidMixture(CASs=['108-88-3', '124-18-5'], HeatCapacityLiquids=HeatCapacityLiquids, MWs=MWs)
+
+    Ts = np.array([250.0, 300.0, 300.0, 300.0, 450.0])
+    Ps = np.array([101325.0, 101325.0, 1e6, 101325.0, 101325.0])
+    ws_2d = np.array([[.9, .1], [.9, .1], [.5, .5], [0.0, 1.0], [.2, .8]])
+    zs_2d = np.array([ws_to_zs(ws=ws, MWs=MWs) for ws in ws_2d.tolist()])
+    obj.method = LINEAR
+    assert LINEAR in obj.vectorized_methods
+    Cps_expect = [obj.calculate(T, P, zs, ws, LINEAR) for T, P, zs, ws in zip(Ts.tolist(), Ps.tolist(), zs_2d.tolist(), ws_2d.tolist())]
+    assert_close1d(obj.calculate_many(Ts, Ps, zs_2d, ws_2d, LINEAR), Cps_expect, rtol=1e-13)
+    assert_close1d(obj.mixture_property_many(Ts, Ps, zs_2d, ws_2d), Cps_expect, rtol=1e-13)
+
+
 @pytest.mark.meta_T_dept
 def test_HeatCapacityGas_polynomial_input_forms():
     obj_basic = HeatCapacityGas(quadratic_parameters={'WebBook': {'A': 1e-5, 'B': 2e-5, 'C': 4e-5,
@@ -283,3 +283,23 @@ def test_SurfaceTensionMixture():
     assert hash(obj) == hash0
     assert hash(obj2) == hash0
 
+
+def test_SurfaceTensionMixture_many():
+    # ['pentane', 'dichloromethane']
+    MWs = [72.14878, 84.93258]
+    VolumeLiquids = [VolumeLiquid(CASRN="109-66-0", MW=72.14878, Tb=309.21, Tc=469.7, Pc=3370000.0, Vc=0.000311, Zc=0.26837097540904814, omega=0.251, dipole=0.0, extrapolation="constant", method=POLY_FIT, poly_fit=(144, 459.7000000000001, [1.0839519373491257e-22, -2.420837244222272e-19, 2.318236501104612e-16, -1.241609625841306e-13, 4.0636406847721776e-11, -8.315431504053525e-09, 1.038485128954003e-06, -7.224842789857136e-05, 0.0022328080060137396])),
+     VolumeLiquid(CASRN="75-09-2", MW=84.93258, Tb=312.95, Tc=508.0, Pc=6350000.0, Vc=0.000177, Zc=0.26610258553203137, omega=0.2027, dipole=1.6, extrapolation="constant", method=POLY_FIT, poly_fit=(178.01, 484.5, [1.5991056738532454e-23, -3.92303910541969e-20, 4.1522438881104836e-17, -2.473595776587317e-14, 9.064684097377694e-12, -2.0911320815626796e-09, 2.9653069375266426e-07, -2.3580713574913447e-05, 0.0008567355308938564]))]
+    SurfaceTensions = [SurfaceTension(CASRN="109-66-0", MW=72.14878, Tb=309.21, Tc=469.7, Pc=3370000.0, Vc=0.000311, Zc=0.26837097540904814, omega=0.251, StielPolar=0.005164116344598568, Hvap_Tb=357736.5860890071, extrapolation=None, method=VDI_PPDS),
+                       SurfaceTension(CASRN="75-09-2", MW=84.93258, Tb=312.95, Tc=508.0, Pc=6350000.0, Vc=0.000177, Zc=0.26610258553203137, omega=0.2027, StielPolar=-0.027514125341022044, Hvap_Tb=333985.7240672881, extrapolation=None, method=VDI_PPDS)]
+    obj = SurfaceTensionMixture(MWs=MWs, Tbs=[309.21, 312.95], Tcs=[469.7, 508.0], correct_pressure_pure=False, CASs=['109-66-0', '75-09-2'], SurfaceTensions=SurfaceTensions, VolumeLiquids=VolumeLiquids)
+
+    Ts = np.array([200.0, 298.15, 298.15, 350.0, 420.0])
+    Ps = np.array([101325.0, 101325.0, 1e6, 101325.0, 2e6])
+    zs_2d = np.array([[.1606, .8394], [.1606, .8394], [.5, .5], [1.0, 0.0], [.9, .1]])
+    ws_2d = np.array([zs_to_ws(zs, MWs=MWs) for zs in zs_2d.tolist()])
+    for method in (WINTERFELDSCRIVENDAVIS, LINEAR):
+        assert method in obj.vectorized_methods
+        obj.method = method
+        sigmas_expect = [obj.calculate(T, P, zs, ws, method) for T, P, zs, ws in zip(Ts.tolist(), Ps.tolist(), zs_2d.tolist(), ws_2d.tolist())]
+        assert_close1d(obj.calculate_many(Ts, Ps, zs_2d, ws_2d, method), sigmas_expect, rtol=1e-13)
+        assert_close1d(obj.mixture_property_many(Ts, Ps, zs_2d, ws_2d), sigmas_expect, rtol=1e-13)
@@ -22,6 +22,7 @@ SOFTWARE.'''
 
 import os
 import pytest
+import numpy as np
 from fluids.numerics import assert_close, assert_close1d
 from thermo.joback import *
 from thermo.joback import J_BIGGS_JOBACK_SMARTS_id_dict
@@ -72,6 +73,62 @@ def test_Joback_acetone():
     assert res['mul_coeffs'] is None
 
 
+
+def test_Joback_estimate_many_counts():
+    from random import Random
+    rng = Random(0)
+    counts = [{1: 2, 24: 1}, {1: 1, 2: 1, 20: 1}, {13: 5, 14: 1, 38: 1}, {36: 1, 1: 1}]
+    for _ in range(50):
+        counts.append({rng.randint(1, 41): rng.randint(1, 4) for _ in range(rng.randint(1, 5))})
+    atom_counts = [rng.randint(3, 40) for _ in counts]
+    Tbs = [300.0 + i for i in range(len(counts))]
+
+    estimates = Joback.estimate_many(counts, atom_counts=atom_counts)
+    estimates_Tb = Joback.estimate_many(Joback.group_count_matrix(counts), atom_counts=atom_counts, Tbs=Tbs)
+    for i, c in enumerate(counts):
+        expect = {'Tb': Joback.Tb(c), 'Tm': Joback.Tm(c), 'Tc': Joback.Tc(c), 'Pc': Joback.Pc(c, atom_counts[i]),
+                  'Vc': Joback.Vc(c), 'Hf': Joback.Hf(c), 'Gf': Joback.Gf(c), 'Hfus': Joback.Hfus(c),
+                  'Hvap': Joback.Hvap(c), 'Cpig_coeffs': Joback.Cpig_coeffs(c), 'mul_coeffs': Joback.mul_coeffs(c)}
+        for k, v in expect.items():
+            calc = estimates[k][i]
+            if v is None:
+                assert np.all(np.isnan(calc))
+            else:
+                assert_close1d(np.atleast_1d(calc), np.atleast_1d(v), rtol=1e-13)
+        Tc = Joback.Tc(c, Tbs[i])
+        if Tc is None:
+            assert np.isnan(estimates_Tb['Tc'][i])
+        else:
+            assert_close(estimates_Tb['Tc'][i], Tc, rtol=1e-13)
+
+    # The nitro group has no viscosity contribution
+    assert np.all(np.isnan(estimates['mul_coeffs'][2]))
+    assert np.all(np.isnan(Joback.estimate_many(counts)['Pc']))
+    with pytest.raises(ValueError):
+        Joback.group_count_matrix([{42: 1}])
+
+@pytest.mark.rdkit
+@pytest.mark.skipif(rdkit is None, reason="requires rdkit")
+def test_Joback_fragment_many():
+    smiles = ['CC(=O)C', 'CCO', 'C1=CC=C(C=C1)[N+](=O)[O-]', 'CCC(=O)OC(=O)CC', 'not a smiles']
+    mols = smiles[:-1] + [Chem.MolFromSmiles('CCCC')]
+    for inputs in (smiles, mols):
+        counts, atom_counts, MWs, statuses = Joback.fragment_many(inputs)
+        counts_pool, atom_counts_pool, MWs_pool, statuses_pool = Joback.fragment_many(inputs, processes=2)
+        assert counts == counts_pool and atom_counts == atom_counts_pool
+        assert MWs == MWs_pool and statuses == statuses_pool
+        for i, mol in enumerate(inputs):
+            if mol == 'not a smiles':
+                assert counts[i] == {} and atom_counts[i] is None
+                assert statuses[i] == 'Failed to construct mol'
+                continue
+            J = Joback(mol)
+            assert counts[i] == J.counts
+            assert atom_counts[i] == J.atom_count
+            assert_close(MWs[i], J.MW)
+            assert statuses[i] == J.status
+
+
 @pytest.mark.fuzz
 @pytest.mark.slow
 @pytest.mark.rdkit
@@ -31,7 +31,7 @@ from random import random
 from thermo import *
 import numpy as np
 from fluids.numerics import jacobian, hessian, derivative, normalize, assert_close, assert_close1d, assert_close2d, linspace
-from thermo.test_utils import check_np_output_activity
+from thermo.test_utils import check_np_output_activity, check_many_output_activity
 import pickle
 
 
@@ -408,6 +408,33 @@ def test_NRTL_numpy_output():
     model_pickle = pickle.loads(pickle.dumps(model))
     assert model_pickle == model
 
+
+def test_NRTL_many_compositions():
+    alphas = [[[0.0, 2e-05], [0.2937, 7e-05], [0.2999, 0.0001]],
+     [[0.2937, 1e-05], [0.0, 4e-05], [0.3009, 8e-05]],
+     [[0.2999, 1e-05], [0.3009, 3e-05], [0.0, 5e-05]]]
+
+    taus = [[[6e-05, 0.0, 7e-05, 7e-05, 0.00788, 3.6e-07],
+      [3e-05, 624.868, 9e-05, 7e-05, 0.00472, 8.5e-07],
+      [3e-05, 398.953, 4e-05, 1e-05, 0.00279, 5.6e-07]],
+     [[1e-05, -29.167, 8e-05, 9e-05, 0.00256, 1e-07],
+      [2e-05, 0.0, 7e-05, 6e-05, 0.00587, 4.2e-07],
+      [0.0, -35.482, 8e-05, 4e-05, 0.00889, 8.2e-07]],
+     [[9e-05, -95.132, 6e-05, 1e-05, 0.00905, 5.2e-07],
+      [9e-05, 33.862, 2e-05, 6e-05, 0.00517, 1.4e-07],
+      [0.0001, 0.0, 6e-05, 2e-05, 0.00095, 7.4e-07]]]
+    T = 273.15+70
+    xs = [.2, .3, .5]
+    xs_matrix = [[.2, .3, .5], [.1, .1, .8], [.6, .3, .1], [1.0/3, 1.0/3, 1.0/3]]
+    model = NRTL(T, xs, taus, alphas)
+    modelnp = NRTL(T=T, xs=np.array(xs), tau_coeffs=np.array(taus), alpha_coeffs=np.array(alphas))
+    check_many_output_activity(model, modelnp, T, xs_matrix)
+    check_many_output_activity(model, modelnp, 350.0, xs_matrix)
+
+    gammas_many = model.gammas_many(T, xs_matrix)
+    assert_close1d(gammas_many[0], model.gammas(), rtol=1e-13)
+
+
 def test_NRTL_numpy_output_correct_array_internal_ownership():
     '''Without the array calls and the order bit, performance was probably bad
     and pypy gave a different object hash.'''
@@ -604,6 +631,43 @@ def test_NRTL_regression_basics():
     assert stats['MAE'] < 0.001
 
 
+def test_NRTL_regression_multistart_many(tmpdir):
+    import json
+    pts = 10
+    xs_points = [[xi, 1-xi] for xi in linspace(0.01, 0.99, pts)]
+    datasets = []
+    for chemgroups in ([{1: 1, 2: 1, 14: 1}, {16: 1}], [{16: 1}, {1: 2, 2: 4}]):
+        GE = UNIFAC.from_subgroups(T=298.15, xs=[.5, .5], chemgroups=chemgroups)
+        datasets.append(dict(gammas=[GE.to_T_xs(T=GE.T, xs=xs_points[i]).gammas() for i in range(pts)],
+                             xs=xs_points))
+
+    # water-hexane; the best hardcoded guess ends in a poor local minimum
+    res, stats = NRTL.regress_binary_parameters(symmetric_alphas=True, **datasets[1])
+    res_ms, stats_ms = NRTL.regress_binary_parameters(symmetric_alphas=True, multistart=30, **datasets[1])
+    assert stats['MAE'] > 0.5
+    assert stats_ms['MAE'] < 0.1
+    # Same seed, same answer
+    res_ms2, _ = NRTL.regress_binary_parameters(symmetric_alphas=True, multistart=30, **datasets[1])
+    assert res_ms == res_ms2
+
+    # Failed systems give None and are recorded in the file
+    datasets.append(dict(gammas=[[1.0, 1.0]]*pts, xs=xs_points[:-1]))
+    path = str(tmpdir.join('fits.jsonl'))
+    results = NRTL.regress_binary_parameters_many(datasets, path=path, multistart=30, symmetric_alphas=True)
+    assert results[0][0] == NRTL.regress_binary_parameters(symmetric_alphas=True, multistart=30, **datasets[0])[0]
+    assert results[1][0] == res_ms
+    assert results[2] is None
+
+    lines = [json.loads(l) for l in open(path)]
+    assert [l['index'] for l in lines] == [0, 1, 2]
+    assert lines[1]['parameters'] == res_ms
+    assert_close(lines[1]['MAE'], stats_ms['MAE'])
+    assert 'error' in lines[2]
+
+    results_pool = NRTL.regress_binary_parameters_many(datasets, processes=2, multistart=30, symmetric_alphas=True)
+    assert [r[0] for r in results_pool[:2]] == [r[0] for r in results[:2]]
+    assert results_pool[2] is None
+
 def test_NRTL_one_component():
     GE = NRTL(T=350.0, xs=[1.0], ABEFGHCD=([[0.0]], [[0.0]], [[0.0]], [[0.0]], [[0.0]], [[0.0]], [[0.0]], [[0.0]]))
     for s in GE._point_properties:
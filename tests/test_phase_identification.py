@@ -206,3 +206,75 @@ def test_sort_phases_liquids():
                            water_sort=WATER_NOT_SPECIAL)
     liquids, _ = sort_phases(liquids=[liq0, liq1], solids=[], constants=constants, settings=settings)
     assert_close(liquids[1].zs[1], 0.9989622883894993)
+
+
+def test_phase_identification_plan_matches_identity_sort():
+    from itertools import permutations
+    from thermo.phase_identification import (PROP_SORT, DENSITY_MASS, DENSITY, ISOTHERMAL_COMPRESSIBILITY,
+                                             HEAT_CAPACITY, phase_identification_plan)
+    constants = ChemicalConstantsPackage(Tcs=[563.0, 647.14, 514.0], Vcs=[0.000274, 5.6e-05, 0.000168], Pcs=[4414000.0, 22048320.0, 6137000.0], omegas=[0.59, 0.344, 0.635], MWs=[74.1216, 18.01528, 46.06844], CASs=['71-36-3', '7732-18-5', '64-17-5'])
+    properties = PropertyCorrelationsPackage(constants=constants, skip_missing=True,
+                                             HeatCapacityGases=[HeatCapacityGas(load_data=False, poly_fit=(50.0, 1000.0, [-3.787200194613107e-20, 1.7692887427654656e-16, -3.445247207129205e-13, 3.612771874320634e-10, -2.1953250181084466e-07, 7.707135849197655e-05, -0.014658388538054169, 1.5642629364740657, -7.614560475001724])),
+                                             HeatCapacityGas(load_data=False, poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759])),
+                                             HeatCapacityGas(load_data=False, poly_fit=(50.0, 1000.0, [-1.162767978165682e-20, 5.4975285700787494e-17, -1.0861242757337942e-13, 1.1582703354362728e-10, -7.160627710867427e-08, 2.5392014654765875e-05, -0.004732593693568646, 0.5072291035198603, 20.037826650765965])),], )
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    gas = CEOSGas(SRKMIX, eos_kwargs, HeatCapacityGases=properties.HeatCapacityGases)
+    liq = CEOSLiquid(SRKMIX, eos_kwargs, HeatCapacityGases=properties.HeatCapacityGases)
+    T, P = 361, 1e5
+    gas = gas.to(T=T, P=P, zs=[0.2384009970908655, 0.5786839935180925, 0.1829150093910419])
+    liq0 = liq.to(T=T, P=P, zs=[7.619975052238032e-05, 0.9989622883894993, 0.0009615118599781474])
+    liq1 = liq.to(T=T, P=P, zs=[0.6793120076703771, 0.19699746328631124, 0.12369052904331178])
+    beta_map = {id(gas): 0.027939322463018015, id(liq0): 0.6139152961492583, id(liq1): 0.35814538138772367}
+
+    # Results must be identical to identifying and then sorting the phases
+    for m in VL_ID_METHODS:
+        for prop in (DENSITY_MASS, DENSITY, ISOTHERMAL_COMPRESSIBILITY, HEAT_CAPACITY):
+            for higher_first in (True, False):
+                for water_sort in (WATER_FIRST, WATER_LAST, WATER_NOT_SPECIAL):
+                    settings = BulkSettings(VL_ID=m, liquid_sort_method=PROP_SORT, liquid_sort_prop=prop,
+                                            phase_sort_higher_first=higher_first, water_sort=water_sort)
+                    for skip_solids in (True, False):
+                        for phases in [[gas, liq0], [liq1, gas]] + list(permutations([gas, liq0, liq1])):
+                            phases = list(phases)
+                            betas = [beta_map[id(p)] for p in phases]
+                            g, ls, ss, new_betas = identify_sort_phases(phases, betas, constants, properties,
+                                                                        settings=settings, skip_solids=skip_solids)
+                            g_ref, ls_ref, ss_ref = identity_phase_states(phases, constants, properties, VL_method=m,
+                                                                          skip_solids=skip_solids)
+                            ls_ref, ss_ref = sort_phases(ls_ref, ss_ref, constants, settings)
+                            assert g is g_ref
+                            assert len(ls) == len(ls_ref) and all(a is b for a, b in zip(ls, ls_ref))
+                            assert ss == ss_ref == []
+                            betas_ref = [beta_map[id(p)] for p in ([g_ref] if g_ref is not None else []) + ls_ref]
+                            assert new_betas == betas_ref
+
+    # Forced phases are not scored
+    liq_forced = liq1.to(T=T, P=P, zs=liq1.zs)
+    liq_forced.force_phase = 'l'
+    gas_forced = gas.to(T=T, P=P, zs=gas.zs)
+    gas_forced.force_phase = 'g'
+    settings = BulkSettings()
+    g, ls, ss, betas = identify_sort_phases([liq_forced, gas_forced], [0.4, 0.6], constants, properties,
+                                            settings=settings, skip_solids=True)
+    assert g is gas_forced and ls[0] is liq_forced
+    assert betas == [0.6, 0.4]
+
+    # Phase fractions are optional
+    for phases in ([liq0, gas], [liq1, gas, liq0]):
+        g, ls, ss, betas = identify_sort_phases(phases, None, constants, properties,
+                                                settings=BulkSettings(VL_ID=VL_ID_PIP), skip_solids=True)
+        assert g is gas and betas is None
+        assert len(ls) == len(phases) - 1
+
+    # Plans are reused and follow changes to the settings
+    settings = BulkSettings(VL_ID=VL_ID_PIP)
+    plan = phase_identification_plan(constants, settings, skip_solids=True)
+    assert plan is phase_identification_plan(constants, settings, skip_solids=True)
+    assert plan is not phase_identification_plan(constants, settings, skip_solids=False)
+    settings.VL_ID = VL_ID_WILSON
+    plan_Wilson = phase_identification_plan(constants, settings, skip_solids=True)
+    assert plan_Wilson is not plan
+    assert plan_Wilson.VL_method == VL_ID_WILSON
+
+    with pytest.raises(ValueError):
+        phase_identification_plan(constants, BulkSettings(VL_ID='bad method'))
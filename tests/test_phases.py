@@ -906,6 +906,70 @@ def test_GibbsExcessLiquid_at_methods():
     assert_close1d(liq2.dphis_dT(), liquid.dphis_dT_at(285.5, 1e4, [0.2, 0.0, 0.8]), rtol=1e-12)
 
 
+def test_GibbsExcessLiquid_many_methods():
+    import numpy as np
+    constants = ChemicalConstantsPackage(Tcs=[508.1, 536.2, 512.5], Pcs=[4700000.0, 5330000.0, 8084000.0], omegas=[0.309, 0.21600000000000003, 0.5589999999999999],
+                                         MWs=[58.07914, 119.37764000000001, 32.04186], CASs=['67-64-1', '67-66-3', '67-56-1'], names=['acetone', 'chloroform', 'methanol'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.3320002425347943e-21, 6.4063345232664645e-18, -1.251025808150141e-14, 1.2265314167534311e-11, -5.535306305509636e-09, -4.32538332013644e-08, 0.0010438724775716248, -0.19650919978971002, 63.84239495676709])),
+     HeatCapacityGas(poly_fit=(200.0, 1000.0, [1.5389278550737367e-21, -8.289631533963465e-18, 1.9149760160518977e-14, -2.470836671137373e-11, 1.9355882067011222e-08, -9.265600540761629e-06, 0.0024825718663005762, -0.21617464276832307, 48.149539665907696])),
+     HeatCapacityGas(poly_fit=(50.0, 1000.0, [2.3511458696647882e-21, -9.223721411371584e-18, 1.3574178156001128e-14, -8.311274917169928e-12, 4.601738891380102e-10, 1.78316202142183e-06, -0.0007052056417063217, 0.13263597297874355, 28.44324970462924]))]
+    VolumeLiquids = [VolumeLiquid(poly_fit=(178.51, 498.1, [6.564241965071999e-23, -1.6568522275506375e-19, 1.800261692081815e-16, -1.0988731296761538e-13, 4.118691518070104e-11, -9.701938804617744e-09, 1.4022905458596618e-06, -0.00011362923883050033, 0.0040109650220160956])),
+                    VolumeLiquid(poly_fit=(209.63, 509.5799999999999, [2.034047306563089e-23, -5.45567626310959e-20, 6.331811062990084e-17, -4.149759318710192e-14, 1.6788970104955462e-11, -4.291900093120011e-09, 6.769385838271721e-07, -6.0166473220815445e-05, 0.0023740769479069054])),
+                    VolumeLiquid(poly_fit=(175.7, 502.5, [3.5725079384600736e-23, -9.031033742820083e-20, 9.819637959370411e-17, -5.993173551565636e-14, 2.2442465416964825e-11, -5.27776114586072e-09, 7.610461006178106e-07, -6.148574498547711e-05, 0.00216398089328537])),]
+    VaporPressures = [VaporPressure(exp_poly_fit=(178.51, 508.09000000000003, [-1.3233111115238975e-19, 4.2217134794609376e-16, -5.861832547132719e-13, 4.6488594950801467e-10, -2.3199079844570237e-07, 7.548290741523459e-05, -0.015966705328994194, 2.093003523977292, -125.39006100979816])),
+                      VaporPressure(extrapolation='DIPPR101_ABC|AntoineAB', exp_poly_fit=(207.15, 536.4, [-8.714046553871422e-20, 2.910491615051279e-16, -4.2588796020294357e-13, 3.580003116042944e-10, -1.902612144361103e-07, 6.614096470077095e-05, -0.01494801055978542, 2.079082613726621, -130.24643185169472])),
+                      VaporPressure(exp_poly_fit=(175.7, 512.49, [-1.446088049406911e-19, 4.565038519454878e-16, -6.278051259204248e-13, 4.935674274379539e-10, -2.443464113936029e-07, 7.893819658700523e-05, -0.016615779444332356, 2.1842496316772264, -134.19766175812708]))]
+    eoss = [PR(Tc=constants.Tcs[i], Pc=constants.Pcs[i], omega=constants.omegas[i], T=300, P=1e5) for i in range(3)]
+    liquid = GibbsExcessLiquid(VaporPressures=VaporPressures, VolumeLiquids=VolumeLiquids,
+                 HeatCapacityGases=HeatCapacityGases, use_Poynting=True,
+                 eos_pure_instances=eoss, use_phis_sat=True, T=300.0, P=1e5, zs=[0.2, 0.3, 0.5])
+
+    # Low and high extrapolation of every correlation, and overflow of Psat
+    Ts = [5.0, 100.0, 178.51, 250.0, 285.5, 350.0, 508.09000000000003, 520.0, 700.0, 5000.0]
+    Ps = [1e3*(i + 1) for i in range(len(Ts))]
+    Psats = liquid.Psats_many(Ts)
+    Vms_sat = liquid.Vms_sat_many(Ts)
+    Poyntings = liquid.Poyntings_many(Ts, Ps)
+    Ts_phis = [100.0, 250.0, 285.5, 285.5, 350.0, 520.0, 700.0]
+    phis_sat = liquid.phis_sat_many(Ts_phis)
+    for i, (T, P) in enumerate(zip(Ts, Ps)):
+        liq2 = liquid.to(T=T, P=P, zs=[0.2, 0.3, 0.5])
+        assert Psats[i].tolist() == liq2.Psats()
+        assert Vms_sat[i].tolist() == liq2.Vms_sat()
+        assert Poyntings[i].tolist() == liq2.Poyntings()
+    for i, T in enumerate(Ts_phis):
+        assert phis_sat[i].tolist() == liquid.to(T=T, P=1e5, zs=[0.2, 0.3, 0.5]).phis_sat()
+    assert Psats.shape == Vms_sat.shape == Poyntings.shape == (10, 3)
+
+    # Henry's law constants of acetone in chloroform and methanol, weighted by
+    # the critical volumes of the solvents
+    henry_data = [[None, [10.0, -2000.0, 0.5, 1e-3, 1e4], [12.0, -2500.0, 0.2, 0.0, 0.0]], None, None]
+    with pytest.raises(ValueError):
+        GibbsExcessLiquid(VaporPressures=VaporPressures, henry_components=[True, False, False], henry_data=henry_data)
+    Vcs = [0.000209, 0.000239, 0.000118]
+    liquid_henry = GibbsExcessLiquid(VaporPressures=VaporPressures, VolumeLiquids=VolumeLiquids,
+                                     HeatCapacityGases=HeatCapacityGases, henry_components=[True, False, False],
+                                     henry_data=henry_data, henry_Vcs=Vcs, T=300.0, P=1e5, zs=[0.2, 0.3, 0.5])
+    Ts = [250.0, 300.0, 350.0]
+    Psats = liquid_henry.Psats_many(Ts)
+    for i, T in enumerate(Ts):
+        liq2 = liquid_henry.to(T=T, P=1e5, zs=[0.2, 0.3, 0.5])
+        assert_close1d(Psats[i].tolist(), liq2.Psats(), rtol=1e-14)
+    logH = (0.3*Vcs[1]**(2.0/3.0)*(10.0 - 2000.0/300.0 + 0.5*log(300.0) + 0.3 + 1e4/300.0**2)
+            + 0.5*Vcs[2]**(2.0/3.0)*(12.0 - 2500.0/300.0 + 0.2*log(300.0)))/(0.3*Vcs[1]**(2.0/3.0) + 0.5*Vcs[2]**(2.0/3.0))
+    assert_close(Psats[1][0], exp(logH)*1e5, rtol=1e-13)
+
+    # Polynomial-fit kernel including both extrapolation branches
+    Psats_data = [[178.51, 207.15], None, None, [508.09, 536.4], None, None,
+                  [VaporPressures[0].exp_poly_fit_coeffs, VaporPressures[1].exp_poly_fit_coeffs], None, None,
+                  [[30.0, -4000.0, -1.5], [25.0, -3500.0, -1.0]], [[400.0, -20000.0, 60.0], [21.0, -3000.0, 0.1]]]
+    Ts = [10.0, 200.0, 300.0, 520.0, 1e4, 1e6]
+    Psats = GibbsExcessLiquid._Psats_many_poly_fit(np.array(Ts), Psats_data, 2)
+    for i, T in enumerate(Ts):
+        assert Psats[i].tolist() == GibbsExcessLiquid._Psats_at_poly_fit(T, Psats_data, range(2))
+    assert Psats[-1][0] == 1.6549840276802644e+300
+
+
 def test_GibbsExcessLiquid_hashing_and_serialization():
     # water-ethanol
     T = 400.0
@@ -2767,6 +2831,202 @@ def test_DryAirLemmon():
     assert_close(g0.mu()*1e6, 17.7623, atol=.00005)
 
 
+def test_HelmholtzEOS_fused_Ar_derivatives():
+    from thermo.phases.iapws_phase import iapws95_Ar_derivatives
+    # IAPWS-95 verification values for the residual part, 500 K/838.025 kg/m^3 and 647 K/358 kg/m^3
+    assert_close1d(iapws95_Ar_derivatives(647.096/500.0, 838.025/322.0),
+                   [-3.42693206, -0.364366650, 0.856063701, -5.81403435, -2.23440737, -1.12176915], rtol=1e-8)
+    assert_close1d(iapws95_Ar_derivatives(647.096/647.0, 358.0/322.0),
+                   [-1.21202657, -0.714012024, 0.475730696, -3.21722501, -9.96029507, -1.33214720], rtol=1e-8)
+
+    names = ['_Ar_func', '_dAr_ddelta_func', '_d2Ar_ddelta2_func', '_dAr_dtau_func', '_d2Ar_dtau2_func', '_d2Ar_ddeltadtau_func']
+    phases = [IAPWS95Liquid(T=300.0, P=1e5, zs=[1]), IAPWS95Gas(T=800.0, P=1e5, zs=[1]),
+              IAPWS95(T=640.0, P=2.2e7, zs=[1]), IAPWS95(T=1000.0, P=1e9, zs=[1])]
+    phases += [DryAirLemmon(T=T, P=P) for T, P in [(300.0, 1e5), (140.0, 1e7), (133.0, 3e7), (2000.0, 2e9), (1000.0, 1e3)]]
+    for phase in phases:
+        unfused = copy(phase)
+        unfused._Ar_derivatives_func = None
+        assert_close(phase.V(), unfused.V(), rtol=0.0)
+
+        # A and its first derivatives come from their own functions
+        lazy = copy(phase)
+        first = [lazy.A(), lazy.dA_ddelta(), lazy.dA_dtau()]
+        assert not hasattr(lazy, '_d2A_dtau2')
+        # Any second derivative calculates all of them, keeping the values
+        # already returned
+        lazy.d2A_ddeltadtau()
+        assert hasattr(lazy, '_d2A_dtau2') and hasattr(lazy, '_d2A_ddelta2')
+        assert [lazy.A(), lazy.dA_ddelta(), lazy.dA_dtau()] == first
+
+        fused = phase._Ar_derivatives_func(phase.tau, phase.delta)
+        separate = [getattr(phase, name)(phase.tau, phase.delta) for name in names]
+        assert_close1d(fused, separate, rtol=1e-11)
+        assert_close1d([phase.d2A_ddelta2(), phase.d2A_dtau2(), phase.d2A_ddeltadtau()],
+                       [fused[2] - 1.0/phase.delta**2, phase.d2A0_dtau2 + fused[4], fused[5]], rtol=1e-12)
+
+        for prop in ('A', 'Cp', 'Cv', 'H', 'S', 'speed_of_sound', 'Joule_Thomson', 'dP_dV'):
+            assert_close(getattr(phase, prop)(), getattr(unfused, prop)(), rtol=1e-11)
+        # ln(Z) turns a round-off of ~1e-13 in delta*dAr_ddelta into an
+        # absolute error of ~1e-13/Z
+        Z = phase.P*phase.V()/(phase.R*phase.T)
+        assert_close1d(phase.lnphis(), unfused.lnphis(), rtol=1e-11, atol=1e-13/Z)
+
+        # T-V states calculate the derivatives only when first needed
+        TV = phase.to(T=phase.T, V=phase.V(), zs=[1])
+        assert not hasattr(TV, '_d2A_ddelta2')
+        assert_close(TV.P, phase.P, rtol=1e-9)
+        assert_close(TV.Cp(), phase.Cp(), rtol=1e-9)
+
+
+def test_HumidAirPsychrometrics_vs_HumidAirRP1485():
+    import numpy as np
+    from chemicals.iapws import iapws95_rhol_sat
+    psy = humid_air_psychrometrics()
+    Ts = np.array([250.0, 273.15, 293.15, 313.15, 330.0])
+    Ps = np.array([9e4, 101325.0, 101325.0, 2e5, 101325.0])
+    psi_ws = np.array([5e-4, 4e-3, 0.012, 0.02, 0.1])
+
+    Vs, Hs = psy.V(Ts, Ps, psi_ws), psy.H(Ts, Ps, psi_ws)
+    Bs, Cs, dBs_dT, dCs_dT = psy.virial_coefficients(Ts, psi_ws)
+    for i in range(len(Ts)):
+        phase = HumidAirRP1485(T=Ts[i], P=Ps[i], zs=[1.0 - psi_ws[i], psi_ws[i]])
+        assert_close(Bs[i], phase.B(), rtol=1e-14)
+        assert_close(Cs[i], phase.C(), rtol=1e-14)
+        assert_close(dBs_dT[i], phase.dB_dT(), rtol=1e-14)
+        assert_close(dCs_dT[i], phase.dC_dT(), rtol=1e-14)
+        assert_close(Vs[i], phase.V(), rtol=1e-13)
+        assert_close(Hs[i], phase.H(), rtol=1e-13)
+
+    # Interpolated temperature-only quantities; they agree with the exact
+    # correlations to ~1e-13 rather than to round-off, by design
+    tabled = HumidAirPsychrometrics(exact_max_Ts=0)
+    assert_close1d(tabled.T_properties_array(Ts)[:14].ravel(),
+                   psy.T_properties_array(Ts)[:14].ravel(), rtol=1e-12)
+    assert_close1d(tabled.H(Ts, Ps, psi_ws), Hs, rtol=1e-11)
+    assert_close1d(tabled.V(Ts, Ps, psi_ws), Vs, rtol=1e-12)
+
+    # Broadcasting
+    assert psy.H(Ts[:, None], 101325.0, psi_ws[None, :]).shape == (5, 5)
+
+    psi_ws_sat, fs = psy.saturation(Ts, Ps)
+    assert np.all(fs > 1.0) and np.all(fs < 1.01)
+    # Boiling water
+    assert psy.saturation(373.15, 101325.0)[0] == 1.0
+    assert_close(psy.humidity_ratio(0.02), 0.02*IAPWS95._MW/(0.98*DryAirLemmon._MW), rtol=1e-15)
+
+    # Dew points are saturated at the given water content
+    T_dews = psy.dew_point(Ps, 0.5*psi_ws_sat)
+    assert_close1d(psy.saturation(T_dews, Ps)[0], 0.5*psi_ws_sat, rtol=1e-11)
+    assert np.isnan(psy.dew_point(101325.0, 0.0))
+
+    # Wet bulb temperatures close the adiabatic saturation energy balance
+    T_wbs = psy.wet_bulb(Ts[2:], Ps[2:], 0.5*psi_ws_sat[2:])
+    assert np.all(T_wbs < Ts[2:]) and np.all(T_wbs > T_dews[2:])
+    for T, P, psi_w, T_wb in zip(Ts[2:], Ps[2:], 0.5*psi_ws_sat[2:], T_wbs):
+        psi_w_wb = psy.saturation(T_wb, P)[0]
+        V_l = rho_to_Vm(iapws95_rhol_sat(T_wb), IAPWS95._MW)
+        h_l = IAPWS95Liquid(T=T_wb, P=P, zs=[1.0]).to(T=T_wb, V=V_l, zs=[1.0]).H()
+        h_in = HumidAirRP1485(T=T, P=P, zs=[1.0 - psi_w, psi_w]).H()/(1.0 - psi_w)
+        h_out = HumidAirRP1485(T=T_wb, P=P, zs=[1.0 - psi_w_wb, psi_w_wb]).H()/(1.0 - psi_w_wb)
+        added = (psi_w_wb/(1.0 - psi_w_wb) - psi_w/(1.0 - psi_w))*h_l
+        assert_close(h_out, h_in + added, rtol=1e-10)
+    assert_close1d(psy.wet_bulb(Ts[2:], Ps[2:], psi_ws_sat[2:]), Ts[2:], rtol=1e-15)
+
+
+def test_HumidAirRP1485_V_H():
+    from thermo.phases.virial_phase import Z_from_virial_density_form
+    R = HumidAirRP1485.R
+    # Where the density-form root is the gas root, the volume is unchanged
+    for T, P, psi_w in [(250.0, 9e4, 5e-4), (293.15, 101325.0, 0.01), (313.15, 2e5, 0.03)]:
+        gas = HumidAirRP1485(T=T, P=P, zs=[1.0 - psi_w, psi_w])
+        assert_close(gas.V(), Z_from_virial_density_form(T, P, gas.B(), gas.C())*R*T/P, rtol=1e-13)
+    # Near saturation C is negative and the closed form returns a negative
+    # compressibility; the gas root is returned instead
+    for T, psi_w in [(330.0, 0.1), (350.0, 0.3), (373.15, 0.9)]:
+        gas = HumidAirRP1485(T=T, P=101325.0, zs=[1.0 - psi_w, psi_w])
+        B, C, V = gas.B(), gas.C(), gas.V()
+        assert Z_from_virial_density_form(T, 101325.0, B, C) < 0.0
+        assert 0.98 < gas.Z() < 1.0
+        assert_close(101325.0*V/(R*T), 1.0 + B/V + C/(V*V), rtol=1e-14)
+
+    T, P, zs = 320.0, 2e5, [0.9, 0.1]
+    gas = HumidAirRP1485(T=T, P=P, zs=zs)
+    assert_close(gas.dB_dT(), derivative(lambda T: HumidAirRP1485(T=T, P=P, zs=zs).B(), T, dx=T*1e-5, order=5), rtol=1e-8)
+    assert_close(gas.dC_dT(), derivative(lambda T: HumidAirRP1485(T=T, P=P, zs=zs).C(), T, dx=T*1e-5, order=5), rtol=1e-8)
+
+    # Departure enthalpy from the fugacities; H = -RT^2 d(sum zi ln phi_i)/dT
+    lnphi = lambda T: sum(z*lnphi for z, lnphi in zip(zs, HumidAirRP1485(T=T, P=P, zs=zs).lnphis()))
+    assert gas.H_dep() < 0.0
+    assert_close(gas.H_dep(), -R*T*T*derivative(lnphi, T, dx=T*1e-4, order=5), rtol=1e-9)
+    # Pure component limits at low pressure
+    assert_close(HumidAirRP1485(T=300.0, P=1e3, zs=[1.0, 0.0]).H(), DryAirLemmon(T=300.0, P=1e3).H(), rtol=1e-9)
+    assert_close(HumidAirRP1485(T=300.0, P=1e5, zs=[1.0, 0.0]).H(), DryAirLemmon(T=300.0, P=1e5).H(), rtol=1e-7)
+    assert_close(HumidAirRP1485(T=300.0, P=1e3, zs=[0.0, 1.0]).H(), IAPWS95Gas(T=300.0, P=1e3).H(), rtol=1e-5)
+
+
+def test_VirialGas_coefficient_cache_lnphis():
+    from chemicals.virial import BVirial_Pitzer_Curl
+    from thermo.phases.virial_phase import _virial_coefficients_cache
+    from thermo.flash import FlashVL
+    Tcs, Pcs, omegas = [647.14, 563.1], [22048320.0, 4414000.0], [0.344, 0.59]
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [-3.787200194613107e-20, 1.7692887427654656e-16, -3.445247207129205e-13, 3.612771874320634e-10, -2.1953250181084466e-07, 7.707135849197655e-05, -0.014658388538054169, 1.5642629364740657, -7.614560475001724]))]
+    model = VirialCorrelationsPitzerCurl(Tcs, Pcs, omegas)
+    T, P, zs = 365.0, 1e5, [0.8, 0.2]
+    gas = VirialGas(model, HeatCapacityGases=HeatCapacityGases, T=T, P=P, zs=zs)
+    Bs = [BVirial_Pitzer_Curl(T, Tcs[i], Pcs[i], omegas[i]) for i in range(2)]
+    assert_close(gas.B(), zs[0]*Bs[0] + zs[1]*Bs[1], rtol=1e-13)
+    assert_close2d(model.B_matrix(T), [[Bs[0], 0.0], [0.0, Bs[1]]], rtol=1e-13)
+    with pytest.raises(ValueError):
+        model.B_matrix(T)[0][0] = 0.0
+
+    # Copies at the same temperature share the matrices
+    new = gas.to(T=T, P=2e5, zs=[0.3, 0.7])
+    new.B(), new.dB_dT(), new.C()
+    assert model.B_matrix(T) is model.B_matrix(T)
+    assert (model._cache_hash, T) in _virial_coefficients_cache
+    assert_close(new.dB_dT(), 0.3*model.dB_dT_matrix(T)[0][0] + 0.7*model.dB_dT_matrix(T)[1][1], rtol=1e-13)
+
+    # Cross coefficients and the lnphis against numerical composition derivatives
+    class CrossModel(VirialCorrelationsPitzerCurl):
+        def B_interactions(self, T):
+            B = self.B_pures(T)
+            return [[0.0, 0.6*(B[0] + B[1])], [0.6*(B[0] + B[1]), 0.0]]
+    gas = VirialGas(CrossModel(Tcs, Pcs, omegas), HeatCapacityGases=HeatCapacityGases, T=T, P=P, zs=zs)
+    def nG_res(ns):
+        n = sum(ns)
+        phase = gas.to_TP_zs(T=T, P=P, zs=[ni/n for ni in ns])
+        return n*(2.0*phase.B()/phase.V() - log(phase.Z()))
+    for i in range(2):
+        dnG_res = derivative(lambda ni: nG_res([ni if j == i else zs[j] for j in range(2)]), zs[i], dx=1e-6)
+        assert_close(gas.lnphis()[i], dnG_res, rtol=1e-7)
+
+    # Usable in a flash
+    constants = ChemicalConstantsPackage(Tcs=Tcs, Pcs=Pcs, omegas=omegas, MWs=[18.01528, 74.1216],
+                                         CASs=['7732-18-5', '71-36-3'], names=['water', '1-butanol'])
+    VaporPressures = [VaporPressure(exp_poly_fit=(273.17, 647.086, [-2.8478502840358144e-21, 1.7295186670575222e-17, -4.034229148562168e-14, 5.0588958391215855e-11, -3.861625996277003e-08, 1.886271475957639e-05, -0.005928371869421494, 1.1494956887882308, -96.74302379151317])),
+                      VaporPressure(exp_poly_fit=(183.85, 563.1, [-1.369963570009104e-19, 4.601627231730426e-16, -6.744785620228449e-13, 5.655784279629317e-10, -2.986123576859473e-07, 0.00010278182137225028, -0.022995143239892296, 3.186560947413634, -210.12716900412732]))]
+    correlations = PropertyCorrelationsPackage(constants, VaporPressures=VaporPressures,
+                                               HeatCapacityGases=HeatCapacityGases, skip_missing=True)
+    liquid = GibbsExcessLiquid(VaporPressures=VaporPressures, HeatCapacityGases=HeatCapacityGases, T=T, P=P, zs=zs)
+    flasher = FlashVL(constants, correlations, liquid=liquid, gas=VirialGas(model, HeatCapacityGases=HeatCapacityGases, T=T, P=P, zs=zs))
+    res = flasher.flash(T=T, P=6.5e4, zs=zs)
+    assert 0.0 < res.VF < 1.0
+    assert_close1d(res.gas.fugacities(), res.liquid0.fugacities(), rtol=1e-7)
+
+def test_HumidAirRP1485_lnphis():
+    T, P, zs = 320.0, 2e5, [0.9, 0.1]
+    gas = HumidAirRP1485(T=T, P=P, zs=zs)
+    def nG_res(ns):
+        n = sum(ns)
+        phase = HumidAirRP1485(T=T, P=P, zs=[ni/n for ni in ns])
+        V = phase.V()
+        return n*(2.0*phase.B()/V + 1.5*phase.C()/(V*V) - log(phase.Z()))
+    lnphis = gas.lnphis()
+    for i in range(2):
+        dnG_res = derivative(lambda ni: nG_res([ni if j == i else zs[j] for j in range(2)]), zs[i], dx=1e-4, order=5)
+        assert_close(lnphis[i], dnG_res, rtol=1e-9)
+
 def test_lnphis_at_zs_eos_mix():
     # Acetone, chloroform, methanol
     T, P, zs = 331.42, 90923,  [0.229, 0.175, 0.596]
@@ -29,7 +29,7 @@ import numpy as np
 from fluids.numerics import jacobian, hessian, assert_close, assert_close1d, assert_close2d, assert_close3d
 from random import random
 from chemicals import normalize
-from thermo.test_utils import check_np_output_activity
+from thermo.test_utils import check_np_output_activity, check_many_output_activity
 import pickle
 
 def test_no_interactions():
@@ -212,6 +212,24 @@ def test_numpy_inputs():
     assert modelnp_pickle == modelnp
     model_pickle = pickle.loads(pickle.dumps(model))
     assert model_pickle == model
+
+
+def test_regular_solution_many_compositions():
+    xs = [.4, .3, .2, .1]
+    SPs = [19570.2, 18864.7, 29261.4, 47863.5]
+    Vs = [7.421e-05, 8.068e-05, 4.083e-05, 1.808e-05]
+    T = 300.0
+    lambda_coeffs = [[0.0, 0.01811, 0.01736, 0.02111],
+     [0.00662, 0.0, 0.00774, 0.01966],
+     [0.01601, 0.01022, 0.0, 0.00698],
+     [0.0152, 0.00544, 0.02579, 0.0]]
+    xs_matrix = [xs, [.1, .2, .3, .4], [.25, .25, .25, .25]]
+
+    model = RegularSolution(T, xs, Vs, SPs, lambda_coeffs)
+    modelnp =  RegularSolution(T, np.array(xs), np.array(Vs), np.array(SPs), np.array(lambda_coeffs))
+    check_many_output_activity(model, modelnp, T, xs_matrix)
+    check_many_output_activity(model, modelnp, 350.0, xs_matrix)
+
 def test_regular_solution_gammas_binaries():
     kwargs = dict(xs=[.1, .9, 0.3, 0.7, .85, .15], Vs=[7.421e-05, 8.068e-05], SPs=[19570.2, 18864.7], Ts=[300.0, 400.0, 500.0], lambda12=0.1759, lambda21=0.7991)
     gammas_expect = [6818.906971998236, 1.105437709428331, 62.66284813913256, 2.0118436126911754, 1.1814344452004402, 137.6232341969005]
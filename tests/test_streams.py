@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2021 Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+# Tests of the stream module which do not depend on the legacy Chemical and
+# Mixture objects; test_stream.py is not collected (see conftest.py)
+import pytest
+from thermo.stream import StreamArgs, EnergyStream, flowsheet_balance
+from fluids.numerics import assert_close, assert_close1d, normalize
+
+
+def test_flowsheet_balance():
+    # Mixer, heater and splitter with a recycle; the feed is given by
+    # composition and flow, one product by flow only and the other by nothing
+    feed = StreamArgs(n=3.0, zs=[0.5, 0.25, 0.25])
+    recycle = StreamArgs(ns=[0.5, 0.5, 1.0])
+    mixed, heated, purge = StreamArgs(), StreamArgs(), StreamArgs(zs=[0.2, 0.3, 0.5])
+    product = StreamArgs(n=2.0)
+    units = [([feed, recycle], [mixed]), ([mixed], [heated]),
+             ([heated], [product, recycle, purge])]
+    assert flowsheet_balance(units, compounds=3, energy=False)
+    assert_close1d(mixed.ns, [2.0, 1.25, 1.75])
+    assert_close1d(heated.ns, [2.0, 1.25, 1.75])
+    assert_close1d(purge.ns, [0.2, 0.3, 0.5])
+    assert_close1d(product.ns, [1.3, 0.45, 0.25])
+    assert not flowsheet_balance(units, compounds=3, energy=False)
+
+    # Partially specified component flows are completed, without modifying
+    # the lists they were specified with
+    f0_ns, p0_ns = [1, 2, 3, None], [None, None, None, 5]
+    f0 = StreamArgs(ns=f0_ns)
+    f1 = StreamArgs(ns=[3, 5, 9, 3])
+    p0 = StreamArgs(ns=p0_ns)
+    flowsheet_balance([([f0, f1], [p0])], compounds=4, energy=False)
+    assert_close1d(f0.ns, [1, 2, 3, 2])
+    assert_close1d(p0.ns, [4, 7, 12, 5])
+    assert f0_ns == [1, 2, 3, None] and p0_ns == [None, None, None, 5]
+
+    # The recycle flow is not determined without a split specification
+    recycle = StreamArgs()
+    units = [([StreamArgs(ns=[1.0, 2.0]), recycle], [StreamArgs()]), ([units[0][1][0]], [StreamArgs(), recycle])]
+    with pytest.raises(ValueError):
+        flowsheet_balance(units, compounds=2, energy=False)
+
+    # Contradictory specifications
+    with pytest.raises(ValueError):
+        flowsheet_balance([([StreamArgs(ns=[1.0, 2.0])], [StreamArgs(n=2.0)])],
+                          compounds=2, energy=False)
+
+
+def test_flowsheet_balance_energy_flash():
+    from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, HeatCapacityGas, IdealGas, FlashVLN
+    constants = ChemicalConstantsPackage(Tcs=[508.1, 536.2], Pcs=[4700000.0, 5330000.0], omegas=[0.309, 0.216],
+                                         MWs=[58.07914, 119.37764], CASs=['67-64-1', '67-66-3'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.3320002425347943e-21, 6.4063345232664645e-18, -1.251025808150141e-14, 1.2265314167534311e-11, -5.535306305509636e-09, -4.32538332013644e-08, 0.0010438724775716248, -0.19650919978971002, 63.84239495676709])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [1.5389278550737367e-21, -8.289631533963465e-18, 1.9149760160518977e-14, -2.470836671137373e-11, 1.9355882067011222e-08, -9.265600540761629e-06, 0.0024825718663005762, -0.21617464276832307, 48.149539665907696]))]
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases, skip_missing=True)
+    gas = IdealGas(HeatCapacityGases=HeatCapacityGases, T=300.0, P=1e5, zs=[0.5, 0.5])
+    flasher = FlashVLN(constants, correlations, liquids=[], gas=gas)
+
+    feed = StreamArgs(pkg=flasher, T=400.0, P=1e5, ns=[1.0, 2.0])
+    recycle = StreamArgs(pkg=flasher, T=450.0, P=1e5, ns=[0.25, 0.75])
+    mixed, heated = StreamArgs(pkg=flasher, P=1e5), StreamArgs(pkg=flasher, P=1e5)
+    product = StreamArgs(pkg=flasher, T=450.0, P=1e5)
+    duty, cooling = EnergyStream(Q=2000.0), EnergyStream(Q=None)
+    units = [([feed, recycle], [mixed]), ([mixed, duty], [heated]),
+             ([heated], [product, recycle, cooling])]
+    assert flowsheet_balance(units, compounds=2, flash=True)
+    assert_close1d(product.ns, [1.0, 2.0])
+
+    H_feed = flasher.flash(T=400.0, P=1e5, zs=[1/3., 2/3.]).H()*3.0
+    H_recycle = flasher.flash(T=450.0, P=1e5, zs=[0.25, 0.75]).H()
+    assert_close(mixed.energy, H_feed + H_recycle, rtol=1e-13)
+    assert_close(heated.energy, H_feed + H_recycle + 2000.0, rtol=1e-13)
+    assert_close(cooling.Q, heated.energy - product.energy_calc - H_recycle, rtol=1e-13)
+    # Outlets were flashed at their calculated enthalpy
+    T_heated = flasher.flash(P=1e5, H=heated.energy/4.0, zs=[0.3125, 0.6875]).T
+    assert_close(heated.flash_state().T, T_heated, rtol=1e-9)
+    assert heated._state_cache is not None
+
+
+def test_EquilibriumStream_volumetric_flow_reference_cache():
+    from thermo import (ChemicalConstantsPackage, PropertyCorrelationsPackage, VaporPressure,
+                        HeatCapacityGas, VolumeLiquid, GibbsExcessLiquid, IdealGas, FlashVL)
+    from thermo.stream import EquilibriumStream
+    constants = ChemicalConstantsPackage(Tcs=[647.14, 563.1], Pcs=[22048320.0, 4414000.0],
+                                         omegas=[0.344, 0.59], MWs=[18.01528, 74.1216],
+                                         CASs=['7732-18-5', '71-36-3'], Vml_STPs=[1.8068e-05, 9.1968e-05])
+    VaporPressures = [VaporPressure(exp_poly_fit=(273.17, 647.086, [-2.8478502840358144e-21, 1.7295186670575222e-17, -4.034229148562168e-14, 5.0588958391215855e-11, -3.861625996277003e-08, 1.886271475957639e-05, -0.005928371869421494, 1.1494956887882308, -96.74302379151317])),
+                      VaporPressure(exp_poly_fit=(183.85, 563.1, [-1.369963570009104e-19, 4.601627231730426e-16, -6.744785620228449e-13, 5.655784279629317e-10, -2.986123576859473e-07, 0.00010278182137225028, -0.022995143239892296, 3.186560947413634, -210.12716900412732]))]
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [-3.787200194613107e-20, 1.7692887427654656e-16, -3.445247207129205e-13, 3.612771874320634e-10, -2.1953250181084466e-07, 7.707135849197655e-05, -0.014658388538054169, 1.5642629364740657, -7.614560475001724]))]
+    # Water has a pressure dependent liquid volume method, butanol does not
+    VolumeLiquids = [VolumeLiquid(poly_fit=(273.17, 637.096, [9.00307261049824e-24, -3.097008950027417e-20, 4.608271228765265e-17, -3.8726692841874345e-14, 2.0099220218891486e-11, -6.596204729785676e-09, 1.3368112879131157e-06, -0.00015298762503607717, 0.007589247005014652]),
+                                  Tc=647.14, Pc=22048320.0, omega=0.344, Psat=VaporPressures[0]),
+                     VolumeLiquid(poly_fit=(183.85, 534.945, [8.166268567991483e-24, -2.165718271472294e-20, 2.4731798748970672e-17, -1.5862095449169107e-14, 6.243674899388041e-12, -1.5433275010768489e-09, 2.3391927454003685e-07, -1.9817325459693386e-05, 0.0007969650387898196]))]
+    correlations = PropertyCorrelationsPackage(constants, VaporPressures=VaporPressures, HeatCapacityGases=HeatCapacityGases,
+                                               VolumeLiquids=VolumeLiquids, skip_missing=True)
+    liquid = GibbsExcessLiquid(VaporPressures=VaporPressures, HeatCapacityGases=HeatCapacityGases,
+                               VolumeLiquids=VolumeLiquids, T=300.0, P=1e5, zs=[0.5, 0.5])
+    gas = IdealGas(HeatCapacityGases=HeatCapacityGases, T=300.0, P=1e5, zs=[0.5, 0.5])
+    flasher = FlashVL(constants, correlations, liquid=liquid, gas=gas)
+    zs = [0.9, 0.1]
+
+    for Q_TP in [(288.15, 101325.0, ''), (288.15, 101325.0, 'l'), (400.0, 101325.0, 'g'), (288.15, 101325.0)]:
+        if len(Q_TP) == 3 and Q_TP[-1] == 'l':
+            V = liquid.to(T=288.15, P=101325.0, zs=zs).V()
+        elif len(Q_TP) == 3 and Q_TP[-1] == 'g':
+            V = gas.to(T=400.0, P=101325.0, zs=zs).V()
+        else:
+            V = flasher.flash(T=288.15, P=101325.0, zs=zs).V()
+        for _ in range(2):
+            stream = EquilibriumStream(flasher, T=350.0, P=1e5, zs=zs, Q=1e-3, Q_TP=Q_TP)
+            assert_close(stream.n, 1e-3/V, rtol=1e-13)
+    assert len(flasher._reference_volume_cache) == 4
+
+    # Liquid volume fractions at reference conditions, from the flasher's
+    # VolumeLiquids; compressed if possible, otherwise saturated
+    Vms = flasher.Vms_liquid_reference(300.0, 1e5)
+    assert Vms is flasher.Vms_liquid_reference(300.0, 1e5)
+    assert VolumeLiquids[0].method_P is not None and VolumeLiquids[1].method_P is None
+    assert_close(Vms[0], VolumeLiquids[0](300.0, 1e5), rtol=1e-13)
+    assert Vms[0] != VolumeLiquids[0].T_dependent_property(300.0)
+    assert_close(Vms[1], VolumeLiquids[1].T_dependent_property(300.0), rtol=1e-13)
+    assert flasher.Vms_liquid_reference() is constants.Vml_STPs
+    stream = EquilibriumStream(flasher, T=350.0, P=1e5, Vfls=[0.5, 0.5], n=1.0, Vf_TP=(300.0, 1e5))
+    assert_close1d(stream.zs, normalize([0.5/Vms[0], 0.5/Vms[1]]), rtol=1e-13)
@@ -22,6 +22,7 @@ SOFTWARE.'''
 
 import json
 import pytest
+import numpy as np
 from fluids.numerics import assert_close, assert_close1d, assert_close2d, linspace
 from fluids.constants import R
 from chemicals.utils import ws_to_zs
@@ -343,6 +344,42 @@ def test_ThermalConductivityGasMixture():
     assert hash(kg_mix2) == hash0
 
 
+def test_ThermalConductivityGasMixture_many():
+    MWs = [28.0134, 39.948, 31.9988]
+    Tbs = [77.355, 87.302, 90.188]
+    CASs = ['7727-37-9', '7440-37-1', '7782-44-7']
+    ViscosityGases = [
+        ViscosityGas(CASRN="7727-37-9", MW=28.0134, Tc=126.2, Pc=3394387.5, Zc=0.2895282296391198, dipole=0.0, extrapolation="linear", method=DIPPR_PERRY_8E, method_P=None),
+        ViscosityGas(CASRN="7440-37-1", MW=39.948, Tc=150.8, Pc=4873732.5, Zc=0.29114409080360165, dipole=0.0, extrapolation="linear", method=DIPPR_PERRY_8E, method_P=None),
+        ViscosityGas(CASRN="7782-44-7", MW=31.9988, Tc=154.58, Pc=5042945.25, Zc=0.2880002236716698, dipole=0.0, extrapolation="linear", method=DIPPR_PERRY_8E, method_P=None),
+    ]
+    ThermalConductivityGases = [
+        ThermalConductivityGas(CASRN="7727-37-9", MW=28.0134, Tb=77.355, Tc=126.2, Pc=3394387.5, Vc=8.95e-05, Zc=0.2895282296391198, omega=0.04, dipole=0.0, extrapolation="linear", method=VDI_PPDS, method_P=ELI_HANLEY_DENSE),
+        ThermalConductivityGas(CASRN="7440-37-1", MW=39.948, Tb=87.302, Tc=150.8, Pc=4873732.5, Vc=7.49e-05, Zc=0.29114409080360165, omega=-0.004, dipole=0.0, extrapolation="linear", method=VDI_PPDS, method_P=ELI_HANLEY_DENSE),
+        ThermalConductivityGas(CASRN="7782-44-7", MW=31.9988, Tb=90.188, Tc=154.58, Pc=5042945.25, Vc=7.34e-05, Zc=0.2880002236716698, omega=0.021, dipole=0.0, extrapolation="linear", method=VDI_PPDS, method_P=ELI_HANLEY_DENSE),
+        ]
+    Ts = [250.0, 298.15, 298.15, 400.0, 1000.0]
+    Ps = [101325.0, 101325.0, 1e6, 1e7, 101325.0]
+    ws_2d = [[0.7557, 0.0127, 0.2316], [0.7557, 0.0127, 0.2316], [0.2, 0.3, 0.5],
+             [1.0, 0.0, 0.0], [0.5, 0.25, 0.25]]
+    for correct_pressure_pure in (False, True):
+        kg_mix = ThermalConductivityGasMixture(MWs=MWs, Tbs=Tbs, CASs=CASs, correct_pressure_pure=correct_pressure_pure,
+                                               ThermalConductivityGases=ThermalConductivityGases,
+                                               ViscosityGases=ViscosityGases)
+        for method in (LINEAR, LINDSAY_BROMLEY):
+            kg_mix.method = method
+            kgs = kg_mix.mixture_property_many(Ts, Ps, ws_2d=ws_2d)
+            kgs_expect = [kg_mix.mixture_property(T, P, ws=ws) for T, P, ws in zip(Ts, Ps, ws_2d)]
+            assert_close1d(kgs, kgs_expect, rtol=1e-13)
+
+    kg_mix.method = LINDSAY_BROMLEY
+    kgs = kg_mix.mixture_property_many(298.15, 101325.0, ws_2d=[0.7557, 0.0127, 0.2316])
+    assert kgs.shape == (1,)
+
+    with pytest.raises(Exception):
+        kg_mix.mixture_property_many(Ts, Ps)
+
+
 def test_ThermalConductivityLiquidMixture():
     T, P = 298.15, 101325.0
     ws = [0.258, 0.742]
@@ -384,6 +421,30 @@ def test_ThermalConductivityLiquidMixture():
     assert hash(kl_mix) == hash0
     assert hash(kl_mix2) == hash0
 
+
+def test_ThermalConductivityLiquidMixture_many():
+    MWs = [46.06844, 88.14818]
+    CASs = ['64-17-5', '71-41-0']
+    # ['ethanol', 'pentanol']
+    ThermalConductivityLiquids = [
+        ThermalConductivityLiquid(CASRN="64-17-5", MW=46.06844, Tm=159.05, Tb=351.39, Tc=514.0, Pc=6137000.0, omega=0.635, Hfus=4931.0, extrapolation="linear", method="DIPPR_PERRY_8E", method_P="DIPPR_9G"),
+        ThermalConductivityLiquid(CASRN="71-41-0", MW=88.14818, Tm=194.7, Tb=410.75, Tc=588.1, Pc=3897000.0, omega=0.58, Hfus=10500.0, extrapolation="linear", method="DIPPR_PERRY_8E", method_P="DIPPR_9G")
+    ]
+    Ts = np.array([250.0, 298.15, 298.15, 298.15, 340.0])
+    Ps = np.array([101325.0, 101325.0, 1e7, 101325.0, 1e6])
+    ws_2d = np.array([[0.258, 0.742], [0.258, 0.742], [0.5, 0.5], [1.0, 0.0], [0.1, 0.9]])
+    zs_2d = np.array([ws_to_zs(ws=ws, MWs=MWs) for ws in ws_2d.tolist()])
+    for correct_pressure_pure in (False, True):
+        kl_mix = ThermalConductivityLiquidMixture(CASs=CASs, ThermalConductivityLiquids=ThermalConductivityLiquids, MWs=MWs,
+                                                  correct_pressure_pure=correct_pressure_pure)
+        for method in (DIPPR_9H, LINEAR, FILIPPOV):
+            assert method in kl_mix.vectorized_methods
+            kl_mix.method = method
+            ks_expect = [kl_mix.calculate(T, P, zs, ws, method) for T, P, zs, ws in zip(Ts.tolist(), Ps.tolist(), zs_2d.tolist(), ws_2d.tolist())]
+            assert_close1d(kl_mix.calculate_many(Ts, Ps, zs_2d, ws_2d, method), ks_expect, rtol=1e-13)
+            assert_close1d(kl_mix.mixture_property_many(Ts, Ps, zs_2d, ws_2d), ks_expect, rtol=1e-13)
+
+
 def test_ThermalConductivityLiquidMixture_electrolytes():
     # Test electrolytes
     # m = Mixture(['water', 'sulfuric acid'], ws=[.5, .5], T=298.15)
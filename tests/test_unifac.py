@@ -32,7 +32,7 @@ from fluids.constants import R
 from thermo.unifac import UFIP, LLEUFIP, LUFIP, DOUFIP2006, DOUFIP2016, NISTUFIP, NISTKTUFIP, PSRKIP, VTPRIP, DOUFSG
 import types
 import pickle, json
-from thermo.test_utils import check_np_output_activity
+from thermo.test_utils import check_np_output_activity, check_many_output_activity
 
 '''
 Test suite currently takes ~0.2 seconds :)
@@ -851,7 +851,7 @@ def test_UNIFAC_default_data():
 
 def call_all_methods_first_UNIFAC(kwargs):
     cls = UNIFAC
-    skip_methods = ('__init__', 'to_T_xs', '__delattr__', '__format__', '__getattribute__', '__setattr__', 'from_json', 'model_id', '_regress_binary_parameters')
+    skip_methods = ('__init__', 'to_T_xs', '__delattr__', '__format__', '__getattribute__', '__setattr__', 'from_json', 'model_id', '_regress_binary_parameters', 'regress_binary_parameters_many')
     special_methods = {1: ('Vis_modified', 'dVis_modified_dxs', 'd2Vis_modified_dxixjs', 'd3Vis_modified_dxixjxks')}
     special_methods[4] = special_methods[1]
 
@@ -975,6 +975,21 @@ def test_unifac_np_output_and_hash():
     assert model_pickle == model
 
 
+def test_UNIFAC_many_compositions():
+    T = 373.15
+    xs = [0.2, 0.3, 0.1, 0.4]
+    xs_matrix = [xs, [.1, .2, .3, .4], [.25, .25, .25, .25], [0.0, 0.5, 0.5, 0.0]]
+    chemgroups = [{9:6}, {78:6}, {1:1, 18:1}, {1:1, 2:1, 14:1}]
+    for version in (0, 1, 3):
+        model = UNIFAC.from_subgroups(T=T, xs=xs, chemgroups=chemgroups, version=version,
+                                   interaction_data=DOUFIP2006, subgroups=DOUFSG)
+        modelnp = UNIFAC.from_subgroups(T=T, xs=np.array(xs), chemgroups=chemgroups, version=version,
+                               interaction_data=DOUFIP2006, subgroups=DOUFSG)
+        check_many_output_activity(model, modelnp, T, xs_matrix)
+        check_many_output_activity(model, modelnp, 330.0, xs_matrix)
+
+
+
 
 
 
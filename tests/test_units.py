@@ -22,7 +22,9 @@ SOFTWARE.'''
 
 from __future__ import division
 import pint
+import sys
 import types
+import json
 import numpy as np
 import pytest
 import fluids
@@ -273,4 +275,71 @@ def test_Wilson_units_1():
     for model in (model_ABD, model_from_DDBST, model_lambda_coeffs):
         for prop in get_properties:
             res = getattr(model, prop)()
-            assert isinstance(res, pint.Quantity)
\ No newline at end of file
+            assert isinstance(res, pint.Quantity)
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='Module __getattr__ needs Python 3.7')
+def test_units_lazy_import():
+    import os, subprocess, sys
+    env = os.environ.copy()
+    env['PYTHONPATH'] = os.path.dirname(os.path.dirname(thermo.__file__))
+    code = ("import sys, thermo.units; "
+            "assert 'fluids.units' not in sys.modules; "
+            "assert 'PRMIX' not in vars(thermo.units); "
+            "cls = thermo.units.PRMIX; assert vars(thermo.units)['PRMIX'] is cls")
+    subprocess.check_call([sys.executable, '-c', code], env=env)
+
+
+def test_wrap_from_unit_signature():
+    import fluids.units
+    for obj in (thermo.PRMIX, thermo.NRTL, thermo.VaporPressure, thermo.Chemical, thermo.FlashVL):
+        signature = json.loads(json.dumps(thermo.units.unit_signature(obj)))
+        assert signature['fingerprint'] == thermo.units.docstring_fingerprint(obj)
+        fast = thermo.units.wrap_from_signature(obj, signature)
+        slow = fluids.units.wrap_numpydoc_obj(obj)
+        assert fast.__name__ == slow.__name__ and fast.__module__ == slow.__module__
+        assert fast.static_methods == slow.static_methods
+        assert fast.class_methods == slow.class_methods
+        assert fast.method_units == {k: tuple(v) for k, v in slow.method_units.items()}
+        assert set(fast.property_units) == set(slow.property_units)
+        for k, v in slow.property_units.items():
+            if isinstance(v, list):
+                assert fast.property_units[k] == v
+            else:
+                assert 1*fast.property_units[k] == 1*v
+
+def test_generate_unit_signatures(tmpdir, monkeypatch):
+    # The signatures are generated when the package is built; they are not
+    # stored in the repository
+    path = str(tmpdir.join('unit_signatures.json'))
+    thermo.units.generate_unit_signatures(path)
+    monkeypatch.setattr(thermo.units, 'unit_signatures_path', path)
+    monkeypatch.setattr(thermo.units, '_unit_signatures', None)
+    assert thermo.units.stale_unit_signatures() == []
+
+    # The stored signatures are used for classes whose documentation is unchanged
+    signatures = thermo.units.load_unit_signatures()
+    assert 'PRMIX' in signatures
+    eos = thermo.units.wrap_thermo_obj(thermo.PRMIX)(T=400*u.K, P=1e5*u.Pa, Tcs=[126.1, 190.6]*u.K,
+        Pcs=[33.94E5, 46.04E5]*u.Pa, omegas=[0.04, 0.011]*u.dimensionless, zs=[0.5, 0.5]*u.dimensionless)
+    assert_pint_allclose(eos.V_g, thermo.PRMIX(T=400.0, P=1e5, Tcs=[126.1, 190.6], Pcs=[33.94E5, 46.04E5],
+                                               omegas=[0.04, 0.011], zs=[0.5, 0.5]).V_g, u.m**3/u.mol)
+
+    # A stale signature is only a slower path; the docstrings are parsed
+    signatures['PRMIX'] = dict(signatures['PRMIX'], fingerprint='stale', property_units={}, method_units={})
+    assert thermo.units.stale_unit_signatures() == ['PRMIX']
+    eos = thermo.units.wrap_thermo_obj(thermo.PRMIX)(T=400*u.K, P=1e5*u.Pa, Tcs=[126.1, 190.6]*u.K,
+        Pcs=[33.94E5, 46.04E5]*u.Pa, omegas=[0.04, 0.011]*u.dimensionless, zs=[0.5, 0.5]*u.dimensionless)
+    assert_pint_allclose(eos.V_g, thermo.PRMIX(T=400.0, P=1e5, Tcs=[126.1, 190.6], Pcs=[33.94E5, 46.04E5],
+                                               omegas=[0.04, 0.011], zs=[0.5, 0.5]).V_g, u.m**3/u.mol)
+
+
+def test_units_eager_wrapping_without_module_getattr():
+    # Python 3.6 has no module __getattr__; every class is wrapped on import
+    import os, subprocess, sys
+    env = os.environ.copy()
+    env['PYTHONPATH'] = os.path.dirname(os.path.dirname(thermo.__file__))
+    code = ("import sys; sys.version_info = (3, 6, 0); import thermo.units; "
+            "assert 'PRMIX' in vars(thermo.units) and 'NRTL' in vars(thermo.units); "
+            "assert vars(thermo.units)['PRMIX'].wrapped is thermo.PRMIX; "
+            "assert 'wraps_numpydoc' in vars(thermo.units)")
+    subprocess.check_call([sys.executable, '-c', code], env=env)
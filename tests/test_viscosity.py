@@ -562,6 +562,25 @@ def test_ViscosityLiquidMixture():
     assert hash(obj2) == hash0
 
 
+def test_ViscosityLiquidMixture_many():
+    ViscosityLiquids = [ViscosityLiquid(CASRN=CAS) for CAS in ['56-23-5', '67-63-0']]
+    for obj in ViscosityLiquids:
+        obj.method = DIPPR_PERRY_8E
+    MWs = [153.8227, 60.09502]
+    obj = ViscosityLiquidMixture(ViscosityLiquids=ViscosityLiquids, CASs=['56-23-5', '67-63-0'], MWs=MWs)
+
+    Ts = np.array([280.0, 313.2, 313.2, 313.2, 340.0])
+    Ps = np.array([101325.0, 101325.0, 1e6, 101325.0, 101325.0])
+    zs_2d = np.array([[.5, .5], [.5, .5], [.2, .8], [0.0, 1.0], [.9, .1]])
+    ws_2d = np.array([zs_to_ws(zs, MWs=MWs) for zs in zs_2d.tolist()])
+    for method in (MIXING_LOG_MOLAR, MIXING_LOG_MASS, LINEAR):
+        assert method in obj.vectorized_methods
+        obj.method = method
+        mus_expect = [obj.calculate(T, P, zs, ws, method) for T, P, zs, ws in zip(Ts.tolist(), Ps.tolist(), zs_2d.tolist(), ws_2d.tolist())]
+        assert_close1d(obj.calculate_many(Ts, Ps, zs_2d, ws_2d, method), mus_expect, rtol=1e-13)
+        assert_close1d(obj.mixture_property_many(Ts, Ps, zs_2d, ws_2d), mus_expect, rtol=1e-13)
+
+
 def test_ViscosityLiquidMixture_electrolyte():
     # Test Laliberte
     m = Mixture(['water', 'sulfuric acid'], zs=[0.5, 0.5], T=298.15)
@@ -622,3 +641,26 @@ def test_ViscosityGasMixture():
     assert obj == obj2
     assert hash(obj) == hash0
     assert hash(obj2) == hash0
+
+
+def test_ViscosityGasMixture_many():
+    MWs = [46.06844, 64.0638]
+    molecular_diameters = [4.594142622412462, 3.98053]
+    Stockmayers = [330.53265973799995, 333.4]
+    CASs = ['115-10-6', '7446-09-5']
+    ViscosityGases = [ViscosityGas(CASRN="115-10-6", MW=46.06844, Tc=400.2, Pc=5340000.0, Zc=0.26961203187388905, dipole=1.3, extrapolation="linear", method=DIPPR_PERRY_8E, method_P=None),
+                      ViscosityGas(CASRN="7446-09-5", MW=64.0638, Tc=430.8, Pc=7884098.25, Zc=0.2685356680541311, dipole=1.63, extrapolation="linear", method=DIPPR_PERRY_8E, method_P=None)]
+    obj = ViscosityGasMixture(MWs=MWs, molecular_diameters=molecular_diameters, Stockmayers=Stockmayers, CASs=CASs,
+                              ViscosityGases=ViscosityGases, correct_pressure_pure=False)
+
+    Ts = [250.0, 308.2, 308.2, 308.2, 500.0]
+    P = 101325.0
+    zs_2d = [[.95, .05], [.95, .05], [.5, .5], [0.0, 1.0], [.1, .9]]
+    for method in (BROKAW, HERNING_ZIPPERER, WILKE, LINEAR):
+        obj.method = method
+        mus = obj.mixture_property_many(Ts, P, zs_2d)
+        mus_expect = [obj.mixture_property(T, P, zs) for T, zs in zip(Ts, zs_2d)]
+        assert_close1d(mus, mus_expect, rtol=1e-13)
+
+    obj.method = BROKAW
+    assert_close(obj.mixture_property_many([308.2], [P], [[.95, .05]])[0], 9.758786340336624e-06, rtol=1e-10)
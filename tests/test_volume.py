@@ -555,6 +555,32 @@ def test_VolumeLiquidMixture():
     with pytest.raises(Exception):
         obj.test_method_validity(m.T, m.P, m.zs, m.ws, 'BADMETHOD')
 
+
+def test_VolumeLiquidMixture_many():
+    # ['benzene', 'toluene']
+    MWs = [78.11184, 92.13842]
+    VaporPressures = [
+        VaporPressure(CASRN="71-43-2", Tb=353.23, Tc=562.05, Pc=4895000.0, omega=0.212, extrapolation="AntoineAB|DIPPR101_ABC", method=EXP_POLY_FIT, exp_poly_fit=(278.68399999999997, 562.01, [4.547344107145341e-20, -1.3312501882259186e-16, 1.6282983902136683e-13, -1.0498233680158312e-10, 3.535838362096064e-08, -3.6181923213017173e-06, -0.001593607608896686, 0.6373679536454406, -64.4285974110459])),
+        VaporPressure(CASRN="108-88-3", Tb=383.75, Tc=591.75, Pc=4108000.0, omega=0.257, extrapolation="AntoineAB|DIPPR101_ABC", method=EXP_POLY_FIT, exp_poly_fit=(178.01, 591.74, [-8.638045111752356e-20, 2.995512203611858e-16, -4.5148088801006036e-13, 3.8761537879200513e-10, -2.0856828984716705e-07, 7.279010846673517e-05, -0.01641020023565049, 2.2758331029405516, -146.04484159879843]))
+    ]
+    VolumeLiquids = [
+        VolumeLiquid(CASRN="71-43-2", MW=78.11184, Tb=353.23, Tc=562.05, Pc=4895000.0, Vc=0.000256, Zc=0.2681535335844513, omega=0.212, dipole=0.0, Psat=VaporPressures[0], extrapolation="constant", method=POLY_FIT, poly_fit=(278.68399999999997, 552.02, [2.5040222732960933e-22, -7.922607445206804e-19, 1.088548130214618e-15, -8.481605391952225e-13, 4.098451788397536e-10, -1.257577461969114e-07, 2.3927976459304723e-05, -0.0025810882828932375, 0.12092854717588034])),
+        VolumeLiquid(CASRN="108-88-3", MW=92.13842, Tb=383.75, Tc=591.75, Pc=4108000.0, Vc=0.000316, Zc=0.2638426898300023, omega=0.257, dipole=0.33, Psat=VaporPressures[1], extrapolation="constant", method=POLY_FIT, poly_fit=(178.01, 581.75, [2.2801490297347937e-23, -6.411956871696508e-20, 7.723152902379232e-17, -5.197203733189603e-14, 2.1348482785660093e-11, -5.476649499770259e-09, 8.564670053875876e-07, -7.455178589434267e-05, 0.0028545812080104068]))
+    ]
+    Ts = np.array([280.0, 298.15, 298.15, 298.15, 400.0])
+    Ps = np.array([101325.0, 101325.0, 1e7, 101325.0, 1e6])
+    zs_2d = np.array([[.5, .5], [.5, .5], [.2, .8], [0.0, 1.0], [.9, .1]])
+    ws_2d = np.array([zs_to_ws(zs, MWs=MWs) for zs in zs_2d.tolist()])
+    for correct_pressure_pure in (False, True):
+        obj = VolumeLiquidMixture(MWs=MWs, Tcs=[562.05, 591.75], Pcs=[4895000.0, 4108000.0], Vcs=[0.000256, 0.000316], Zcs=[0.2681535335844513, 0.2638426898300023], omegas=[0.212, 0.257],
+                                  CASs=['71-43-2', '108-88-3'], VolumeLiquids=VolumeLiquids, correct_pressure_pure=correct_pressure_pure)
+        obj.method = LINEAR
+        assert LINEAR in obj.vectorized_methods
+        Vms_expect = [obj.calculate(T, P, zs, ws, LINEAR) for T, P, zs, ws in zip(Ts.tolist(), Ps.tolist(), zs_2d.tolist(), ws_2d.tolist())]
+        assert_close1d(obj.calculate_many(Ts, Ps, zs_2d, ws_2d, LINEAR), Vms_expect, rtol=1e-13)
+        assert_close1d(obj.mixture_property_many(Ts, Ps, zs_2d, ws_2d), Vms_expect, rtol=1e-13)
+
+
 @pytest.mark.meta_T_dept
 def test_VolumeLiquidMixture_Laliberte():
     # Test Laliberte
@@ -68,12 +68,13 @@ References
 from __future__ import division
 
 __all__ = ['GibbsExcess', 'IdealSolution']
+import json
 from fluids.constants import R, R_inv
 from fluids.numerics import numpy as np, trunc_exp
 from chemicals.utils import exp, log
 from chemicals.utils import normalize, dxs_to_dns, dxs_to_dn_partials, dns_to_dn_partials, d2xs_to_dxdn_partials, hash_any_primitive
 from thermo import serialize
-from thermo.fitting import fit_customized
+from thermo.fitting import fit_customized, latin_hypercube_samples
 
 try:
     npexp, ones, zeros, array, ndarray = np.exp, np.ones, np.zeros, np.array, np.ndarray
@@ -1021,10 +1022,122 @@ class GibbsExcess(object):
             dgammas_dT = array(dgammas_dT)
         self._dgammas_dT = dgammas_dT
         return dgammas_dT
-    
+
+    def _model_at_T(self, T):
+        # Object at `T` whose temperature-only terms can be shared by all
+        # compositions evaluated in the `_many` methods
+        if T == self.T:
+            return self
+        return self.to_T_xs(T, self.xs)
+
+    def _zeros_many(self, M):
+        N = self.N
+        if self.scalar:
+            return [[0.0]*N for _ in range(M)]
+        return zeros((M, N))
+
+    def gammas_many(self, T, xs_matrix):
+        r'''Calculate and return the activity coefficients of a liquid phase
+        at many compositions, all at the same temperature `T`. The
+        temperature-only terms of the model are calculated once and shared
+        by every composition.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]]
+            Mole fractions of each component, one row per composition [-]
+
+        Returns
+        -------
+        gammas_many : list[list[float]]
+            Activity coefficients, one row per composition [-]
+
+        Notes
+        -----
+        This base implementation walks through the compositions with
+        `to_T_xs`, which carries the temperature-only terms from one object
+        to the next; most models override it with a dedicated kernel.
+
+        Examples
+        --------
+        >>> model = IdealSolution(T=300.0, xs=[.1, .2, .3, .4])
+        >>> model.gammas_many(350.0, [[.5, .5, 0.0, 0.0], [.25, .25, .25, .25]])
+        [[1.0, 1.0, 1.0, 1.0], [1.0, 1.0, 1.0, 1.0]]
+        '''
+        gammas_many = self._zeros_many(len(xs_matrix))
+        model = self._model_at_T(T)
+        for k in range(len(xs_matrix)):
+            model = model.to_T_xs(T, xs_matrix[k])
+            gammas_many[k] = model.gammas()
+        return gammas_many
+
+    def GE_many(self, T, xs_matrix):
+        r'''Calculate and return the excess Gibbs energy of a liquid phase
+        at many compositions, all at the same temperature `T`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]]
+            Mole fractions of each component, one row per composition [-]
+
+        Returns
+        -------
+        GE_many : list[float]
+            Excess Gibbs energy at each composition, [J/mol]
+
+        Notes
+        -----
+        Like :obj:`gammas_many`, this base implementation walks through the
+        compositions with `to_T_xs`; NRTL, Wilson, UNIQUAC, UNIFAC and
+        RegularSolution override it with a dedicated kernel.
+        '''
+        M = len(xs_matrix)
+        GE_many = [0.0]*M if self.scalar else zeros(M)
+        model = self._model_at_T(T)
+        for k in range(M):
+            model = model.to_T_xs(T, xs_matrix[k])
+            GE_many[k] = model.GE()
+        return GE_many
+
+    def dGE_dxs_many(self, T, xs_matrix):
+        r'''Calculate and return the mole fraction derivatives of excess Gibbs
+        energy of a liquid phase at many compositions, all at the same
+        temperature `T`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        xs_matrix : list[list[float]]
+            Mole fractions of each component, one row per composition [-]
+
+        Returns
+        -------
+        dGE_dxs_many : list[list[float]]
+            Mole fraction derivatives of excess Gibbs energy, one row per
+            composition [J/mol]
+
+        Notes
+        -----
+        Like :obj:`gammas_many`, this base implementation walks through the
+        compositions with `to_T_xs`; NRTL, Wilson, UNIQUAC and
+        RegularSolution override it with a dedicated kernel.
+        '''
+        dGE_dxs_many = self._zeros_many(len(xs_matrix))
+        model = self._model_at_T(T)
+        for k in range(len(xs_matrix)):
+            model = model.to_T_xs(T, xs_matrix[k])
+            dGE_dxs_many[k] = model.dGE_dxs()
+        return dGE_dxs_many
+
     @classmethod
     def _regress_binary_parameters(cls, gammas, xs, fitting_func, fit_parameters,
                                    use_fit_parameters, initial_guesses=None, analytical_jac=None,
+                                   multistart=0, multistart_bounds=None, multistart_seed=0,
                                    **kwargs):
 
         fit_kwargs = dict(fit_method='lm', 
@@ -1034,12 +1147,119 @@ class GibbsExcess(object):
                    solver_kwargs=None, use_numba=False, multiple_tries=False,
                    do_statistics=True, multiple_tries_max_err=1e-5)
         fit_kwargs.update(kwargs)
-         
+        
+        if multistart:
+            # Latin hypercube starting points are added to the hardcoded
+            # guesses; fit_customized sorts all of them by their initial error
+            # and runs the solver from each until one is good enough
+            hardcoded = initial_guesses if initial_guesses else []
+            bounds = []
+            for k in use_fit_parameters:
+                if multistart_bounds is not None and k in multistart_bounds:
+                    bounds.append(multistart_bounds[k])
+                else:
+                    values = [g[k] for g in hardcoded] + [1.0]
+                    bounds.append((min(values), max(values)))
+            samples = latin_hypercube_samples(bounds, multistart, seed=multistart_seed)
+            fit_kwargs['initial_guesses'] = list(hardcoded) + [dict(zip(use_fit_parameters, p)) for p in samples]
+            if not fit_kwargs['multiple_tries']:
+                fit_kwargs['multiple_tries'] = True
              
         res = fit_customized(xs, data=gammas, fitting_func=fitting_func, fit_parameters=fit_parameters, use_fit_parameters=use_fit_parameters,
                     **fit_kwargs)
         return res
 
+    @classmethod
+    def regress_binary_parameters_many(cls, datasets, processes=1, path=None,
+                                       **kwargs):
+        r'''Regress the binary parameters of many binary systems at once,
+        by calling `regress_binary_parameters` of the model for each of them.
+        The systems can be spread over a pool of worker processes, and each
+        result can be written to a file as soon as it is available so a long
+        job can be monitored or salvaged.
+
+        Parameters
+        ----------
+        datasets : list[dict]
+            Keyword arguments specific to each binary system, normally
+            `gammas` and `xs` and any pure component parameters the model
+            needs, [-]
+        processes : int, optional
+            Number of worker processes; 1 regresses every system in this
+            process, and None uses one process per CPU, [-]
+        path : str, optional
+            If given, one line of JSON per system is written to this file in
+            the order of `datasets`, [-]
+        kwargs : dict
+            Keyword arguments passed to `regress_binary_parameters` for every
+            system, for example `multistart`, [-]
+
+        Returns
+        -------
+        results : list
+            The result of `regress_binary_parameters` for each system, or None
+            for systems where the regression failed, [-]
+
+        Notes
+        -----
+        Each line in `path` holds the `index` of the system and either its
+        `parameters` (and, if statistics were computed, `MAE`, `STDEV`,
+        `min_ratio` and `max_ratio`) or the `error` which was raised.
+
+        The multistart guesses for each system are evaluated serially within
+        one process; a single least squares solve with an analytical
+        jacobian is too quick to be worth sending to another process.
+        '''
+        jobs = [(cls, dataset, kwargs) for dataset in datasets]
+        handle = open(path, 'w') if path is not None else None
+        results = []
+        pool = None
+        try:
+            if processes == 1:
+                outputs = map(_regress_binary_parameters_job, jobs)
+            else:
+                from multiprocessing import Pool, cpu_count
+                if processes is None:
+                    processes = cpu_count()
+                pool = Pool(processes)
+                chunksize = max(1, len(jobs)//(4*processes))
+                outputs = pool.imap(_regress_binary_parameters_job, jobs, chunksize)
+            for i, res in enumerate(outputs):
+                if isinstance(res, Exception):
+                    results.append(None)
+                    line = {'index': i, 'error': repr(res)}
+                else:
+                    results.append(res)
+                    if type(res) is tuple:
+                        coeffs, stats = res
+                        line = {'index': i, 'parameters': coeffs}
+                        for k in ('MAE', 'STDEV', 'min_ratio', 'max_ratio'):
+                            line[k] = float(stats[k])
+                    else:
+                        line = {'index': i, 'parameters': res}
+                if handle is not None:
+                    handle.write(json.dumps(line) + '\n')
+                    handle.flush()
+            if pool is not None:
+                pool.close()
+                pool.join()
+        finally:
+            if handle is not None:
+                handle.close()
+            if pool is not None:
+                pool.terminate()
+        return results
+
+
+def _regress_binary_parameters_job(args):
+    cls, dataset, kwargs = args
+    call_kwargs = dict(kwargs)
+    call_kwargs.update(dataset)
+    try:
+        return cls.regress_binary_parameters(**call_kwargs)
+    except Exception as e:
+        return e
+
 
 class IdealSolution(GibbsExcess):
     r'''Class for  representing an ideal liquid, with no excess gibbs energy
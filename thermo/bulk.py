@@ -1278,10 +1278,19 @@ class Bulk(Phase):
     def _equilibrium_derivative(self, of='P', wrt='T', const='V'):
         '''Calculate the equilibrium derivative of a property by performing
         a numerical derivative on flash calculations.
+
+        Both points come from the same kind of flash; a state from a `T`-`P`
+        flash and one from, for example, a `P`-`H` flash agree only to the
+        convergence tolerances of their solvers, which is not enough for a
+        difference with a small perturbation.
         '''
         const_value = self.value(const)
         wrt_value = self.value(wrt)
-        of_value = self.value(of)
+        if wrt in ('T', 'P') and const in ('T', 'P'):
+            of_value = self.value(of)
+        else:
+            kwargs = {wrt: wrt_value, const: const_value}
+            of_value = self.flasher.flash(zs=self.zs, **kwargs).value(of)
 
         pert = self.settings.equilibrium_perturbation
         wrt_value2 = wrt_value*(1.0 + pert)
@@ -256,6 +256,44 @@ class MultiCheb1D(object):
         x = (2.0*x-a-b)/(b-a)
         return self.chebval(x, coeffs)
 
+    def evaluate_many(self, xs):
+        '''Evaluate the approximation at many points at once, with the
+        same results as calling the object at each point. The segment of each
+        point is found with a binary search, and all points are evaluated
+        together with the Clenshaw recurrence.
+
+        Parameters
+        ----------
+        xs : ndarray
+            Points to evaluate the approximation at, [-]
+
+        Returns
+        -------
+        values : ndarray
+            Approximated values, [-]
+        '''
+        try:
+            points, coeffs = self._points_array, self._coeffs_array
+        except AttributeError:
+            # Pad shorter coefficient sets with zeros; the recurrence then
+            # gives identical results to the unpadded coefficients
+            points = self._points_array = np.array(self.points, dtype=float)
+            m = max(len(c) for c in self.coeffs)
+            coeffs = np.zeros((self.N, m))
+            for i, c in enumerate(self.coeffs):
+                coeffs[i, :len(c)] = c
+            self._coeffs_array = coeffs
+        shape = np.shape(xs)
+        xs = np.atleast_1d(np.asarray(xs, dtype=float))
+        i = np.searchsorted(points, xs, side='left')
+        i[(i == 0) & (xs == points[0])] = 1
+        if (i == 0).any():
+            raise ValueError('Requested value is under the limits')
+        if (i > self.N).any():
+            raise ValueError('Requested value is above the limits')
+        a, b = points[i-1], points[i]
+        return self.chebval_many((2.0*xs-a-b)/(b-a), coeffs[i-1]).reshape(shape)
+
     @staticmethod
     def chebval(x, c):
         # copied from numpy's source, slightly optimized
@@ -270,6 +308,138 @@ class MultiCheb1D(object):
             c1 = tmp + c1*x2
         return c0 + c1*x
 
+    @staticmethod
+    def chebval_many(x, c):
+        # Same recurrence as `chebval`, with a row of coefficients in `c` for
+        # each value in `x`; unlike it, constant and empty series are allowed
+        x = np.asarray(x, dtype=float)
+        c = np.asarray(c, dtype=float)
+        if c.shape[-1] < 2:
+            c0 = c[..., 0] if c.shape[-1] else np.zeros(c.shape[:-1])
+            return c0 + 0.0*x
+        x2 = 2.*x
+        c0 = c[..., -2]
+        c1 = c[..., -1]
+        for i in range(3, c.shape[-1] + 1):
+            tmp = c0
+            c0 = c[..., -i] - c1
+            c1 = tmp + c1*x2
+        return c0 + c1*x
+
+    @classmethod
+    def from_function(cls, f, low, high, pieces=8, n=16):
+        '''Create an approximation of a function of one variable by
+        interpolating it at the Chebyshev points of equal width segments of
+        its range.
+
+        Parameters
+        ----------
+        f : callable
+            Function of one float returning a float, [-]
+        low : float
+            Lower limit of the approximation, [-]
+        high : float
+            Upper limit of the approximation, [-]
+        pieces : int, optional
+            Number of segments, [-]
+        n : int, optional
+            Degree of the Chebyshev series in each segment, [-]
+
+        Returns
+        -------
+        approximator : MultiCheb1D
+            Approximation, [-]
+
+        Examples
+        --------
+        >>> from math import exp
+        >>> approx = MultiCheb1D.from_function(exp, 0.0, 2.0, pieces=2, n=12)
+        >>> round(approx(1.5), 12)
+        4.481689070338
+        '''
+        from numpy.polynomial.chebyshev import chebinterpolate
+        points = np.linspace(low, high, pieces+1).tolist()
+        points[0], points[-1] = low, high
+        coeffs = []
+        for a, b in zip(points[:-1], points[1:]):
+            half_width, middle = 0.5*(b - a), 0.5*(a + b)
+            segment = lambda xs: [f(middle + half_width*x) for x in xs.tolist()]
+            coeffs.append(chebinterpolate(segment, n).tolist())
+        return cls(points, coeffs)
+
+    @classmethod
+    def from_property(cls, prop, Tmin=None, Tmax=None, pieces=8, n=16):
+        '''Create an approximation of a temperature dependent property
+        object such as :obj:`thermo.vapor_pressure.VaporPressure`, using its
+        currently selected method. CoolProp is not needed.
+
+        Parameters
+        ----------
+        prop : :obj:`thermo.utils.TDependentProperty`
+            Property object to approximate, [-]
+        Tmin : float, optional
+            Lower temperature limit; the method's lower limit if not given, [K]
+        Tmax : float, optional
+            Upper temperature limit; the method's upper limit if not given, [K]
+        pieces : int, optional
+            Number of segments, [-]
+        n : int, optional
+            Degree of the Chebyshev series in each segment, [-]
+
+        Returns
+        -------
+        approximator : MultiCheb1D
+            Approximation, [-]
+
+        Examples
+        --------
+        >>> from thermo.vapor_pressure import VaporPressure
+        >>> obj = VaporPressure(CASRN='7732-18-5')
+        >>> approx = MultiCheb1D.from_property(obj, 300.0, 600.0)
+        >>> round(approx(400.0)/obj(400.0), 10)
+        1.0
+        '''
+        if Tmin is None or Tmax is None:
+            low, high = prop.T_limits[prop.method]
+            Tmin = low if Tmin is None else Tmin
+            Tmax = high if Tmax is None else Tmax
+
+        def f(T):
+            value = prop.T_dependent_property(T)
+            if value is None:
+                raise ValueError('Property could not be calculated at %g K' %(T))
+            return value
+        return cls.from_function(f, Tmin, Tmax, pieces=pieces, n=n)
+
+    def as_json(self):
+        '''Method to create a JSON-friendly representation of the
+        approximation which can be stored, and reloaded later with
+        :obj:`from_json`.
+
+        Returns
+        -------
+        json_repr : dict
+            JSON-friendly representation, [-]
+        '''
+        return {'points': list(self.points), 'coeffs': [list(c) for c in self.coeffs]}
+
+    @classmethod
+    def from_json(cls, json_repr):
+        '''Method to create a MultiCheb1D from a JSON-friendly serialization
+        of another MultiCheb1D.
+
+        Parameters
+        ----------
+        json_repr : dict
+            JSON-friendly representation, [-]
+
+        Returns
+        -------
+        approximator : MultiCheb1D
+            Newly created object from the json serialization, [-]
+        '''
+        return cls(json_repr['points'], json_repr['coeffs'])
+
 
 
 class CP_fluid_approximator(object):
@@ -292,6 +462,71 @@ class CP_fluid_approximator(object):
             raise Exception('Given chemical does not have a fit available for '
                             'that property and phase')
 
+    def calculate_many(self, Ts, prop, phase):
+        '''Calculate a property at many temperatures at once, with the same
+        results as :obj:`calculate` at each temperature.
+
+        Parameters
+        ----------
+        Ts : ndarray
+            Temperatures, [K]
+        prop : str
+            CoolProp property key such as 'DMOLAR', [-]
+        phase : str
+            Either 'l' or 'g'; ignored for 'CP0MOLAR', [-]
+
+        Returns
+        -------
+        values : ndarray
+            Approximated property, [-]
+        '''
+        assert phase in ['l', 'g']
+        name = prop if prop == 'CP0MOLAR' else prop + ('_g' if phase == 'g' else '_l')
+        try:
+            approximator = getattr(self, name)
+        except AttributeError:
+            raise Exception('Given chemical does not have a fit available for '
+                            'that property and phase')
+        return approximator.evaluate_many(Ts)
+
+    def as_json(self):
+        '''Method to create a JSON-friendly representation of the
+        approximator and all of its property fits, which can be reloaded
+        later with :obj:`from_json` without CoolProp.
+
+        Returns
+        -------
+        json_repr : dict
+            JSON-friendly representation, [-]
+        '''
+        d = {}
+        for k in self.__slots__:
+            if k == 'HEOS' or not hasattr(self, k):
+                continue
+            v = getattr(self, k)
+            d[k] = v.as_json() if isinstance(v, MultiCheb1D) else v
+        return d
+
+    @classmethod
+    def from_json(cls, json_repr):
+        '''Method to create a CP_fluid_approximator from a JSON-friendly
+        serialization of another one.
+
+        Parameters
+        ----------
+        json_repr : dict
+            JSON-friendly representation, [-]
+
+        Returns
+        -------
+        approximator : CP_fluid_approximator
+            Newly created object from the json serialization, [-]
+        '''
+        obj = cls()
+        for k, v in json_repr.items():
+            setattr(obj, k, MultiCheb1D.from_json(v) if isinstance(v, dict) else v)
+        return obj
+
     def validate_prop(self, prop, phase, evaluated_points=30):
         phase_key = '_g' if phase == 'g' else '_l'
         name = prop + phase_key
@@ -23,9 +23,12 @@ SOFTWARE.'''
 from __future__ import division
 
 __all__ = ['tabulate_solid', 'tabulate_liq', 'tabulate_gas',
-           'tabulate_constants', 'tabulate_streams']
+           'tabulate_constants', 'tabulate_streams', 'tabulate_many',
+           'tabulate_constants_many']
 
 from collections import OrderedDict
+from math import nan
+from fluids.constants import R
 from fluids.numerics import numpy as np
 from thermo.chemical import Chemical
 
@@ -231,6 +234,253 @@ def tabulate_constants(chemical, full=False, vertical=False):
     return df
 
 
+tabulate_constants_many_columns = OrderedDict([
+    ('Formula', 'formulas'),
+    ('MW, g/mol', 'MWs'),
+    ('Tm, K', 'Tms'),
+    ('Tb, K', 'Tbs'),
+    ('Tc, K', 'Tcs'),
+    ('Pc, Pa', 'Pcs'),
+    ('Vc, m^3/mol', 'Vcs'),
+    ('Zc', 'Zcs'),
+    ('rhoc, kg/m^3', 'rhocs_mass'),
+    ('Acentric factor', 'omegas'),
+    ('Triple temperature, K', 'Tts'),
+    ('Triple pressure, Pa', 'Pts'),
+    ('Heat of vaporization at Tb, J/mol', 'Hvap_Tbs'),
+    ('Heat of fusion, J/mol', 'Hfus_Tms'),
+    ('Heat of sublimation, J/mol', 'Hsub_Tts'),
+    ('Heat of formation, J/mol', 'Hfgs'),
+    ('Dipole moment, debye', 'dipoles'),
+    ('Molecular Diameter, Angstrom', 'molecular_diameters'),
+    ('Stockmayer parameter, K', 'Stockmayers'),
+    ('Refractive index', 'RIs'),
+    ('Lower flammability limit, fraction', 'LFLs'),
+    ('Upper flammability limit, fraction', 'UFLs'),
+    ('Flash temperature, K', 'Tflashs'),
+    ('Autoignition temperature, K', 'Tautoignitions'),
+    ('logP', 'logPs'),
+])
+
+
+def _tabulate_many_T_range(constants, i, phase, Tmin, Tmax):
+    # Same default limits as `tabulate_liq`, `tabulate_gas` and
+    # `tabulate_solid`
+    Tm, Tc = constants.Tms[i], constants.Tcs[i]
+    if phase == 's':
+        if not Tmin:
+            Tmin = min(Tm-100, 1e-2) if Tm else 150.
+        if not Tmax:
+            Tmax = Tm if Tm else 350.
+    else:
+        if not Tmin:
+            Tmin = Tm if Tm else 273.15
+        if not Tmax:
+            Tmax = Tc if Tc else 450.
+    return Tmin, Tmax
+
+
+def _tabulate_many_property(objs, i, Ts):
+    if objs is None or objs[i] is None:
+        return np.full(Ts.size, nan)
+    return objs[i].T_dependent_property_many(Ts)
+
+
+def _tabulate_many_job(args):
+    correlations, phase, Tmin, Tmax, pts, P = args
+    constants = correlations.constants
+    columns = OrderedDict()
+    CASs, names, Ts_all = [], [], []
+    values = OrderedDict()
+    for i in constants.cmps:
+        low, high = _tabulate_many_T_range(constants, i, phase, Tmin, Tmax)
+        Ts = np.linspace(low, high, pts)
+        MW = constants.MWs[i]
+        to_mass = 1000.0/MW
+        if phase == 's':
+            data = OrderedDict()
+            data['Density, kg/m^3'] = 1.0/(to_mass*_tabulate_many_property(correlations.VolumeSolids, i, Ts))
+            data['Constant-pressure heat capacity, J/kg/K'] = _tabulate_many_property(correlations.HeatCapacitySolids, i, Ts)*to_mass
+        elif phase == 'l':
+            rho = 1.0/(to_mass*_tabulate_many_property(correlations.VolumeLiquids, i, Ts))
+            Cp = _tabulate_many_property(correlations.HeatCapacityLiquids, i, Ts)*to_mass
+            mu = _tabulate_many_property(correlations.ViscosityLiquids, i, Ts)
+            k = _tabulate_many_property(correlations.ThermalConductivityLiquids, i, Ts)
+            data = OrderedDict()
+            data['Saturation pressure, Pa'] = _tabulate_many_property(correlations.VaporPressures, i, Ts)
+            data['Density, kg/m^3'] = rho
+            data['Constant-pressure heat capacity, J/kg/K'] = Cp
+            data['Heat of vaporization, J/kg'] = _tabulate_many_property(correlations.EnthalpyVaporizations, i, Ts)*to_mass
+            data['Viscosity, Pa*s'] = mu
+            data['Thermal conductivity, W/m/K'] = k
+            data['Surface tension, N/m'] = _tabulate_many_property(correlations.SurfaceTensions, i, Ts)
+            data['Prandtl number'] = Cp*mu/k
+            data['Thermal diffusivity, m^2/s'] = k/(rho*Cp)
+            data['PermittivityLiquid'] = _tabulate_many_property(correlations.PermittivityLiquids, i, Ts)
+        else:
+            rho = P*MW/(1000.0*R*Ts)
+            Cp = _tabulate_many_property(correlations.HeatCapacityGases, i, Ts)*to_mass
+            Cv = Cp - R*to_mass
+            mu = _tabulate_many_property(correlations.ViscosityGases, i, Ts)
+            k = _tabulate_many_property(correlations.ThermalConductivityGases, i, Ts)
+            data = OrderedDict()
+            data['Density, kg/m^3'] = rho
+            data['Constant-pressure heat capacity, J/kg/K'] = Cp
+            data['Constant-volume heat capacity, J/kg/K'] = Cv
+            data['Viscosity, Pa*s'] = mu
+            data['Thermal conductivity, W/m/K'] = k
+            data['Prandtl number'] = Cp*mu/k
+            data['Thermal diffusivity, m^2/s'] = k/(rho*Cp)
+            data['Isobaric expansion, 1/K'] = 1.0/Ts
+            data['Isentropic exponent'] = Cp/Cv
+        CASs.extend([constants.CASs[i]]*pts)
+        names.extend([constants.names[i]]*pts)
+        Ts_all.append(Ts)
+        for key, v in data.items():
+            values.setdefault(key, []).append(v)
+    columns['CAS'] = CASs
+    columns['Name'] = names
+    columns['T, K'] = np.concatenate(Ts_all) if Ts_all else np.zeros(0)
+    for key, v in values.items():
+        columns[key] = np.concatenate(v)
+    return columns
+
+
+def _tabulate_many_write(columns, path):
+    if path.endswith('.npz'):
+        np.savez(path, **{k: np.asarray(v) for k, v in columns.items()})
+        return
+    import csv
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(list(columns.keys()))
+        writer.writerows(zip(*[v.tolist() if isinstance(v, np.ndarray) else v
+                               for v in columns.values()]))
+
+
+def tabulate_many(correlations, phase='l', Tmin=None, Tmax=None, pts=10,
+                  P=101325.0, path=None, processes=1):
+    r'''Tabulate the temperature dependent properties of every chemical in
+    a :obj:`PropertyCorrelationsPackage <thermo.chemical_package.PropertyCorrelationsPackage>`
+    at once, as a single table with one row per chemical and temperature.
+    Each correlation is evaluated over its chemical's whole temperature grid
+    with :obj:`T_dependent_property_many <thermo.utils.TDependentProperty.T_dependent_property_many>`
+    rather than creating a :obj:`Chemical <thermo.chemical.Chemical>` at
+    every temperature, as :obj:`tabulate_liq`, :obj:`tabulate_gas`
+    and :obj:`tabulate_solid` do.
+
+    Parameters
+    ----------
+    correlations : PropertyCorrelationsPackage
+        Correlations and constants of the chemicals, [-]
+    phase : str, optional
+        'l' for liquid, 'g' for gas or 's' for solid properties, [-]
+    Tmin : float, optional
+        Lowest temperature of every chemical's table; if not given, the same
+        defaults as the single chemical functions are used, [K]
+    Tmax : float, optional
+        Highest temperature of every chemical's table; if not given, the same
+        defaults as the single chemical functions are used, [K]
+    pts : int, optional
+        Number of temperatures for each chemical, [-]
+    P : float, optional
+        Pressure of the gas properties, [Pa]
+    path : str, optional
+        If given, the table is also written to this file; a `.npz` extension
+        saves numpy arrays, anything else a CSV file, [-]
+    processes : int, optional
+        Number of worker processes to split the chemicals between, [-]
+
+    Returns
+    -------
+    columns : OrderedDict
+        Columns of the table by title; 'CAS' and 'Name' are lists and all
+        others numpy arrays, with NaN where a property is not available, [-]
+
+    Notes
+    -----
+    Gas properties are those of the ideal gas with the low pressure
+    viscosity and thermal conductivity, so the Joule-Thomson coefficient is
+    not included. Liquid properties are those of the saturated liquid; the
+    isobaric expansion and Joule-Thomson coefficients are not included.
+
+    Examples
+    --------
+    >>> from thermo import ChemicalConstantsPackage
+    >>> constants, correlations = ChemicalConstantsPackage.from_IDs(['water', 'hexane'])
+    >>> table = tabulate_many(correlations, Tmin=300.0, Tmax=350.0, pts=3)
+    >>> table['Name']
+    ['water', 'water', 'water', 'hexane', 'hexane', 'hexane']
+    >>> table['Saturation pressure, Pa'].round(0)
+    array([  3534.,  13514.,  41620.,  21841.,  57739., 129801.])
+    '''
+    if phase not in ('l', 'g', 's'):
+        raise ValueError("phase must be one of 'l', 'g' or 's'")
+    N = correlations.constants.N
+    if processes > 1 and N > 1:
+        from multiprocessing import Pool
+        # Keep the chemicals in order by giving each worker a contiguous block
+        size = -(-N//processes)
+        chunks = [list(range(i, min(i+size, N))) for i in range(0, N, size)]
+        jobs = [(correlations.subset(idxs), phase, Tmin, Tmax, pts, P) for idxs in chunks]
+        with Pool(processes) as pool:
+            results = pool.map(_tabulate_many_job, jobs)
+        columns = OrderedDict()
+        for key in results[0]:
+            parts = [r[key] for r in results]
+            if isinstance(parts[0], list):
+                columns[key] = [v for part in parts for v in part]
+            else:
+                columns[key] = np.concatenate(parts)
+    else:
+        columns = _tabulate_many_job((correlations, phase, Tmin, Tmax, pts, P))
+    if path is not None:
+        _tabulate_many_write(columns, path)
+    return columns
+
+
+def tabulate_constants_many(constants, path=None):
+    r'''Tabulate the constant properties of every chemical in a
+    :obj:`ChemicalConstantsPackage <thermo.chemical_package.ChemicalConstantsPackage>`,
+    with one row per chemical and the same columns as
+    :obj:`tabulate_constants`; no :obj:`Chemical <thermo.chemical.Chemical>`
+    objects are created.
+
+    Parameters
+    ----------
+    constants : ChemicalConstantsPackage
+        Constants of the chemicals, [-]
+    path : str, optional
+        If given, the table is also written to this file; a `.npz` extension
+        saves numpy arrays, anything else a CSV file, [-]
+
+    Returns
+    -------
+    columns : OrderedDict
+        Columns of the table by title; 'CAS', 'Name' and 'Formula' are lists
+        and all others numpy arrays, with NaN where a constant is missing, [-]
+
+    Examples
+    --------
+    >>> from thermo import ChemicalConstantsPackage
+    >>> constants = ChemicalConstantsPackage.constants_from_IDs(['water', 'hexane'])
+    >>> tabulate_constants_many(constants)['Tc, K']
+    array([647.14, 507.6 ])
+    '''
+    columns = OrderedDict()
+    columns['CAS'] = list(constants.CASs)
+    columns['Name'] = list(constants.names)
+    for title, attr in tabulate_constants_many_columns.items():
+        values = getattr(constants, attr)
+        if attr == 'formulas':
+            columns[title] = list(values)
+        else:
+            columns[title] = np.array([nan if v is None else v for v in values], dtype=float)
+    if path is not None:
+        _tabulate_many_write(columns, path)
+    return columns
+
+
 def tabulate_streams(names=None, *args, **kwargs):
     # Names are the names of the streams to be displayed; input
     # strings for each of them or bad things happen!
@@ -40,6 +40,7 @@ Aqueous Electrolyte Density
 .. autofunction:: Laliberte_density_mix
 .. autofunction:: Laliberte_density_i
 .. autofunction:: Laliberte_density_w
+.. autofunction:: Laliberte_density_many
 
 Aqueous Electrolyte Heat Capacity
 -----------------------------------
@@ -47,6 +48,7 @@ Aqueous Electrolyte Heat Capacity
 .. autofunction:: Laliberte_heat_capacity_mix
 .. autofunction:: Laliberte_heat_capacity_i
 .. autofunction:: Laliberte_heat_capacity_w
+.. autofunction:: Laliberte_heat_capacity_many
 
 Aqueous Electrolyte Viscosity
 -----------------------------
@@ -54,6 +56,8 @@ Aqueous Electrolyte Viscosity
 .. autofunction:: Laliberte_viscosity_mix
 .. autofunction:: Laliberte_viscosity_i
 .. autofunction:: Laliberte_viscosity_w
+.. autofunction:: Laliberte_viscosity_many
+.. autofunction:: Laliberte_coefficients
 
 Aqueous Electrolyte Thermal Conductivity
 ----------------------------------------
@@ -112,6 +116,8 @@ __all__ = ['Laliberte_density', 'Laliberte_heat_capacity',
            'Laliberte_viscosity_i', 'Laliberte_density_w',
            'Laliberte_density_i', 'Laliberte_density_mix', 'Laliberte_heat_capacity_w',
            'Laliberte_heat_capacity_i','Laliberte_heat_capacity_mix',
+           'Laliberte_coefficients', 'Laliberte_density_many',
+           'Laliberte_viscosity_many', 'Laliberte_heat_capacity_many',
            'dilute_ionic_conductivity', 'conductivity_McCleskey',
            'conductivity', 'conductivity_methods', 'conductivity_all_methods',
            'thermal_conductivity_Magomedov', 'Magomedov_mix', 'ionic_strength', 'Kweq_1981',
@@ -121,10 +127,11 @@ __all__ = ['Laliberte_density', 'Laliberte_heat_capacity',
 
 import os
 from fluids.constants import e, N_A
-from fluids.numerics import newton, horner, chebval
+from fluids.numerics import newton, horner, chebval, numpy as np
 from chemicals.utils import source_path, os_path_join, can_load_data, PY37
 from chemicals.data_reader import data_source, register_df_source
 from chemicals.utils import exp, log10, isnan
+from math import nan
 from chemicals.utils import to_num, ws_to_zs, mixing_simple
 from chemicals import identifiers
 
@@ -185,6 +192,90 @@ else:
     if can_load_data:
         _load_electrochem_data()
 
+### Laliberte coefficient store - parsed once, without pandas
+
+_loaded_Laliberte_coeffs = False
+def _load_Laliberte_coeffs():
+    global _Laliberte_density_coeffs, _Laliberte_viscosity_coeffs
+    global _Laliberte_heat_capacity_coeffs, _loaded_Laliberte_coeffs
+    rho_coeffs, mu_coeffs, Cp_coeffs = {}, {}, {}
+    with open(os.path.join(folder, 'Laliberte2009.tsv'), encoding='utf-8') as f:
+        next(f)
+        for line in f:
+            row = line.rstrip('\r\n').split('\t')
+            if len(row) < 2 or not row[1]:
+                continue
+            # Name, CASRN and formula, then numeric columns
+            vals = [float(v) if v.strip() else nan for v in row[3:]]
+            CAS = row[1]
+            rho_coeffs[CAS] = tuple(vals[1:6])
+            mu_coeffs[CAS] = tuple(vals[10:16])
+            Cp_coeffs[CAS] = tuple(vals[20:26])
+    _Laliberte_density_coeffs = rho_coeffs
+    _Laliberte_viscosity_coeffs = mu_coeffs
+    _Laliberte_heat_capacity_coeffs = Cp_coeffs
+    _loaded_Laliberte_coeffs = True
+
+def Laliberte_coefficients(CASRNs):
+    r'''Look up the coefficients of the Laliberte [1]_ density, viscosity
+    and heat capacity models for a list of solutes. The data is read once
+    from the same file as :obj:`Laliberte_data`, without pandas; missing
+    coefficients are NaN.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CAS numbers of the fluid components other than water, [-]
+
+    Returns
+    -------
+    rho_coeffs : ndarray
+        Density coefficients `c0` to `c4` of each solute, shape (N, 5), [-]
+    mu_coeffs : ndarray
+        Viscosity coefficients `v1` to `v6` of each solute, shape (N, 6), [-]
+    Cp_coeffs : ndarray
+        Heat capacity coefficients `a1` to `a6` of each solute, shape (N, 6),
+        [-]
+
+    Notes
+    -----
+    A KeyError is raised for a CAS number without data.
+
+    Examples
+    --------
+    >>> rho_coeffs, mu_coeffs, Cp_coeffs = Laliberte_coefficients(['7647-14-5'])
+    >>> mu_coeffs
+    array([[1.62217886e+01, 1.32293087e+00, 1.48485985e+00, 7.46912560e-03,
+            3.07802008e+01, 2.05826852e+00]])
+
+    References
+    ----------
+    .. [1] Laliberte, Marc. "A Model for Calculating the Heat Capacity of
+       Aqueous Solutions, with Updated Density and Viscosity Data." Journal of
+       Chemical & Engineering Data 54, no. 6 (June 11, 2009): 1725-60.
+       doi:10.1021/je8008123
+    '''
+    if not _loaded_Laliberte_coeffs: _load_Laliberte_coeffs()
+    N = len(CASRNs)
+    rho_coeffs = np.array([_Laliberte_density_coeffs[CAS] for CAS in CASRNs]).reshape(N, 5)
+    mu_coeffs = np.array([_Laliberte_viscosity_coeffs[CAS] for CAS in CASRNs]).reshape(N, 6)
+    Cp_coeffs = np.array([_Laliberte_heat_capacity_coeffs[CAS] for CAS in CASRNs]).reshape(N, 6)
+    return rho_coeffs, mu_coeffs, Cp_coeffs
+
+def _Laliberte_many_inputs(Ts, ws_2d):
+    Ts = np.asarray(Ts, dtype=float).ravel()
+    ws_2d = np.atleast_2d(np.asarray(ws_2d, dtype=float))
+    M = max(Ts.size, ws_2d.shape[0])
+    Ts = np.broadcast_to(Ts, (M,))
+    ws_2d = np.broadcast_to(ws_2d, (M, ws_2d.shape[1]))
+    # Summed in the same order as the scalar functions
+    w_w = np.ones(M)
+    w_solutes = np.zeros(M)
+    for i in range(ws_2d.shape[1]):
+        w_solutes = w_solutes + ws_2d[:, i]
+    w_w -= w_solutes
+    return Ts, ws_2d, w_w
+
 ### Laliberty Viscosity Functions
 
 
@@ -378,18 +469,54 @@ def Laliberte_viscosity(T, ws, CASRNs):
        Chemical & Engineering Data 54, no. 6 (June 11, 2009): 1725-60.
        doi:10.1021/je8008123
     '''
-    if not _loaded_electrochem_data: _load_electrochem_data()
+    if not _loaded_Laliberte_coeffs: _load_Laliberte_coeffs()
     v1s, v2s, v3s, v4s, v5s, v6s = [], [], [], [], [], []
     for CAS in CASRNs:
-        dat = Laliberte_data.loc[CAS].values
-        v1s.append(float(dat[12]))
-        v2s.append(float(dat[13]))
-        v3s.append(float(dat[14]))
-        v4s.append(float(dat[15]))
-        v5s.append(float(dat[16]))
-        v6s.append(float(dat[17]))
+        v1, v2, v3, v4, v5, v6 = _Laliberte_viscosity_coeffs[CAS]
+        v1s.append(v1)
+        v2s.append(v2)
+        v3s.append(v3)
+        v4s.append(v4)
+        v5s.append(v5)
+        v6s.append(v6)
     return Laliberte_viscosity_mix(T, ws, v1s, v2s, v3s, v4s, v5s, v6s)
 
+def Laliberte_viscosity_many(Ts, ws_2d, CASRNs):
+    r'''Calculate the viscosity of many aqueous mixtures of the same solutes
+    with the model of :obj:`Laliberte_viscosity`, using array operations.
+
+    Parameters
+    ----------
+    Ts : list[float]
+        Temperatures of fluid, [K]
+    ws_2d : list[list[float]]
+        Weight fractions of fluid components other than water, one row per
+        temperature or a single row for all of them, [-]
+    CASRNs : list[str]
+        CAS numbers of the fluid components other than water, [-]
+
+    Returns
+    -------
+    mus : ndarray
+        Viscosities of aqueous mixture, [Pa*s]
+
+    Examples
+    --------
+    >>> Laliberte_viscosity_many([273.15+5, 298.15], [[0.005810]], ['7647-14-5'])
+    array([0.00152858, 0.00089734])
+    '''
+    mu_coeffs = Laliberte_coefficients(CASRNs)[1]
+    Ts, ws_2d, w_w = _Laliberte_many_inputs(Ts, ws_2d)
+    t = Ts - 273.15
+    mu = (Laliberte_viscosity_w(Ts)*1000.)**w_w
+    factor = np.ones(Ts.size)
+    w_s = 1.0 - w_w
+    for i in range(len(CASRNs)):
+        v1, v2, v3, v4, v5, v6 = mu_coeffs[i].tolist()
+        mu_i = np.exp((v1*w_s**v2 + v3)/(v4*t + 1.0))/(v5*w_s**v6 + 1.0)
+        factor *= mu_i**ws_2d[:, i]
+    return mu*factor*1e-3
+
 
 ### Laliberty Density Functions
 
@@ -580,17 +707,54 @@ def Laliberte_density(T, ws, CASRNs):
        Chemical & Engineering Data 54, no. 6 (June 11, 2009): 1725-60.
        doi:10.1021/je8008123
     '''
-    if not _loaded_electrochem_data: _load_electrochem_data()
+    if not _loaded_Laliberte_coeffs: _load_Laliberte_coeffs()
     c0s, c1s, c2s, c3s, c4s = [], [], [], [], []
     for CAS in CASRNs:
-        dat = Laliberte_data.loc[CAS].values
-        c0s.append(float(dat[3]))
-        c1s.append(float(dat[4]))
-        c2s.append(float(dat[5]))
-        c3s.append(float(dat[6]))
-        c4s.append(float(dat[7]))
+        c0, c1, c2, c3, c4 = _Laliberte_density_coeffs[CAS]
+        c0s.append(c0)
+        c1s.append(c1)
+        c2s.append(c2)
+        c3s.append(c3)
+        c4s.append(c4)
 
     return Laliberte_density_mix(T, ws, c0s, c1s, c2s, c3s, c4s)
+
+def Laliberte_density_many(Ts, ws_2d, CASRNs):
+    r'''Calculate the density of many aqueous electrolyte mixtures of the
+    same solutes with the model of :obj:`Laliberte_density`, using array
+    operations.
+
+    Parameters
+    ----------
+    Ts : list[float]
+        Temperatures of fluid, [K]
+    ws_2d : list[list[float]]
+        Weight fractions of fluid components other than water, one row per
+        temperature or a single row for all of them, [-]
+    CASRNs : list[str]
+        CAS numbers of the fluid components other than water, [-]
+
+    Returns
+    -------
+    rhos : ndarray
+        Solution densities, [kg/m^3]
+
+    Examples
+    --------
+    >>> Laliberte_density_many([273.15, 298.15], [[0.0037838838]], ['7647-14-5'])
+    array([1002.62501202,  999.6743846 ])
+    '''
+    rho_coeffs = Laliberte_coefficients(CASRNs)[0]
+    Ts, ws_2d, w_w = _Laliberte_many_inputs(Ts, ws_2d)
+    t = Ts - 273.15
+    rho = w_w/Laliberte_density_w(Ts)
+    w_s = 1.0 - w_w
+    for i in range(len(CASRNs)):
+        c0, c1, c2, c3, c4 = rho_coeffs[i].tolist()
+        tc4 = t + c4
+        rho_i = ((c0*w_s + c1)*np.exp(1E-6*tc4*tc4))/(w_s + c2 + c3*t)
+        rho = rho + ws_2d[:, i]/rho_i
+    return 1./rho
 #
 
 ### Laliberty Heat Capacity Functions
@@ -814,18 +978,63 @@ def Laliberte_heat_capacity(T, ws, CASRNs):
        Chemical & Engineering Data 54, no. 6 (June 11, 2009): 1725-60.
        doi:10.1021/je8008123
     '''
-    if not _loaded_electrochem_data: _load_electrochem_data()
+    if not _loaded_Laliberte_coeffs: _load_Laliberte_coeffs()
     a1s, a2s, a3s, a4s, a5s, a6s = [], [], [], [], [], []
     for CAS in CASRNs:
-        dat = Laliberte_data.loc[CAS].values
-        a1s.append(float(dat[22]))
-        a2s.append(float(dat[23]))
-        a3s.append(float(dat[24]))
-        a4s.append(float(dat[25]))
-        a5s.append(float(dat[26]))
-        a6s.append(float(dat[27]))
+        a1, a2, a3, a4, a5, a6 = _Laliberte_heat_capacity_coeffs[CAS]
+        a1s.append(a1)
+        a2s.append(a2)
+        a3s.append(a3)
+        a4s.append(a4)
+        a5s.append(a5)
+        a6s.append(a6)
     return Laliberte_heat_capacity_mix(T, ws, a1s, a2s, a3s, a4s, a5s, a6s)
 
+def Laliberte_heat_capacity_many(Ts, ws_2d, CASRNs):
+    r'''Calculate the heat capacity of many aqueous electrolyte mixtures of
+    the same solutes with the model of :obj:`Laliberte_heat_capacity`, using
+    array operations. Above 365.18 K the heat capacity of water is
+    calculated once for each unique temperature.
+
+    Parameters
+    ----------
+    Ts : list[float]
+        Temperatures of fluid, [K]
+    ws_2d : list[list[float]]
+        Weight fractions of fluid components other than water, one row per
+        temperature or a single row for all of them, [-]
+    CASRNs : list[str]
+        CAS numbers of the fluid components other than water, [-]
+
+    Returns
+    -------
+    Cps : ndarray
+        Solution heat capacities, [J/kg/K]
+
+    Examples
+    --------
+    >>> Laliberte_heat_capacity_many([273.15+1.5, 298.15], [[0.00398447]], ['7647-14-5'])
+    array([4186.5754076 , 4159.99505224])
+    '''
+    Cp_coeffs = Laliberte_coefficients(CASRNs)[2]
+    Ts, ws_2d, w_w = _Laliberte_many_inputs(Ts, ws_2d)
+    Cp_ws = chebval(0.012903225806451612892*(Ts - 335.64999999999997726),
+                    Laliberte_heat_capacity_coeffs)
+    high = Ts > 365.1800756083714
+    if high.any():
+        Ts_unique, inverse = np.unique(Ts[high], return_inverse=True)
+        Cp_ws[high] = np.array([iapws95_Cpl_mass_sat(T) for T in Ts_unique.tolist()])[inverse.ravel()]
+    t = Ts - 273.15
+    Cp = w_w*Cp_ws
+    w_s = 1.0 - w_w
+    exp_t = np.exp(0.01*t)
+    for i in range(len(CASRNs)):
+        a1, a2, a3, a4, a5, a6 = Cp_coeffs[i].tolist()
+        alpha = a2*t + a3*exp_t + a4*w_s
+        Cp_i = (a1*np.exp(alpha) + a5*w_s**a6)*1000.
+        Cp += ws_2d[:, i]*Cp_i
+    return Cp
+
 ### Electrical Conductivity
 
 
@@ -931,6 +931,7 @@ class GCEOS(object):
         self._model_hash = h
         return h
 
+    hash_ignore_props = ()
     def __hash__(self):
         r'''Method to calculate and return a hash representing the exact state
         of the object.
@@ -941,7 +942,16 @@ class GCEOS(object):
             Hash of the object, [-]
         '''
         d = self.__dict__
+        # values cached from the model parameters should be ignored
+        temp_store = {}
+        for k in self.hash_ignore_props:
+            try:
+                temp_store[k] = d[k]
+                del d[k]
+            except KeyError:
+                pass
         ans = hash_any_primitive((self.__class__.__name__, d))
+        d.update(temp_store)
         return ans
 
     def __eq__(self, other):
@@ -1029,6 +1039,12 @@ class GCEOS(object):
             del d['kwargs']
         except:
             pass
+        # Cached values are recomputed when needed
+        for k in self.hash_ignore_props:
+            try:
+                del d[k]
+            except KeyError:
+                pass
         d["py/object"] = self.__full_path__
         d['json_version'] = 1
         return d
@@ -1235,7 +1251,7 @@ class GCEOS(object):
                                                   force_g=force_g)
                 self.phase = 'l/g'
         elif good_root_count == 2 and (good_roots[0] == good_roots[1]):
-	    self.phase = self.set_properties_from_solution(self.T, self.P,
+            self.phase = self.set_properties_from_solution(self.T, self.P,
                                                            good_roots[0], b,
                                                            self.delta, self.epsilon,
                                                            self.a_alpha, self.da_alpha_dT,
@@ -1256,7 +1272,7 @@ class GCEOS(object):
                                                   force_l=force_l,
                                                   force_g=force_g)
                 self.phase = 'l/g'
-	elif good_root_count > 1:
+        elif good_root_count > 1:
             V_l, V_g = min(good_roots), max(good_roots)
 
             if not only_g:
@@ -198,6 +198,7 @@ __all__ = ['GCEOSMIX', 'PRMIX', 'SRKMIX', 'PR78MIX', 'VDWMIX', 'PRSVMIX',
 
 import sys
 from cmath import log as clog
+from math import nan
 
 from fluids.numerics import numpy as np, IS_PYPY, newton_system, broyden2, UnconvergedError, trunc_exp, solve_2_direct, catanh
 from fluids.numerics.arrays import det, subset_matrix
@@ -212,6 +213,9 @@ from thermo import serialize
 from thermo.eos_mix_methods import (a_alpha_aijs_composition_independent,
     a_alpha_aijs_composition_independent_support_zeros, a_alpha_and_derivatives, a_alpha_and_derivatives_full,
     a_alpha_quadratic_terms, a_alpha_and_derivatives_quadratic_terms,
+    a_alpha_kijs_sparsity, a_alpha_quadratic_terms_sparse,
+    a_alpha_and_derivatives_quadratic_terms_sparse,
+    a_alpha_and_derivatives_quadratic_terms_dense,
     G_dep_lnphi_d_helper, eos_mix_dV_dzs, VDW_lnphis, SRK_lnphis, eos_mix_db_dns, PR_translated_ddelta_dns,
     PR_translated_depsilon_dns, PR_depsilon_dns, PR_translated_d2epsilon_dzizjs,
     PR_d2epsilon_dninjs, PR_d3epsilon_dninjnks, PR_d2delta_dninjs, PR_d3delta_dninjnks,
@@ -250,6 +254,32 @@ c1R2_PR = PR.c1R2
 c2R_PR = PR.c2R
 
 
+def _critical_point_secant(func, x0, dx0, xtol, max_step, maxiter=100):
+    # Secant method with steps limited to a fraction `max_step` of the
+    # current value; a point where `func` cannot be evaluated (the EOS gives
+    # a negative pressure, or the volume is at or below the covolume) is
+    # stepped back towards the last good point
+    x1, f1 = x0, func(x0)
+    x2 = x0 + dx0
+    for _ in range(maxiter):
+        try:
+            f2 = func(x2)
+        except (ValueError, ZeroDivisionError):
+            x2 = 0.5*(x1 + x2)
+            continue
+        if f2 == f1:
+            return x2
+        step = -f2*(x2 - x1)/(f2 - f1)
+        limit = max_step*abs(x2)
+        if abs(step) > limit:
+            step = limit if step > 0.0 else -limit
+        x1, f1 = x2, f2
+        x2 += step
+        if abs(step) < xtol*abs(x2):
+            return x2
+    raise UnconvergedError("Critical point search did not converge")
+
+
 class GCEOSMIX(GCEOS):
     r'''Class for solving a generic pressure-explicit three-parameter cubic
     equation of state for a mixture. Does not implement any parameters itself;
@@ -259,6 +289,7 @@ class GCEOSMIX(GCEOS):
         P=\frac{RT}{V-b}-\frac{a\alpha(T)}{V^2 + \delta V + \epsilon}
     '''
     nonstate_constants = ('N', 'cmps', 'Tcs', 'Pcs', 'omegas', 'kijs', 'kwargs', 'ais', 'bs')
+    hash_ignore_props = ('_kijs_sparse', '_one_minus_kijs')
     mix_kwargs_to_pure = {}
     kwargs_square = ('kijs',)
     '''Tuple of 2D arguments used by the specific EOS.
@@ -472,6 +503,14 @@ class GCEOSMIX(GCEOS):
         new.Pcs = self.Pcs
         new.omegas = self.omegas
         new.kijs = self.kijs
+        try:
+            new._kijs_sparse = self._kijs_sparse
+        except AttributeError:
+            pass
+        try:
+            new._one_minus_kijs = self._one_minus_kijs
+        except AttributeError:
+            pass
         new.kwargs = self.kwargs
         new.ais = self.ais
         new.bs = self.bs
@@ -1167,6 +1206,38 @@ class GCEOSMIX(GCEOS):
             self.a_alpha_roots = a_alpha_roots = [sqrt(i) for i in a_alphas]
         else:
             self.a_alpha_roots = a_alpha_roots = npsqrt(a_alphas)
+        if N >= 10:
+            # Many components - often pseudocomponents without kijs.
+            # In NumPy mode, let BLAS do the double sums; otherwise avoid the
+            # N^2 loops when kijs are sparse.
+            if not scalar and N >= 50:
+                one_minus_kijs = self.one_minus_kijs
+                if one_minus_kijs is not None:
+                    if full:
+                        a_alpha, da_alpha_dT, d2a_alpha_dT2, self.a_alpha_j_rows, self.da_alpha_dT_j_rows = (
+                            a_alpha_and_derivatives_quadratic_terms_dense(a_alphas, a_alpha_roots, da_alpha_dTs,
+                                                                          d2a_alpha_dT2s, T, zs, one_minus_kijs, full=True))
+                        return a_alpha, da_alpha_dT, d2a_alpha_dT2
+                    a_alpha, self.a_alpha_j_rows = a_alpha_and_derivatives_quadratic_terms_dense(a_alphas, a_alpha_roots, None, None,
+                                                                                                 T, zs, one_minus_kijs, full=False)
+                    return a_alpha
+            kij_is, kij_js, kij_values = self.kijs_sparse
+            if kij_is is not None:
+                if scalar:
+                    a_alpha_j_rows, da_alpha_dT_j_rows = [0.0]*N, [0.0]*N
+                else:
+                    a_alpha_j_rows, da_alpha_dT_j_rows = zeros(N), zeros(N)
+                if full:
+                    a_alpha, da_alpha_dT, d2a_alpha_dT2, self.a_alpha_j_rows, self.da_alpha_dT_j_rows = (
+                        a_alpha_and_derivatives_quadratic_terms_sparse(a_alphas, a_alpha_roots, da_alpha_dTs,
+                                                                       d2a_alpha_dT2s, T, zs, kij_is, kij_js, kij_values,
+                                                                       a_alpha_j_rows=a_alpha_j_rows,
+                                                                       da_alpha_dT_j_rows=da_alpha_dT_j_rows))
+                    return a_alpha, da_alpha_dT, d2a_alpha_dT2
+                a_alpha, self.a_alpha_j_rows = a_alpha_quadratic_terms_sparse(a_alphas, a_alpha_roots, T, zs, kij_is, kij_js,
+                                                                              kij_values, a_alpha_j_rows=a_alpha_j_rows,
+                                                                              vec0=da_alpha_dT_j_rows)
+                return a_alpha
         if full:
             # Converting kijs into a matrix kills the performance! 5x slower than the performance of the functions.
             # converting the 1d arrays also takes as long as the function.
@@ -1191,6 +1262,61 @@ class GCEOSMIX(GCEOS):
 
 
 
+    @property
+    def kijs_sparse(self):
+        r'''Return the nonzero entries of `kijs` if they are sparse enough for
+        the O(N) mixing rules, as the tuple `(kij_is, kij_js, kij_values)` of
+        the row indices, column indices and values of the nonzero lower
+        triangle entries; all three are None if the matrix is too dense.
+
+        Returns
+        -------
+        kijs_sparse : tuple(list[int], list[int], list[float])
+            Sparse representation of `kijs`, [-]
+
+        Notes
+        -----
+        This is computed once and shared with the objects created by
+        :obj:`GCEOSMIX.to_TP_zs_fast`.
+        '''
+        try:
+            return self._kijs_sparse
+        except AttributeError:
+            pass
+        kij_is, kij_js, kij_values = a_alpha_kijs_sparsity(self.kijs, self.N)
+        if kij_is is not None and not self.scalar:
+            kij_is, kij_js, kij_values = array(kij_is, dtype=int), array(kij_js, dtype=int), array(kij_values)
+        self._kijs_sparse = (kij_is, kij_js, kij_values)
+        return self._kijs_sparse
+
+    @property
+    def one_minus_kijs(self):
+        r'''Return the symmetric matrix :math:`1 - k_{ij}` built from the
+        lower triangle of `kijs`, as used by the BLAS mixing rules; None if
+        `kijs` has a nonzero diagonal.
+
+        Returns
+        -------
+        one_minus_kijs : ndarray[float]
+            One minus the binary interaction parameters, [-]
+
+        Notes
+        -----
+        This is computed once and shared with the objects created by
+        :obj:`GCEOSMIX.to_TP_zs_fast`.
+        '''
+        try:
+            return self._one_minus_kijs
+        except AttributeError:
+            pass
+        kijs = np.array(self.kijs)
+        if np.any(np.diag(kijs)):
+            self._one_minus_kijs = None
+        else:
+            lower = np.tril(kijs, -1)
+            self._one_minus_kijs = 1.0 - (lower + lower.T)
+        return self._one_minus_kijs
+
     def a_alpha_and_derivatives_numpy(self, a_alphas, da_alpha_dTs, d2a_alpha_dT2s, T, full=True, quick=True):
         zs, kijs = self.zs, np.array(self.kijs)
         a_alphas = np.array(a_alphas)
@@ -1456,6 +1582,207 @@ class GCEOSMIX(GCEOS):
         T, P = float(TP[0]), float(TP[1])
         return T, P
 
+    def _critical_point_stability_matrix(self, T, V, zs):
+        # Second mole number derivatives of the Helmholtz energy at constant
+        # T and total volume divided by RT, for one mole. Obtained from the
+        # constant T and P derivatives and the partial molar volumes:
+        # (dmu_i/dn_j)_V = (dmu_i/dn_j)_P - Vi_i*Vi_j*(dP/dV)
+        eos = self.to(zs=zs, T=T, V=V, fugacities=False)
+        P = eos.P
+        Z = P*V/(R*T)
+        dlnphis_dns = eos.dlnphis_dns(Z)
+        Vis = eos.dnV_dns(Z)
+        b, delta, epsilon, a_alpha = eos.b, eos.delta, eos.epsilon, eos.a_alpha
+        x0 = V*V + delta*V + epsilon
+        dP_dV = -R*T/((V - b)*(V - b)) + a_alpha*(V + V + delta)/(x0*x0)
+        x1 = -dP_dV/(R*T)
+        N = self.N
+        Q = [[0.0]*N for _ in range(N)]
+        for i in range(N):
+            r = dlnphis_dns[i]
+            for j in range(N):
+                Q[i][j] = r[j] - 1.0 + x1*Vis[i]*Vis[j]
+            Q[i][i] += 1.0/zs[i]
+        return Q, P
+
+    def _critical_point_lambda_min(self, T, V, zs):
+        # Smallest eigenvalue of the scaled stability matrix and its
+        # eigenvector as a mole number change, with a consistent sign
+        Q, P = self._critical_point_stability_matrix(T, V, zs)
+        root_zs = np.sqrt(zs)
+        B = np.array(Q)*np.outer(root_zs, root_zs)
+        eigenvalues, eigenvectors = np.linalg.eigh(B)
+        u = eigenvectors[:, 0]
+        if u[np.argmax(np.abs(u))] < 0.0:
+            u = -u
+        return float(eigenvalues[0]), (u*root_zs).tolist(), P
+
+    def _critical_point_cubic_form(self, T, V, zs, dns, step=1e-5):
+        # Third derivative of the Helmholtz energy along `dns`, from a central
+        # difference of the stability matrix at constant T and total volume;
+        # the step balances the truncation and rounding errors
+        N = self.N
+        vals = []
+        for s in (step, -step):
+            ns = [zs[i] + s*dns[i] for i in range(N)]
+            n = sum(ns)
+            Q, _ = self._critical_point_stability_matrix(T, V/n, [ni/n for ni in ns])
+            tot = 0.0
+            for i in range(N):
+                for j in range(N):
+                    tot += dns[i]*dns[j]*Q[i][j]
+            vals.append(tot/n)
+        return (vals[0] - vals[1])/(2.0*step)
+
+    def critical_point(self, T_guess=None, V_guess=None, zs=None):
+        r'''Method to calculate the true critical point of a mixture of
+        defined composition, using the criteria of Heidemann and Khalil [1]_.
+
+        At constant temperature and total volume, the matrix of second mole
+        number derivatives of the Helmholtz energy is singular, and the third
+        derivative along the matrix's null vector :math:`\Delta n` is zero:
+
+        .. math::
+            \text{det}\left(\frac{\partial^2 A}{\partial n_i \partial
+            n_j}\right)_{T, V} = 0
+
+        .. math::
+            \sum_i \sum_j \sum_k \frac{\partial^3 A}{\partial n_i
+            \partial n_j \partial n_k} \Delta n_i \Delta n_j \Delta n_k = 0
+
+        Parameters
+        ----------
+        T_guess : float, optional
+            Initial guess for the critical temperature; 1.5 times the mole
+            weighted critical temperature if not given, [K]
+        V_guess : float, optional
+            Initial guess for the critical volume; 4 times the covolume if not
+            given, [m^3/mol]
+        zs : list[float], optional
+            Mole fractions to find the critical point at; this object's
+            composition if not given, [-]
+
+        Returns
+        -------
+        T : float
+            Critical temperature, [K]
+        P : float
+            Critical pressure, [Pa]
+        V : float
+            Critical molar volume, [m^3/mol]
+
+        Notes
+        -----
+        The second derivatives are formed from the analytical
+        :obj:`dlnphis_dns <GCEOSMIX.dlnphis_dns>` and
+        :obj:`dnV_dns <GCEOSMIX.dnV_dns>`. The third derivative is not
+        analytical as in [1]_ but a central finite difference of them in the
+        direction of the null vector; this limits the accuracy of the
+        critical temperature, pressure and volume to a relative error of
+        about 1E-10, rather than the solver tolerances. The volume is solved for in an outer loop
+        and the temperature at which the smallest eigenvalue of the matrix is
+        zero in an inner loop, with the secant method in both. A few
+        milliseconds are needed from the default guesses for small mixtures.
+
+        Where a mixture has more than one critical point, the one found
+        depends on the guesses.
+
+        Examples
+        --------
+        >>> eos = PRMIX(Tcs=[190.56, 305.32], Pcs=[4599000.0, 4872000.0], omegas=[0.008, 0.098], zs=[0.5, 0.5], T=300.0, P=1e5)
+        >>> T, P, V = eos.critical_point()
+        >>> round(T, 4), round(P, 0)
+        (265.7598, 6820277.0)
+
+        References
+        ----------
+        .. [1] Heidemann, Robert A., and Ahmed M. Khalil. "The Calculation of
+           Critical Points." AIChE Journal 26, no. 5 (1980): 769-79.
+           https://doi.org/10.1002/aic.690260510.
+        '''
+        if zs is None:
+            zs = self.zs
+        N = self.N
+        if V_guess is None:
+            bs = self.bs
+            V_guess = 4.0*sum([zs[i]*bs[i] for i in range(N)])
+        if T_guess is None:
+            Tcs = self.Tcs
+            T_guess = 1.5*sum([zs[i]*Tcs[i] for i in range(N)])
+        state = [T_guess, None]
+
+        def cubic_form_err(V):
+            T = _critical_point_secant(lambda T: self._critical_point_lambda_min(T, V, zs)[0],
+                                       state[0], -1e-5*state[0], xtol=1e-11, max_step=0.05)
+            _, dns, P = self._critical_point_lambda_min(T, V, zs)
+            state[0], state[1] = T, P
+            return self._critical_point_cubic_form(T, V, zs, dns)
+
+        V = _critical_point_secant(cubic_form_err, V_guess, 1e-3*V_guess, xtol=1e-9, max_step=0.1)
+        if state[1] is None or state[1] < 0.0:
+            raise ValueError("Critical point search ended at a negative pressure")
+        return state[0], state[1], V
+
+    def critical_point_many(self, zs_list, T_guess=None, V_guess=None):
+        r'''Method to calculate the true critical points of many mixtures
+        of the same components, as described in
+        :obj:`critical_point <GCEOSMIX.critical_point>`. Each solution starts
+        from the previous composition's solution, so compositions along a
+        path (such as a critical locus or a grid in a ternary diagram) should
+        be given in order.
+
+        Parameters
+        ----------
+        zs_list : list[list[float]]
+            Mole fractions of each mixture, [-]
+        T_guess : float, optional
+            Initial guess for the critical temperature of the first mixture,
+            [K]
+        V_guess : float, optional
+            Initial guess for the critical volume of the first mixture,
+            [m^3/mol]
+
+        Returns
+        -------
+        Ts : list[float]
+            Critical temperatures; NaN where no solution was found, [K]
+        Ps : list[float]
+            Critical pressures; NaN where no solution was found, [Pa]
+        Vs : list[float]
+            Critical molar volumes; NaN where no solution was found, [m^3/mol]
+
+        Notes
+        -----
+        A mixture whose warm started solve fails is retried from the default
+        guesses. Only failures of the solution - an :obj:`UnconvergedError`,
+        or a `ValueError` or `ZeroDivisionError` from an EOS evaluated at an
+        impossible trial point - give NaN; other errors are raised.
+
+        Examples
+        --------
+        >>> eos = PRMIX(Tcs=[190.56, 305.32], Pcs=[4599000.0, 4872000.0], omegas=[0.008, 0.098], zs=[0.5, 0.5], T=300.0, P=1e5)
+        >>> Ts, Ps, Vs = eos.critical_point_many([[0.4, 0.6], [0.5, 0.5], [0.6, 0.4]])
+        >>> [round(T, 2) for T in Ts]
+        [275.78, 265.76, 254.33]
+        '''
+        Ts, Ps, Vs = [], [], []
+        for zs in zs_list:
+            try:
+                T, P, V = self.critical_point(T_guess=T_guess, V_guess=V_guess, zs=zs)
+            except (UnconvergedError, ValueError, ZeroDivisionError):
+                try:
+                    T, P, V = self.critical_point(zs=zs)
+                except (UnconvergedError, ValueError, ZeroDivisionError):
+                    Ts.append(nan)
+                    Ps.append(nan)
+                    Vs.append(nan)
+                    continue
+            Ts.append(T)
+            Ps.append(P)
+            Vs.append(V)
+            T_guess, V_guess = T, V
+        return Ts, Ps, Vs
+
     def fugacities(self, only_l=False, only_g=False):
         r'''Helper method for calculating fugacity coefficients for any
         phases present, using either the overall mole fractions for both phases
@@ -50,6 +50,14 @@ Faster implementations which do not store N^2 matrices:
 
 .. autofunction:: a_alpha_quadratic_terms
 .. autofunction:: a_alpha_and_derivatives_quadratic_terms
+
+Implementations for many components, which avoid the N^2 loops when `kijs`
+is sparse or use BLAS when it is dense:
+
+.. autofunction:: a_alpha_kijs_sparsity
+.. autofunction:: a_alpha_quadratic_terms_sparse
+.. autofunction:: a_alpha_and_derivatives_quadratic_terms_sparse
+.. autofunction:: a_alpha_and_derivatives_quadratic_terms_dense
 '''
 '''
 Direct fugacity calls
@@ -75,6 +83,9 @@ from thermo.eos_volume import volume_solutions_halley, volume_solutions_fast
 __all__ = ['a_alpha_aijs_composition_independent',
            'a_alpha_and_derivatives', 'a_alpha_and_derivatives_full',
            'a_alpha_quadratic_terms', 'a_alpha_and_derivatives_quadratic_terms',
+           'a_alpha_kijs_sparsity', 'a_alpha_quadratic_terms_sparse',
+           'a_alpha_and_derivatives_quadratic_terms_sparse',
+           'a_alpha_and_derivatives_quadratic_terms_dense',
            'PR_lnphis', 'VDW_lnphis', 'SRK_lnphis', 'eos_mix_lnphis_general',
            
            'VDW_lnphis_fastest', 'PR_lnphis_fastest',
@@ -745,6 +756,332 @@ def a_alpha_and_derivatives_quadratic_terms(a_alphas, a_alpha_roots,
     return a_alpha, da_alpha_dT, d2a_alpha_dT2, a_alpha_j_rows, da_alpha_dT_j_rows
 
 
+def a_alpha_kijs_sparsity(kijs, N):
+    r'''Detects whether a `kijs` matrix is sparse enough for the `a_alpha`
+    mixing rule to be evaluated with the square root factorization
+    :math:`(a\alpha)_{ij} = \sqrt{(a\alpha)_{i}}\sqrt{(a\alpha)_{j}}
+    - k_{ij}\sqrt{(a\alpha)_{i}}\sqrt{(a\alpha)_{j}}`, which costs O(N) plus
+    one operation per nonzero `kij`. This is the common case for mixtures of
+    many pseudocomponents, which often have no interaction parameters at all.
+
+    Only the lower triangle of `kijs` is inspected, as in
+    :obj:`a_alpha_quadratic_terms`.
+
+    Parameters
+    ----------
+    kijs : list[list[float]]
+        Constant kijs, [-]
+    N : int
+        Number of components, [-]
+
+    Returns
+    -------
+    kij_is : list[int] or None
+        First indexes of the nonzero `kijs`; None if `kijs` has a nonzero
+        diagonal or more than a quarter of its entries are nonzero, [-]
+    kij_js : list[int] or None
+        Second indexes of the nonzero `kijs`, [-]
+    kij_values : list[float] or None
+        Values of the nonzero `kijs`, [-]
+
+    Examples
+    --------
+    >>> a_alpha_kijs_sparsity([[0.0, 0.0, 0.1], [0.0, 0.0, 0.0], [0.1, 0.0, 0.0]], 3)
+    ([2], [0], [0.1])
+    >>> a_alpha_kijs_sparsity([[0.0, 0.1], [0.1, 0.0]], 2)
+    (None, None, None)
+    '''
+    kij_is, kij_js, kij_values = [], [], []
+    max_nonzero = N*(N - 1)//4
+    for i in range(N):
+        kijs_i = kijs[i]
+        if kijs_i[i] != 0.0:
+            return None, None, None
+        for j in range(i):
+            kij = kijs_i[j]
+            if kij != 0.0:
+                if len(kij_values) == max_nonzero:
+                    return None, None, None
+                kij_is.append(i)
+                kij_js.append(j)
+                kij_values.append(float(kij))
+    return kij_is, kij_js, kij_values
+
+
+def a_alpha_quadratic_terms_sparse(a_alphas, a_alpha_roots, T, zs, kij_is,
+                                   kij_js, kij_values, a_alpha_j_rows=None,
+                                   vec0=None):
+    r'''Calculates the `a_alpha` term for an equation of state along with the
+    vector quantities needed to compute the fugacities of the mixture, for
+    a `kijs` matrix described by its nonzero entries only (see
+    :obj:`a_alpha_kijs_sparsity`). Gives the same result as
+    :obj:`a_alpha_quadratic_terms` in O(N) plus one operation per nonzero
+    `kij`, using
+
+    .. math::
+        \sum_j z_j(a\alpha)_{ij} = \sqrt{(a\alpha)_{i}}\left(\sum_j z_j
+        \sqrt{(a\alpha)_{j}} - \sum_j k_{ij} z_j\sqrt{(a\alpha)_{j}}\right)
+
+    Parameters
+    ----------
+    a_alphas : list[float]
+        EOS attractive terms, [J^2/mol^2/Pa]
+    a_alpha_roots : list[float]
+        Square roots of `a_alphas`; provided for speed [J/mol/Pa^0.5]
+    T : float
+        Temperature, not used, [K]
+    zs : list[float]
+        Mole fractions of each species
+    kij_is : list[int]
+        First indexes of the nonzero `kijs`, [-]
+    kij_js : list[int]
+        Second indexes of the nonzero `kijs`, [-]
+    kij_values : list[float]
+        Values of the nonzero `kijs`, [-]
+    a_alpha_j_rows : list[float], optional
+        EOS attractive term row destimation vector (does not need
+        to be zeroed, should be provided to prevent allocations),
+        [J^2/mol^2/Pa]
+    vec0 : list[float], optional
+        Empty vector, used in internal calculations, provide to avoid
+        the allocations; does not need to be zeroed, [-]
+
+    Returns
+    -------
+    a_alpha : float
+        EOS attractive term, [J^2/mol^2/Pa]
+    a_alpha_j_rows : list[float]
+        EOS attractive term row sums, [J^2/mol^2/Pa]
+
+    Examples
+    --------
+    >>> zs = [0.1164203, 0.8835797]
+    >>> a_alphas = [0.2491099357671155, 0.6486495863528039]
+    >>> a_alpha_roots = [i**0.5 for i in a_alphas]
+    >>> a_alpha, a_alpha_j_rows = a_alpha_quadratic_terms_sparse(a_alphas, a_alpha_roots, 299.0, zs, [1], [0], [.083])
+    >>> a_alpha, a_alpha_j_rows
+    (0.58562139582, [0.35469988173, 0.61604757237])
+    '''
+    N = len(a_alphas)
+    if a_alpha_j_rows is None:
+        a_alpha_j_rows = [0.0]*N
+    if vec0 is None:
+        vec0 = [0.0]*N
+
+    root_sum = 0.0
+    for i in range(N):
+        vec0[i] = a_alpha_roots[i]*zs[i]
+        root_sum += vec0[i]
+        a_alpha_j_rows[i] = 0.0
+
+    for k in range(len(kij_values)):
+        i, j, kij = kij_is[k], kij_js[k], kij_values[k]
+        a_alpha_j_rows[i] += kij*vec0[j]
+        a_alpha_j_rows[j] += kij*vec0[i]
+
+    a_alpha = 0.0
+    for i in range(N):
+        a_alpha_j_rows[i] = a_alpha_roots[i]*(root_sum - a_alpha_j_rows[i])
+        a_alpha += a_alpha_j_rows[i]*zs[i]
+    return a_alpha, a_alpha_j_rows
+
+
+def a_alpha_and_derivatives_quadratic_terms_sparse(a_alphas, a_alpha_roots,
+                                                   da_alpha_dTs, d2a_alpha_dT2s,
+                                                   T, zs, kij_is, kij_js,
+                                                   kij_values,
+                                                   a_alpha_j_rows=None,
+                                                   da_alpha_dT_j_rows=None):
+    r'''Calculates the `a_alpha` term, and its first two temperature
+    derivatives, for an equation of state along with the vector quantities
+    needed to compute the fugacities and temperature derivatives of
+    fugacities of the mixture, for a `kijs` matrix described by its nonzero
+    entries only (see :obj:`a_alpha_kijs_sparsity`). Gives the same result
+    as :obj:`a_alpha_and_derivatives_quadratic_terms` in O(N) plus one
+    operation per nonzero `kij`.
+
+    With :math:`r_i = \sqrt{(a\alpha)_{i}}`, the pair terms factor as
+    :math:`(a\alpha)_{ij} = (1-k_{ij})r_i r_j` and
+
+    .. math::
+        \frac{\partial (a\alpha)_{ij}}{\partial T} = (1-k_{ij})\left(
+        \frac{\partial r_i}{\partial T} r_j + r_i\frac{\partial r_j}
+        {\partial T}\right)
+
+    .. math::
+        \frac{\partial^2 (a\alpha)_{ij}}{\partial T^2} = (1-k_{ij})\left(
+        \frac{\partial^2 r_i}{\partial T^2} r_j + 2\frac{\partial r_i}
+        {\partial T}\frac{\partial r_j}{\partial T} + r_i\frac{\partial^2 r_j}
+        {\partial T^2}\right)
+
+    so every double sum reduces to sums over single components plus a
+    correction for each nonzero `kij`.
+
+    Parameters
+    ----------
+    a_alphas : list[float]
+        EOS attractive terms, [J^2/mol^2/Pa]
+    a_alpha_roots : list[float]
+        Square roots of `a_alphas`; provided for speed [J/mol/Pa^0.5]
+    da_alpha_dTs : list[float]
+        Temperature derivative of coefficient calculated by EOS-specific
+        method, [J^2/mol^2/Pa/K]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of coefficient calculated by
+        EOS-specific method, [J^2/mol^2/Pa/K**2]
+    T : float
+        Temperature, not used, [K]
+    zs : list[float]
+        Mole fractions of each species
+    kij_is : list[int]
+        First indexes of the nonzero `kijs`, [-]
+    kij_js : list[int]
+        Second indexes of the nonzero `kijs`, [-]
+    kij_values : list[float]
+        Values of the nonzero `kijs`, [-]
+
+    Returns
+    -------
+    a_alpha : float
+        EOS attractive term, [J^2/mol^2/Pa]
+    da_alpha_dT : float
+        Temperature derivative of coefficient calculated by EOS-specific
+        method, [J^2/mol^2/Pa/K]
+    d2a_alpha_dT2 : float
+        Second temperature derivative of coefficient calculated by
+        EOS-specific method, [J^2/mol^2/Pa/K**2]
+    a_alpha_j_rows : list[float]
+        EOS attractive term row sums, [J^2/mol^2/Pa]
+    da_alpha_dT_j_rows : list[float]
+        Temperature derivative of EOS attractive term row sums, [J^2/mol^2/Pa/K]
+
+    Examples
+    --------
+    >>> zs = [0.1164203, 0.8835797]
+    >>> a_alphas = [0.2491099357671155, 0.6486495863528039]
+    >>> a_alpha_roots = [i**0.5 for i in a_alphas]
+    >>> da_alpha_dTs = [-0.0005102028006086241, -0.0011131153520304886]
+    >>> d2a_alpha_dT2s = [1.8651128859234162e-06, 3.884331923127011e-06]
+    >>> a_alpha_and_derivatives_quadratic_terms_sparse(a_alphas, a_alpha_roots, da_alpha_dTs, d2a_alpha_dT2s, 299.0, zs, [1], [0], [.083])
+    (0.58562139582, -0.001018667672, 3.56669817856e-06, [0.35469988173, 0.61604757237], [-0.000672387374, -0.001064293501])
+    '''
+    N = len(a_alphas)
+    if a_alpha_j_rows is None:
+        a_alpha_j_rows = [0.0]*N
+    if da_alpha_dT_j_rows is None:
+        da_alpha_dT_j_rows = [0.0]*N
+
+    # a_alpha_j_rows and da_alpha_dT_j_rows first hold the kij corrections
+    # to the sums of zj*r_j and zj*dr_j/dT
+    root_sum = droot_sum = 0.0
+    for i in range(N):
+        a_alpha_j_rows[i] = da_alpha_dT_j_rows[i] = 0.0
+        root_sum += zs[i]*a_alpha_roots[i]
+        droot_sum += zs[i]*(0.5*da_alpha_dTs[i]/a_alpha_roots[i])
+
+    for k in range(len(kij_values)):
+        i, j, kij = kij_is[k], kij_js[k], kij_values[k]
+        dri = 0.5*da_alpha_dTs[i]/a_alpha_roots[i]
+        drj = 0.5*da_alpha_dTs[j]/a_alpha_roots[j]
+        a_alpha_j_rows[i] += kij*zs[j]*a_alpha_roots[j]
+        a_alpha_j_rows[j] += kij*zs[i]*a_alpha_roots[i]
+        da_alpha_dT_j_rows[i] += kij*zs[j]*drj
+        da_alpha_dT_j_rows[j] += kij*zs[i]*dri
+
+    a_alpha = da_alpha_dT = d2a_alpha_dT2 = 0.0
+    for i in range(N):
+        ri = a_alpha_roots[i]
+        ri_inv = 1.0/ri
+        dri = 0.5*da_alpha_dTs[i]*ri_inv
+        d2ri = (0.5*d2a_alpha_dT2s[i] - dri*dri)*ri_inv
+        root_row = root_sum - a_alpha_j_rows[i]
+        droot_row = droot_sum - da_alpha_dT_j_rows[i]
+
+        a_alpha_j_rows[i] = ri*root_row
+        da_alpha_dT_j_rows[i] = dri*root_row + ri*droot_row
+        zi = zs[i]
+        a_alpha += zi*a_alpha_j_rows[i]
+        da_alpha_dT += zi*da_alpha_dT_j_rows[i]
+        d2a_alpha_dT2 += 2.0*zi*(d2ri*root_row + dri*droot_row)
+
+    return a_alpha, da_alpha_dT, d2a_alpha_dT2, a_alpha_j_rows, da_alpha_dT_j_rows
+
+
+def a_alpha_and_derivatives_quadratic_terms_dense(a_alphas, a_alpha_roots,
+                                                  da_alpha_dTs, d2a_alpha_dT2s,
+                                                  T, zs, one_minus_kijs,
+                                                  full=True):
+    r'''Calculates the `a_alpha` term, and optionally its first two
+    temperature derivatives, along with the row sums needed for fugacities
+    using matrix-vector products. Gives the same result as
+    :obj:`a_alpha_and_derivatives_quadratic_terms` (or
+    :obj:`a_alpha_quadratic_terms` if `full` is False) but the work is done
+    in BLAS, which is the fastest option for a large dense `kijs` matrix in
+    NumPy mode. The same factorization as in
+    :obj:`a_alpha_and_derivatives_quadratic_terms_sparse` is used.
+
+    Parameters
+    ----------
+    a_alphas : ndarray[float]
+        EOS attractive terms, [J^2/mol^2/Pa]
+    a_alpha_roots : ndarray[float]
+        Square roots of `a_alphas`; provided for speed [J/mol/Pa^0.5]
+    da_alpha_dTs : ndarray[float]
+        Temperature derivative of coefficient calculated by EOS-specific
+        method; not used if `full` is False, [J^2/mol^2/Pa/K]
+    d2a_alpha_dT2s : ndarray[float]
+        Second temperature derivative of coefficient calculated by
+        EOS-specific method; not used if `full` is False, [J^2/mol^2/Pa/K**2]
+    T : float
+        Temperature, not used, [K]
+    zs : ndarray[float]
+        Mole fractions of each species
+    one_minus_kijs : ndarray[float]
+        Symmetric matrix of `1 - kijs`, [-]
+    full : bool
+        Whether or not to compute the temperature derivatives, [-]
+
+    Returns
+    -------
+    a_alpha : float
+        EOS attractive term, [J^2/mol^2/Pa]
+    da_alpha_dT : float
+        Temperature derivative of coefficient calculated by EOS-specific
+        method (only if `full`), [J^2/mol^2/Pa/K]
+    d2a_alpha_dT2 : float
+        Second temperature derivative of coefficient calculated by
+        EOS-specific method (only if `full`), [J^2/mol^2/Pa/K**2]
+    a_alpha_j_rows : ndarray[float]
+        EOS attractive term row sums, [J^2/mol^2/Pa]
+    da_alpha_dT_j_rows : ndarray[float]
+        Temperature derivative of EOS attractive term row sums (only if
+        `full`), [J^2/mol^2/Pa/K]
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> zs = np.array([0.1164203, 0.8835797])
+    >>> a_alphas = np.array([0.2491099357671155, 0.6486495863528039])
+    >>> one_minus_kijs = 1.0 - np.array([[0,.083],[0.083,0]])
+    >>> a_alpha, a_alpha_j_rows = a_alpha_and_derivatives_quadratic_terms_dense(a_alphas, np.sqrt(a_alphas), None, None, 299.0, zs, one_minus_kijs, full=False)
+    >>> float(a_alpha)
+    0.58562139582
+    '''
+    root_zs = a_alpha_roots*zs
+    root_rows = np.dot(one_minus_kijs, root_zs)
+    a_alpha_j_rows = a_alpha_roots*root_rows
+    a_alpha = float(np.dot(zs, a_alpha_j_rows))
+    if not full:
+        return a_alpha, a_alpha_j_rows
+    droots = 0.5*da_alpha_dTs/a_alpha_roots
+    d2roots = (0.5*d2a_alpha_dT2s - droots*droots)/a_alpha_roots
+    droot_rows = np.dot(one_minus_kijs, droots*zs)
+    da_alpha_dT_j_rows = droots*root_rows + a_alpha_roots*droot_rows
+    da_alpha_dT = float(np.dot(zs, da_alpha_dT_j_rows))
+    d2a_alpha_dT2 = 2.0*float(np.dot(zs, d2roots*root_rows + droots*droot_rows))
+    return a_alpha, da_alpha_dT, d2a_alpha_dT2, a_alpha_j_rows, da_alpha_dT_j_rows
+
+
 
 
 def eos_mix_dV_dzs(T, P, Z, b, delta, epsilon, a_alpha, db_dzs, ddelta_dzs,
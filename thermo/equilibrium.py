@@ -39,7 +39,7 @@ EquilibriumState
 '''
 
 from __future__ import division
-__all__ = ['EquilibriumState']
+__all__ = ['EquilibriumState', 'transport_properties_many']
 
 from fluids.constants import R, R_inv
 from fluids.core import thermal_diffusivity
@@ -47,8 +47,9 @@ from chemicals.utils import log, exp, normalize, zs_to_ws, vapor_mass_quality, m
 from chemicals.virial import B_from_Z
 from chemicals.elements import atom_fractions, mass_fractions, simple_formula_parser, molecular_weight, mixture_atomic_composition
 from thermo.phases import gas_phases, liquid_phases, solid_phases, Phase, derivatives_thermodynamic, derivatives_thermodynamic_mass, derivatives_jacobian
+from thermo.phases import IdealGas, CEOSGas, CEOSLiquid, GibbsExcessLiquid
 from thermo.chemical_package import ChemicalConstantsPackage, PropertyCorrelationsPackage, constants_docstrings
-from thermo.bulk import Bulk, BulkSettings, default_settings
+from thermo.bulk import Bulk, BulkSettings, default_settings, AS_ONE_LIQUID, AS_ONE_GAS
 all_phases = gas_phases + liquid_phases + solid_phases
 
 CAS_H2O = '7732-18-5'
@@ -2447,6 +2448,119 @@ for name in bulk_props:
     setattr(EquilibriumState, name, getter)
 
 
+def _transport_phase(phase):
+    # 'g' or 'l' for phases whose `mu` and `k` come from the mixture
+    # correlations and are cached, otherwise None
+    if isinstance(phase, (CEOSGas, CEOSLiquid)):
+        return getattr(phase, 'assigned_phase', None)
+    elif isinstance(phase, IdealGas):
+        return 'g'
+    elif isinstance(phase, GibbsExcessLiquid):
+        return 'l'
+    return None
+
+def transport_properties_many(results):
+    r'''Method to calculate the viscosity, thermal conductivity and
+    surface tension of many :obj:`EquilibriumState` objects at once.
+    The phases and bulks of every result are filled in as if `mu`, `k` and
+    `sigma` had been called on each; the mixing rules selected in each
+    result's :obj:`BulkSettings <thermo.bulk.BulkSettings>` are followed.
+    The liquid bulk of results with multiple liquids has its phase values
+    filled in, and mixes them when its own properties are requested.
+
+    All of the mixture correlation evaluations are grouped by correlation
+    object and calculated with
+    :obj:`mixture_property_many <thermo.utils.MixtureProperty.mixture_property_many>`,
+    so the pure component properties are only calculated once at each
+    temperature (and pressure) shared between results.
+
+    Parameters
+    ----------
+    results : list[EquilibriumState]
+        Flash results, [-]
+
+    Returns
+    -------
+    mus : list[float]
+        Viscosities of the bulk of each result, [Pa*s]
+    ks : list[float]
+        Thermal conductivities of the bulk of each result, [W/m/K]
+    sigmas : list[float]
+        Surface tensions of the bulk of each result, [N/m]
+
+    Notes
+    -----
+    Phases without correlation-based transport properties (Helmholtz,
+    CoolProp, IAPWS) are calculated one at a time as usual.
+    '''
+    pending = {}
+    scheduled = set()
+    def schedule(mix_obj, obj, attr, T, P, zs, ws):
+        key = (id(obj), attr)
+        if key in scheduled or hasattr(obj, attr):
+            return
+        scheduled.add(key)
+        try:
+            group = pending[id(mix_obj)]
+        except KeyError:
+            group = pending[id(mix_obj)] = (mix_obj, [], [], [], [], [])
+        group[1].append((obj, attr))
+        group[2].append(T)
+        group[3].append(P)
+        group[4].append(zs)
+        group[5].append(ws)
+
+    for result in results:
+        correlations, settings = result.correlations, result.settings
+        T, P = result.T, result.P
+        phases = [result.gas] + result.liquids if result.gas is not None else result.liquids
+        for phase in phases:
+            ws = phase.ws()
+            kind = _transport_phase(phase)
+            if kind == 'g':
+                schedule(correlations.ViscosityGasMixture, phase, '_mu', T, P, phase.zs, ws)
+                schedule(correlations.ThermalConductivityGasMixture, phase, '_k', T, P, phase.zs, ws)
+            elif kind == 'l':
+                schedule(correlations.ViscosityLiquidMixture, phase, '_mu', T, P, phase.zs, ws)
+                schedule(correlations.ThermalConductivityLiquidMixture, phase, '_k', T, P, phase.zs, ws)
+            if getattr(phase, 'assigned_phase', None) == 'l':
+                schedule(correlations.SurfaceTensionMixture, phase, '_sigma', T, P, phase.zs, ws)
+
+        for bulk in (result.bulk, result.liquid_bulk):
+            if not isinstance(bulk, Bulk) or len(bulk.phase_fractions) == 1:
+                continue
+            ws = bulk.ws()
+            if bulk.phase_bulk == 'l' or result.gas is None:
+                if settings.mu_LL == AS_ONE_LIQUID:
+                    schedule(correlations.ViscosityLiquidMixture, bulk, '_mu', T, P, bulk.zs, ws)
+                if settings.k_LL == AS_ONE_LIQUID:
+                    schedule(correlations.ThermalConductivityLiquidMixture, bulk, '_k', T, P, bulk.zs, ws)
+                if settings.sigma_LL == AS_ONE_LIQUID:
+                    schedule(correlations.SurfaceTensionMixture, bulk, '_sigma', T, P, bulk.zs, ws)
+            else:
+                if settings.mu_VL == AS_ONE_LIQUID:
+                    schedule(correlations.ViscosityLiquidMixture, bulk, '_mu', T, P, bulk.zs, ws)
+                elif settings.mu_VL == AS_ONE_GAS:
+                    schedule(correlations.ViscosityGasMixture, bulk, '_mu', T, P, bulk.zs, ws)
+                if settings.k_VL == AS_ONE_LIQUID:
+                    schedule(correlations.ThermalConductivityLiquidMixture, bulk, '_k', T, P, bulk.zs, ws)
+                elif settings.k_VL == AS_ONE_GAS:
+                    schedule(correlations.ThermalConductivityGasMixture, bulk, '_k', T, P, bulk.zs, ws)
+
+    for mix_obj, targets, Ts, Ps, zs_2d, ws_2d in pending.values():
+        props = mix_obj.mixture_property_many(Ts, Ps, zs_2d, ws_2d).tolist()
+        for (obj, attr), prop in zip(targets, props):
+            setattr(obj, attr, None if prop != prop else prop)
+
+    mus, ks, sigmas = [], [], []
+    for result in results:
+        bulk = result.bulk
+        mus.append(bulk.mu())
+        ks.append(bulk.k())
+        sigmas.append(bulk.sigma())
+    return mus, ks, sigmas
+
+
 try:
     EquilibriumState.__doc__ = EquilibriumState.__doc__ +'\n    ' + '\n    '.join(_add_attrs_doc)
 except:
@@ -26,7 +26,8 @@ __all__ = ['alpha_Twu91_objf', 'alpha_Twu91_objfc', 'fit_function',
            'Twu91_check_params', 'postproc_lmfit',
            'alpha_poly_objf', 'alpha_poly_objfc', 'poly_check_params',
            'fit_polynomial', 'poly_fit_statistics', 'fit_cheb_poly_auto',
-           'data_fit_statistics', 'fit_customized']
+           'data_fit_statistics', 'fit_customized', 'latin_hypercube_samples',
+           'fit_bubble_point']
 
 from fluids.numerics import (chebval, brenth, third, sixth, roots_cubic,
                              roots_cubic_a1, numpy as np, newton,
@@ -49,7 +50,7 @@ try:
 except:
     pass
 try:
-    from random import uniform
+    from random import uniform, Random
 except:
     pass
 
@@ -592,6 +593,46 @@ def fit_function(fun, x0=None, args=None, check_fun=None, debug=False,
 
 
 
+def latin_hypercube_samples(bounds, n, seed=None):
+    r'''Draw `n` points from a Latin hypercube spanning `bounds`. Each
+    parameter's range is split into `n` equal strata; every stratum is
+    sampled exactly once, at a random location inside it, and the strata are
+    paired randomly between parameters.
+
+    Parameters
+    ----------
+    bounds : list[tuple(float, 2)]
+        Lower and upper limit of each parameter, [-]
+    n : int
+        Number of points to draw, [-]
+    seed : int, optional
+        Seed for the random number generator; the same seed always gives the
+        same points, [-]
+
+    Returns
+    -------
+    samples : list[list[float]]
+        Sampled points, one row per point, [-]
+
+    Examples
+    --------
+    >>> samples = latin_hypercube_samples([(0.0, 1.0), (-10.0, 10.0)], 4, seed=0)
+    >>> sorted(int(s[0]*4) for s in samples)
+    [0, 1, 2, 3]
+    '''
+    rng = Random(seed)
+    N = len(bounds)
+    samples = [[0.0]*N for _ in range(n)]
+    strata = list(range(n))
+    for j in range(N):
+        low, high = bounds[j]
+        step = (high - low)/n
+        rng.shuffle(strata)
+        for i in range(n):
+            samples[i][j] = low + (strata[i] + rng.random())*step
+    return samples
+
+
 def fit_customized(Ts, data, fitting_func, fit_parameters, use_fit_parameters, 
                    fit_method, objective, multiple_tries_max_objective, 
                    guesses=None, initial_guesses=None, analytical_jac=None,
@@ -759,5 +800,226 @@ def fit_customized(Ts, data, fitting_func, fit_parameters, use_fit_parameters,
     return out_kwargs
 
 
+def fit_bubble_point(phases_func, guesses, xs, Ts=None, Ps=None, ys=None,
+                     spec='P', analytical_jac=True, solver_kwargs=None,
+                     do_statistics=True, maxiter=200, rtol=1e-9,
+                     jac_step=1e-7):
+    r'''Fit model parameters - normally binary interaction parameters - to
+    vapor-liquid equilibrium data by minimizing the error in the calculated
+    bubble pressures (at the measured temperatures) or bubble temperatures
+    (at the measured pressures), and optionally in the vapor compositions.
+
+    Each bubble point is solved with
+    :obj:`bubble_P_Michelsen_Mollerup <thermo.flash.flash_utils.bubble_P_Michelsen_Mollerup>`
+    or :obj:`bubble_T_Michelsen_Mollerup <thermo.flash.flash_utils.bubble_T_Michelsen_Mollerup>`,
+    starting from the converged pressure or temperature and vapor composition
+    of the previous optimizer iteration. Only the first iteration starts from
+    the measured values.
+
+    Parameters
+    ----------
+    phases_func : callable
+        Function which accepts the parameters being fit as keyword arguments
+        and returns a liquid and a gas phase object using them, [-]
+    guesses : dict[str, float]
+        Initial values of the parameters being fit, [various]
+    xs : list[list[float]]
+        Measured liquid mole fractions, one row per point, [-]
+    Ts : list[float], optional
+        Measured temperatures, [K]
+    Ps : list[float], optional
+        Measured pressures, [Pa]
+    ys : list[list[float]], optional
+        Measured vapor mole fractions; if given, the error in all but the last
+        component's vapor mole fraction is part of the objective, [-]
+    spec : str, optional
+        'P' to fit bubble pressures at the measured temperatures, or 'T' to fit
+        bubble temperatures at the measured pressures, [-]
+    analytical_jac : bool, optional
+        Whether to compute the sensitivities of the bubble points to the
+        parameters as described in the notes, instead of letting `leastsq`
+        take finite differences of the whole objective, [-]
+    solver_kwargs : dict, optional
+        Extra arguments to `leastsq`, [-]
+    do_statistics : bool, optional
+        Whether to also return the fit statistics, [-]
+    maxiter : int, optional
+        Maximum number of iterations of each bubble point solve, [-]
+    rtol : float, optional
+        Relative tolerance of each bubble point solve, [-]
+    jac_step : float, optional
+        Relative step (absolute below 1) for the parameter derivatives of
+        the fugacity coefficients, [-]
 
+    Returns
+    -------
+    parameters : dict[str, float]
+        Fitted parameters, [various]
+    statistics : dict
+        Statistics of the bubble pressures or temperatures; `calc` holds the
+        calculated values and `ys_calc` the calculated vapor compositions.
+        Only returned if `do_statistics` is True, [-]
 
+    Notes
+    -----
+    The residuals are the relative errors in the bubble pressure or
+    temperature, followed by the absolute errors in the vapor mole fractions
+    if `ys` is given. A point whose bubble point cannot be solved gets a
+    relative error of 1.
+
+    At a converged bubble point, the change in the pressure with a parameter
+    :math:`\theta` is given by the implicit function theorem. The vapor
+    composition terms cancel through the Gibbs-Duhem equation, which leaves:
+
+    .. math::
+        \frac{\partial P}{\partial \theta} = -\frac{\sum_i y_i\left(
+        \frac{\partial \ln \phi_i^l}{\partial \theta} - \frac{\partial
+        \ln \phi_i^g}{\partial \theta}\right)}{\sum_i y_i\left(
+        \frac{\partial \ln \phi_i^l}{\partial P} - \frac{\partial
+        \ln \phi_i^g}{\partial P}\right)}
+
+    The temperature case is the same with :math:`T` in place of :math:`P`.
+    The vapor mole fraction sensitivities come from the same equilibrium
+    condition, solved together with the gas's `dlnphis_dns`. The
+    derivatives of the fugacity coefficients with respect to the parameters
+    are taken by finite difference at constant temperature, pressure and
+    composition, so no extra bubble point solves are needed.
+
+    Examples
+    --------
+    Recover the `kij` of a Peng-Robinson ethane-propane system from bubble
+    pressures it generated:
+
+    >>> from thermo import CEOSGas, CEOSLiquid, PRMIX
+    >>> from thermo.flash.flash_utils import bubble_P_Michelsen_Mollerup
+    >>> eos_kwargs = dict(Tcs=[305.32, 369.83], Pcs=[4872000.0, 4248000.0], omegas=[0.098, 0.152])
+    >>> def phases(kij):
+    ...     kwargs = dict(eos_kwargs, kijs=[[0.0, kij], [kij, 0.0]])
+    ...     return CEOSLiquid(PRMIX, kwargs), CEOSGas(PRMIX, kwargs)
+    >>> liq, gas = phases(kij=0.03)
+    >>> Ts = [250.0, 260.0, 270.0, 280.0]
+    >>> xs = [[0.2, 0.8], [0.4, 0.6], [0.6, 0.4], [0.8, 0.2]]
+    >>> Ps = [bubble_P_Michelsen_Mollerup(1e6, T, x, liq, gas, xtol=1e-3)[0] for T, x in zip(Ts, xs)]
+    >>> params, stats = fit_bubble_point(phases, {'kij': 0.0}, xs, Ts=Ts, Ps=Ps)
+    >>> round(params['kij'], 6)
+    0.03
+    '''
+    from thermo.flash.flash_utils import bubble_P_Michelsen_Mollerup, bubble_T_Michelsen_Mollerup
+    if solver_kwargs is None: solver_kwargs = {}
+    if spec == 'P':
+        solver, fixed, measured = bubble_P_Michelsen_Mollerup, Ts, Ps
+    elif spec == 'T':
+        solver, fixed, measured = bubble_T_Michelsen_Mollerup, Ps, Ts
+    else:
+        raise ValueError("spec must be 'P' or 'T'")
+    names = list(guesses.keys())
+    N_params = len(names)
+    pts = len(xs)
+    N = len(xs[0])
+    N_ys = N - 1 if ys is not None else 0
+    N_res = pts*(1 + N_ys)
+
+    # Converged values of each point, reused as the next iteration's guesses
+    iter_vals = list(measured)
+    iter_ys = [list(ys[i]) for i in range(pts)] if ys is not None else [None]*pts
+    # Phases at the last converged bubble points, for the jacobian
+    state = {'params': None, 'phases': [None]*pts}
+
+    def solve_points(params):
+        liquid, gas = phases_func(**dict(zip(names, params)))
+        residuals = np.zeros(N_res)
+        converged = [None]*pts
+        for i in range(pts):
+            try:
+                val, ys_calc, l, g, _, _ = solver(iter_vals[i], fixed[i], xs[i], liquid, gas,
+                                                  maxiter=maxiter, xtol=rtol*iter_vals[i],
+                                                  ys_guess=iter_ys[i])
+            except Exception:
+                try:
+                    # Warm start failed, try again from the measured values
+                    val, ys_calc, l, g, _, _ = solver(measured[i], fixed[i], xs[i], liquid, gas,
+                                                      maxiter=maxiter, xtol=rtol*measured[i],
+                                                      ys_guess=list(ys[i]) if ys is not None else None)
+                except Exception:
+                    residuals[i] = 1.0
+                    continue
+            iter_vals[i], iter_ys[i] = val, ys_calc
+            converged[i] = (l, g)
+            residuals[i] = (val - measured[i])/measured[i]
+            for j in range(N_ys):
+                residuals[pts + i*N_ys + j] = ys_calc[j] - ys[i][j]
+        state['params'] = list(params)
+        state['phases'] = converged
+        return residuals
+
+    def jac(params):
+        if state['params'] != list(params):
+            solve_points(params)
+        converged = state['phases']
+        out = np.zeros((N_res, N_params))
+        lnphis_l, lnphis_g = [None]*pts, [None]*pts
+        dlnKs_dvar, denominators, composition_matrices = [None]*pts, [0.0]*pts, [None]*pts
+        for i in range(pts):
+            if converged[i] is None:
+                continue
+            l, g = converged[i]
+            lnphis_l[i], lnphis_g[i] = l.lnphis(), g.lnphis()
+            if spec == 'P':
+                dl, dg = l.dlnphis_dP(), g.dlnphis_dP()
+            else:
+                dl, dg = l.dlnphis_dT(), g.dlnphis_dT()
+            ys_calc = iter_ys[i]
+            dlnKs_dvar[i] = dlnKs = [dl[j] - dg[j] for j in range(N)]
+            denominators[i] = sum([ys_calc[j]*dlnKs[j] for j in range(N)])
+            if N_ys:
+                # d ln y_i + sum_j dlnphi_g_i/dn_j dy_j = dlnK_i at constant
+                # vapor composition; ideal gases have no composition term
+                M = np.eye(N)
+                if hasattr(g, 'dlnphis_dns'):
+                    M += np.array(g.dlnphis_dns())*np.array(ys_calc)
+                composition_matrices[i] = M
+        for k in range(N_params):
+            params_h = list(params)
+            h = jac_step*max(abs(params_h[k]), 1.0)
+            params_h[k] += h
+            liquid_h, gas_h = phases_func(**dict(zip(names, params_h)))
+            for i in range(pts):
+                if converged[i] is None:
+                    continue
+                l, g = converged[i]
+                ys_calc = iter_ys[i]
+                lnphis_l_h = liquid_h.to_TP_zs(T=l.T, P=l.P, zs=l.zs).lnphis()
+                lnphis_g_h = gas_h.to_TP_zs(T=g.T, P=g.P, zs=g.zs).lnphis()
+                dlnKs_dparam = [((lnphis_l_h[j] - lnphis_l[i][j]) - (lnphis_g_h[j] - lnphis_g[i][j]))/h
+                                for j in range(N)]
+                dvar_dparam = -sum([ys_calc[j]*dlnKs_dparam[j] for j in range(N)])/denominators[i]
+                out[i, k] = dvar_dparam/measured[i]
+                if N_ys:
+                    dlnKs = [dlnKs_dparam[j] + dlnKs_dvar[i][j]*dvar_dparam for j in range(N)]
+                    dlnys = np.linalg.solve(composition_matrices[i], dlnKs)
+                    for j in range(N_ys):
+                        out[pts + i*N_ys + j, k] = ys_calc[j]*dlnys[j]
+        return out
+
+    Dfun = jac if analytical_jac else None
+    p0 = [guesses[k] for k in names]
+    popt, _ = leastsq(solve_points, p0, Dfun=Dfun, **solver_kwargs)
+    popt = [float(v) for v in popt]
+    parameters = dict(zip(names, popt))
+    if not do_statistics:
+        return parameters
+
+    if state['params'] != popt:
+        solve_points(popt)
+    calc = [iter_vals[i] if state['phases'][i] is not None else None for i in range(pts)]
+    valid = [i for i in range(pts) if calc[i] is not None]
+    measured_valid = [measured[i] for i in valid]
+    stats = data_fit_statistics(measured_valid, measured_valid, [calc[i] for i in valid])
+    statistics = {}
+    statistics['calc'] = calc
+    statistics['ys_calc'] = [iter_ys[i] if calc[i] is not None else None for i in range(pts)]
+    statistics['MAE'] = stats[0]
+    statistics['STDEV'] = stats[1]
+    statistics['min_ratio'] = stats[2]
+    statistics['max_ratio'] = stats[3]
+    return parameters, statistics
@@ -114,9 +114,115 @@ class Flash(object):
     r'''Base class for performing flash calculations. All Flash objects need
     to inherit from this, and common methods can be added to it.'''
 
+    REFERENCE_VOLUME_CACHE_SIZE = 1024
+    # Maximum number of reference molar volumes kept by `V_reference` and
+    # `Vms_liquid_reference`; set to 0 to disable
+
     def __init_subclass__(cls):
         cls.__full_path__ = "%s.%s" %(cls.__module__, cls.__qualname__)
 
+    def _reference_volume_cache_store(self, key, value):
+        # Bounded cache shared by the reference volume methods; the oldest
+        # entry is evicted when full
+        if not self.REFERENCE_VOLUME_CACHE_SIZE:
+            return
+        try:
+            cache = self._reference_volume_cache
+        except AttributeError:
+            cache = self._reference_volume_cache = {}
+        if len(cache) >= self.REFERENCE_VOLUME_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = value
+
+    def V_reference(self, zs, T, P, phase=None):
+        r'''Method to calculate the molar volume of a mixture at the
+        reference conditions a volumetric flow rate is specified at. The
+        result is cached by composition, conditions and `phase`, so streams
+        sharing a composition and reference conditions only calculate it
+        once.
+
+        Parameters
+        ----------
+        zs : list[float]
+            Mole fractions of each component, [-]
+        T : float
+            Reference temperature, [K]
+        P : float
+            Reference pressure, [Pa]
+        phase : str, optional
+            'l' to use the first liquid phase, 'g' to use the gas phase, or
+            None or '' to flash the mixture and use the volume of the
+            equilibrium result, [-]
+
+        Returns
+        -------
+        V : float
+            Molar volume at the reference conditions, [m^3/mol]
+        '''
+        key = ('V', tuple(zs), T, P, phase)
+        try:
+            return self._reference_volume_cache[key]
+        except (AttributeError, KeyError):
+            pass
+        if phase == 'l':
+            V = self.liquids[0].to(T=T, P=P, zs=zs).V()
+        elif phase == 'g':
+            V = self.gas.to(T=T, P=P, zs=zs).V()
+        else:
+            V = self.flash(zs=zs, T=T, P=P).V()
+        self._reference_volume_cache_store(key, V)
+        return V
+
+    def Vms_liquid_reference(self, T=None, P=None):
+        r'''Method to return the pure component liquid molar volumes used to
+        convert liquid volumetric flow rates or fractions into mole flows. At
+        a specified `T` and `P` these come from the `VolumeLiquids` objects -
+        at saturation if they have no pressure dependent method - otherwise
+        the `Vml_STPs` constants are used. The result is cached by
+        `T` and `P`.
+
+        Parameters
+        ----------
+        T : float, optional
+            Reference temperature, [K]
+        P : float, optional
+            Reference pressure, [Pa]
+
+        Returns
+        -------
+        Vms : list[float]
+            Pure component liquid molar volumes, [m^3/mol]
+
+        Notes
+        -----
+        The volume objects are those of the flasher's
+        :obj:`PropertyCorrelationsPackage <thermo.chemical_package.PropertyCorrelationsPackage>`;
+        :obj:`EquilibriumStream <thermo.stream.EquilibriumStream>` used to
+        look them up as `flasher.properties.VolumeLiquids`, which no flasher
+        has, so `Vf_TP` could not be used before.
+
+        A component whose :obj:`VolumeLiquid <thermo.volume.VolumeLiquid>`
+        has a pressure dependent method, such as `COSTALD_COMPRESSED`, gets
+        the compressed liquid volume at `P`; others get the saturated liquid
+        volume at `T`, instead of no value.
+        '''
+        if T is None or P is None:
+            return self.constants.Vml_STPs
+        key = ('Vms_liquid', T, P)
+        try:
+            return self._reference_volume_cache[key]
+        except (AttributeError, KeyError):
+            pass
+        Vms = []
+        for obj in self.correlations.VolumeLiquids:
+            Vm = obj(T, P)
+            if Vm is None:
+                # No pressure dependent method; use the saturated volume
+                Vm = obj.T_dependent_property(T)
+            Vms.append(Vm)
+        self._reference_volume_cache_store(key, Vms)
+        return Vms
+
     def flash(self, zs=None, T=None, P=None, VF=None, SF=None, V=None, H=None,
               S=None, G=None, U=None, A=None, solution=None, hot_start=None,
               retry=False, dest=None):
@@ -20,7 +20,12 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
-__all__ = ['FlashPureVLS']
+__all__ = ['FlashPureVLS', 'PureSaturationTable']
+
+import os
+import re
+from bisect import bisect_right
+from math import exp, log
 
 from thermo.flash.flash_base import Flash
 from fluids.numerics import (
@@ -64,6 +69,7 @@ from thermo.phases import (
     CoolPropLiquid,
     IAPWS95Gas,
     IAPWS95Liquid,
+    IAPWS95Table,
     GibbsExcessLiquid,
     DryAirLemmon
 )
@@ -75,6 +81,126 @@ from thermo.flash.flash_utils import (
     solve_PTV_HSGUA_1P
 )
 
+_VF_TABLE_FORMAT = 1
+_VF_tables = {}
+
+class PureSaturationTable(object):
+    r'''Cubic spline table of the vapor-liquid saturation curve of a pure
+    fluid, used by :obj:`FlashPureVLS` when its `VF_TABLES` attribute is set.
+    The logarithm of the vapor pressure is splined against the inverse of
+    temperature, a nearly linear relationship, and the inverse temperature is
+    also splined against the logarithm of the vapor pressure for lookups at a
+    specified pressure.
+
+    Each interval of the table carries an estimate of the largest error of
+    the lookups in it, obtained when the table is built by comparing a spline
+    through every other node against the rigorous solution at the nodes
+    skipped.
+
+    Parameters
+    ----------
+    xs : list[float]
+        Inverse temperatures of the nodes, in increasing order, [1/K]
+    lnPs : list[float]
+        Natural logarithms of the vapor pressure at the nodes, [-]
+    lnP_errs : list[float]
+        Estimated maximum absolute error in the logarithm of the vapor
+        pressure (relative error in the vapor pressure) in each interval, [-]
+    x_errs : list[float]
+        Estimated maximum relative error in the saturation temperature in each
+        interval, [-]
+
+    Attributes
+    ----------
+    T_min : float
+        Lowest temperature in the table, [K]
+    T_max : float
+        Highest temperature in the table, [K]
+    P_min : float
+        Lowest vapor pressure in the table, [Pa]
+    P_max : float
+        Highest vapor pressure in the table, [Pa]
+    '''
+    def __init__(self, xs, lnPs, lnP_errs, x_errs):
+        from scipy.interpolate import CubicSpline
+        self.xs = xs = [float(v) for v in xs]
+        self.lnPs = lnPs = [float(v) for v in lnPs]
+        self.lnP_errs = [float(v) for v in lnP_errs]
+        self.x_errs = [float(v) for v in x_errs]
+        self.T_min, self.T_max = 1.0/xs[-1], 1.0/xs[0]
+        self.P_min, self.P_max = exp(lnPs[-1]), exp(lnPs[0])
+        # The coefficients are evaluated in Python; calling the scipy
+        # objects for a single point costs more than the lookup itself
+        self.lnP_coeffs = CubicSpline(xs, lnPs).c.T.tolist()
+        self.lnPs_increasing = lnPs[::-1]
+        self.x_coeffs = CubicSpline(self.lnPs_increasing, xs[::-1]).c.T.tolist()
+        self.x_errs_increasing = self.x_errs[::-1]
+
+    def as_arrays(self):
+        r'''Return the node data of the table, suitable for saving with
+        :obj:`numpy.savez`.
+
+        Returns
+        -------
+        data : dict[str : list[float]]
+            Arguments to recreate the table, [-]
+        '''
+        return {'xs': self.xs, 'lnPs': self.lnPs, 'lnP_errs': self.lnP_errs,
+                'x_errs': self.x_errs}
+
+    def Psat(self, T):
+        r'''Look up the vapor pressure at the specified temperature.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+
+        Returns
+        -------
+        Psat : float or None
+            Vapor pressure, or None if `T` is outside the table, [Pa]
+        err : float
+            Estimated maximum relative error in `Psat`, [-]
+        '''
+        x = 1.0/T
+        xs = self.xs
+        if x < xs[0] or x > xs[-1]:
+            return None, None
+        i = bisect_right(xs, x) - 1
+        if i == len(xs) - 1:
+            i -= 1
+        dx = x - xs[i]
+        a, b, c, d = self.lnP_coeffs[i]
+        return exp(((a*dx + b)*dx + c)*dx + d), self.lnP_errs[i]
+
+    def Tsat(self, P):
+        r'''Look up the saturation temperature at the specified pressure.
+
+        Parameters
+        ----------
+        P : float
+            Pressure, [Pa]
+
+        Returns
+        -------
+        Tsat : float or None
+            Saturation temperature, or None if `P` is outside the table, [K]
+        err : float
+            Estimated maximum relative error in `Tsat`, [-]
+        '''
+        lnP = log(P)
+        lnPs = self.lnPs_increasing
+        if lnP < lnPs[0] or lnP > lnPs[-1]:
+            return None, None
+        i = bisect_right(lnPs, lnP) - 1
+        if i == len(lnPs) - 1:
+            i -= 1
+        dx = lnP - lnPs[i]
+        a, b, c, d = self.x_coeffs[i]
+        return 1.0/(((a*dx + b)*dx + c)*dx + d), self.x_errs_increasing[i]
+
+
 
 class FlashPureVLS(Flash):
     r'''Class for performing flash calculations on pure-component systems.
@@ -177,6 +303,28 @@ class FlashPureVLS(Flash):
     PSF_xtol : float
         Convergence tolerance in the pressure dimension when converging a
         flashes with a pressure and solid fraction specification, [-]
+    VF_TABLES : bool
+        Whether or not to use a :obj:`PureSaturationTable` for flashes with a
+        vapor fraction specification, and for `P`-`H`, `P`-`S`, and `P`-`U`
+        flashes in the vapor-liquid region. The table is built the first time
+        it is needed. It is only used for phase models without a specialized
+        saturation routine; see the notes, [-]
+    VF_TABLES_PTS : int
+        Number of nodes in the saturation table; the rigorous saturation flash
+        is solved at about twice as many points to build it, [-]
+    VF_TABLES_TR_MIN : float
+        Lowest reduced temperature included in the saturation table, [-]
+    VF_TABLES_TR_MAX : float
+        Highest reduced temperature included in the saturation table, [-]
+    VF_TABLES_RTOL : float
+        Saturation table lookups whose estimated relative error is under this
+        tolerance are used as the answer; other lookups are the initial guess
+        of the rigorous saturation flash. Set to 0 to always converge the
+        rigorous flash, [-]
+    VF_TABLES_CACHE_DIR : str or None
+        Folder saturation tables are saved to and loaded from, named by a
+        digest of the phase models; None uses the `thermo` user data folder,
+        and '' keeps the tables in memory only, [-]
 
 
     Notes
@@ -192,6 +340,7 @@ class FlashPureVLS(Flash):
     * a :obj:`CEOSLiquid <thermo.phases.CEOSLiquid>` and a :obj:`CEOSGas <thermo.phases.CEOSGas>` with the same (consistent) parameters
     * a :obj:`CEOSGas <thermo.phases.CEOSGas>` with the :obj:`IGMIX <thermo.eos_mix.IGMIX>` eos and a :obj:`GibbsExcessLiquid <thermo.phases.GibbsExcessLiquid>`
     * a :obj:`IAPWS95Liquid <thermo.phases.IAPWS95Liquid>` and a :obj:`IAPWS95Gas <thermo.phases.IAPWS95Gas>`
+    * a :obj:`IAPWS95TableLiquid <thermo.phases.IAPWS95TableLiquid>` and a :obj:`IAPWS95TableGas <thermo.phases.IAPWS95TableGas>`; P-H and P-S flashes are looked up in their spline table
     * a :obj:`CoolPropLiquid <thermo.phases.CoolPropLiquid>` and a :obj:`CoolPropGas <thermo.phases.CoolPropGas>`
 
     Additional information that can be provided in the
@@ -204,6 +353,12 @@ class FlashPureVLS(Flash):
     * Liquid molar volume correlations
     * Heat of vaporization correlations
 
+    Saturation flashes with phase models other than the combinations listed
+    above iterate with the full phase models every time. Setting `VF_TABLES` to True makes repeated
+    flashes near saturation much faster; the saturation table is built once
+    (a fraction of a second up to a few seconds) and then saved to disk, so
+    later flashers with the same phase models load it instead.
+
     Examples
     --------
 
@@ -267,6 +422,13 @@ class FlashPureVLS(Flash):
     PSF_maxiter = 200
     PSF_xtol = 1e-10
 
+    VF_TABLES = False
+    VF_TABLES_PTS = 200
+    VF_TABLES_TR_MIN = 0.3
+    VF_TABLES_TR_MAX = 0.999
+    VF_TABLES_RTOL = 1e-9
+    VF_TABLES_CACHE_DIR = None
+
     def __repr__(self):
         return "FlashPureVLS(gas=%s, liquids=%s, solids=%s)" %(self.gas, self.liquids, self.solids)
     def __init__(self, constants, correlations, gas, liquids, solids,
@@ -325,6 +487,10 @@ class FlashPureVLS(Flash):
                                  and (isinstance(gas, IAPWS95Gas)
                                       or  gas.__class__.__name__ == 'IAPWS95Gas')
                                 and (not solids))
+        self.VL_only_IAPWS95_table = (self.VL_only_IAPWS95
+                                      and isinstance(liquids[0], IAPWS95Table)
+                                      and isinstance(gas, IAPWS95Table)
+                                      and liquids[0].model_hash(True) == gas.model_hash(True))
 
         self.V_only_lemmon2000 = (len(liquids) == 0
                                  and (isinstance(gas, DryAirLemmon)
@@ -347,13 +513,18 @@ class FlashPureVLS(Flash):
 
         self.VL_IG_activity = (len(liquids) == 1
                                and isinstance(liquids[0], GibbsExcessLiquid)
-                               and (isinstance(gas, IdealGas) or gas.eos_class is IGMIX)
+                               and (isinstance(gas, IdealGas) or getattr(gas, 'eos_class', None) is IGMIX)
                                and len(solids) == 0)
 
         if self.VL_only_CEOSs_same:
             # Two phase pure eoss are two phase up to the critical point only! Then one phase
             self.eos_pure_STP = gas.eos_mix.to_TPV_pure(T=298.15, P=101325.0, V=None, i=0)
 
+        # Flashers whose saturation curve is solved directly gain nothing from tables
+        self.VF_tables_supported = (self.supports_VF_flash and not self.VL_only_CoolProp
+                                    and not self.VL_IG_activity and not self.VL_only_IAPWS95
+                                    and not self.VL_only_CEOSs_same)
+
 
         liquids_to_unique_liquids = []
         unique_liquids, unique_liquid_hashes = [], []
@@ -541,6 +712,13 @@ class FlashPureVLS(Flash):
             sat_gas = self.gas.to(T=T, V=rho_to_Vm(iapws95_rhog_sat(T), self.gas._MW), zs=zs)
             sat_liq = self.liquid.to(T=T, V=rho_to_Vm(iapws95_rhol_sat(T), self.liquid._MW), zs=zs)
             return Psat, sat_liq, sat_gas, 0, 0.0
+        elif self.VF_TABLES and self.VF_tables_supported:
+            Psat, table_err = self.VF_table().Psat(T)
+            if Psat is not None:
+                if table_err <= self.VF_TABLES_RTOL:
+                    sat_liq, sat_gas = self._VF_table_phases(T, Psat)
+                    return Psat, sat_liq, sat_gas, 0, table_err
+                return self._flash_TVF_rigorous(T, Psat)
         Psat = self.Psat_guess(T)
         gas = self.gas.to_TP_zs(T, Psat, zs)
 
@@ -550,7 +728,12 @@ class FlashPureVLS(Flash):
 
             sat_liq = self.liquids[0].to_TP_zs(T, Psat, zs, other_eos=gas.eos_mix)
             return Psat, sat_liq, gas, 0, 0.0
+        return self._flash_TVF_rigorous(T, Psat, gas)
 
+    def _flash_TVF_rigorous(self, T, Psat, gas=None):
+        zs = [1.0]
+        if gas is None:
+            gas = self.gas.to_TP_zs(T, Psat, zs)
         liquids = [l.to_TP_zs(T, Psat, zs) for l in self.liquids]
 #        return TVF_pure_newton(Psat, T, liquids, gas, maxiter=self.TVF_maxiter, xtol=self.TVF_xtol)
         Psat, l, g, iterations, err = TVF_pure_secant(Psat, T, liquids, gas, maxiter=self.TVF_maxiter, xtol=self.TVF_xtol)
@@ -591,7 +774,14 @@ class FlashPureVLS(Flash):
             sat_liq = self.liquid.to(T=Tsat, V=1e-3*iapws95_MW/iapws95_rhol_sat(Tsat), zs=zs)
             return Tsat, sat_liq, sat_gas, 0, 0.0
         else:
-            Tsat = self.correlations.VaporPressures[0].solve_property(P)
+            Tsat = None
+            if self.VF_TABLES and self.VF_tables_supported:
+                Tsat, table_err = self.VF_table().Tsat(P)
+                if Tsat is not None and table_err <= self.VF_TABLES_RTOL:
+                    sat_liq, sat_gas = self._VF_table_phases(Tsat, P)
+                    return Tsat, sat_liq, sat_gas, 0, table_err
+            if Tsat is None:
+                Tsat = self.correlations.VaporPressures[0].solve_property(P)
         gas = self.gas.to_TP_zs(Tsat, P, zs)
         liquids = [l.to_TP_zs(Tsat, P, zs) for l in self.liquids]
         Tsat, l, g, iterations, err = PVF_pure_newton(Tsat, P, liquids, gas, maxiter=self.PVF_maxiter, xtol=self.PVF_xtol)
@@ -766,6 +956,40 @@ class FlashPureVLS(Flash):
                         return True
                 return False
 
+        if (self.VL_only_IAPWS95_table and fixed_var == 'P' and spec in ('H', 'S')
+                and not selection_fun_1P_specified and solution is None):
+            table = self.gas.table
+            sln = None
+            if table is not None:
+                sln = table.PH(fixed_var_val, spec_val) if spec == 'H' else table.PS(fixed_var_val, spec_val)
+            if sln is not None:
+                T, VF, liquid_state, gas_state = sln
+                P = fixed_var_val
+                gas_phase, ls, betas = None, [], [1.0]
+                if gas_state is not None:
+                    gas_phase = self.gas.from_table(T, P, *gas_state, zs=zs)
+                if liquid_state is not None:
+                    ls = [self.liquid.from_table(T, P, *liquid_state, zs=zs)]
+                if gas_phase is not None and ls:
+                    betas = [VF, 1.0 - VF]
+                return gas_phase, ls, [], betas, {'iterations': 0, 'err': 0.0}
+
+        if (self.VF_TABLES and self.VF_tables_supported and fixed_var == 'P' and spec in ('H', 'S', 'U')
+                and not self.solid_count and not selection_fun_1P_specified and solution is None):
+            # At a fixed pressure the two phase solution is the stable one
+            # whenever it exists, so the single phase solutions are skipped
+            try:
+                Tsat, VL_liq, VL_gas, VL_iter, VL_err = self.flash_PVF(fixed_var_val, VF=.5, zs=zs)
+                spec_val_l = getattr(VL_liq, spec)()
+                spec_val_g = getattr(VL_gas, spec)()
+                VF = (spec_val - spec_val_l)/(spec_val_g - spec_val_l)
+            except Exception:
+                VF = None
+            if VF is not None and 0.0 <= VF <= 1.0:
+                flash_convergence = {'iterations': 0, 'err': 0.0,
+                                     'VF flash convergence': {'iterations': VL_iter, 'err': VL_err}}
+                return VL_gas, [VL_liq], [], [VF, 1.0 - VF], flash_convergence
+
         if (self.VL_only_CEOSs_same or self.VL_IG_activity) and not selection_fun_1P_specified and solution is None and fixed_var != 'V':
             try:
                 return self.flash_TPV_HSGUA_VL_bound_first(fixed_var_val=fixed_var_val, spec_val=spec_val, fixed_var=fixed_var,
@@ -1116,6 +1340,129 @@ class FlashPureVLS(Flash):
 
 
 
+    def _VF_table_phases(self, T, P):
+        zs = [1.0]
+        # The same liquid the rigorous saturation solvers use
+        return self.liquids[0].to_TP_zs(T, P, zs), self.gas.to_TP_zs(T, P, zs)
+
+    def _VF_table_digest(self):
+        from hashlib import sha1
+        parts = [_VF_TABLE_FORMAT, self.VF_TABLES_PTS, self.VF_TABLES_TR_MIN,
+                 self.VF_TABLES_TR_MAX, self.TVF_xtol, self.constants.Tcs[0]]
+        for phase in [self.gas] + self.liquids:
+            parts.append(phase.__class__.__name__)
+            for attr in phase.model_attributes:
+                try:
+                    parts.append(repr(getattr(phase, attr)))
+                except Exception:
+                    parts.append(None)
+        # Python's hash of strings changes between sessions, so the file name
+        # uses a digest of the model representations; memory addresses are
+        # removed from them as well
+        text = re.sub(' at 0x[0-9a-fA-F]+', '', repr(parts))
+        return sha1(text.encode('utf-8')).hexdigest()
+
+    def _VF_table_check(self, table):
+        # Guards against a saved table from a model the digest cannot tell apart
+        xs, lnPs = table.xs, table.lnPs
+        for i in (0, len(xs)//2, len(xs) - 1):
+            Psat = self._flash_TVF_rigorous(1.0/xs[i], exp(lnPs[i]))[0]
+            if abs(log(Psat) - lnPs[i]) > 1e-9:
+                return False
+        return True
+
+    def build_VF_table(self):
+        r'''Build a :obj:`PureSaturationTable` for the flasher by solving the
+        saturation curve rigorously at `2*VF_TABLES_PTS - 1` temperatures
+        evenly spaced in inverse temperature between `VF_TABLES_TR_MIN` and
+        `VF_TABLES_TR_MAX` times the critical temperature. The table covers
+        the longest range of consecutive points where the saturation flash
+        converged.
+
+        Returns
+        -------
+        table : :obj:`PureSaturationTable`
+            Saturation table, [-]
+        '''
+        from scipy.interpolate import CubicSpline
+        Tc = self.constants.Tcs[0]
+        x_all = linspace(1.0/(self.VF_TABLES_TR_MAX*Tc), 1.0/(self.VF_TABLES_TR_MIN*Tc),
+                         2*self.VF_TABLES_PTS - 1)
+        lnP_all = []
+        for x in x_all:
+            T = 1.0/x
+            try:
+                lnP_all.append(log(self._flash_TVF_rigorous(T, self.Psat_guess(T))[0]))
+            except Exception:
+                lnP_all.append(None)
+
+        # Longest run of converged points with a decreasing vapor pressure
+        start, best = None, (0, 0)
+        for i, lnP in enumerate(lnP_all):
+            if lnP is None:
+                start = None
+                continue
+            if start is None or not lnP < lnP_all[i-1]:
+                start = i
+            if i + 1 - start > best[1] - best[0]:
+                best = (start, i + 1)
+        low, high = best
+        if (high - low) % 2 == 0:
+            high -= 1
+        if high - low < 7:
+            raise ValueError("Could not solve the saturation curve at enough points to build a table")
+        xs, lnPs = np.array(x_all[low:high]), np.array(lnP_all[low:high])
+
+        # Error estimates from a spline through every other point, applied to
+        # both intervals of the final table around each skipped point
+        x_nodes, lnP_nodes, x_mids, lnP_mids = xs[::2], lnPs[::2], xs[1::2], lnPs[1::2]
+        lnP_errs = np.abs(CubicSpline(x_nodes, lnP_nodes)(x_mids) - lnP_mids)
+        x_errs = np.abs(CubicSpline(lnP_nodes[::-1], x_nodes[::-1])(lnP_mids) - x_mids)/x_mids
+        return PureSaturationTable(xs, lnPs, np.repeat(lnP_errs, 2), np.repeat(x_errs, 2))
+
+    def VF_table(self):
+        r'''Return the :obj:`PureSaturationTable` of the flasher. The first
+        time, it is looked up in memory, then in `VF_TABLES_CACHE_DIR`, and
+        built with :obj:`build_VF_table` if it is not found. A built table is
+        saved to `VF_TABLES_CACHE_DIR`, which defaults to the `thermo` user
+        data folder when it is None; when it is '', tables are only kept in
+        memory.
+
+        Returns
+        -------
+        table : :obj:`PureSaturationTable`
+            Saturation table, [-]
+        '''
+        try:
+            return self._VF_table
+        except AttributeError:
+            pass
+        digest = self._VF_table_digest()
+        table = _VF_tables.get(digest)
+        if table is None:
+            cache_dir = self.VF_TABLES_CACHE_DIR
+            if cache_dir is None:
+                from thermo.base import data_dir as cache_dir
+            path = os.path.join(cache_dir, 'FlashPureVLS_VF_table_%s.npz' %(digest,)) if cache_dir else None
+            if path is not None:
+                try:
+                    with np.load(path) as f:
+                        table = PureSaturationTable(f['xs'], f['lnPs'], f['lnP_errs'], f['x_errs'])
+                    if not self._VF_table_check(table):
+                        table = None
+                except Exception:
+                    table = None
+            if table is None:
+                table = self.build_VF_table()
+                if path is not None:
+                    try:
+                        np.savez(path, **table.as_arrays())
+                    except Exception:
+                        pass
+            _VF_tables[digest] = table
+        self._VF_table = table
+        return table
+
     def flash_VF_HSGUA(self, fixed_var_val, spec_val, fixed_var='VF', spec_var='H', zs=None,
                        hot_start=None, solution='high'):
         # solution at high T by default
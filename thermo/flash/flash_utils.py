@@ -40,6 +40,8 @@ __all__ = [
     'TPV_HSGUA_guesses_1P_methods', 
     'TPV_solve_HSGUA_guesses_1P',
     'sequential_substitution_2P_HSGUAbeta',
+    'sequential_substitution_2P_HSGUA_T',
+    'newton_2P_lnKs',
     'sequential_substitution_2P_sat', 
     'TP_solve_VF_guesses',
     'TPV_double_solve_1P', 
@@ -3630,6 +3632,376 @@ def sequential_substitution_2P_HSGUAbeta(zs, xs_guess, ys_guess, liquid_phase,
 
 
 
+def sequential_substitution_2P_HSGUA_T(T, P, zs, xs_guess, ys_guess,
+                                       liquid_phase, gas_phase, spec_val,
+                                       spec='H', V_over_F_guess=0.5,
+                                       maxiter=200, tol_eq=1E-13,
+                                       tol_spec=1e-6, trivial_solution_tol=1e-5,
+                                       xtol_newton=None):
+    r'''Solve a two-phase flash with a specified pressure and enthalpy,
+    entropy, or internal energy by converging the temperature together with
+    the phase equilibrium. Every iteration performs one sequential
+    substitution step and one Newton step in temperature, which is much
+    cheaper than converging a full `PT` flash at every trial temperature.
+
+    The temperature derivative of the spec includes the change in the
+    Rachford-Rice vapor fraction caused by the change of the K values with
+    temperature, which dominates inside the two-phase region:
+
+    .. math::
+        \frac{d X}{dT} = \beta_g \frac{\partial X_g}{\partial T}
+        + (1-\beta_g)\frac{\partial X_l}{\partial T}
+        + (X_g - X_l)\frac{d \beta_g}{dT}
+
+    .. math::
+        \frac{d \beta_g}{dT} = \frac{\sum_i z_i K_i \frac{\partial \ln K_i}
+        {\partial T}\left[1 + \beta_g(K_i-1)\right]^{-2}}
+        {\sum_i z_i (K_i-1)^2 \left[1 + \beta_g(K_i-1)\right]^{-2}}
+
+    The effect of the changing phase compositions on the properties of each
+    phase is neglected in the derivative. After every temperature step the
+    K values are extrapolated to the new temperature with
+    :math:`\partial \ln K_i/\partial T`, so the compositions do not lag
+    one step behind the temperature.
+
+    The Rachford-Rice equation is solved as a negative flash; if the
+    converged vapor fraction is not between 0 and 1, the solution of the
+    flash is a single phase, and the returned temperature is a good guess for
+    it.
+
+    Sequential substitution converges linearly. If `xtol_newton` is given,
+    the solution is finished with Newton's method on the logarithms of the
+    K values and the temperature, by :obj:`newton_2P_lnKs`.
+
+    Parameters
+    ----------
+    T : float
+        Initial guess for temperature, [K]
+    P : float
+        Pressure, [Pa]
+    zs : list[float]
+        Overall mole fractions, [-]
+    xs_guess : list[float]
+        Initial guess for liquid mole fractions, [-]
+    ys_guess : list[float]
+        Initial guess for gas mole fractions, [-]
+    liquid_phase : Phase
+        Liquid phase model, [-]
+    gas_phase : Phase
+        Gas phase model, [-]
+    spec_val : float
+        Value of the specification, [J/mol or J/(mol*K)]
+    spec : str
+        One of 'H', 'S', or 'U', [-]
+    V_over_F_guess : float
+        Initial guess for the vapor fraction, [-]
+    maxiter : int
+        Maximum number of iterations, [-]
+    tol_eq : float
+        Tolerance in the sum of squared fugacity ratio errors, [-]
+    tol_spec : float
+        Relative tolerance in the specification, [-]
+    trivial_solution_tol : float
+        Minimum sum of absolute composition differences between the phases,
+        [-]
+    xtol_newton : float, optional
+        If given, the solution is finished with Newton steps until the steps
+        in the logarithms of the K values and the relative step in
+        temperature are under this tolerance, [-]
+
+    Returns
+    -------
+    T : float
+        Temperature, [K]
+    V_over_F : float
+        Vapor fraction, [-]
+    xs : list[float]
+        Liquid mole fractions, [-]
+    ys : list[float]
+        Gas mole fractions, [-]
+    l : Phase
+        Liquid phase at the solution, [-]
+    g : Phase
+        Gas phase at the solution, [-]
+    iteration : int
+        Number of iterations, [-]
+    err_eq : float
+        Sum of squared fugacity ratio errors, [-]
+    spec_err : float
+        Error in the specification, [J/mol or J/(mol*K)]
+    spec_der : float
+        Derivative of the specification with respect to temperature along
+        the two-phase equilibrium, [J/(mol*K) or J/(mol*K^2)]
+    '''
+    xs, ys = xs_guess, ys_guess
+    V_over_F = V_over_F_guess
+    cmps = range(len(zs))
+
+    tol_spec_abs = tol_spec*abs(spec_val)
+    if tol_spec_abs == 0.0:
+        tol_spec_abs = 1e-7
+
+    spec_fun_l = getattr(liquid_phase.__class__, spec)
+    spec_fun_g = getattr(gas_phase.__class__, spec)
+    s_der = 'd%s_dT' %(spec)
+    spec_der_fun_l = getattr(liquid_phase.__class__, s_der)
+    spec_der_fun_g = getattr(gas_phase.__class__, s_der)
+    T_low = T_high = None
+
+    for iteration in range(maxiter):
+        l = liquid_phase.to_TP_zs(T=T, P=P, zs=xs)
+        g = gas_phase.to_TP_zs(T=T, P=P, zs=ys)
+        lnphis_l = l.lnphis()
+        lnphis_g = g.lnphis()
+        Ks = [exp(lnphis_l[i] - lnphis_g[i]) for i in cmps]
+
+        try:
+            V_over_F, xs_new, ys_new = flash_inner_loop(zs, Ks, guess=V_over_F)
+        except Exception:
+            V_over_F, xs_new, ys_new = flash_inner_loop(zs, Ks, guess=V_over_F, check=True)
+
+        spec_l, spec_g = spec_fun_l(l), spec_fun_g(g)
+        spec_err = spec_g*V_over_F + spec_l*(1.0 - V_over_F) - spec_val
+
+        err_eq, comp_diff = 0.0, 0.0
+        for i in cmps:
+            err_i = Ks[i]*xs[i]/ys[i] - 1.0
+            err_eq += err_i*err_i
+            comp_diff += abs(xs[i] - ys[i])
+        if comp_diff < trivial_solution_tol and iteration:
+            raise TrivialSolutionError("Converged to trivial condition, compositions of both phases equal",
+                                       comp_diff, iteration, err_eq)
+
+        dlnphis_dT_l = l.dlnphis_dT()
+        dlnphis_dT_g = g.dlnphis_dT()
+        num, den = 0.0, 0.0
+        for i in cmps:
+            Km1 = Ks[i] - 1.0
+            t = 1.0/(1.0 + V_over_F*Km1)
+            t *= zs[i]*t
+            num += t*Ks[i]*(dlnphis_dT_l[i] - dlnphis_dT_g[i])
+            den += t*Km1*Km1
+        if den == 0.0:
+            # All K values are 1; the phases are identical
+            raise TrivialSolutionError("Converged to trivial condition, all K values equal to 1",
+                                       comp_diff, iteration, err_eq)
+        spec_der = (spec_der_fun_g(g)*V_over_F + spec_der_fun_l(l)*(1.0 - V_over_F)
+                    + (spec_g - spec_l)*num/den)
+
+        if err_eq < tol_eq and abs(spec_err) < tol_spec_abs:
+            if xtol_newton is None:
+                return T, V_over_F, xs, ys, l, g, iteration, err_eq, spec_err, spec_der
+            sln = newton_2P_lnKs(T, P, zs, Ks, V_over_F, liquid_phase, gas_phase,
+                                 maxiter=maxiter, xtol=xtol_newton, spec=spec, spec_val=spec_val)
+            return sln[:6] + (iteration + sln[6] + 1,) + sln[7:]
+        if spec_der <= 0.0:
+            raise UnconvergedError('Non-positive derivative of the specification with temperature')
+
+        # Newton step in temperature, limited to 10% of the temperature.
+        # The sign of the error brackets the solution; a step leaving the
+        # bracket is replaced by bisection to stop oscillation
+        if spec_err > 0.0:
+            T_high = T if T_high is None else min(T_high, T)
+        else:
+            T_low = T if T_low is None else max(T_low, T)
+        dT = -spec_err/spec_der
+        dT_max = 0.1*T
+        if dT > dT_max:
+            dT = dT_max
+        elif dT < -dT_max:
+            dT = -dT_max
+        if T_low is not None and T_high is not None and not (T_low < T + dT < T_high):
+            dT = 0.5*(T_low + T_high) - T
+        T += dT
+
+        # Extrapolate the K values to the new temperature; otherwise the
+        # compositions lag one step behind the temperature, and the spec
+        # only converges linearly
+        Ks = [Ks[i]*exp((dlnphis_dT_l[i] - dlnphis_dT_g[i])*dT) for i in cmps]
+        try:
+            V_over_F, xs_new, ys_new = flash_inner_loop(zs, Ks, guess=V_over_F)
+        except Exception:
+            V_over_F, xs_new, ys_new = flash_inner_loop(zs, Ks, guess=V_over_F, check=True)
+
+        # Check for negative fractions - normalize only if needed
+        for xi in xs_new:
+            if xi < 0.0:
+                xs_new_sum_inv = 1.0/sum(abs(i) for i in xs_new)
+                xs_new = [abs(i)*xs_new_sum_inv for i in xs_new]
+                break
+        for yi in ys_new:
+            if yi < 0.0:
+                ys_new_sum_inv = 1.0/sum(abs(i) for i in ys_new)
+                ys_new = [abs(i)*ys_new_sum_inv for i in ys_new]
+                break
+        xs, ys = xs_new, ys_new
+    raise UnconvergedError('End of SS without convergence')
+
+def newton_2P_lnKs(T, P, zs, Ks, V_over_F, liquid_phase, gas_phase,
+                   maxiter=50, xtol=1e-12, spec=None, spec_val=None):
+    r'''Finish a two-phase flash with Newton's method on the logarithms of
+    the K values, the vapor fraction and phase compositions following from
+    them through the Rachford-Rice equation. With a specified pressure and
+    enthalpy, entropy, or internal energy, the temperature is solved for as
+    well:
+
+    .. math::
+        F_i = \ln K_i + \ln \phi_i^g - \ln \phi_i^l = 0
+
+    .. math::
+        F_{N+1} = \beta_g X_g + (1-\beta_g) X_l - X_{spec} = 0
+
+    The Jacobian uses the mole number derivatives `dlnphis_dns` and
+    `dH_dns` or `dS_dns` of the phases; those a phase does not implement are
+    taken as zero, which slows convergence to linear but does not change
+    the solution. This is meant to start from a solution converged by
+    sequential substitution.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, or its initial guess if `spec` is given, [K]
+    P : float
+        Pressure, [Pa]
+    zs : list[float]
+        Overall mole fractions, [-]
+    Ks : list[float]
+        Initial guess for the K values, [-]
+    V_over_F : float
+        Initial guess for the vapor fraction, [-]
+    liquid_phase : Phase
+        Liquid phase model, [-]
+    gas_phase : Phase
+        Gas phase model, [-]
+    maxiter : int
+        Maximum number of iterations, [-]
+    xtol : float
+        Tolerance in the steps of the logarithms of the K values, and
+        relative tolerance in the temperature step, [-]
+    spec : str, optional
+        One of 'H', 'S', or 'U'; temperature is fixed if not given, [-]
+    spec_val : float, optional
+        Value of the specification, [J/mol or J/(mol*K)]
+
+    Returns
+    -------
+    T : float
+        Temperature, [K]
+    V_over_F : float
+        Vapor fraction, [-]
+    xs : list[float]
+        Liquid mole fractions, [-]
+    ys : list[float]
+        Gas mole fractions, [-]
+    l : Phase
+        Liquid phase at the solution, [-]
+    g : Phase
+        Gas phase at the solution, [-]
+    iteration : int
+        Number of iterations, [-]
+    err_eq : float
+        Sum of squared fugacity ratio errors, [-]
+    spec_err : float
+        Error in the specification, [J/mol or J/(mol*K)]
+    spec_der : float
+        Derivative of the specification with respect to temperature along
+        the two-phase equilibrium, with the effect of composition on the
+        properties of each phase neglected, [J/(mol*K) or J/(mol*K^2)]
+    '''
+    N = len(zs)
+    cmps = range(N)
+    lnKs = [log(Ki) for Ki in Ks]
+    size = N + 1 if spec is not None else N
+    for iteration in range(maxiter):
+        Ks = [exp(lnKi) for lnKi in lnKs]
+        try:
+            V_over_F, xs, ys = flash_inner_loop(zs, Ks, guess=V_over_F)
+        except Exception:
+            V_over_F, xs, ys = flash_inner_loop(zs, Ks, guess=V_over_F, check=True)
+        l = liquid_phase.to_TP_zs(T=T, P=P, zs=xs)
+        g = gas_phase.to_TP_zs(T=T, P=P, zs=ys)
+        lnphis_l, lnphis_g = l.lnphis(), g.lnphis()
+        # Composition derivatives only change the rate of convergence
+        try:
+            dlnphis_dns_l = l.dlnphis_dns()
+        except (AttributeError, NotImplementedError):
+            dlnphis_dns_l = None
+        try:
+            dlnphis_dns_g = g.dlnphis_dns()
+        except (AttributeError, NotImplementedError):
+            dlnphis_dns_g = None
+
+        Fs = [lnKs[i] + lnphis_g[i] - lnphis_l[i] for i in cmps]
+
+        # Derivatives of the Rachford-Rice solution with respect to lnKs
+        ts = [1.0/(1.0 + V_over_F*(Ks[i] - 1.0)) for i in cmps]
+        den = 0.0
+        for i in cmps:
+            den += zs[i]*ts[i]*ts[i]*(Ks[i] - 1.0)*(Ks[i] - 1.0)
+        if den == 0.0:
+            raise TrivialSolutionError("Converged to trivial condition, all K values equal to 1",
+                                       0.0, iteration, 0.0)
+        dV_over_F_dlnKs = [zs[j]*Ks[j]*ts[j]*ts[j]/den for j in cmps]
+        dxs = [[-xs[i]*ts[i]*(Ks[i] - 1.0)*dV_over_F_dlnKs[j] for j in cmps] for i in cmps]
+        for i in cmps:
+            dxs[i][i] -= xs[i]*ts[i]*V_over_F*Ks[i]
+        dys = [[Ks[i]*dxs[i][j] for j in cmps] for i in cmps]
+        for i in cmps:
+            dys[i][i] += ys[i]
+
+        J = [[0.0]*size for _ in range(size)]
+        for i in cmps:
+            Ji = J[i]
+            Ji[i] = 1.0
+            for k in cmps:
+                a = dlnphis_dns_g[i][k] if dlnphis_dns_g is not None else 0.0
+                b = dlnphis_dns_l[i][k] if dlnphis_dns_l is not None else 0.0
+                if a != 0.0 or b != 0.0:
+                    dys_k, dxs_k = dys[k], dxs[k]
+                    for j in cmps:
+                        Ji[j] += a*dys_k[j] - b*dxs_k[j]
+
+        spec_err = spec_der = 0.0
+        if spec is not None:
+            dlnphis_dT_l, dlnphis_dT_g = l.dlnphis_dT(), g.dlnphis_dT()
+            spec_l, spec_g = getattr(l, spec)(), getattr(g, spec)()
+            dspec_dT_l, dspec_dT_g = getattr(l, 'd%s_dT' %(spec))(), getattr(g, 'd%s_dT' %(spec))()
+            spec_err = V_over_F*spec_g + (1.0 - V_over_F)*spec_l - spec_val
+            Fs.append(spec_err)
+            derivatives = []
+            for phase in (l, g):
+                try:
+                    derivatives.append(getattr(phase, 'd%s_dns' %(spec))())
+                except (AttributeError, NotImplementedError):
+                    derivatives.append([0.0]*N)
+            dspec_dns_l, dspec_dns_g = derivatives
+            for i in cmps:
+                J[i][N] = dlnphis_dT_g[i] - dlnphis_dT_l[i]
+            JN = J[N]
+            for j in cmps:
+                v = (spec_g - spec_l)*dV_over_F_dlnKs[j]
+                for k in cmps:
+                    v += V_over_F*dspec_dns_g[k]*dys[k][j] + (1.0 - V_over_F)*dspec_dns_l[k]*dxs[k][j]
+                JN[j] = v
+            JN[N] = V_over_F*dspec_dT_g + (1.0 - V_over_F)*dspec_dT_l
+            num = 0.0
+            for i in cmps:
+                num += zs[i]*ts[i]*ts[i]*Ks[i]*(dlnphis_dT_l[i] - dlnphis_dT_g[i])
+            spec_der = JN[N] + (spec_g - spec_l)*num/den
+
+        dx = py_solve(J, [-v for v in Fs])
+        dT = dx[N] if spec is not None else 0.0
+        if abs(dT) <= xtol*T and max(abs(v) for v in dx[:N]) <= xtol:
+            err_eq = 0.0
+            for i in cmps:
+                err_i = exp(-Fs[i]) - 1.0
+                err_eq += err_i*err_i
+            return T, V_over_F, xs, ys, l, g, iteration, err_eq, spec_err, spec_der
+        for i in cmps:
+            lnKs[i] += dx[i]
+        T += dT
+    raise UnconvergedError('Newton iterations did not converge')
+
 def sequential_substitution_2P_double(zs, xs_guess, ys_guess, liquid_phase,
                                      gas_phase, guess, spec_vals,
                                      iter_var0='T', iter_var1='P',
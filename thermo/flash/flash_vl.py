@@ -24,6 +24,7 @@ from .flash_base import Flash
 from .flash_utils import (
     PT_SS, PT_SS_MEHRA, PT_SS_GDEM3, PT_NEWTON_lNKVF,
     sequential_substitution_2P,
+    sequential_substitution_2P_HSGUA_T,
     sequential_substitution_Mehra_2P,
     sequential_substitution_GDEM3_2P,
     nonlin_2P_newton,
@@ -46,9 +47,9 @@ from .flash_utils import (
     nonlin_spec_NP,
 )
 from .flash_pure_vls  import FlashPureVLS
-from chemicals.utils import log
+from chemicals.utils import log, exp
 from chemicals.exceptions import TrivialSolutionError
-from fluids.numerics import secant, UnconvergedError
+from fluids.numerics import secant, UnconvergedError, numpy as np
 from thermo.property_package import StabilityTester
 from thermo.bulk import default_settings
 from thermo.coolprop import CPiP_min
@@ -155,6 +156,30 @@ class FlashVL(Flash):
         numerically; this would need to be set to False if the phase objects
         used in the flash do not have complete analytical derivatives
         implemented, [-]
+    TPV_HSGUA_DIRECT : bool
+        Whether or not to first try to solve flashes with a `P` spec and one
+        (`H`, `S`, `U`) spec by converging the temperature together with the
+        two-phase equilibrium, instead of a 1D search over PT flashes, [-]
+    TPV_HSGUA_DIRECT_MAXITER : int
+        Maximum number of switches between single-phase and two-phase
+        iterations in the direct solver for flashes with a `P` spec and one
+        (`H`, `S`, `U`) spec, [-]
+    TPV_HSGUA_DIRECT_SS_MAXITER : int
+        Maximum number of iterations in the direct two-phase solver, and of
+        Newton steps on a single phase, for flashes with a `P` spec and one
+        (`H`, `S`, `U`) spec, [-]
+    TPV_HSGUA_DIRECT_YTOL : float
+        Relative tolerance in the (`H`, `S`, `U`) spec of the direct solver;
+        as its convergence is quadratic in the end, this is kept tight enough
+        for equilibrium derivatives to be calculated numerically, [-]
+    TPV_HSGUA_DIRECT_SS_TOL : float
+        Tolerance in both the squared fugacity errors and the relative error
+        in the (`H`, `S`, `U`) spec at which the sequential substitution of
+        the direct solver hands a two-phase solution to Newton's method, [-]
+    TPV_HSGUA_DIRECT_NEWTON_XTOL : float
+        Tolerance in the log K values and relative tolerance in temperature
+        of the Newton steps which finish two-phase solutions of the direct
+        solver, [-]
 
 
     Notes
@@ -167,7 +192,13 @@ class FlashVL(Flash):
     calculations.
 
     Flashes with one (`T`, `P`, `V`) spec and one (`H`, `S`, `G`, `U`, `A`)
-    spec are solved by a 1D search over PT flashes.
+    spec are solved by a 1D search over PT flashes. When pressure is
+    specified with enthalpy, entropy, or internal energy, the temperature is
+    instead iterated on directly with the phase models: single-phase
+    solutions are found by Newton's method and confirmed by one stability
+    test, and two-phase solutions are converged by solving for temperature
+    together with the phase equilibrium. The 1D search is only used if that
+    fails.
 
     Additional information that can be provided in the
     :obj:`ChemicalConstantsPackage <thermo.chemical_package.ChemicalConstantsPackage>`
@@ -297,6 +328,13 @@ class FlashVL(Flash):
     TPV_HSGUA_NEWTON_SOLVER = 'hybr'
     HSGUA_NEWTON_ANALYTICAL_JAC = True
 
+    TPV_HSGUA_DIRECT = True
+    TPV_HSGUA_DIRECT_MAXITER = 20
+    TPV_HSGUA_DIRECT_SS_MAXITER = 50
+    TPV_HSGUA_DIRECT_YTOL = 1e-12
+    TPV_HSGUA_DIRECT_SS_TOL = 1e-7
+    TPV_HSGUA_DIRECT_NEWTON_XTOL = 1e-12
+
     solids = None
     skip_solids = True
     K_composition_independent = False
@@ -507,6 +545,133 @@ class FlashVL(Flash):
         else:
             raise NotImplementedError("TODO")
 
+    def saturation_curve(self, zs, VF, Ps=None, Ts=None):
+        r'''Method to calculate a bubble (`VF` = 0) or dew (`VF` = 1) point
+        curve of a fixed composition at a series of pressures or
+        temperatures. The curve is followed in the order the points are
+        given; after the first points are converged, the initial guesses for
+        each point are extrapolated from the previous converged points
+        instead of being generated from scratch. For best performance the
+        points should be sorted.
+
+        Parameters
+        ----------
+        zs : list[float]
+            Mole fractions of the feed, [-]
+        VF : float
+            Vapor fraction of the curve; 0 or 1, [-]
+        Ps : list[float], optional
+            Pressures to calculate the saturation temperature at, [Pa]
+        Ts : list[float], optional
+            Temperatures to calculate the saturation pressure at, [K]
+
+        Returns
+        -------
+        values : ndarray
+            Saturation temperatures if `Ps` is given, otherwise saturation
+            pressures; points which could not be converged are NaN, [K or Pa]
+        xs : ndarray
+            Mole fractions of the liquid phase at each point, [-]
+        ys : ndarray
+            Mole fractions of the gas phase at each point, [-]
+        iterations : ndarray
+            Number of iterations used to converge each point, [-]
+
+        Notes
+        -----
+        The extrapolation is quadratic in the saturation temperature (or the
+        log of the saturation pressure) and the log of the K values, against
+        the log of the specified pressure (or the specified temperature).
+        Should the solver fail from the extrapolated guess, the point is
+        solved again in the same way as :obj:`flash <Flash.flash>` would.
+        '''
+        if VF != 0.0 and VF != 1.0:
+            raise ValueError("Saturation curves are only supported for VF of 0 or 1")
+        if (Ps is None) == (Ts is None):
+            raise ValueError("Specify one of `Ps` or `Ts`")
+        if Ps is not None:
+            specs, fixed_var, iter_var = Ps, 'P', 'T'
+            flash_VF_2P = self.flash_PVF_2P
+        else:
+            specs, fixed_var, iter_var = Ts, 'T', 'P'
+            flash_VF_2P = self.flash_TVF_2P
+        dew = VF == 1.0
+        liquid, gas = self.liquid, self.gas
+        N, pts = self.N, len(specs)
+        cmps = range(N)
+        algos = self.dew_bubble_flash_algos
+        maxiter, xtol = self.DEW_BUBBLE_QUASI_NEWTON_MAXITER, self.DEW_BUBBLE_QUASI_NEWTON_XTOL
+        extrapolate = not self.K_composition_independent
+
+        values = np.full(pts, np.nan)
+        xs_all = np.full((pts, N), np.nan)
+        ys_all = np.full((pts, N), np.nan)
+        iterations = np.zeros(pts, dtype=int)
+
+        # Last converged points as (x, y, lnKs); x is the spec and y the
+        # iteration variable, log-transformed when they are pressures
+        history = []
+        for i in range(pts):
+            spec = specs[i]
+            x = log(spec) if fixed_var == 'P' else spec
+            sln = None
+            if extrapolate and len(history) >= 2:
+                # Lagrange polynomial through the previous points
+                weights = []
+                for j, (xj, _, _) in enumerate(history):
+                    w = 1.0
+                    for k, (xk, _, _) in enumerate(history):
+                        if k != j:
+                            w *= (x - xk)/(xj - xk)
+                    weights.append(w)
+                y = 0.0
+                lnKs = [0.0]*N
+                for w, (_, yj, lnKsj) in zip(weights, history):
+                    y += w*yj
+                    for k in cmps:
+                        lnKs[k] += w*lnKsj[k]
+                guess = exp(y) if iter_var == 'P' else y
+                if dew:
+                    comp_guess = [zs[k]*exp(-lnKs[k]) for k in cmps]
+                else:
+                    comp_guess = [zs[k]*exp(lnKs[k]) for k in cmps]
+                tot_inv = 1.0/sum(comp_guess)
+                comp_guess = [v*tot_inv for v in comp_guess]
+                for algo in algos:
+                    try:
+                        guess_calc, _, iter_phase, const_phase, iteration, _ = algo(
+                            guess, fixed_val=spec, zs=zs, liquid_phase=liquid, gas_phase=gas,
+                            iter_var=iter_var, fixed_var=fixed_var, V_over_F=VF,
+                            maxiter=maxiter, xtol=xtol, comp_guess=comp_guess)
+                    except Exception:
+                        continue
+                    if dew:
+                        l, g = iter_phase, const_phase
+                    else:
+                        l, g = const_phase, iter_phase
+                    sln = guess_calc, l, g, iteration
+                    break
+            if sln is None:
+                try:
+                    sln = flash_VF_2P(spec, VF, zs, liquid, gas)[0:4]
+                except Exception:
+                    # Start the extrapolation over past the failed point
+                    history = []
+                    continue
+            val, l, g, iteration = sln
+            values[i] = val
+            xs_all[i] = l.zs
+            ys_all[i] = g.zs
+            iterations[i] = iteration
+            if extrapolate:
+                y = log(val) if iter_var == 'P' else val
+                lnKs = [log(yi/xi) if (xi > 0.0 and yi > 0.0) else 0.0 for xi, yi in zip(l.zs, g.zs)]
+                if all(x != h[0] for h in history):
+                    history.append((x, y, lnKs))
+                if len(history) > 3:
+                    del history[0]
+        return values, xs_all, ys_all, iterations
+
     def stability_test_Michelsen(self, T, P, zs, min_phase, other_phase,
                                  existing_comps=None, skip=None,
                                  expect_liquid=False, expect_aqueous=False,
@@ -773,6 +938,16 @@ class FlashVL(Flash):
                     return True
                 return False
 
+        if (self.TPV_HSGUA_DIRECT and solution is None and fixed_var == 'P'
+                and iter_var == 'T' and spec in ('H', 'S', 'U')):
+            try:
+                return self.solve_PT_HSGUA_direct(zs, fixed_val, spec_val, spec=spec)
+            except (UnconvergedError, TrivialSolutionError, ArithmeticError, ValueError):
+                # Fall back to the 1D search over PT flashes; the direct
+                # solver can also fail numerically, e.g. in the Rachford-Rice
+                # solution or a model evaluated far outside its range
+                pass
+
         try:
             solutions_1P = []
             G_min = 1e100
@@ -873,9 +1048,8 @@ class FlashVL(Flash):
 
 
 
-    def solve_PT_HSGUA_NP_guess_bisect(self, zs, fixed_val, spec_val,
-                                       fixed_var='P', spec='H', iter_var='T'):
-        phases = self.phases
+    def guess_PT_HSGUA(self, zs, fixed_val, spec_val, fixed_var='P', spec='H',
+                       iter_var='T'):
         constants = self.constants
         correlations = self.correlations
         min_bound, max_bound = self.bounds_PT_HSGUA()
@@ -907,6 +1081,105 @@ class FlashVL(Flash):
                 guess = 101325.0
             elif iter_var == 'V':
                 guess = 0.024465403697038125
+        return guess
+
+    def _phases_TP_min_G(self, T, P, zs):
+        # Liquid and gas models at T and P, and whether the liquid is the one
+        # with the lower Gibbs energy (as in `flash_TP_stability_test`)
+        liquid = self.liquid.to(T=T, P=P, zs=zs)
+        gas = self.gas.to(T=T, P=P, zs=zs)
+        if self.ideal_gas_basis:
+            G_liq, G_gas = liquid.G_dep(), gas.G_dep()
+        else:
+            G_liq, G_gas = liquid.G(), gas.G()
+        return liquid, gas, G_liq < G_gas or (G_liq == G_gas and liquid.phase == 'l')
+
+    def solve_PT_HSGUA_direct(self, zs, fixed_val, spec_val, spec='H'):
+        # Pressure is fixed and temperature is iterated on, directly on the
+        # phase models. Single phase states take Newton steps on the phase
+        # with the lowest Gibbs energy and are then checked by one stability
+        # test; an unstable state seeds `sequential_substitution_2P_HSGUA_T`,
+        # which converges temperature together with the two-phase
+        # equilibrium. A negative flash result from that solver means the
+        # solution is single phase after all.
+        P = fixed_val
+        ytol = abs(spec_val)*self.TPV_HSGUA_DIRECT_YTOL
+        xtol = self.TPV_HSGUA_BISECT_XTOL
+        min_bound, max_bound = self.bounds_PT_HSGUA()
+        s_der = 'd%s_dT' %(spec)
+        T = self.guess_PT_HSGUA(zs, fixed_val, spec_val, fixed_var='P', spec=spec, iter_var='T')
+        liquid, gas, liquid_stable = self._phases_TP_min_G(T, P, zs)
+        trial_zs = None
+        iterations = 0
+        for _ in range(self.TPV_HSGUA_DIRECT_MAXITER):
+            if trial_zs is None:
+                # Newton's method on whichever phase model has the lower Gibbs
+                # energy; once that has switched back and forth, the spec is
+                # between those of the two phases
+                converged, switches = False, 0
+                for _ in range(self.TPV_HSGUA_DIRECT_SS_MAXITER):
+                    iterations += 1
+                    phase = liquid if liquid_stable else gas
+                    err = getattr(phase, spec)() - spec_val
+                    dT = -err/getattr(phase, s_der)()
+                    if abs(dT) <= xtol and abs(err) <= ytol:
+                        converged = True
+                        break
+                    dT_max = 0.1*T
+                    if dT > dT_max:
+                        dT = dT_max
+                    elif dT < -dT_max:
+                        dT = -dT_max
+                    T_new = min(max(T + dT, min_bound), max_bound)
+                    if T_new == T:
+                        raise UnconvergedError("Direct HSGUA flash reached the temperature bounds")
+                    T = T_new
+                    liquid, gas, liquid_stable_new = self._phases_TP_min_G(T, P, zs)
+                    if liquid_stable_new != liquid_stable:
+                        liquid_stable = liquid_stable_new
+                        switches += 1
+                        if switches > 1:
+                            break
+                else:
+                    raise UnconvergedError("Direct HSGUA flash did not converge in one phase")
+                min_phase, other_phase = (liquid, gas) if liquid_stable else (gas, liquid)
+                stable, (trial_zs, appearing_zs, V_over_F, _, _, _, _) = self.stability_test_Michelsen(
+                        T, P, zs, min_phase, other_phase, highest_comp_diff=self.SS_2P_STAB_HIGHEST_COMP_DIFF,
+                        min_comp_diff=self.SS_2P_STAB_COMP_DIFF_MIN)
+                if stable:
+                    if not converged:
+                        raise UnconvergedError("Direct HSGUA flash found no two-phase region")
+                    phase = liquid if liquid_stable else gas
+                    return None, [phase], [], [1.0], {'iterations': iterations, 'err': err}
+            else:
+                if not (0.0 < V_over_F < 1.0):
+                    V_over_F = 0.5
+                T, V_over_F, xs, ys, l, g, iteration, _, err, _ = sequential_substitution_2P_HSGUA_T(
+                    T, P, zs, trial_zs, appearing_zs, min_phase, other_phase, spec_val, spec=spec,
+                    V_over_F_guess=V_over_F, maxiter=self.TPV_HSGUA_DIRECT_SS_MAXITER,
+                    tol_eq=self.TPV_HSGUA_DIRECT_SS_TOL, tol_spec=self.TPV_HSGUA_DIRECT_SS_TOL,
+                    xtol_newton=self.TPV_HSGUA_DIRECT_NEWTON_XTOL)
+                iterations += iteration
+                if 0.0 < V_over_F < 1.0:
+                    # Same order as the phases of a PT flash, gas first
+                    flash_convergence = {'iterations': iterations, 'err': err}
+                    if liquid_stable:
+                        return None, [g, l], [], [V_over_F, 1.0 - V_over_F], flash_convergence
+                    return None, [l, g], [], [1.0 - V_over_F, V_over_F], flash_convergence
+                # The spec is met outside of the two-phase region, by the
+                # phase which holds all of the material there
+                if V_over_F >= 1.0:
+                    liquid_stable = not liquid_stable
+                T = min(max(T, min_bound), max_bound)
+                liquid, gas, _ = self._phases_TP_min_G(T, P, zs)
+                trial_zs = None
+        raise UnconvergedError("Direct HSGUA flash did not converge")
+
+    def solve_PT_HSGUA_NP_guess_bisect(self, zs, fixed_val, spec_val,
+                                       fixed_var='P', spec='H', iter_var='T'):
+        min_bound, max_bound = self.bounds_PT_HSGUA()
+        guess = self.guess_PT_HSGUA(zs, fixed_val, spec_val, fixed_var=fixed_var,
+                                    spec=spec, iter_var=iter_var)
         sln = []
         global iterations
         iterations = 0
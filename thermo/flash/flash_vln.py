@@ -29,6 +29,7 @@ from chemicals.exceptions import (
     PhaseCountReducedError, 
     PhaseExistenceImpossible
 )
+from math import log
 from fluids.numerics import (
     UnconvergedError,
     OscillationError,
@@ -47,6 +48,25 @@ from .flash_utils import (
 
 CAS_H2O = '7732-18-5'
 
+def phase_split_tpd_min(T, P, split_phases, phase):
+    # Lowest tangent plane distance, at `T` and `P`, of the compositions of
+    # the phases of a known split from the tangent plane at `phase`, which is
+    # part of the current solution
+    zs = phase.zs
+    lnphis = phase.lnphis()
+    N = len(zs)
+    tpd_min = 1e100
+    for p in split_phases:
+        ws = p.zs
+        trial_lnphis = p.to_TP_zs(T=T, P=P, zs=ws).lnphis()
+        tpd = 0.0
+        for i in range(N):
+            if ws[i] > 0.0 and zs[i] > 0.0:
+                tpd += ws[i]*(log(ws[i]) + trial_lnphis[i] - log(zs[i]) - lnphis[i])
+        if tpd < tpd_min:
+            tpd_min = tpd
+    return tpd_min
+
 class FlashVLN(FlashVL):
     r'''Class for performing flash calculations on multiphase vapor-liquid
     systems. This rigorous class does not make any assumptions and will search
@@ -107,6 +127,29 @@ class FlashVLN(FlashVL):
         stability, instead of testing first for a vapor-liquid solution and
         then moving on to a three phase flash if an instability is detected,
         [-]
+    DOUBLE_CHECK_2P_REUSE : bool
+        When `DOUBLE_CHECK_2P` is set, whether or not to skip searching all
+        phase pairs when a known phase split of the same composition at a
+        nearby temperature and pressure passes a tangent plane distance check
+        against the solution from the usual vapor-liquid or liquid-liquid
+        stability test; that is, none of the phases of the known split is
+        more stable at the current conditions. The known split is the
+        `hot_start` state if one is given, otherwise the last flash by this
+        object in the same temperature and pressure bucket. When the check
+        fails all phase pairs are searched as usual. This is intended for
+        grids of flashes whose neighbours are nearly always in the same phase
+        region, [-]
+    DOUBLE_CHECK_2P_CACHE_SIZE : int
+        Maximum number of composition, temperature and pressure buckets for
+        which the phase split is remembered for `DOUBLE_CHECK_2P_REUSE`, [-]
+    DOUBLE_CHECK_2P_CACHE_DT : float
+        Width of the temperature buckets of the phase split cache, [K]
+    DOUBLE_CHECK_2P_CACHE_DLNP : float
+        Width of the buckets of the logarithm of pressure of the phase split
+        cache, [-]
+    DOUBLE_CHECK_2P_TPD_TOL : float
+        Tangent plane distance below which a phase of a known split is taken
+        to be more stable than the current solution, [-]
 
     Notes
     -----
@@ -160,12 +203,20 @@ class FlashVLN(FlashVL):
     SS_STAB_AQUEOUS_CHECK = True
 
     DOUBLE_CHECK_2P = False
+    DOUBLE_CHECK_2P_REUSE = False
+    DOUBLE_CHECK_2P_CACHE_SIZE = 256
+    DOUBLE_CHECK_2P_CACHE_DT = 50.0
+    DOUBLE_CHECK_2P_CACHE_DLNP = 1.0
+    DOUBLE_CHECK_2P_TPD_TOL = 1e-7
 
     SS_NP_STAB_HIGHEST_COMP_DIFF = False
     SS_NP_STAB_COMP_DIFF_MIN = None
 
     K_COMPOSITION_INDEPENDENT_HACK = True
     skip_solids = True
+
+    # The direct P-H/P-S/P-U solver of FlashVL knows of one liquid only
+    TPV_HSGUA_DIRECT = False
     
     supports_VF_flash = True
     supports_SF_flash = False
@@ -233,6 +284,7 @@ class FlashVLN(FlashVL):
 
 
         self.T_MIN_FLASH = max(p.T_MIN_FLASH for p in self.phases)
+        self.phase_split_cache = {}
         try:
             self.water_index = constants.CASs.index(CAS_H2O)
         except ValueError:
@@ -449,7 +501,22 @@ class FlashVLN(FlashVL):
         else:
             G_2P = sum([found_betas[i]*found_phases[i].G() for i in range(len(found_phases))])
 
-        if sln_2P is not None and self.DOUBLE_CHECK_2P:
+        double_check = sln_2P is not None and self.DOUBLE_CHECK_2P
+        if double_check and self.DOUBLE_CHECK_2P_REUSE:
+            # Check the current solution against the phases of a known split
+            # with one tangent plane distance each; only search all phase
+            # pairs if one of them is more stable
+            split_key = (tuple(zs), round(T/self.DOUBLE_CHECK_2P_CACHE_DT),
+                         round(log(P)/self.DOUBLE_CHECK_2P_CACHE_DLNP))
+            if hot_start is not None:
+                known_phases = hot_start.phases
+            else:
+                known_phases = self.phase_split_cache.get(split_key)
+            if (known_phases is not None
+                and phase_split_tpd_min(T, P, known_phases, found_phases[0]) > -self.DOUBLE_CHECK_2P_TPD_TOL):
+                double_check = False
+
+        if double_check:
             g_id, ls_id, _, _ = identify_sort_phases(found_phases, found_betas, self.constants,
                                                     self.correlations, settings=self.settings,
                                                     skip_solids=self.skip_solids)
@@ -482,6 +549,12 @@ class FlashVLN(FlashVL):
                             existing_comps = [i.zs for i in found_phases]
                             found_betas = double_check_betas
 
+        if sln_2P is not None and self.DOUBLE_CHECK_2P and self.DOUBLE_CHECK_2P_REUSE:
+            cache = self.phase_split_cache
+            while split_key not in cache and len(cache) >= self.DOUBLE_CHECK_2P_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[split_key] = found_phases
+
 
         # Can still be a VLL solution now that a new phase has been added
         if (LL_solved and (self.max_liquids == 2) or (VL_solved and self.max_liquids == 1) or (self.N < 3 and (VL_solved or LL_solved))):
@@ -1489,6 +1489,7 @@ class HeatCapacityLiquidMixture(MixtureProperty):
     the critical point, this value can be obscenely high.'''
 
     ranked_methods = [LALIBERTE, LINEAR]
+    vectorized_methods = (LINEAR,)
     pure_references = ('HeatCapacityLiquids',)
     pure_reference_types = (HeatCapacityLiquid,)
 
@@ -1608,6 +1609,14 @@ class HeatCapacityLiquidMixture(MixtureProperty):
         else:
             raise Exception('Method not valid')
 
+    def calculate_many(self, Ts, Ps, zs_2d, ws_2d, method):
+        r'''Vectorized form of :obj:`calculate` for many states; see
+        :obj:`mixture_property_many <thermo.utils.MixtureProperty.mixture_property_many>`.
+        '''
+        if method == LINEAR:
+            return (zs_2d*self._pure_T_many(self.HeatCapacityLiquids, Ts)).sum(axis=1)
+        raise ValueError('Method not valid')
+
     def test_method_validity(self, T, P, zs, ws, method):
         r'''Method to test the validity of a specified method for the given
         conditions. No methods have implemented checks or strict ranges of
@@ -1668,6 +1677,7 @@ class HeatCapacitySolidMixture(MixtureProperty):
     '''Maximum value of Heat capacity; arbitrarily set.'''
 
     ranked_methods = [LINEAR]
+    vectorized_methods = (LINEAR,)
     pure_references = ('HeatCapacitySolids',)
     pure_reference_types = (HeatCapacitySolid,)
 
@@ -1747,6 +1757,14 @@ class HeatCapacitySolidMixture(MixtureProperty):
         else:
             raise Exception('Method not valid')
 
+    def calculate_many(self, Ts, Ps, zs_2d, ws_2d, method):
+        r'''Vectorized form of :obj:`calculate` for many states; see
+        :obj:`mixture_property_many <thermo.utils.MixtureProperty.mixture_property_many>`.
+        '''
+        if method == LINEAR:
+            return (zs_2d*self._pure_T_many(self.HeatCapacitySolids, Ts)).sum(axis=1)
+        raise ValueError('Method not valid')
+
     def test_method_validity(self, T, P, zs, ws, method):
         r'''Method to test the validity of a specified method for the given
         conditions. No methods have implemented checks or strict ranges of
@@ -1807,6 +1825,7 @@ class HeatCapacityGasMixture(MixtureProperty):
     the critical point, this value can be obscenely high.'''
 
     ranked_methods = [LINEAR]
+    vectorized_methods = (LINEAR,)
     pure_references = ('HeatCapacityGases',)
     pure_reference_types = (HeatCapacityGas,)
 
@@ -1887,6 +1906,14 @@ class HeatCapacityGasMixture(MixtureProperty):
         else:
             raise Exception('Method not valid')
 
+    def calculate_many(self, Ts, Ps, zs_2d, ws_2d, method):
+        r'''Vectorized form of :obj:`calculate` for many states; see
+        :obj:`mixture_property_many <thermo.utils.MixtureProperty.mixture_property_many>`.
+        '''
+        if method == LINEAR:
+            return (zs_2d*self._pure_T_many(self.HeatCapacityGases, Ts)).sum(axis=1)
+        raise ValueError('Method not valid')
+
     def test_method_validity(self, T, P, zs, ws, method):
         r'''Method to test the validity of a specified method for the given
         conditions. No methods have implemented checks or strict ranges of
@@ -550,6 +550,7 @@ class SurfaceTensionMixture(MixtureProperty):
     cobalt at its melting point.'''
 
     ranked_methods = [WINTERFELDSCRIVENDAVIS, DIGUILIOTEJA, LINEAR]
+    vectorized_methods = (WINTERFELDSCRIVENDAVIS, LINEAR)
 
     pure_references = ('SurfaceTensions', 'VolumeLiquids')
     pure_reference_types = (SurfaceTension, VolumeLiquid)
@@ -638,6 +639,27 @@ class SurfaceTensionMixture(MixtureProperty):
         else:
             raise Exception('Method not valid')
 
+    def calculate_many(self, Ts, Ps, zs_2d, ws_2d, method):
+        r'''Vectorized form of :obj:`calculate` for many states; see
+        :obj:`mixture_property_many <thermo.utils.MixtureProperty.mixture_property_many>`.
+        '''
+        sigmas = self._pure_T_many(self.SurfaceTensions, Ts)
+        if method == LINEAR:
+            return (zs_2d*sigmas).sum(axis=1)
+        elif method == WINTERFELDSCRIVENDAVIS:
+            if self._correct_pressure_pure:
+                Vms = self._pure_TP_many(self.VolumeLiquids, Ts, Ps, T_fallback=False)
+            else:
+                Vms = self._pure_T_many(self.VolumeLiquids, Ts)
+            # Winterfeld_Scriven_Davis with molar densities 1/Vms; the double
+            # sum over pairs is half the square of the single sum
+            Vms = 1e3*Vms
+            rhos = 2.0**0.5/(zs_2d*Vms).sum(axis=1)
+            vals = np.sqrt(sigmas)*zs_2d*rhos[:, None]*Vms
+            tots = vals.sum(axis=1)
+            return 0.5*tots*tots
+        raise ValueError('Method not valid')
+
     def test_method_validity(self, T, P, zs, ws, method):
         r'''Method to test the validity of a specified method for the given
         conditions. No methods have implemented checks or strict ranges of
@@ -53,6 +53,7 @@ __all__ = ['smarts_fragment', 'Joback', 'J_BIGGS_JOBACK_SMARTS',
            'J_BIGGS_JOBACK_SMARTS_id_dict']
 
 from chemicals.utils import to_num, horner, exp
+from fluids.numerics import numpy as np
 
 rdkit_missing = 'RDKit is not installed; it is required to use this functionality'
 
@@ -262,6 +263,49 @@ for i, line in enumerate(joback_data_txt.split('\n')):
     joback_groups_id_dict[i+1] = j
 
 
+# Group contributions as a matrix for the batch estimators, one row per group
+# in the order of the group ids; 'n. a.' contributions are zero in
+# `joback_contributions` and flagged in `joback_contributions_missing`
+joback_contribution_names = ('Tc', 'Pc', 'Vc', 'Tb', 'Tm', 'Hform', 'Gform', 'Cpa',
+                             'Cpb', 'Cpc', 'Cpd', 'Hfus', 'Hvap', 'mua', 'mub')
+joback_contribution_indexes = {k: i for i, k in enumerate(joback_contribution_names)}
+joback_contributions = np.zeros((len(joback_groups_id_dict), len(joback_contribution_names)))
+joback_contributions_missing = np.zeros(joback_contributions.shape)
+for i in range(len(joback_groups_id_dict)):
+    for j, k in enumerate(joback_contribution_names):
+        v = getattr(joback_groups_id_dict[i+1], k)
+        if type(v) is float:
+            joback_contributions[i, j] = v
+        else:
+            joback_contributions_missing[i, j] = 1.0
+del i, j, k, v
+
+_Joback_compiled_catalog = None
+def _Joback_catalog_compiled():
+    # The SMARTS patterns are parsed once per process
+    global _Joback_compiled_catalog
+    if _Joback_compiled_catalog is None:
+        if not loaded_rdkit:
+            load_rdkit_modules()
+        _Joback_compiled_catalog = {k: Chem.MolFromSmarts(v) for k, v in J_BIGGS_JOBACK_SMARTS_id_dict.items()}
+    return _Joback_compiled_catalog
+
+def _Joback_fragment_job(mol):
+    if not loaded_rdkit:
+        load_rdkit_modules()
+    if type(mol) == Chem.rdchem.Mol:
+        rdkitmol = mol
+    else:
+        rdkitmol = Chem.MolFromSmiles(mol)
+        if rdkitmol is None:
+            return {}, None, None, False, 'Failed to construct mol'
+    rdkitmol_Hs = Chem.AddHs(rdkitmol)
+    atom_count = len(rdkitmol_Hs.GetAtoms())
+    MW = rdMolDescriptors.CalcExactMolWt(rdkitmol_Hs)
+    counts, success, status = smarts_fragment(_Joback_catalog_compiled(), rdkitmol=rdkitmol)
+    return counts, atom_count, MW, success, status
+
+
 def smarts_fragment(catalog, rdkitmol=None, smi=None, deduplicate=True):
     r'''Fragments a molecule into a set of unique groups and counts as
     specified by the `catalog`. The molecule can either be an rdkit
@@ -1021,6 +1065,165 @@ class Joback(object):
         except:
             return None
 
+    @staticmethod
+    def fragment_many(mols, processes=1):
+        r'''Fragments many molecules into Joback groups, and counts their
+        atoms and calculates their molecular weights as the class does for a
+        single molecule. The SMARTS patterns are compiled only once per
+        process.
+
+        Parameters
+        ----------
+        mols : list[rdkitmol or smiles str]
+            Input molecules, [-]
+        processes : int, optional
+            Number of worker processes; 1 fragments every molecule in this
+            process, and None uses one process per CPU, [-]
+
+        Returns
+        -------
+        counts : list[dict]
+            Dictionaries of the Joback groups of each molecule and their
+            counts, [-]
+        atom_counts : list[int]
+            Total number of atoms (including hydrogens) in each molecule;
+            None if the molecule could not be constructed, [-]
+        MWs : list[float]
+            Molecular weights, None if the molecule could not be
+            constructed, [g/mol]
+        statuses : list[str]
+            'OK' for molecules which were fully and uniquely fragmented, or
+            an explanation of why the fragmentation failed, [-]
+
+        Examples
+        --------
+        >>> counts, atom_counts, MWs, statuses = Joback.fragment_many(['CC(=O)C', 'CCO']) # doctest:+SKIP
+        >>> counts # doctest:+SKIP
+        [{1: 2, 24: 1}, {1: 1, 2: 1, 20: 1}]
+        '''
+        if processes == 1:
+            results = [_Joback_fragment_job(mol) for mol in mols]
+        else:
+            from multiprocessing import Pool, cpu_count
+            if processes is None:
+                processes = cpu_count()
+            pool = Pool(processes)
+            try:
+                results = pool.map(_Joback_fragment_job, mols,
+                                   max(1, len(mols)//(4*processes)))
+                pool.close()
+                pool.join()
+            finally:
+                pool.terminate()
+        counts = [r[0] for r in results]
+        atom_counts = [r[1] for r in results]
+        MWs = [r[2] for r in results]
+        statuses = [r[4] for r in results]
+        return counts, atom_counts, MWs, statuses
+
+    @staticmethod
+    def group_count_matrix(counts):
+        r'''Converts the group counts of many molecules into a matrix, with one
+        row per molecule and one column per Joback group (group 1 in the first
+        column).
+
+        Parameters
+        ----------
+        counts : list[dict]
+            Dictionaries of the Joback groups of each molecule (numerically
+            indexed) and their counts, [-]
+
+        Returns
+        -------
+        count_matrix : ndarray
+            Group counts, [-]
+
+        Examples
+        --------
+        >>> Joback.group_count_matrix([{1: 2, 24: 1}])[0, [0, 23]]
+        array([2., 1.])
+        '''
+        N_groups = len(joback_groups_id_dict)
+        count_matrix = np.zeros((len(counts), N_groups))
+        for i, c in enumerate(counts):
+            for group, count in c.items():
+                if not 0 < group <= N_groups:
+                    raise ValueError("Unknown Joback group %s" %(group,))
+                count_matrix[i, group-1] = count
+        return count_matrix
+
+    @staticmethod
+    def estimate_many(counts, atom_counts=None, Tbs=None):
+        r'''Estimates all of the Joback properties of many molecules at once,
+        from their group counts. Each property is the matrix product of the
+        group counts and that property's contributions.
+
+        Parameters
+        ----------
+        counts : list[dict] or ndarray
+            Dictionaries of the Joback groups of each molecule (numerically
+            indexed) and their counts, or a matrix of them as returned by
+            :obj:`group_count_matrix`, [-]
+        atom_counts : list[int], optional
+            Total number of atoms (including hydrogens) in each molecule;
+            needed to estimate `Pc`, [-]
+        Tbs : list[float], optional
+            Experimental normal boiling temperatures, used to estimate `Tc`
+            instead of the estimated ones, [K]
+
+        Returns
+        -------
+        estimates : dict[str, ndarray]
+            Arrays of `Tb`, `Tm`, `Tc`, `Pc`, `Vc`, `Hf`, `Gf`, `Hfus` and
+            `Hvap` with one value per molecule, and `Cpig_coeffs` and
+            `mul_coeffs` with one row of coefficients per molecule, in the
+            units of the single molecule methods, [various]
+
+        Notes
+        -----
+        Where a molecule has a group with no contribution to a property, that
+        property is NaN instead of None. `Pc` is NaN for every molecule if
+        `atom_counts` is not given.
+
+        Examples
+        --------
+        >>> estimates = Joback.estimate_many([{1: 2, 24: 1}, {1: 1, 2: 1, 20: 1}], atom_counts=[10, 9])
+        >>> estimates['Tb']
+        array([322.11, 337.54])
+        >>> estimates['Cpig_coeffs'][0]
+        array([ 7.520e+00,  2.6084e-01, -1.207e-04,  1.546e-08])
+        '''
+        if isinstance(counts, np.ndarray):
+            count_matrix = counts
+        else:
+            count_matrix = Joback.group_count_matrix(counts)
+        sums = count_matrix.dot(joback_contributions)
+        missing = count_matrix.dot(joback_contributions_missing) != 0.0
+        sums[missing] = np.nan
+        idx = joback_contribution_indexes
+
+        Tb = 198.2 + sums[:, idx['Tb']]
+        Tb_Tc = Tb if Tbs is None else np.array(Tbs, dtype=float)
+        tot = sums[:, idx['Tc']]
+        Tc = Tb_Tc/(0.584 + 0.965*tot - tot*tot)
+        if atom_counts is not None:
+            Pc = (0.113 + 0.0032*np.array(atom_counts, dtype=float) - sums[:, idx['Pc']])**-2*1E5
+        else:
+            Pc = np.full(count_matrix.shape[0], np.nan)
+        Cpig_coeffs = sums[:, idx['Cpa']:idx['Cpd']+1] + np.array([-37.93, 0.210, -3.91E-4, 2.06E-7])
+        mul_coeffs = sums[:, idx['mua']:idx['mub']+1] - np.array([597.82, 11.202])
+        return {'Tb': Tb,
+                'Tm': 122.5 + sums[:, idx['Tm']],
+                'Tc': Tc,
+                'Pc': Pc,
+                'Vc': (17.5 + sums[:, idx['Vc']])*1E-6,
+                'Hf': (68.29 + sums[:, idx['Hform']])*1000,
+                'Gf': (53.88 + sums[:, idx['Gform']])*1000,
+                'Hfus': (-0.88 + sums[:, idx['Hfus']])*1000,
+                'Hvap': (15.3 + sums[:, idx['Hvap']])*1000,
+                'mul_coeffs': mul_coeffs,
+                'Cpig_coeffs': Cpig_coeffs}
+
     def Cpig(self, T):
         r'''Computes ideal-gas heat capacity at a specified temperature
         of an organic compound using the Joback method as a function of
@@ -446,6 +446,58 @@ def nrtl_d2GE_dTdxs(N, T, xs, taus, dtaus_dT, Gs, dGs_dT, xj_Gs_taus_jis,
         d2GE_dTdxs[i] = -R*(T*tot1 - others)
     return d2GE_dTdxs
 
+def nrtl_gammas_many(xs_matrix, N, Gs, taus, gammas_many=None):
+    M = len(xs_matrix)
+    if gammas_many is None:
+        gammas_many = [[0.0]*N for _ in range(M)] # numba: delete
+#        gammas_many = zeros((M, N)) # numba: uncomment
+
+    xj_Gs_jis = [0.0]*N
+    xj_Gs_taus_jis = [0.0]*N
+    xj_Gs_jis_inv = [0.0]*N
+    vec0 = [0.0]*N
+    vec1 = [0.0]*N
+    for m in range(M):
+        xs = xs_matrix[m]
+        nrtl_xj_Gs_jis_and_Gs_taus_jis(N, xs, Gs, taus, xj_Gs_jis, xj_Gs_taus_jis)
+        for i in range(N):
+            xj_Gs_jis_inv[i] = 1.0/xj_Gs_jis[i]
+        nrtl_gammas(xs, N, Gs, taus, xj_Gs_jis_inv, xj_Gs_taus_jis, gammas_many[m], vec0, vec1)
+    return gammas_many
+
+def nrtl_GE_many(xs_matrix, N, T, Gs, taus, GE_many=None):
+    M = len(xs_matrix)
+    if GE_many is None:
+        GE_many = [0.0]*M
+
+    xj_Gs_jis = [0.0]*N
+    xj_Gs_taus_jis = [0.0]*N
+    xj_Gs_jis_inv = [0.0]*N
+    for m in range(M):
+        xs = xs_matrix[m]
+        nrtl_xj_Gs_jis_and_Gs_taus_jis(N, xs, Gs, taus, xj_Gs_jis, xj_Gs_taus_jis)
+        for i in range(N):
+            xj_Gs_jis_inv[i] = 1.0/xj_Gs_jis[i]
+        GE_many[m] = nrtl_GE(N, T, xs, xj_Gs_taus_jis, xj_Gs_jis_inv)
+    return GE_many
+
+def nrtl_dGE_dxs_many(xs_matrix, N, T, Gs, taus, dGE_dxs_many=None):
+    M = len(xs_matrix)
+    if dGE_dxs_many is None:
+        dGE_dxs_many = [[0.0]*N for _ in range(M)] # numba: delete
+#        dGE_dxs_many = zeros((M, N)) # numba: uncomment
+
+    xj_Gs_jis = [0.0]*N
+    xj_Gs_taus_jis = [0.0]*N
+    xj_Gs_jis_inv = [0.0]*N
+    for m in range(M):
+        xs = xs_matrix[m]
+        nrtl_xj_Gs_jis_and_Gs_taus_jis(N, xs, Gs, taus, xj_Gs_jis, xj_Gs_taus_jis)
+        for i in range(N):
+            xj_Gs_jis_inv[i] = 1.0/xj_Gs_jis[i]
+        nrtl_dGE_dxs(N, T, xs, taus, Gs, xj_Gs_taus_jis, xj_Gs_jis_inv, dGE_dxs_many[m])
+    return dGE_dxs_many
+
 class NRTL(GibbsExcess):
     r'''Class for representing an a liquid with excess gibbs energy represented
     by the NRTL equation. This model is capable of representing VL and LL
@@ -805,6 +857,24 @@ class NRTL(GibbsExcess):
         self._gammas = nrtl_gammas(xs, N, Gs, taus, xj_Gs_jis_inv, xj_Gs_taus_jis, gammas)
         return gammas
 
+    def gammas_many(self, T, xs_matrix):
+        # `taus` and `Gs` depend on temperature only and are shared by
+        # every composition
+        model = self._model_at_T(T)
+        return nrtl_gammas_many(xs_matrix, self.N, model.Gs(), model.taus(),
+                                self._zeros_many(len(xs_matrix)))
+
+    def GE_many(self, T, xs_matrix):
+        model = self._model_at_T(T)
+        M = len(xs_matrix)
+        GE_many = [0.0]*M if self.scalar else zeros(M)
+        return nrtl_GE_many(xs_matrix, self.N, T, model.Gs(), model.taus(), GE_many)
+
+    def dGE_dxs_many(self, T, xs_matrix):
+        model = self._model_at_T(T)
+        return nrtl_dGE_dxs_many(xs_matrix, self.N, T, model.Gs(), model.taus(),
+                                 self._zeros_many(len(xs_matrix)))
+
 
     def taus(self):
         r'''Calculate and return the `tau` terms for the NRTL model for a
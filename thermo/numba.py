@@ -55,7 +55,7 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
     __funcs.update(normal_fluids.numba.numbafied_fluids_functions.copy())
 
     blacklist = set(['identify_sort_phases', 'score_phases_S', 'score_phases_VL',
-                     'identity_phase_states', 'sort_phases',
+                     'identity_phase_states', 'sort_phases', 'phase_identification_plan',
                     'sequential_substitution_2P',
                     'sequential_substitution_NP',
                     'sequential_substitution_Mehra_2P',
@@ -93,6 +93,7 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                     'sequential_substitution_2P_sat',
                     'SS_VF_simultaneous',
                     'sequential_substitution_2P_HSGUAbeta',
+                    'sequential_substitution_2P_HSGUA_T',
                     'sequential_substitution_2P_double',
                     'stability_iteration_Michelsen',
                     'TPV_double_solve_1P',
@@ -127,6 +128,8 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                  'eos_mix_methods.a_alpha_quadratic_terms',
                  
                  'eos_mix_methods.a_alpha_and_derivatives_quadratic_terms',
+                 'eos_mix_methods.a_alpha_quadratic_terms_sparse',
+                 'eos_mix_methods.a_alpha_and_derivatives_quadratic_terms_sparse',
                  'eos_mix_methods.a_alpha_aijs_composition_independent',
                  'eos_mix_methods.a_alpha_and_derivatives_full',
 
@@ -182,12 +185,17 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                  'regular_solution.RegularSolution',
                  'regular_solution.regular_solution_gammas_binaries',
                  'regular_solution.regular_solution_gammas_binaries_jac',
+                 'regular_solution.regular_solution_gammas_many',
+                 'regular_solution.regular_solution_GE_many',
+                 'regular_solution.regular_solution_dGE_dxs_many',
 
                  'wilson.Wilson',
                  'wilson.wilson_xj_Lambda_ijs', 'wilson.wilson_d2GE_dTdxs',
                  'wilson.wilson_dGE_dxs', 'wilson.wilson_d2GE_dxixjs',
                  'wilson.wilson_d3GE_dxixjxks', 'wilson.wilson_gammas',
                  'wilson.wilson_gammas_binaries', 'wilson.wilson_gammas_binaries_jac',
+                 'wilson.wilson_gammas_many', 'wilson.wilson_GE_many',
+                 'wilson.wilson_dGE_dxs_many',
 
                  'uniquac.UNIQUAC',
                  'uniquac.uniquac_phis',
@@ -198,6 +206,9 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                  'uniquac.uniquac_dGE_dxs',
                  'uniquac.uniquac_d2GE_dTdxs',
                  'uniquac.UNIQUAC_gammas_binaries',
+                 'uniquac.uniquac_GE_many',
+                 'uniquac.uniquac_dGE_dxs_many',
+                 'uniquac.uniquac_gammas_many',
 
                  'nrtl.NRTL',
                  'nrtl.nrtl_gammas',
@@ -218,6 +229,9 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                  'nrtl.nrtl_d2GE_dTdxs',
                  'nrtl.NRTL_gammas_binaries',
                  'nrtl.NRTL_gammas_binaries_jac',
+                 'nrtl.nrtl_gammas_many',
+                 'nrtl.nrtl_GE_many',
+                 'nrtl.nrtl_dGE_dxs_many',
 
                 'unifac.unifac_psis',
                 'unifac.unifac_dpsis_dT',
@@ -267,6 +281,8 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                 'unifac.unifac_d3lngammas_c_dxixjxks',
                 'unifac.UNIFAC',
                 'unifac.unifac_gammas_at_T',
+                'unifac.unifac_gammas_many',
+                'unifac.unifac_GE_many',
 
                  'activity.gibbs_excess_gammas', 'activity.gibbs_excess_dHE_dxs',
                  'activity.gibbs_excess_dgammas_dns', 'activity.gibbs_excess_dgammas_dT',
@@ -51,6 +51,10 @@ Main Interface
 Secondary Interfaces
 --------------------
 .. autofunction:: identity_phase_states
+.. autofunction:: phase_identification_plan
+.. autoclass:: PhaseIdentificationPlan
+    :members: identify, sort, __call__
+.. autodata:: PHASE_IDENTIFICATION_PLAN_CACHE_SIZE
 .. autodata:: VL_ID_METHODS
 .. autodata:: S_ID_METHODS
 
@@ -85,6 +89,8 @@ __all__ = ['vapor_score_Tpc', 'vapor_score_Vpc',
            'S_ID_METHODS', 'VL_ID_METHODS',
 
            'sort_phases', 'identify_sort_phases',
+           'PhaseIdentificationPlan', 'phase_identification_plan',
+           'PHASE_IDENTIFICATION_PLAN_CACHE_SIZE',
 
            'WATER_FIRST', 'WATER_LAST', 'WATER_NOT_SPECIAL',
            'WATER_SORT_METHODS', 'KEY_COMPONENTS_SORT', 'PROP_SORT',
@@ -963,13 +969,346 @@ def sort_phases(liquids, solids, constants, settings):
                         liquids.insert(0, water)
     if len(solids) > 1:
         solids = mini_sort_phases(solids, sort_method=settings.solid_sort_method,
-                         prop=setings.solid_sort_prop,
+                         prop=settings.solid_sort_prop,
                          cmps=settings.solid_sort_cmps,
                          cmps_neg=settings.solid_sort_cmps_neg,
                          reverse=settings.phase_sort_higher_first, constants=constants)
     return liquids, solids
 
 
+PHASE_IDENTIFICATION_PLAN_CACHE_SIZE = 64
+'''Number of :obj:`PhaseIdentificationPlan` objects kept by
+:obj:`phase_identification_plan`; set to 0 to disable the cache.
+'''
+_phase_identification_plans = {}
+
+class PhaseIdentificationPlan(object):
+    r'''Phase identification and sorting procedure prepared once for a set of
+    constants and settings, and then applied to the results of many flashes.
+
+    The component arrays needed by the selected vapor-liquid scoring method
+    and by the liquid sorting method are looked up once, and the scoring
+    function is selected once. Phases are tracked by index while being
+    identified, so the phase fractions are reordered without searching for
+    each phase, and a system of one gas and one liquid is returned without
+    sorting. The results are identical to those of :obj:`identity_phase_states`
+    followed by :obj:`sort_phases`.
+
+    Parameters
+    ----------
+    constants : :obj:`ChemicalConstantsPackage <thermo.chemical_package.ChemicalConstantsPackage>`
+        Constants used in the identification, [-]
+    settings : :obj:`BulkSettings <thermo.bulk.BulkSettings>`
+        Settings object controlling the phase ID and sorting, [-]
+    skip_solids : bool
+        Set this to True if no phases are provided which can represent a solid phase, [-]
+
+    Notes
+    -----
+    The plan copies the values of the settings when it is created; use
+    :obj:`phase_identification_plan` to obtain a plan which matches the
+    current values of the settings.
+    '''
+    def __init__(self, constants, settings, skip_solids=False):
+        self.constants = constants
+        self.skip_solids = skip_solids
+        self.VL_method = VL_method = settings.VL_ID
+        self.S_method = S_method = settings.S_ID
+
+        if VL_method == VL_ID_TPC:
+            self.Tcs = constants.Tcs
+            self.VL_score = self._VL_score_Tpc
+        elif VL_method == VL_ID_VPC:
+            self.Vcs = constants.Vcs
+            self.VL_score = self._VL_score_Vpc
+        elif VL_method == VL_ID_TPC_VC_WEIGHTED:
+            self.Tcs, self.Vcs = constants.Tcs, constants.Vcs
+            self.VL_score = self._VL_score_Tpc_weighted
+        elif VL_method == VL_ID_TPC_VPC:
+            self.Tcs, self.Vcs = constants.Tcs, constants.Vcs
+            self.VL_score = self._VL_score_Tpc_Vpc
+        elif VL_method == VL_ID_WILSON:
+            self.Tcs, self.Pcs, self.omegas = constants.Tcs, constants.Pcs, constants.omegas
+            self.VL_score = self._VL_score_Wilson
+        elif VL_method == VL_ID_POLING:
+            self.VL_score = self._VL_score_Poling
+        elif VL_method == VL_ID_PIP:
+            self.VL_score = self._VL_score_PIP
+        elif VL_method == VL_ID_BS:
+            self.VL_score = self._VL_score_Bennett_Schmidt
+        elif VL_method == VL_ID_TRACES:
+            self.Tcs, self.CASs = constants.Tcs, constants.CASs
+            self.VL_score = self._VL_score_traces
+        else:
+            raise ValueError("Unrecognized vapor-liquid phase identification method %s" %(VL_method,))
+        if not skip_solids and S_method not in S_ID_METHODS:
+            raise ValueError("Unrecognized solid phase identification method %s" %(S_method,))
+
+        self.liquid_sort_method = settings.liquid_sort_method
+        self.liquid_sort_prop = settings.liquid_sort_prop
+        self.liquid_sort_cmps = settings.liquid_sort_cmps
+        self.liquid_sort_cmps_neg = settings.liquid_sort_cmps_neg
+        self.solid_sort_method = settings.solid_sort_method
+        self.solid_sort_prop = settings.solid_sort_prop
+        self.solid_sort_cmps = settings.solid_sort_cmps
+        self.solid_sort_cmps_neg = settings.solid_sort_cmps_neg
+        self.phase_sort_higher_first = settings.phase_sort_higher_first
+        self.water_sort = water_sort = settings.water_sort
+        self.water_index = constants.water_index if water_sort != WATER_NOT_SPECIAL else None
+        if DENSITY_MASS in (self.liquid_sort_prop, self.solid_sort_prop):
+            self.MWs = constants.MWs
+            self.cmps = constants.cmps
+
+    def _VL_score_Tpc(self, phase, T, Ks_cache):
+        return vapor_score_Tpc(T, self.Tcs, phase.zs)
+
+    def _VL_score_Vpc(self, phase, T, Ks_cache):
+        return vapor_score_Vpc(phase.V(), self.Vcs, phase.zs)
+
+    def _VL_score_Tpc_weighted(self, phase, T, Ks_cache):
+        return vapor_score_Tpc_weighted(T, self.Tcs, self.Vcs, phase.zs)
+
+    def _VL_score_Tpc_Vpc(self, phase, T, Ks_cache):
+        return vapor_score_Tpc_Vpc(T, phase.V(), self.Tcs, self.Vcs, phase.zs)
+
+    def _VL_score_Wilson(self, phase, T, Ks_cache):
+        # Same result as `vapor_score_Wilson`; the phases of a flash share
+        # T and P, so the K values are only computed once for all of them.
+        # `Ks_cache` belongs to one call of `identify`, as the plan itself is
+        # shared
+        P = phase.P
+        try:
+            Ks = Ks_cache[(T, P)]
+        except KeyError:
+            Tcs, Pcs, omegas = self.Tcs, self.Pcs, self.omegas
+            Ks = Ks_cache[(T, P)] = [Wilson_K_value(T, P, Tcs[i], Pcs[i], omegas[i]) for i in range(len(Tcs))]
+        if len(Ks) == 1:
+            return P - Ks[0]*P
+        return Rachford_Rice_flash_error(V_over_F=0.5, zs=phase.zs, Ks=Ks)
+
+    def _VL_score_Poling(self, phase, T, Ks_cache):
+        return vapor_score_Poling(phase.kappa())
+
+    def _VL_score_PIP(self, phase, T, Ks_cache):
+        return -(phase.PIP() - 1.00000000000001)
+
+    def _VL_score_Bennett_Schmidt(self, phase, T, Ks_cache):
+        return vapor_score_Bennett_Schmidt(phase.disobaric_expansion_dT())
+
+    def _VL_score_traces(self, phase, T, Ks_cache):
+        return vapor_score_traces(phase.zs, self.CASs, Tcs=self.Tcs)
+
+    def identify(self, phases):
+        r'''Identify the given phases as gas, liquid, or solid.
+
+        Parameters
+        ----------
+        phases : list[:obj:`Phase <thermo.phases.Phase>`]
+            Phases to be identified, [-]
+
+        Returns
+        -------
+        gas : int or None
+            Index of the gas phase, if one was identified, [-]
+        liquids : list[int]
+            Indexes of the phases identified as liquids, [-]
+        solids : list[int]
+            Indexes of the phases identified as solids, [-]
+        '''
+        skip_solids = self.skip_solids
+        VL_score = self.VL_score
+        T = phases[0].T
+        solids = []
+        liquids = []
+        possible_gases = []
+        possible_gas_scores = []
+        Ks_cache = {}
+        for i, p in enumerate(phases):
+            force_phase = p.force_phase
+            if force_phase is not None:
+                # Phases with a forced phase are not scored
+                if force_phase == 'l':
+                    liquids.append(i)
+                elif force_phase == 's':
+                    solids.append(i)
+                elif force_phase == 'g':
+                    possible_gases.append(i)
+            elif not skip_solids and p.d2P_dVdT() >= 0.0:
+                solids.append(i)
+            else:
+                score = VL_score(p, T, Ks_cache)
+                if score >= 0.0:
+                    possible_gases.append(i)
+                    possible_gas_scores.append(score)
+                else:
+                    liquids.append(i)
+
+        possible_gas_count = len(possible_gases)
+        if possible_gas_count > 1:
+            gas = possible_gases[possible_gas_scores.index(max(possible_gas_scores))]
+            for i in possible_gases:
+                if i != gas:
+                    liquids.append(i)
+        elif possible_gas_count == 1:
+            gas = possible_gases[0]
+        else:
+            gas = None
+        return gas, liquids, solids
+
+    def sort(self, phases, idxs, sort_method, prop, cmps, cmps_neg):
+        r'''Sort the indexes of liquid or solid phases according to the
+        configured sorting method; this is the index-based equivalent of
+        :obj:`sort_phases`.
+
+        Parameters
+        ----------
+        phases : list[:obj:`Phase <thermo.phases.Phase>`]
+            All phases from the flash, [-]
+        idxs : list[int]
+            Indexes of the phases to be sorted, [-]
+        sort_method : str
+            One of :obj:`LIQUID_SORT_METHODS`, [-]
+        prop : str
+            Property used when sorting by property, [-]
+        cmps : list[int]
+            Key components used when sorting by key components, [-]
+        cmps_neg : list[int]
+            Negative key components used when sorting by key components, [-]
+
+        Returns
+        -------
+        idxs : list[int]
+            Sorted indexes of the phases, [-]
+        '''
+        reverse = self.phase_sort_higher_first
+        if sort_method == PROP_SORT:
+            if prop == DENSITY_MASS:
+                MWs, cmps = self.MWs, self.cmps
+                keys = []
+                for i in idxs:
+                    p = phases[i]
+                    zs = p.zs
+                    MW = 0.0
+                    for j in cmps:
+                        MW += zs[j]*MWs[j]
+                    keys.append(Vm_to_rho(p.V(), MW))
+            elif prop == DENSITY:
+                keys = [phases[i].rho() for i in idxs]
+            elif prop == ISOTHERMAL_COMPRESSIBILITY:
+                keys = [phases[i].isobaric_expansion() for i in idxs]
+            elif prop == HEAT_CAPACITY:
+                keys = [phases[i].Cp() for i in idxs]
+            idxs = [i for _, i in sorted(zip(keys, idxs))]
+            if reverse:
+                idxs.reverse()
+        elif sort_method == KEY_COMPONENTS_SORT:
+            sorted_phases = key_cmp_sort([phases[i] for i in idxs], cmps, cmps_neg)
+            if not reverse:
+                sorted_phases.reverse()
+            idxs = [next(i for i in idxs if phases[i] is p) for p in sorted_phases]
+        return idxs
+
+    def __call__(self, phases, betas):
+        r'''Identify and sort the given phases, and reorder their phase
+        fractions to match.
+
+        Parameters
+        ----------
+        phases : list[:obj:`Phase <thermo.phases.Phase>`]
+            Phases to be identified and sorted, [-]
+        betas : list[float] or None
+            Phase molar fractions, [-]
+
+        Returns
+        -------
+        gas : :obj:`Phase <thermo.phases.Phase>`
+            Gas phase, if one was identified, [-]
+        liquids : list[:obj:`Phase <thermo.phases.Phase>`]
+            Liquids that were identified and sorted, [-]
+        solids : list[:obj:`Phase <thermo.phases.Phase>`]
+            Solids that were identified and sorted, [-]
+        betas : list[float] or None
+            Sorted phase molar fractions, in order (gas, liquids..., solids...);
+            None if `betas` was None [-]
+        '''
+        gas, liquids, solids = self.identify(phases)
+        gas_phase = phases[gas] if gas is not None else None
+        if betas is not None and len(betas) == 1:
+            return (gas_phase, [phases[i] for i in liquids],
+                    [phases[i] for i in solids], betas)
+        if gas is not None and len(liquids) == 1 and not solids:
+            # One gas and one liquid - nothing to sort
+            liquid = liquids[0]
+            if betas is not None:
+                betas = [betas[gas], betas[liquid]]
+            return gas_phase, [phases[liquid]], [], betas
+
+        if len(liquids) > 1:
+            liquids = self.sort(phases, liquids, self.liquid_sort_method,
+                                self.liquid_sort_prop, self.liquid_sort_cmps,
+                                self.liquid_sort_cmps_neg)
+            water_index = self.water_index
+            if water_index is not None:
+                water_zs = [phases[i].zs[water_index] for i in liquids]
+                water_max_zs = max(water_zs)
+                if water_max_zs > 1e-4:
+                    water = liquids.pop(water_zs.index(water_max_zs))
+                    if self.water_sort == WATER_LAST:
+                        liquids.append(water)
+                    elif self.water_sort == WATER_FIRST:
+                        liquids.insert(0, water)
+        if len(solids) > 1:
+            solids = self.sort(phases, solids, self.solid_sort_method,
+                               self.solid_sort_prop, self.solid_sort_cmps,
+                               self.solid_sort_cmps_neg)
+
+        if betas is not None:
+            order = liquids + solids
+            if gas is not None:
+                order.insert(0, gas)
+            betas = [betas[i] for i in order]
+        return (gas_phase, [phases[i] for i in liquids],
+                [phases[i] for i in solids], betas)
+
+
+def phase_identification_plan(constants, settings, skip_solids=False):
+    r'''Return a :obj:`PhaseIdentificationPlan` for the given constants and
+    settings, reusing a previously created plan when the constants and the
+    phase identification and sorting settings are unchanged. Up to
+    :obj:`PHASE_IDENTIFICATION_PLAN_CACHE_SIZE` plans are kept.
+
+    Parameters
+    ----------
+    constants : :obj:`ChemicalConstantsPackage <thermo.chemical_package.ChemicalConstantsPackage>`
+        Constants used in the identification, [-]
+    settings : :obj:`BulkSettings <thermo.bulk.BulkSettings>`
+        Settings object controlling the phase ID and sorting, [-]
+    skip_solids : bool
+        Set this to True if no phases are provided which can represent a solid phase, [-]
+
+    Returns
+    -------
+    plan : :obj:`PhaseIdentificationPlan`
+        Phase identification plan, [-]
+    '''
+    key = (hash(constants), skip_solids, settings.VL_ID, settings.S_ID,
+           settings.liquid_sort_method, settings.liquid_sort_prop,
+           tuple(settings.liquid_sort_cmps), tuple(settings.liquid_sort_cmps_neg),
+           settings.solid_sort_method, settings.solid_sort_prop,
+           tuple(settings.solid_sort_cmps), tuple(settings.solid_sort_cmps_neg),
+           settings.phase_sort_higher_first, settings.water_sort)
+    try:
+        return _phase_identification_plans[key]
+    except KeyError:
+        pass
+    plan = PhaseIdentificationPlan(constants, settings, skip_solids=skip_solids)
+    if PHASE_IDENTIFICATION_PLAN_CACHE_SIZE:
+        if len(_phase_identification_plans) >= PHASE_IDENTIFICATION_PLAN_CACHE_SIZE:
+            del _phase_identification_plans[next(iter(_phase_identification_plans))]
+        _phase_identification_plans[key] = plan
+    return plan
+
+
 def identify_sort_phases(phases, betas, constants, correlations, settings,
                          skip_solids=False):
     r'''Identify and sort all phases given the provided parameters.
@@ -978,7 +1317,7 @@ def identify_sort_phases(phases, betas, constants, correlations, settings,
     ----------
     phases : list[:obj:`Phase <thermo.phases.Phase>`]
         Phases to be identified and sorted, [-]
-    betas : list[float]
+    betas : list[float] or None
         Phase molar fractions, [-]
     constants : :obj:`ChemicalConstantsPackage <thermo.chemical_package.ChemicalConstantsPackage>`
         Constants used in the identification, [-]
@@ -997,8 +1336,9 @@ def identify_sort_phases(phases, betas, constants, correlations, settings,
         Liquids that were identified and sorted, [-]
     solids : list[:obj:`Phase <thermo.phases.Phase>`]
         Solids that were identified and sorted, [-]
-    betas : list[float]
-        Sorted phase molar fractions, in order (gas, liquids..., solids...) [-]
+    betas : list[float] or None
+        Sorted phase molar fractions, in order (gas, liquids..., solids...);
+        None if `betas` was None [-]
 
     Notes
     -----
@@ -1008,6 +1348,9 @@ def identify_sort_phases(phases, betas, constants, correlations, settings,
     Thermodynamics doesn't care about gases, liquids, or solids;
     it just cares about minimizing Gibbs energy!
 
+    The work is done by a :obj:`PhaseIdentificationPlan`, which is cached
+    by :obj:`phase_identification_plan` for the given constants and settings.
+
     Examples
     --------
     A butanol-water-ethanol flash yields three phases. For brevity we skip
@@ -1032,36 +1375,5 @@ def identify_sort_phases(phases, betas, constants, correlations, settings,
     >>> res[0] is gas, res[1][0] is liq0, res[1][1] is liq1, res[2]
     (True, True, True, [])
     '''
-    gas, liquids, solids = identity_phase_states(phases, constants, correlations,
-                              VL_method=settings.VL_ID,
-                              S_method=settings.S_ID,
-                              VL_ID_settings=settings.VL_ID_settings,
-                              S_ID_settings=settings.S_ID_settings,
-                              skip_solids=skip_solids)
-    if len(betas) == 1:
-        return gas, liquids, solids, betas
-    if liquids or solids:
-        liquids, solids = sort_phases(liquids, solids, constants, settings)
-    if betas is not None:
-        # Probably worth adding a fast path here which avoids index
-        new_betas = []
-        if gas is not None:
-            # Cannot use .index on the betas lsit as the objects define __hash__.
-            for i, p in enumerate(phases):
-                if p is gas:
-                    new_betas.append(betas[i])
-                    break
-        for liquid in liquids:
-            for i, p in enumerate(phases):
-                if p is liquid:
-                    new_betas.append(betas[i])
-                    break
-        for solid in solids:
-            for i, p in enumerate(phases):
-                if p is solid:
-                    new_betas.append(betas[i])
-                    break
-        betas = new_betas
-    return gas, liquids, solids, betas
-
-
+    plan = phase_identification_plan(constants, settings, skip_solids=skip_solids)
+    return plan(phases, betas)
@@ -106,6 +106,27 @@ respectively.
    :show-inheritance:
    :members: force_phase
 
+`IAPWS95TableGas` and `IAPWS95TableLiquid` take their densities, enthalpies
+and entropies from an `IAPWS95SplineTable` of bicubic splines instead of
+solving IAPWS-95; a `FlashPureVLS` made of them also answers P-H and P-S
+flashes from the table.
+
+.. autoclass:: IAPWS95Table
+   :show-inheritance:
+   :members: table, from_table
+
+.. autoclass:: IAPWS95TableGas
+   :show-inheritance:
+
+.. autoclass:: IAPWS95TableLiquid
+   :show-inheritance:
+
+.. autoclass:: IAPWS95SplineTable
+   :show-inheritance:
+   :members: TP, PH, PS, Tsat, build_data
+
+.. autofunction:: iapws95_spline_table
+
 
 `DryAirLemmon` is an implementation of thermophysical properties of air by
 Lemmon (2000).
@@ -192,6 +213,7 @@ gas_phases = (
     CEOSGas, 
     CoolPropGas, 
     IAPWS95Gas, 
+    IAPWS95TableGas, 
     VirialGas, 
     HumidAirRP1485, 
     DryAirLemmon
@@ -200,13 +222,15 @@ liquid_phases = (
     CEOSLiquid, 
     GibbsExcessLiquid, 
     CoolPropLiquid, 
-    IAPWS95Liquid
+    IAPWS95Liquid, 
+    IAPWS95TableLiquid
 )
 solid_phases = (
     GibbsExcessSolid,
 )
 many_phases = (
     IAPWS95,
+    IAPWS95Table,
     IAPWS97,
     CoolPropPhase,
 )
@@ -21,16 +21,52 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 
 '''
-__all__ = ['DryAirLemmon', 'HumidAirRP1485']
+__all__ = ['DryAirLemmon', 'HumidAirRP1485', 'humid_air_virial_V', 'HumidAirPsychrometrics',
+           'humid_air_psychrometrics']
 
-from chemicals import air
-from chemicals.virial import Z_from_virial_density_form
+from math import ceil, log, nan
+from fluids.numerics import numpy as np
+from chemicals import air, iapws
+from chemicals.utils import rho_to_Vm
 from chemicals.viscosity import mu_air_lemmon
 from chemicals.thermal_conductivity import k_air_lemmon
-from .helmholtz_eos import HelmholtzEOS
+from .helmholtz_eos import HelmholtzEOS, helmholtz_Ar_derivatives
 from .virial_phase import VirialGas
 from .iapws_phase import IAPWS95
 
+# Coefficients of the residual part of the Lemmon (2000) equation of state
+# for air
+lemmon2000_air_Ar_ns = (0.118160747229, 0.713116392079, -1.61824192067, 0.0714140178971, -0.0865421396646,
+                        0.134211176704, 0.0112626704218, -0.0420533228842, 0.0349008431982, 0.000164957183186,
+                        -0.101365037912, -0.17381369097, -0.0472103183731, -0.0122523554253, -0.146629609713,
+                        -0.0316055879821, 0.000233594806142, 0.0148287891978, -0.00938782884667)
+lemmon2000_air_Ar_ds = (1, 1, 1, 2, 3, 3, 4, 4, 4, 6, 1, 3, 5, 6, 1, 3, 11, 1, 3)
+lemmon2000_air_Ar_ts = (0.0, 0.33, 1.01, 0.0, 0.0, 0.15, 0.0, 0.2, 0.35, 1.35, 1.6, 0.8, 0.95, 1.25, 3.6, 6.0,
+                        3.25, 3.5, 15.0)
+lemmon2000_air_Ar_cs = (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 3, 3)
+
+def lemmon2000_air_Ar_derivatives(tau, delta):
+    r'''Calculates the residual Helmholtz energy of the Lemmon (2000) air
+    equation of state and its first and second derivatives with respect to
+    `tau` and `delta` together, in the order of
+    :obj:`thermo.phases.helmholtz_eos.helmholtz_Ar_derivatives`.
+
+    Parameters
+    ----------
+    tau : float
+        Dimensionless temperature, (132.6312 K/T), [-]
+    delta : float
+        Dimensionless density, (rho/(10447.7 mol/m^3)), [-]
+
+    Returns
+    -------
+    derivatives : tuple[float]
+        `Ar`, `dAr_ddelta`, `d2Ar_ddelta2`, `dAr_dtau`, `d2Ar_dtau2` and
+        `d2Ar_ddeltadtau`, [-]
+    '''
+    return helmholtz_Ar_derivatives(tau, delta, lemmon2000_air_Ar_ns, lemmon2000_air_Ar_ds,
+                                    lemmon2000_air_Ar_ts, lemmon2000_air_Ar_cs)
+
 class DryAirLemmon(HelmholtzEOS):
     model_name = 'lemmon2000'
     is_gas = True
@@ -52,6 +88,7 @@ class DryAirLemmon(HelmholtzEOS):
     T_fixed_transport = 265.262
 
     _Ar_func = staticmethod(air.lemmon2000_air_Ar)
+    _Ar_derivatives_func = staticmethod(lemmon2000_air_Ar_derivatives)
 
     _d3Ar_ddeltadtau2_func = staticmethod(air.lemmon2000_air_d3Ar_ddeltadtau2)
     _d3Ar_ddelta2dtau_func = staticmethod(air.lemmon2000_air_d3Ar_ddelta2dtau)
@@ -71,7 +108,7 @@ class DryAirLemmon(HelmholtzEOS):
     _d4Ar_ddelta3dtau_func = staticmethod(air.lemmon2000_air_d4Ar_ddelta3dtau)
     _d4Ar_ddeltadtau3_func = staticmethod(air.lemmon2000_air_d4Ar_ddeltadtau3)
 
-    def __init__(self, T=None, P=None, zs=None):
+    def _set_TP_state(self, T, P):
         self.T = T
         self.P = P
         self._rho = rho = air.lemmon2000_rho(T, P)
@@ -83,29 +120,21 @@ class DryAirLemmon(HelmholtzEOS):
         self.d2A0_dtau2 = air.lemmon2000_air_d2A0_dtau2(tau, delta)
         self.d3A0_dtau3 = air.lemmon2000_air_d3A0_dtau3(tau, delta)
 
+    def __init__(self, T=None, P=None, zs=None):
+        self._set_TP_state(T, P)
+
     def to_TP_zs(self, T, P, zs):
         new = self.__class__.__new__(self.__class__)
         new.zs = zs
-        new.T = T
-        new.P = P
-        new._rho = rho = air.lemmon2000_rho(T, P)
-        new._V = 1.0/rho
-        new.tau = tau = new.T_red/T
-        new.delta = delta = rho*new.rho_red_inv
-        new.A0 = air.lemmon2000_air_A0(tau, delta)
-        new.dA0_dtau = air.lemmon2000_air_dA0_dtau(tau, delta)
-        new.d2A0_dtau2 = air.lemmon2000_air_d2A0_dtau2(tau, delta)
-        new.d3A0_dtau3 = air.lemmon2000_air_d3A0_dtau3(tau, delta)
+        new._set_TP_state(T, P)
         return new
 
     def to(self, zs, T=None, P=None, V=None):
         new = self.__class__.__new__(self.__class__)
         new.zs = zs
         if T is not None and P is not None:
-            new.T = T
-            new._rho = air.lemmon2000_rho(T, P)
-            new._V = 1.0/new._rho
-            new.P = P
+            new._set_TP_state(T, P)
+            return new
         elif T is not None and V is not None:
             new._rho = 1.0/V
             new._V = V
@@ -171,6 +200,47 @@ class DryAirLemmon(HelmholtzEOS):
 
 
 
+def humid_air_virial_V(T, P, B, C, R=VirialGas.R):
+    r'''Solve the virial equation of state in the density form,
+    :math:`PV/(RT) = 1 + B/V + C/V^2`, for the gas-like molar volume with
+    Newton's method, starting from the pressure series of the equation.
+    Unlike the closed-form cubic root, this does not pick a liquid-like root
+    when `C` is negative, as it is for humid air with a lot of water.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    B : float
+        Second virial coefficient, [m^3/mol]
+    C : float
+        Third virial coefficient, [m^6/mol^2]
+    R : float, optional
+        Gas constant, [J/mol/K]
+
+    Returns
+    -------
+    V : float
+        Molar volume, [m^3/mol]
+
+    Examples
+    --------
+    >>> humid_air_virial_V(330.0, 101325.0, -2.8934e-05, -9.69e-09)
+    0.0270496068
+    '''
+    RT = R*T
+    x = P/RT
+    V = (1.0 + x*(B + x*(C - B*B)))/x
+    for _ in range(100):
+        V2 = V*V
+        dV = (P*V2*V - RT*(V2 + B*V + C))/(3.0*P*V2 - RT*(2.0*V + B))
+        V = V - dV
+        if not abs(dV) > 1e-14*abs(V):
+            break
+    return V
+
 class HumidAirRP1485(VirialGas):
     is_gas = True
     is_liquid = False
@@ -200,8 +270,7 @@ class HumidAirRP1485(VirialGas):
         if T is not None and P is not None and zs is not None:
             self.air = DryAirLemmon(T=T, P=P)
             self.water = IAPWS95(T=T, P=P)
-            Z = Z_from_virial_density_form(T, P, self.B(), self.C())
-            self._V = Z*self.R*T/P
+            self._V = humid_air_virial_V(T, P, self.B(), self.C(), self.R)
             self._MW = DryAirLemmon._MW*psi_a + IAPWS95._MW*psi_w
 
     def B(self):
@@ -231,3 +300,663 @@ class HumidAirRP1485(VirialGas):
         self._C = C = (psi_a*psi_a*(Caaa + 3.0*psi_w*Caaw)
                        + psi_w*psi_w*(3.0*psi_a*Caww + psi_w*Cwww))
         return C
+
+    def dB_dT(self):
+        try:
+            return self._dB_dT
+        except:
+            pass
+        dBaa = self.air.dB_virial_dT()
+        dBaw = air.TEOS10_BAW_derivatives(self.T)[1]
+        dBww = self.water.dB_virial_dT()
+        psi_a, psi_w = self.psi_a, self.psi_w
+
+        self._dB_dT = dB_dT = psi_a*psi_a*dBaa + 2.0*psi_a*psi_w*dBaw + psi_w*psi_w*dBww
+        return dB_dT
+
+    def dC_dT(self):
+        try:
+            return self._dC_dT
+        except:
+            pass
+        T = self.T
+        dCaaa = self.air.dC_virial_dT()
+        dCwww = self.water.dC_virial_dT()
+        dCaww = air.TEOS10_CAWW_derivatives(T)[1]
+        dCaaw = air.TEOS10_CAAW_derivatives(T)[1]
+        psi_a, psi_w = self.psi_a, self.psi_w
+        self._dC_dT = dC_dT = (psi_a*psi_a*(dCaaa + 3.0*psi_w*dCaaw)
+                               + psi_w*psi_w*(3.0*psi_a*dCaww + psi_w*dCwww))
+        return dC_dT
+
+    def dB_dzs(self):
+        try:
+            return self._dB_dzs
+        except:
+            pass
+        Baa = self.air.B_virial()
+        Baw = air.TEOS10_BAW_derivatives(self.T)[0]
+        Bww = self.water.B_virial()
+        psi_a, psi_w = self.psi_a, self.psi_w
+        self._dB_dzs = dB_dzs = [2.0*(psi_a*Baa + psi_w*Baw), 2.0*(psi_a*Baw + psi_w*Bww)]
+        return dB_dzs
+
+    def dC_dzs(self):
+        try:
+            return self._dC_dzs
+        except:
+            pass
+        T = self.T
+        Caaa = self.air.C_virial()
+        Cwww = self.water.C_virial()
+        Caww = air.TEOS10_CAWW_derivatives(T)[0]
+        Caaw = air.TEOS10_CAAW_derivatives(T)[0]
+        psi_a, psi_w = self.psi_a, self.psi_w
+        self._dC_dzs = dC_dzs = [psi_a*(2.0*Caaa + 6.0*psi_w*Caaw) + 3.0*psi_w*psi_w*Caww,
+                                 3.0*psi_a*psi_a*Caaw + psi_w*(6.0*psi_a*Caww + 3.0*psi_w*Cwww)]
+        return dC_dzs
+
+    def H(self):
+        try:
+            return self._H
+        except:
+            pass
+        # Ideal gas parts are on the reference states of the air and water
+        # formulations, each with its own gas constant
+        T, dry, water = self.T, self.air, self.water
+        H_ideal = (self.psi_a*dry.R*T*(1.0 + dry.tau*dry.dA0_dtau)
+                   + self.psi_w*water.R*T*(1.0 + water.tau*water.dA0_dtau))
+        self._H = H = H_ideal + self.H_dep()
+        return H
+
+
+HUMID_AIR_T_MIN = 173.15
+'''Lowest temperature covered by :obj:`HumidAirPsychrometrics`, [K]'''
+HUMID_AIR_T_MAX = 623.15
+'''Highest temperature covered by :obj:`HumidAirPsychrometrics`, [K]'''
+HUMID_AIR_T_SEGMENT = 10.0
+HUMID_AIR_CHEBYSHEV_DEGREE = 12
+# Above this many distinct temperatures the interpolants are used, which agree
+# with the exact correlations to ~1E-13 relative rather than to round-off
+HUMID_AIR_EXACT_MAX_TS = 256
+
+WATER_T_TRIPLE = 273.16
+ICE_IH_V_TRIPLE = 1.9652e-05
+'''Molar volume of ice Ih at the triple point of water, [m^3/mol]'''
+
+def _broadcast_flat(*args):
+    arrays = np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in args])
+    return arrays[0].shape, [v.ravel() for v in arrays]
+
+
+class HumidAirPsychrometrics(object):
+    r'''Array-oriented psychrometric calculations for humid air, consistent
+    with :obj:`HumidAirRP1485`. Every property of the humid air phase depends
+    on temperature only through the pure and cross virial coefficients, the
+    ideal gas enthalpies of air and water, and the saturation properties of
+    condensed water; these are evaluated once per distinct temperature (see
+    :obj:`HumidAirPsychrometrics.T_properties`), and everything else is done
+    with numpy over whole arrays of states.
+
+    When an array has more than `exact_max_Ts` distinct temperatures, and in
+    the dew point and wet bulb solvers, the temperature-only quantities come
+    from piecewise Chebyshev interpolants built on first use. This is a
+    deliberate approximation: the interpolants agree with the exact
+    correlations to about 1E-13 relative (away from zeros of the quantities),
+    not to round-off, so results differ from :obj:`HumidAirRP1485` by that
+    much. Arrays with at most `exact_max_Ts` distinct temperatures are
+    evaluated with the exact correlations.
+
+    The saturation mole fraction of water includes the enhancement factor
+    from the virial mixture fugacity and the Poynting correction of the
+    condensed phase, which is liquid water above the triple point and ice Ih
+    (at a constant molar volume) below it; the solubility of air in the
+    condensed water is neglected. Wet bulb temperatures are calculated for a
+    liquid water film only.
+
+    Normally created with :obj:`humid_air_psychrometrics`, which keeps the
+    interpolants in memory.
+
+    Parameters
+    ----------
+    degree : int, optional
+        Degree of the Chebyshev interpolant in each temperature segment, [-]
+    segment : float, optional
+        Approximate width of each temperature segment, [K]
+    exact_max_Ts : int, optional
+        Largest number of distinct temperatures evaluated exactly rather than
+        with the interpolants, [-]
+
+    Examples
+    --------
+    >>> psy = humid_air_psychrometrics()
+    >>> psi_ws, fs = psy.saturation([293.15, 313.15], 101325.0)
+    >>> psi_ws, fs
+    (array([0.02318398, 0.07323679]), array([1.00418878, 1.00484492]))
+    >>> psy.humidity_ratio(0.5*psi_ws)
+    array([0.00729427, 0.02364075])
+    >>> psy.dew_point(101325.0, 0.5*psi_ws)
+    array([282.42488007, 300.74284481])
+    >>> psy.wet_bulb([293.15, 313.15], 101325.0, 0.5*psi_ws)
+    array([286.92643315, 303.45585093])
+    '''
+    T_min = HUMID_AIR_T_MIN
+    T_max = HUMID_AIR_T_MAX
+    R = VirialGas.R
+    MW_air = DryAirLemmon._MW
+    MW_water = IAPWS95._MW
+
+    T_properties_names = ('Baa', 'Baw', 'Bww', 'Caaa', 'Caaw', 'Caww', 'Cwww',
+                          'dBaa_dT', 'dBaw_dT', 'dBww_dT', 'dCaaa_dT', 'dCaaw_dT',
+                          'dCaww_dT', 'dCwww_dT', 'H_air', 'H_water', 'ln_Psat',
+                          'V_condensed', 'H_liquid')
+    _nan_values = (nan,)*len(T_properties_names)
+    # Quantities needed for the saturation state only
+    _saturation_rows = np.array([0, 1, 2, 3, 4, 5, 6, 16, 17])
+    # Arrays are worked on in pieces of this size to stay in the CPU cache
+    chunk_size = 16384
+
+    def __init__(self, degree=HUMID_AIR_CHEBYSHEV_DEGREE,
+                 segment=HUMID_AIR_T_SEGMENT, exact_max_Ts=HUMID_AIR_EXACT_MAX_TS):
+        self.degree = degree
+        self.exact_max_Ts = exact_max_Ts
+        # The triple point is a segment edge; the condensed phase changes there
+        n_ice = int(ceil((WATER_T_TRIPLE - self.T_min)/segment))
+        n_liquid = int(ceil((self.T_max - WATER_T_TRIPLE)/segment))
+        self.edges = np.concatenate((np.linspace(self.T_min, WATER_T_TRIPLE, n_ice + 1),
+                                     np.linspace(WATER_T_TRIPLE, self.T_max, n_liquid + 1)[1:]))
+        self._coeffs = self._Tsat_grid_data = None
+
+    @staticmethod
+    def T_properties(T):
+        r'''Evaluate every temperature-only quantity of humid air at one
+        temperature, in the order of
+        :obj:`HumidAirPsychrometrics.T_properties_names`: the seven virial
+        coefficients used by :obj:`HumidAirRP1485` and their temperature
+        derivatives, the ideal gas enthalpies of air and water, the logarithm
+        of the vapor (or sublimation) pressure of water, the molar volume of
+        the condensed water, and the enthalpy of saturated liquid water
+        (`nan` below the triple point).
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+
+        Returns
+        -------
+        values : tuple[float]
+            Temperature-only quantities, [various]
+        '''
+        # The virial coefficients of the formulations depend on tau only
+        air_ref = DryAirLemmon.__new__(DryAirLemmon)
+        air_ref.T = T
+        air_ref.tau = tau_a = DryAirLemmon.T_red/T
+        water_ref = IAPWS95.__new__(IAPWS95)
+        water_ref.T = T
+        water_ref.tau = tau_w = IAPWS95.T_red/T
+
+        Baw, dBaw = air.TEOS10_BAW_derivatives(T)[:2]
+        Caaw, dCaaw = air.TEOS10_CAAW_derivatives(T)[:2]
+        Caww, dCaww = air.TEOS10_CAWW_derivatives(T)[:2]
+        H_air = DryAirLemmon.R*T*(1.0 + tau_a*air.lemmon2000_air_dA0_dtau(tau_a, 1.0))
+        H_water = IAPWS95.R*T*(1.0 + tau_w*iapws.iapws95_A0_tau_derivatives(tau_w, 1.0)[1])
+        if T < WATER_T_TRIPLE:
+            Psat, V_condensed, H_liquid = iapws.iapws11_Psub(T), ICE_IH_V_TRIPLE, nan
+        else:
+            Psat = iapws.iapws95_Psat(T)
+            V_condensed = rho_to_Vm(iapws.iapws95_rhol_sat(T), IAPWS95._MW)
+            H_liquid = water_ref.to(zs=[1.0], T=T, V=V_condensed).H()
+        return (air_ref.B_virial(), Baw, water_ref.B_virial(), air_ref.C_virial(),
+                Caaw, Caww, water_ref.C_virial(),
+                air_ref.dB_virial_dT(), dBaw, water_ref.dB_virial_dT(),
+                air_ref.dC_virial_dT(), dCaaw, dCaww, water_ref.dC_virial_dT(),
+                H_air, H_water, log(Psat), V_condensed, H_liquid)
+
+    def _table_coeffs(self):
+        coeffs = self._coeffs
+        if coeffs is not None:
+            return coeffs
+        n = self.degree + 1
+        thetas = np.pi*(np.arange(n) + 0.5)/n
+        xs = np.cos(thetas)
+        # Chebyshev coefficients of the interpolant through the nodes
+        transform = (2.0/n)*np.cos(np.outer(np.arange(n), thetas))
+        transform[0] *= 0.5
+        edges = self.edges
+        coeffs = np.empty((len(edges) - 1, len(self.T_properties_names), n))
+        for i in range(len(edges) - 1):
+            mid, half = 0.5*(edges[i + 1] + edges[i]), 0.5*(edges[i + 1] - edges[i])
+            values = np.array([self.T_properties(T) for T in (mid + half*xs).tolist()])
+            coeffs[i] = np.dot(transform, values).T
+        self._coeffs = coeffs
+        return coeffs
+
+    def _table_values(self, Ts, rows=None):
+        coeffs = self._table_coeffs()
+        if rows is not None:
+            coeffs = coeffs[:, rows]
+        edges = self.edges
+        n_segments, n = len(edges) - 1, self.degree + 1
+        segments = np.clip(np.searchsorted(edges, Ts, side='right') - 1, 0, n_segments - 1)
+        order = np.argsort(segments, kind='stable')
+        Ts_sorted = Ts[order]
+        starts = np.searchsorted(segments[order], np.arange(n_segments + 1))
+        values_sorted = np.empty((coeffs.shape[1], Ts.size))
+        for i in range(n_segments):
+            start, end = starts[i], starts[i + 1]
+            if start == end:
+                continue
+            x = (2.0*Ts_sorted[start:end] - (edges[i] + edges[i + 1]))/(edges[i + 1] - edges[i])
+            # Chebyshev polynomials by their recurrence, then one matrix product
+            basis = np.empty((n, end - start))
+            basis[0] = 1.0
+            basis[1] = x
+            x2 = 2.0*x
+            for k in range(2, n):
+                basis[k] = x2*basis[k - 1] - basis[k - 2]
+            values_sorted[:, start:end] = np.dot(coeffs[i], basis)
+        values = np.empty_like(values_sorted)
+        values[:, order] = values_sorted
+        if rows is None:
+            return values
+        all_values = np.full((len(self.T_properties_names), Ts.size), nan)
+        all_values[rows] = values
+        return all_values
+
+    def _T_values(self, Ts):
+        # Returns a function giving the temperature-only quantities of a slice
+        # of `Ts`, so the work can be split into chunks
+        if np.any((Ts < self.T_min) | (Ts > self.T_max)):
+            raise ValueError("Temperatures must be between %g and %g K" %(self.T_min, self.T_max))
+        Ts_unique, inverse = np.unique(Ts, return_inverse=True)
+        if Ts_unique.size > self.exact_max_Ts:
+            return lambda s: self._table_values(Ts[s])
+        values = np.array([self.T_properties(T) if T == T else self._nan_values
+                           for T in Ts_unique.tolist()])
+        values = values.reshape(Ts_unique.size, len(self.T_properties_names)).T
+        inverse = inverse.ravel()
+        return lambda s: values[:, inverse[s]]
+
+    def _chunks(self, size):
+        return [slice(i, i + self.chunk_size) for i in range(0, size, self.chunk_size)]
+
+    def T_properties_array(self, Ts):
+        r'''Evaluate the temperature-only quantities of
+        :obj:`HumidAirPsychrometrics.T_properties` for an array of
+        temperatures.
+
+        Parameters
+        ----------
+        Ts : array_like
+            Temperatures, [K]
+
+        Returns
+        -------
+        values : numpy.ndarray
+            Temperature-only quantities, with a leading axis in the order of
+            :obj:`HumidAirPsychrometrics.T_properties_names`, [various]
+        '''
+        shape, (Ts,) = _broadcast_flat(Ts)
+        return self._T_values(Ts)(slice(None)).reshape((len(self.T_properties_names),) + shape)
+
+    def _solve_V(self, Ts, Ps, Bs, Cs, Vs=None):
+        RTs = self.R*Ts
+        if Vs is None:
+            # Pressure series of the virial equation, truncated after C
+            x = Ps/RTs
+            Vs = (1.0 + x*(Bs + x*(Cs - Bs*Bs)))/x
+        for _ in range(100):
+            V2s = Vs*Vs
+            dVs = ((Ps*V2s*Vs - RTs*(V2s + Bs*Vs + Cs))
+                   /(3.0*Ps*V2s - RTs*(2.0*Vs + Bs)))
+            Vs = Vs - dVs
+            if not np.any(np.abs(dVs) > 1e-14*np.abs(Vs)):
+                break
+        return Vs
+
+    def _B_C(self, values, psi_ws):
+        Baa, Baw, Bww, Caaa, Caaw, Caww, Cwww = values[:7]
+        psi_as = 1.0 - psi_ws
+        Bs = psi_as*psi_as*Baa + 2.0*psi_as*psi_ws*Baw + psi_ws*psi_ws*Bww
+        Cs = (psi_as*psi_as*(Caaa + 3.0*psi_ws*Caaw)
+              + psi_ws*psi_ws*(3.0*psi_as*Caww + psi_ws*Cwww))
+        return Bs, Cs
+
+    def _dB_C_dT(self, values, psi_ws):
+        return self._B_C(values[7:14], psi_ws)
+
+    def _H(self, values, Ts, Ps, psi_ws):
+        Bs, Cs = self._B_C(values, psi_ws)
+        dBs, dCs = self._dB_C_dT(values, psi_ws)
+        Vs = self._solve_V(Ts, Ps, Bs, Cs)
+        V2s = Vs*Vs
+        H_deps = self.R*Ts*((-1.0 + (V2s + Vs*Bs + Cs)/V2s)
+                            - Ts*(2.0*Vs*dBs + dCs)/(2.0*V2s))
+        return (1.0 - psi_ws)*values[14] + psi_ws*values[15] + H_deps
+
+    def _ln_f_condensed(self, values, Ts, Ps):
+        Bww, Cwww, ln_Psats, V_condensed = values[2], values[6], values[16], values[17]
+        RTs = self.R*Ts
+        Psats = np.exp(ln_Psats)
+        # Water boils where the pressure is below its saturation pressure
+        Psats_condensed = np.minimum(Psats, Ps)
+        # Pure vapor at saturation, then the Poynting correction
+        V_sats = self._solve_V(Ts, Psats_condensed, Bww, Cwww)
+        ln_fs = (np.log(Psats_condensed) + 2.0*Bww/V_sats + 1.5*Cwww/(V_sats*V_sats)
+                 - np.log(Psats_condensed*V_sats/RTs) + V_condensed*(Ps - Psats_condensed)/RTs)
+        return ln_fs, Psats
+
+    def _ln_phi_w(self, values, Ts, Ps, psi_ws, Vs=None):
+        Baw, Bww, Caaw, Caww, Cwww = values[1], values[2], values[4], values[5], values[6]
+        psi_as = 1.0 - psi_ws
+        Bs, Cs = self._B_C(values, psi_ws)
+        Vs = self._solve_V(Ts, Ps, Bs, Cs, Vs)
+        ln_phi_ws = (2.0*(psi_as*Baw + psi_ws*Bww)/Vs
+                     + 1.5*(psi_as*psi_as*Caaw + 2.0*psi_as*psi_ws*Caww + psi_ws*psi_ws*Cwww)/(Vs*Vs)
+                     - np.log(Ps*Vs/(self.R*Ts)))
+        return ln_phi_ws, Vs
+
+    def _saturation(self, values, Ts, Ps, enhancements=1.0):
+        ln_fs, Psats = self._ln_f_condensed(values, Ts, Ps)
+        boiling = Psats >= Ps
+        psi_ws = np.minimum(enhancements*Psats/Ps, 1.0)
+        Vs = None
+        for _ in range(100):
+            ln_phi_ws, Vs = self._ln_phi_w(values, Ts, Ps, psi_ws, Vs)
+            psi_ws_new = np.where(boiling, 1.0, np.minimum(np.exp(ln_fs - ln_phi_ws)/Ps, 1.0))
+            converged = not np.any(np.abs(psi_ws_new - psi_ws) > 1e-14*psi_ws_new)
+            psi_ws = psi_ws_new
+            if converged:
+                break
+        return psi_ws, Psats
+
+    def _solve_T(self, err, T_low, T_high, xtol=1e-10, maxiter=100):
+        # Vectorized Anderson-Bjorck regula falsi; `err` increases with temperature
+        Ts = np.full(T_low.size, nan)
+        idxs = np.arange(T_low.size)
+        f_low, f_high = err(T_low, idxs), err(T_high, idxs)
+        Ts[f_low == 0.0] = T_low[f_low == 0.0]
+        Ts[f_high == 0.0] = T_high[f_high == 0.0]
+        active = (f_low < 0.0) & (f_high > 0.0)
+        a, b, fa, fb, idxs = T_low[active], T_high[active], f_low[active], f_high[active], idxs[active]
+        for _ in range(maxiter):
+            if not idxs.size:
+                break
+            c = b - fb*(b - a)/(fb - fa)
+            fc = err(c, idxs)
+            flip = fc*fb < 0.0
+            done = (fc == 0.0) | (np.abs(c - b) <= 1e-12*c)
+            m = 1.0 - fc/fb
+            a, fa = np.where(flip, b, a), np.where(flip, fb, np.where(m > 0.0, m, 0.5)*fa)
+            b, fb = c, fc
+            done |= np.abs(b - a) <= xtol
+            Ts[idxs[done]] = b[done]
+            keep = ~done
+            a, b, fa, fb, idxs = a[keep], b[keep], fa[keep], fb[keep], idxs[keep]
+        return Ts
+
+    def _Tsat_grid(self):
+        grid = self._Tsat_grid_data
+        if grid is None:
+            Ts = np.linspace(self.T_min, self.T_max, 4501)
+            # Keep the grid increasing across the triple point
+            ln_Psats = np.maximum.accumulate(self._table_values(Ts)[16])
+            self._Tsat_grid_data = grid = (ln_Psats, Ts)
+        return grid
+
+    def _dew_point_bracket(self, Ps, ln_psi_ws):
+        # Bracket the dew point around the temperature where the vapor
+        # pressure equals the partial pressure; the logarithm of the
+        # enhancement factor is roughly 4E-8 times the pressure in Pa
+        ln_Psats, Ts = self._Tsat_grid()
+        ln_P_partials = ln_psi_ws + np.log(Ps)
+        return (np.interp(ln_P_partials - 0.01 - 1e-7*Ps, ln_Psats, Ts),
+                np.interp(ln_P_partials + 0.01, ln_Psats, Ts))
+
+    def _dew_point(self, Ps, psi_ws):
+        ln_psi_ws = np.log(psi_ws)
+        def err(Ts, idxs):
+            # With the water content known, the fugacities are compared directly
+            values = self._table_values(Ts, self._saturation_rows)
+            P_dews, psi_ws_dew = Ps[idxs], psi_ws[idxs]
+            ln_phi_ws = self._ln_phi_w(values, Ts, P_dews, psi_ws_dew)[0]
+            return (self._ln_f_condensed(values, Ts, P_dews)[0] - ln_psi_ws[idxs]
+                    - np.log(P_dews) - ln_phi_ws)
+
+        T_dews = self._solve_T(err, *self._dew_point_bracket(Ps, ln_psi_ws))
+        retry = np.isnan(T_dews)
+        if np.any(retry):
+            # Fall back to the whole temperature range
+            idxs = np.where(retry)[0]
+            def err_retry(Ts, sub_idxs):
+                return err(Ts, idxs[sub_idxs])
+            T_dews[retry] = self._solve_T(err_retry, np.full(idxs.size, self.T_min),
+                                          np.full(idxs.size, self.T_max))
+        return T_dews
+
+    def _wet_bulb(self, values, Ts, Ps, psi_ws):
+        psi_ws_sat = self._saturation(values, Ts, Ps)[0]
+        # Enthalpy per mole of dry air, and moles of water per mole of dry air
+        hs = self._H(values, Ts, Ps, psi_ws)/(1.0 - psi_ws)
+        rs = psi_ws/(1.0 - psi_ws)
+
+        # The enhancement factor changes slowly, so the last one is kept as
+        # the starting point of the next saturation calculation
+        enhancements = np.ones(Ts.size)
+        def err(T_wbs, idxs):
+            # Energy balance multiplied by (1 - psi_w_sat) so it stays finite
+            values = self._table_values(T_wbs)
+            P_wbs = Ps[idxs]
+            psi_ws_wb, Psats = self._saturation(values, T_wbs, P_wbs, enhancements[idxs])
+            enhancements[idxs] = psi_ws_wb*P_wbs/Psats
+            psi_as_wb = 1.0 - psi_ws_wb
+            return (self._H(values, T_wbs, P_wbs, psi_ws_wb) - psi_as_wb*hs[idxs]
+                    - (psi_ws_wb - rs[idxs]*psi_as_wb)*values[18])
+
+        # Any temperature at or below the dew point has a negative error
+        T_lows = np.fmax(self._dew_point_bracket(Ps, np.log(psi_ws))[0], WATER_T_TRIPLE)
+        T_highs = np.where(T_lows < Ts, Ts, nan)
+        T_wbs = self._solve_T(err, T_lows, T_highs)
+        saturated = psi_ws >= psi_ws_sat
+        T_wbs[saturated] = Ts[saturated]
+        return T_wbs
+
+    def virial_coefficients(self, Ts, psi_ws):
+        r'''Calculate the second and third virial coefficients of humid air
+        and their temperature derivatives, as in :obj:`HumidAirRP1485`.
+
+        Parameters
+        ----------
+        Ts : array_like
+            Temperatures, [K]
+        psi_ws : array_like
+            Mole fractions of water, [-]
+
+        Returns
+        -------
+        Bs : numpy.ndarray
+            Second virial coefficients, [m^3/mol]
+        Cs : numpy.ndarray
+            Third virial coefficients, [m^6/mol^2]
+        dBs_dT : numpy.ndarray
+            Temperature derivatives of `Bs`, [m^3/mol/K]
+        dCs_dT : numpy.ndarray
+            Temperature derivatives of `Cs`, [m^6/mol^2/K]
+        '''
+        shape, (Ts, psi_ws) = _broadcast_flat(Ts, psi_ws)
+        values = self._T_values(Ts)(slice(None))
+        return tuple(v.reshape(shape) for v in self._B_C(values, psi_ws) + self._dB_C_dT(values, psi_ws))
+
+    def V(self, Ts, Ps, psi_ws):
+        r'''Calculate the molar volume of humid air.
+
+        Parameters
+        ----------
+        Ts : array_like
+            Temperatures, [K]
+        Ps : array_like
+            Pressures, [Pa]
+        psi_ws : array_like
+            Mole fractions of water, [-]
+
+        Returns
+        -------
+        Vs : numpy.ndarray
+            Molar volumes, [m^3/mol]
+        '''
+        shape, (Ts, Ps, psi_ws) = _broadcast_flat(Ts, Ps, psi_ws)
+        T_values, Vs = self._T_values(Ts), np.empty(Ts.size)
+        for s in self._chunks(Ts.size):
+            Bs, Cs = self._B_C(T_values(s), psi_ws[s])
+            Vs[s] = self._solve_V(Ts[s], Ps[s], Bs, Cs)
+        return Vs.reshape(shape)
+
+    def H(self, Ts, Ps, psi_ws):
+        r'''Calculate the molar enthalpy of humid air, on the same basis as
+        :obj:`HumidAirRP1485.H`.
+
+        Parameters
+        ----------
+        Ts : array_like
+            Temperatures, [K]
+        Ps : array_like
+            Pressures, [Pa]
+        psi_ws : array_like
+            Mole fractions of water, [-]
+
+        Returns
+        -------
+        Hs : numpy.ndarray
+            Molar enthalpies, [J/mol]
+        '''
+        shape, (Ts, Ps, psi_ws) = _broadcast_flat(Ts, Ps, psi_ws)
+        T_values, Hs = self._T_values(Ts), np.empty(Ts.size)
+        for s in self._chunks(Ts.size):
+            Hs[s] = self._H(T_values(s), Ts[s], Ps[s], psi_ws[s])
+        return Hs.reshape(shape)
+
+    def saturation(self, Ts, Ps):
+        r'''Calculate the mole fraction of water in humid air saturated with
+        respect to liquid water (or ice, below the triple point), and the
+        enhancement factor of the saturation pressure. Where the pressure is
+        below the saturation pressure the mole fraction is 1.
+
+        Parameters
+        ----------
+        Ts : array_like
+            Temperatures, [K]
+        Ps : array_like
+            Pressures, [Pa]
+
+        Returns
+        -------
+        psi_ws : numpy.ndarray
+            Saturation mole fractions of water, [-]
+        fs : numpy.ndarray
+            Enhancement factors, :math:`\psi_w P/P^{sat}`, [-]
+        '''
+        shape, (Ts, Ps) = _broadcast_flat(Ts, Ps)
+        T_values, psi_ws, fs = self._T_values(Ts), np.empty(Ts.size), np.empty(Ts.size)
+        for s in self._chunks(Ts.size):
+            psi_ws[s], Psats = self._saturation(T_values(s), Ts[s], Ps[s])
+            fs[s] = psi_ws[s]*Ps[s]/Psats
+        return psi_ws.reshape(shape), fs.reshape(shape)
+
+    def humidity_ratio(self, psi_ws):
+        r'''Calculate the humidity ratio (mass of water per mass of dry air)
+        of humid air.
+
+        Parameters
+        ----------
+        psi_ws : array_like
+            Mole fractions of water, [-]
+
+        Returns
+        -------
+        Ws : numpy.ndarray
+            Humidity ratios, [-]
+        '''
+        psi_ws = np.asarray(psi_ws, dtype=float)
+        return self.MW_water*psi_ws/(self.MW_air*(1.0 - psi_ws))
+
+    def dew_point(self, Ps, psi_ws):
+        r'''Calculate the dew point (or frost point, below the triple point)
+        of humid air. Points without a dew point between
+        :obj:`HUMID_AIR_T_MIN` and :obj:`HUMID_AIR_T_MAX` are `nan`.
+
+        Parameters
+        ----------
+        Ps : array_like
+            Pressures, [Pa]
+        psi_ws : array_like
+            Mole fractions of water, [-]
+
+        Returns
+        -------
+        Ts : numpy.ndarray
+            Dew point temperatures, [K]
+        '''
+        shape, (Ps, psi_ws) = _broadcast_flat(Ps, psi_ws)
+        T_dews = np.empty(Ps.size)
+        with np.errstate(divide='ignore'):
+            for s in self._chunks(Ps.size):
+                T_dews[s] = self._dew_point(Ps[s], psi_ws[s])
+        return T_dews.reshape(shape)
+
+    def wet_bulb(self, Ts, Ps, psi_ws):
+        r'''Calculate the adiabatic saturation (thermodynamic wet bulb)
+        temperature of humid air: the temperature at which evaporating liquid
+        water at that temperature saturates the air with no heat exchanged.
+        Saturated air returns its own temperature; wet bulb temperatures
+        below the triple point are `nan`.
+
+        Parameters
+        ----------
+        Ts : array_like
+            Temperatures, [K]
+        Ps : array_like
+            Pressures, [Pa]
+        psi_ws : array_like
+            Mole fractions of water, [-]
+
+        Returns
+        -------
+        T_wbs : numpy.ndarray
+            Wet bulb temperatures, [K]
+        '''
+        shape, (Ts, Ps, psi_ws) = _broadcast_flat(Ts, Ps, psi_ws)
+        T_values, T_wbs = self._T_values(Ts), np.empty(Ts.size)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for s in self._chunks(Ts.size):
+                T_wbs[s] = self._wet_bulb(T_values(s), Ts[s], Ps[s], psi_ws[s])
+        return T_wbs.reshape(shape)
+
+
+_humid_air_psychrometrics = {}
+
+def humid_air_psychrometrics(degree=HUMID_AIR_CHEBYSHEV_DEGREE,
+                             segment=HUMID_AIR_T_SEGMENT):
+    r'''Return the :obj:`HumidAirPsychrometrics` with the given interpolant
+    resolution. Objects are kept in memory once created, so the interpolants
+    (which take about a second to build) are only built once.
+
+    Parameters
+    ----------
+    degree : int, optional
+        Degree of the Chebyshev interpolant in each temperature segment, [-]
+    segment : float, optional
+        Approximate width of each temperature segment, [K]
+
+    Returns
+    -------
+    psychrometrics : :obj:`HumidAirPsychrometrics`
+        Batched psychrometric calculator, [-]
+    '''
+    key = (degree, segment)
+    try:
+        return _humid_air_psychrometrics[key]
+    except KeyError:
+        pass
+    _humid_air_psychrometrics[key] = psychrometrics = HumidAirPsychrometrics(degree, segment)
+    return psychrometrics
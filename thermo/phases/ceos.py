@@ -940,10 +940,10 @@ class CEOSGas(Phase):
         return P_max
 
     def mu(self):
-#        try:
-#            return self._mu
-#        except AttributeError:
-#            pass
+        try:
+            return self._mu
+        except AttributeError:
+            pass
         try:
             phase = self.assigned_phase
         except:
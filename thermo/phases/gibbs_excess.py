@@ -29,6 +29,7 @@ from fluids.numerics import (horner_and_der2, derivative,
                              evaluate_linear_fits, evaluate_linear_fits_d,
                              evaluate_linear_fits_d2,
                              trunc_exp, secant)
+from fluids.numerics import numpy as np
 from chemicals.utils import log, exp
 from thermo.activity import IdealSolution
 from thermo.utils import POLY_FIT, PROPERTY_TRANSFORM_LN, PROPERTY_TRANSFORM_DLN, PROPERTY_TRANSFORM_D2LN, PROPERTY_TRANSFORM_D_X, PROPERTY_TRANSFORM_D2_X
@@ -39,6 +40,21 @@ from thermo.phase_change import EnthalpyVaporization, EnthalpySublimation
 
 from thermo.phases.phase import Phase
 
+
+def _log_many(xs):
+    # math.log element by element, so array results match the scalar methods
+    # exactly; numpy's log may differ in the last bit
+    return np.array([log(x) for x in xs.tolist()])
+
+def _exp_many(xs, overflow):
+    values = []
+    for x in xs.ravel().tolist():
+        try:
+            values.append(exp(x))
+        except:
+            values.append(overflow)
+    return np.array(values).reshape(xs.shape)
+
 class GibbsExcessLiquid(Phase):
     r'''Phase based on combining Raoult's law with a
     :obj:`GibbsExcess <thermo.activity.GibbsExcess>` model, optionally
@@ -152,6 +168,10 @@ class GibbsExcessLiquid(Phase):
     Gfs : list[float], optional
         Molar ideal-gas standard Gibbs energies of formation at 298.15 K and
         1 atm, [J/mol]
+    henry_Vcs : list[float], optional
+        Critical volumes of each component; used to weight the Henry's law
+        constants of a dissolved component in each solvent, and required if
+        there are `henry_components`, [m^3/mol]
     T : float, optional
         Temperature, [K]
     P : float, optional
@@ -212,7 +232,7 @@ class GibbsExcessLiquid(Phase):
     model_attributes = ('Hfs', 'Gfs', 'Sfs', 'GibbsExcessModel',
                         'eos_pure_instances', 'use_Poynting', 'use_phis_sat',
                         'use_Tait', 'use_eos_volume', 'henry_components',
-                        'henry_data', 'Psat_extrpolation') + pure_references
+                        'henry_data', 'henry_Vcs', 'Psat_extrpolation') + pure_references
 
     obj_references = ('GibbsExcessModel', 'eos_pure_instances')
     
@@ -232,7 +252,7 @@ class GibbsExcessLiquid(Phase):
 
                  Hfs=None, Gfs=None, Sfs=None,
 
-                 henry_components=None, henry_data=None,
+                 henry_components=None, henry_data=None, henry_Vcs=None,
 
                  T=None, P=None, zs=None,
                  Psat_extrpolation='AB',
@@ -411,6 +431,9 @@ class GibbsExcessLiquid(Phase):
         self.has_henry_components = any(henry_components)
         self.henry_components = henry_components
         self.henry_data = henry_data
+        if self.has_henry_components and henry_Vcs is None:
+            raise ValueError("Critical volumes `henry_Vcs` are required to mix Henry's law constants")
+        self.henry_Vcs = henry_Vcs
 
         self.composition_independent = isinstance(GibbsExcessModel, IdealSolution) and not self.has_henry_components
 
@@ -510,6 +533,7 @@ class GibbsExcessLiquid(Phase):
         new.henry_data = self.henry_data
         new.henry_components = self.henry_components
         new.has_henry_components = self.has_henry_components
+        new.henry_Vcs = self.henry_Vcs
 
         new.composition_independent = self.composition_independent
         new.model_id = self.model_id
@@ -657,10 +681,9 @@ class GibbsExcessLiquid(Phase):
             henry_components = self.henry_components
             henry_data = self.henry_data
             zs = self.zs
+            Vcs = self.henry_Vcs
 
             for i in range(self.N):
-#                Vcs = [1, 1, 1]
-                Vcs = [5.6000000000000006e-05, 0.000168, 7.340000000000001e-05]
                 if henry_components[i]:
                     # WORKING - Need a bunch of conversions of data in terms of other values
                     # into this basis
@@ -688,6 +711,91 @@ class GibbsExcessLiquid(Phase):
 
         return Psats
 
+    @staticmethod
+    def _Psats_many_poly_fit(Ts, Psats_data, N):
+        T_invs = 1.0/Ts
+        logTs = _log_many(Ts)
+        Tmins, Tmaxes, coeffs = Psats_data[0], Psats_data[3], Psats_data[6]
+        lnPsats = np.empty((Ts.size, N))
+        for i in range(N):
+            low, high = Ts < Tmins[i], Ts > Tmaxes[i]
+            A, B, C = Psats_data[9][i]
+            col = A + B*T_invs + C*logTs
+            if high.any():
+                A, B, C = Psats_data[10][i]
+                col[high] = (A + B*T_invs + C*logTs)[high]
+            middle = ~(low | high)
+            if middle.any():
+                # Same Horner sequence as the scalar loop
+                Ts_middle = Ts[middle]
+                Psat = np.zeros(Ts_middle.size)
+                for c in coeffs[i]:
+                    Psat = Psat*Ts_middle + c
+                col[middle] = Psat
+            lnPsats[:, i] = col
+        return _exp_many(lnPsats, 1.6549840276802644e+300)
+
+    def _Psats_many_henry(self, Ts, zs, Psats):
+        # Vectorized counterpart of the Henry's law block in `Psats`
+        henry_components, henry_data = self.henry_components, self.henry_data
+        cmps = range(self.N)
+        Vcs = self.henry_Vcs
+        logTs = _log_many(Ts)
+        for i in cmps:
+            if henry_components[i]:
+                d = henry_data[i]
+                logH = np.zeros(Ts.size)
+                for j in cmps:
+                    if d[j]:
+                        r = d[j]
+                        log_Hi = (r[0] + r[1]/Ts + r[2]*logTs + r[3]*Ts + r[4]/Ts**2)
+                        wi = zs[j]*Vcs[j]**(2.0/3.0)/sum([zs[_]*Vcs[_]**(2.0/3.0) for _ in cmps if d[_]])
+                        logH += wi*log_Hi
+                Psats[:, i] = np.array([exp(x) for x in logH.tolist()])*1e5 # bar to Pa
+        return Psats
+
+    def Psats_many(self, Ts, zs=None):
+        r'''Method to calculate and return the vapor pressures of every
+        component at many temperatures at once, [Pa].
+
+        When the vapor pressures are polynomial fits, all components and
+        temperatures, including the low- and high-temperature extrapolation
+        branches, are evaluated with array operations; otherwise each
+        correlation is evaluated at each temperature.
+
+        Parameters
+        ----------
+        Ts : list[float]
+            Temperatures, [K]
+        zs : list[float], optional
+            Mole fractions used to mix Henry's law constants when the phase
+            has Henry's law components; the phase's own composition is used
+            if not provided, [-]
+
+        Returns
+        -------
+        Psats_many : ndarray
+            Vapor pressures, one row per temperature, [Pa]
+
+        Notes
+        -----
+        Each row matches :obj:`GibbsExcessLiquid.Psats` for a phase at that
+        temperature.
+        '''
+        Ts = np.asarray(Ts, dtype=float).ravel()
+        N = self.N
+        if self.Psats_poly_fit:
+            return self._Psats_many_poly_fit(Ts, self._Psats_data, N)
+        VaporPressures = self.VaporPressures
+        Psats = np.empty((Ts.size, N))
+        for i in range(N):
+            Psats[:, i] = VaporPressures[i].T_dependent_property_many(Ts)
+        if self.has_henry_components:
+            if zs is None:
+                zs = self.zs
+            Psats = self._Psats_many_henry(Ts, zs, Psats)
+        return Psats
+
 #    def PIP(self):
 #        # Force liquid
 #        return 2.0
@@ -1008,6 +1116,65 @@ class GibbsExcessLiquid(Phase):
         self._Vms_sat = [VolumeLiquids[i].T_dependent_property(T) for i in range(self.N)]
         return self._Vms_sat
 
+    @staticmethod
+    def _Vms_sat_many_poly_fit(Ts, Vms_sat_data, N):
+        Tmins, Tmaxes, coeffs, coeffs_Tmin = Vms_sat_data[0], Vms_sat_data[3], Vms_sat_data[6], Vms_sat_data[9]
+        Vms_sat = np.empty((Ts.size, N))
+        for i in range(N):
+            low, high = Ts < Tmins[i], Ts > Tmaxes[i]
+            Vm = np.zeros(Ts.size)
+            for c in coeffs[i]:
+                Vm = Vm*Ts + c
+            if low.any():
+                Ts_low = Ts[low]
+                Vm_low = np.zeros(Ts_low.size)
+                for c in coeffs_Tmin[i]:
+                    Vm_low = Vm_low*Ts_low + c
+                Vm[low] = Vm_low
+            if high.any():
+                Vm[high] = (Ts[high] - Tmaxes[i])*Vms_sat_data[4][i] + Vms_sat_data[5][i]
+            Vms_sat[:, i] = Vm
+        return Vms_sat
+
+    def Vms_sat_many(self, Ts):
+        r'''Method to calculate and return the saturation molar volumes of
+        every component at many temperatures at once, [m^3/mol].
+
+        Parameters
+        ----------
+        Ts : list[float]
+            Temperatures, [K]
+
+        Returns
+        -------
+        Vms_sat_many : ndarray
+            Saturation liquid molar volumes, one row per temperature,
+            [m^3/mol]
+        '''
+        Ts = np.asarray(Ts, dtype=float).ravel()
+        N = self.N
+        if self.Vms_sat_poly_fit:
+            return self._Vms_sat_many_poly_fit(Ts, self._Vms_sat_data, N)
+        Vms_sat = np.empty((Ts.size, N))
+        Ts_list = Ts.tolist()
+        if self.use_eos_volume:
+            Psats = self.Psats_many(Ts)
+            for i, eos in enumerate(self.eos_pure_instances):
+                for k, T in enumerate(Ts_list):
+                    if T < eos.Tc:
+                        Vms_sat[k, i] = eos.V_l_sat(T)
+                    else:
+                        e_sat = eos.to(T=T, P=float(Psats[k, i]))
+                        try:
+                            Vms_sat[k, i] = e_sat.V_l
+                        except:
+                            Vms_sat[k, i] = e_sat.V_g
+            return Vms_sat
+        VolumeLiquids = self.VolumeLiquids
+        for i in range(N):
+            Vms_sat[:, i] = VolumeLiquids[i].T_dependent_property_many(Ts)
+        return Vms_sat
+
     @staticmethod
     def _dVms_sat_dT_at(T, Vms_sat_data, cmps):
         Vms_sat_data = Vms_sat_data
@@ -1247,6 +1414,39 @@ class GibbsExcessLiquid(Phase):
         return self._Poyntings
 
 
+    def Poyntings_many(self, Ts, Ps, Psats=None, Vms_sat=None):
+        r'''Method to calculate and return the Poynting pressure correction
+        factors of every component at many temperatures and pressures at
+        once, [-].
+
+        Parameters
+        ----------
+        Ts : list[float]
+            Temperatures, [K]
+        Ps : float or list[float]
+            Pressures, either one for all temperatures or one for each, [Pa]
+        Psats : ndarray, optional
+            Vapor pressures from :obj:`GibbsExcessLiquid.Psats_many`, [Pa]
+        Vms_sat : ndarray, optional
+            Saturation molar volumes from
+            :obj:`GibbsExcessLiquid.Vms_sat_many`, [m^3/mol]
+
+        Returns
+        -------
+        Poyntings_many : ndarray
+            Poynting pressure correction factors, one row per temperature, [-]
+        '''
+        Ts = np.asarray(Ts, dtype=float).ravel()
+        if not self.use_Poynting:
+            return np.ones((Ts.size, self.N))
+        Ps = np.broadcast_to(np.asarray(Ps, dtype=float).ravel(), Ts.shape)
+        if Psats is None:
+            Psats = self.Psats_many(Ts)
+        if Vms_sat is None:
+            Vms_sat = self.Vms_sat_many(Ts)
+        RT_invs = 1.0/(R*Ts)
+        return _exp_many(Vms_sat*(Ps[:, None] - Psats)*RT_invs[:, None], 1.7976931348622732e+308)
+
     def dPoyntings_dT(self):
         try:
             return self._dPoyntings_dT
@@ -1494,6 +1694,47 @@ class GibbsExcessLiquid(Phase):
 
 
 
+    def phis_sat_many(self, Ts):
+        r'''Method to calculate and return the saturation fugacity
+        coefficient correction factors of every component at many
+        temperatures at once, [-].
+
+        Each factor needs a rigorous saturation calculation of the pure
+        component's equation of state, so it is calculated only once per
+        distinct temperature (all supercritical temperatures of a component
+        share the value at its critical point).
+
+        Parameters
+        ----------
+        Ts : list[float]
+            Temperatures, [K]
+
+        Returns
+        -------
+        phis_sat_many : ndarray
+            Saturation fugacity coefficient correction factors, one row per
+            temperature, [-]
+        '''
+        Ts = np.asarray(Ts, dtype=float).ravel()
+        if not self.use_phis_sat:
+            return np.ones((Ts.size, self.N))
+        phis_sat = np.empty((Ts.size, self.N))
+        PHI_SAT_IDEAL_TR = self.PHI_SAT_IDEAL_TR
+        for i, eos in enumerate(self.eos_pure_instances):
+            Tc = eos.Tc
+            Ts_unique, inverse = np.unique(np.minimum(Ts, Tc), return_inverse=True)
+            values = []
+            for T in Ts_unique.tolist():
+                try:
+                    values.append(eos.phi_sat(T, polish=True))
+                except Exception as err:
+                    if T < PHI_SAT_IDEAL_TR*Tc:
+                        values.append(1.0)
+                    else:
+                        raise err
+            phis_sat[:, i] = np.array(values)[inverse.ravel()]
+        return phis_sat
+
     def dphis_sat_dT_at(self, T):
         if not self.use_phis_sat:
             return [0.0]*self.N
@@ -23,13 +23,120 @@ SOFTWARE.
 '''
 __all__ = ['HelmholtzEOS',]
 
-from chemicals.utils import log
+from chemicals.utils import log, exp
 from .phase import Phase
 
+def helmholtz_Ar_derivatives(tau, delta, ns, ds, ts, cs):
+    r'''Calculates the residual Helmholtz energy and its first and second
+    derivatives with respect to `tau` and `delta` of a sum of polynomial and
+    exponential terms, in a single pass over the terms.
+
+    .. math::
+        \alpha^r = \sum_i n_i \delta^{d_i} \tau^{t_i} \exp(-\delta^{c_i})
+
+    Terms with a `c` of zero are polynomial terms; the terms should be sorted
+    by `c` so the exponential can be shared between terms.
+
+    Parameters
+    ----------
+    tau : float
+        Dimensionless temperature, (Tc/T), [-]
+    delta : float
+        Dimensionless density, (rho/rhoc), [-]
+    ns : tuple[float]
+        Coefficients of each term, [-]
+    ds : tuple[int]
+        Density exponents of each term, [-]
+    ts : tuple[float]
+        Temperature exponents of each term, [-]
+    cs : tuple[int]
+        Density exponents in the exponential of each term, [-]
+
+    Returns
+    -------
+    Ar : float
+        Residual Helmholtz energy, [-]
+    dAr_ddelta : float
+        First derivative with respect to `delta`, [-]
+    d2Ar_ddelta2 : float
+        Second derivative with respect to `delta`, [-]
+    dAr_dtau : float
+        First derivative with respect to `tau`, [-]
+    d2Ar_dtau2 : float
+        Second derivative with respect to `tau`, [-]
+    d2Ar_ddeltadtau : float
+        Second derivative with respect to `delta` and `tau`, [-]
+    '''
+    delta_inv, tau_inv = 1.0/delta, 1.0/tau
+    Ar = dAr_ddelta = d2Ar_ddelta2 = dAr_dtau = d2Ar_dtau2 = d2Ar_ddeltadtau = 0.0
+    c_last, delta_c, exp_delta_c = 0, 1.0, 1.0
+    for n, d, t, c in zip(ns, ds, ts, cs):
+        term = n*delta**d*tau**t
+        if c:
+            if c != c_last:
+                c_last = c
+                delta_c = delta**c
+                exp_delta_c = exp(-delta_c)
+            term *= exp_delta_c
+            g = d - c*delta_c
+            h = g*(g - 1.0) - c*c*delta_c
+        else:
+            g = d
+            h = d*(d - 1.0)
+        term_t = term*t
+        Ar += term
+        dAr_ddelta += term*g
+        d2Ar_ddelta2 += term*h
+        dAr_dtau += term_t
+        d2Ar_dtau2 += term_t*(t - 1.0)
+        d2Ar_ddeltadtau += term_t*g
+    return (Ar, dAr_ddelta*delta_inv, d2Ar_ddelta2*delta_inv*delta_inv,
+            dAr_dtau*tau_inv, d2Ar_dtau2*tau_inv*tau_inv,
+            d2Ar_ddeltadtau*delta_inv*tau_inv)
+
+def helmholtz_Ar_gaussian_derivatives(tau, delta, ns, ds, ts, alphas, betas,
+                                      gammas, epsilons):
+    r'''Calculates the residual Helmholtz energy and its first and second
+    derivatives with respect to `tau` and `delta` of a sum of Gaussian bell
+    shaped terms, in a single pass over the terms.
+
+    .. math::
+        \alpha^r = \sum_i n_i \delta^{d_i} \tau^{t_i}
+        \exp(-\alpha_i(\delta - \epsilon_i)^2 - \beta_i(\tau - \gamma_i)^2)
+
+    Returns the same values as :obj:`helmholtz_Ar_derivatives`.
+    '''
+    delta_inv, tau_inv = 1.0/delta, 1.0/tau
+    Ar = dAr_ddelta = d2Ar_ddelta2 = dAr_dtau = d2Ar_dtau2 = d2Ar_ddeltadtau = 0.0
+    for n, d, t, alpha, beta, gamma, epsilon in zip(ns, ds, ts, alphas, betas, gammas, epsilons):
+        x, y = delta - epsilon, tau - gamma
+        arg = -alpha*x*x - beta*y*y
+        if arg < -746.0:
+            # The exponential underflows to zero
+            continue
+        term = n*delta**d*tau**t*exp(arg)
+        fd = d*delta_inv - 2.0*alpha*x
+        ft = t*tau_inv - 2.0*beta*y
+        Ar += term
+        dAr_ddelta += term*fd
+        d2Ar_ddelta2 += term*(fd*fd - d*delta_inv*delta_inv - 2.0*alpha)
+        dAr_dtau += term*ft
+        d2Ar_dtau2 += term*(ft*ft - t*tau_inv*tau_inv - 2.0*beta)
+        d2Ar_ddeltadtau += term*fd*ft
+    return Ar, dAr_ddelta, d2Ar_ddelta2, dAr_dtau, d2Ar_dtau2, d2Ar_ddeltadtau
+
 class HelmholtzEOS(Phase):
 
     model_attributes = ('model_name',)
 
+    _Ar_derivatives_func = None
+    '''Optional function of (`tau`, `delta`) returning the residual Helmholtz
+    energy and its first and second derivatives in one call, in the order of
+    :obj:`helmholtz_Ar_derivatives`; when set, the first request for a second
+    derivative calculates and caches all of them. `A` and the first
+    derivatives alone, which are all that fugacities, enthalpy and entropy
+    need, are cheaper from their own functions.'''
+
     def __repr__(self):
         r'''Method to create a string representation of the phase object, with
         the goal of making it easy to obtain standalone code which reproduces
@@ -61,6 +168,22 @@ class HelmholtzEOS(Phase):
     def V(self):
         return self._V
 
+    def _set_A_derivatives(self):
+        tau, delta = self.tau, self.delta
+        Ar, dAr_ddelta, d2Ar_ddelta2, dAr_dtau, d2Ar_dtau2, d2Ar_ddeltadtau = self._Ar_derivatives_func(tau, delta)
+        self._d2A_ddelta2 = d2Ar_ddelta2 - 1./(delta*delta)
+        self._d2A_dtau2 = d2Ar_dtau2 + self.d2A0_dtau2
+        self._d2A_ddeltadtau = d2Ar_ddeltadtau
+        # Values already returned from their own functions are kept, so they
+        # do not change in the last digits
+        d = self.__dict__
+        if '_A' not in d:
+            self._A = self.A0 + Ar
+        if '_dA_ddelta' not in d:
+            self._dA_ddelta = dAr_ddelta + 1./delta
+        if '_dA_dtau' not in d:
+            self._dA_dtau = dAr_dtau + self.dA0_dtau
+
     def A(self):
         try:
             return self._A
@@ -83,6 +206,9 @@ class HelmholtzEOS(Phase):
             return self._d2A_ddelta2
         except:
             pass
+        if self._Ar_derivatives_func is not None:
+            self._set_A_derivatives()
+            return self._d2A_ddelta2
         delta = self.delta
         self._d2A_ddelta2 = d2A_ddelta2 = self._d2Ar_ddelta2_func(self.tau, delta) - 1./(delta*delta)
         return d2A_ddelta2
@@ -110,6 +236,9 @@ class HelmholtzEOS(Phase):
             return self._d2A_dtau2
         except:
             pass
+        if self._Ar_derivatives_func is not None:
+            self._set_A_derivatives()
+            return self._d2A_dtau2
         self._d2A_dtau2 = d2A_dtau2 = self._d2Ar_dtau2_func(self.tau, self.delta) + self.d2A0_dtau2
         return d2A_dtau2
 
@@ -118,6 +247,9 @@ class HelmholtzEOS(Phase):
             return self._d2A_ddeltadtau
         except:
             pass
+        if self._Ar_derivatives_func is not None:
+            self._set_A_derivatives()
+            return self._d2A_ddeltadtau
         self._d2A_ddeltadtau = d2A_ddeltadtau = self._d2Ar_ddeltadtau_func(self.tau, self.delta)
         return d2A_ddeltadtau
 
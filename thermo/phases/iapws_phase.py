@@ -21,15 +21,157 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 '''
 
-__all__ = ['IAPWS95', 'IAPWS95Gas', 'IAPWS95Liquid', 'IAPWS97']
+__all__ = ['IAPWS95', 'IAPWS95Gas', 'IAPWS95Liquid', 'IAPWS97',
+           'IAPWS95Table', 'IAPWS95TableGas', 'IAPWS95TableLiquid',
+           'IAPWS95SplineTable', 'iapws95_spline_table']
+
+import os
+from math import exp, log, sqrt
+from fluids.numerics import numpy as np
 
 from chemicals import iapws
 from chemicals.viscosity import mu_IAPWS
 from chemicals.thermal_conductivity import k_IAPWS
-from .helmholtz_eos import HelmholtzEOS
+from .helmholtz_eos import HelmholtzEOS, helmholtz_Ar_derivatives, helmholtz_Ar_gaussian_derivatives
 from chemicals.utils import rho_to_Vm, Vm_to_rho
 from .phase import Phase
 
+# Coefficients of the residual part of IAPWS-95, terms 1-51 (polynomial and
+# exponential), 52-54 (Gaussian) and 55-56 (non-analytical)
+iapws95_Ar_ns = (0.012533547935523, 7.8957634722828, -8.7803203303561, 0.31802509345418, -0.26145533859358,
+                 -0.0078199751687981, 0.0088089493102134, -0.66856572307965, 0.20433810950965, -6.6212605039687e-05,
+                 -0.19232721156002, -0.25709043003438, 0.16074868486251, -0.040092828925807, 3.9343422603254e-07,
+                 -7.5941377088144e-06, 0.00056250979351888, -1.5608652257135e-05, 1.1537996422951e-09, 3.6582165144204e-07,
+                 -1.3251180074668e-12, -6.2639586912454e-10, -0.10793600908932, 0.017611491008752, 0.22132295167546,
+                 -0.40247669763528, 0.58083399985759, 0.0049969146990806, -0.031358700712549, -0.74315929710341,
+                 0.4780732991548, 0.020527940895948, -0.13636435110343, 0.014180634400617, 0.0083326504880713,
+                 -0.029052336009585, 0.038615085574206, -0.020393486513704, -0.0016554050063734, 0.0019955571979541,
+                 0.00015870308324157, -1.638856834253e-05, 0.043613615723811, 0.034994005463765, -0.076788197844621,
+                 0.022446277332006, -6.2689710414685e-05, -5.5711118565645e-10, -0.19905718354408, 0.31777497330738,
+                 -0.11841182425981)
+iapws95_Ar_ds = (1, 1, 1, 2, 2, 3, 4, 1, 1, 1, 2, 2, 3, 4, 4, 5, 7, 9, 10, 11, 13, 15, 1, 2, 2, 2, 3, 4, 4, 4, 5,
+                 6, 6, 7, 9, 9, 9, 9, 9, 10, 10, 12, 3, 4, 4, 5, 14, 3, 6, 6, 6)
+iapws95_Ar_ts = (-0.5, 0.875, 1.0, 0.5, 0.75, 0.375, 1.0, 4.0, 6.0, 12.0, 1.0, 5.0, 4.0, 2.0, 13.0, 9.0, 3.0, 4.0,
+                 11.0, 4.0, 13.0, 1.0, 7.0, 1.0, 9.0, 10.0, 10.0, 3.0, 7.0, 10.0, 10.0, 6.0, 10.0, 10.0, 1.0, 2.0,
+                 3.0, 4.0, 8.0, 6.0, 9.0, 8.0, 16.0, 22.0, 23.0, 23.0, 10.0, 50.0, 44.0, 46.0, 50.0)
+iapws95_Ar_cs = (0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+                 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 4, 6, 6, 6, 6)
+
+iapws95_Ar_gaussian_ns = (-31.306260323435, 31.546140237781, -2521.3154341695)
+iapws95_Ar_gaussian_ds = (3, 3, 3)
+iapws95_Ar_gaussian_ts = (0.0, 1.0, 4.0)
+iapws95_Ar_gaussian_alphas = (20.0, 20.0, 20.0)
+iapws95_Ar_gaussian_betas = (150.0, 150.0, 250.0)
+iapws95_Ar_gaussian_gammas = (1.21, 1.21, 1.25)
+iapws95_Ar_gaussian_epsilons = (1.0, 1.0, 1.0)
+
+iapws95_Ar_nonanalytic_ns = (-0.14874640856724, 0.31806110878444)
+iapws95_Ar_nonanalytic_bs = (0.85, 0.95)
+iapws95_Ar_nonanalytic_Cs = (28.0, 32.0)
+iapws95_Ar_nonanalytic_Ds = (700.0, 800.0)
+iapws95_Ar_nonanalytic_a = 3.5
+iapws95_Ar_nonanalytic_B = 0.2
+iapws95_Ar_nonanalytic_A = 0.32
+iapws95_Ar_nonanalytic_beta = 0.3
+
+def iapws95_Ar_nonanalytic_derivatives(tau, delta):
+    # Terms 55 and 56 of IAPWS-95; singular at exactly the critical density
+    dm1 = delta - 1.0
+    if dm1 == 0.0:
+        dm1 = 1e-14
+    dm12 = dm1*dm1
+    tm1 = tau - 1.0
+    if 28.0*dm12 + 700.0*tm1*tm1 > 746.0:
+        # exp(-C*dm12 - D*tm1*tm1) underflows to zero for both terms
+        return 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+    dm12_inv = 1.0/dm12
+    a, B, A, beta = iapws95_Ar_nonanalytic_a, iapws95_Ar_nonanalytic_B, iapws95_Ar_nonanalytic_A, iapws95_Ar_nonanalytic_beta
+    beta_inv2 = 0.5/beta
+
+    # Terms shared by both
+    p_theta = dm12**beta_inv2
+    p_a = dm12**a
+    theta = (1.0 - tau) + A*p_theta
+    Delta = theta*theta + B*p_a
+    Delta_inv = 1.0/Delta
+    dDelta_dd = dm1*(A*theta*2.0/beta*p_theta + 2.0*B*a*p_a)*dm12_inv
+    d2Delta_dd2 = (dDelta_dd/dm1 + (4.0*B*a*(a - 1.0)*p_a + 2.0*A*A/(beta*beta)*p_theta*p_theta
+                   + A*theta*4.0/beta*(beta_inv2 - 1.0)*p_theta)*dm12_inv)
+
+    Ar = dAr_ddelta = d2Ar_ddelta2 = dAr_dtau = d2Ar_dtau2 = d2Ar_ddeltadtau = 0.0
+    for n, b, C, D in zip(iapws95_Ar_nonanalytic_ns, iapws95_Ar_nonanalytic_bs,
+                          iapws95_Ar_nonanalytic_Cs, iapws95_Ar_nonanalytic_Ds):
+        psi = exp(-C*dm12 - D*tm1*tm1)
+        psi_d = -2.0*C*dm1*psi
+        psi_dd = (2.0*C*dm12 - 1.0)*2.0*C*psi
+        psi_t = -2.0*D*tm1*psi
+        psi_tt = (2.0*D*tm1*tm1 - 1.0)*2.0*D*psi
+        psi_dt = 4.0*C*D*dm1*tm1*psi
+
+        # Delta**b and its derivatives
+        Db = Delta**b
+        Db1 = b*Db*Delta_inv
+        Db2 = (b - 1.0)*Db1*Delta_inv
+        dDb_dd = Db1*dDelta_dd
+        d2Db_dd2 = Db1*d2Delta_dd2 + Db2*dDelta_dd*dDelta_dd
+        dDb_dt = -2.0*theta*Db1
+        d2Db_dt2 = 2.0*Db1 + 4.0*theta*theta*Db2
+        d2Db_dddt = -A*2.0/beta*Db1*dm1*p_theta*dm12_inv - 2.0*theta*Db2*dDelta_dd
+
+        Ar += n*Db*delta*psi
+        dAr_ddelta += n*(Db*(psi + delta*psi_d) + dDb_dd*delta*psi)
+        d2Ar_ddelta2 += n*(Db*(2.0*psi_d + delta*psi_dd) + 2.0*dDb_dd*(psi + delta*psi_d)
+                           + d2Db_dd2*delta*psi)
+        dAr_dtau += n*delta*(dDb_dt*psi + Db*psi_t)
+        d2Ar_dtau2 += n*delta*(d2Db_dt2*psi + 2.0*dDb_dt*psi_t + Db*psi_tt)
+        d2Ar_ddeltadtau += n*(Db*(psi_t + delta*psi_dt) + delta*dDb_dd*psi_t
+                              + dDb_dt*(psi + delta*psi_d) + d2Db_dddt*delta*psi)
+    return Ar, dAr_ddelta, d2Ar_ddelta2, dAr_dtau, d2Ar_dtau2, d2Ar_ddeltadtau
+
+def iapws95_Ar_derivatives(tau, delta):
+    r'''Calculates the residual Helmholtz energy of IAPWS-95 and its first
+    and second derivatives with respect to `tau` and `delta` together,
+    sharing the powers and exponentials of each term between the
+    derivatives.
+
+    Parameters
+    ----------
+    tau : float
+        Dimensionless temperature, (647.096 K/T), [-]
+    delta : float
+        Dimensionless density, (rho/(322 kg/m^3)), [-]
+
+    Returns
+    -------
+    Ar : float
+        Residual Helmholtz energy, [-]
+    dAr_ddelta : float
+        First derivative with respect to `delta`, [-]
+    d2Ar_ddelta2 : float
+        Second derivative with respect to `delta`, [-]
+    dAr_dtau : float
+        First derivative with respect to `tau`, [-]
+    d2Ar_dtau2 : float
+        Second derivative with respect to `tau`, [-]
+    d2Ar_ddeltadtau : float
+        Second derivative with respect to `delta` and `tau`, [-]
+
+    Examples
+    --------
+    Verification point of IAPWS-95 at 500 K and 838.025 kg/m^3:
+
+    >>> iapws95_Ar_derivatives(647.096/500.0, 838.025/322.0)
+    (-3.42693206, -0.36436665, 0.8560637, -5.81403435, -2.23440737, -1.12176915)
+    '''
+    A0, A1, A2, A3, A4, A5 = helmholtz_Ar_derivatives(tau, delta, iapws95_Ar_ns, iapws95_Ar_ds,
+                                                      iapws95_Ar_ts, iapws95_Ar_cs)
+    B0, B1, B2, B3, B4, B5 = helmholtz_Ar_gaussian_derivatives(tau, delta, iapws95_Ar_gaussian_ns,
+                                                               iapws95_Ar_gaussian_ds, iapws95_Ar_gaussian_ts,
+                                                               iapws95_Ar_gaussian_alphas, iapws95_Ar_gaussian_betas,
+                                                               iapws95_Ar_gaussian_gammas, iapws95_Ar_gaussian_epsilons)
+    C0, C1, C2, C3, C4, C5 = iapws95_Ar_nonanalytic_derivatives(tau, delta)
+    return (A0 + B0 + C0, A1 + B1 + C1, A2 + B2 + C2, A3 + B3 + C3, A4 + B4 + C4, A5 + B5 + C5)
+
 class IAPWS95(HelmholtzEOS):
     model_name = 'iapws95'
     _MW = iapws.iapws95_MW
@@ -70,7 +212,7 @@ class IAPWS95(HelmholtzEOS):
     _d2Ar_ddelta2_func = staticmethod(iapws.iapws95_d2Ar_ddelta2)
     _dAr_ddelta_func = staticmethod(iapws.iapws95_dAr_ddelta)
     _Ar_func = staticmethod(iapws.iapws95_Ar)
-
+    _Ar_derivatives_func = staticmethod(iapws95_Ar_derivatives)
 
     def __init__(self, T=None, P=None, zs=None):
         self.T = T
@@ -179,6 +321,735 @@ class IAPWS95Liquid(IAPWS95):
     is_gas = False
     is_liquid = True
 
+IAPWS95_TABLE_T_MIN = 273.16
+'''Lowest temperature covered by :obj:`IAPWS95SplineTable`, the triple
+point of water, [K]'''
+IAPWS95_TABLE_T_MAX = 1073.15
+'''Highest temperature covered by :obj:`IAPWS95SplineTable`, [K]'''
+IAPWS95_TABLE_P_MIN = 611.6547710078968
+'''Lowest pressure covered by :obj:`IAPWS95SplineTable`, the saturation
+pressure at the triple point, [Pa]'''
+IAPWS95_TABLE_P_MAX = 1e8
+'''Highest pressure covered by :obj:`IAPWS95SplineTable`, [Pa]'''
+
+IAPWS95_TABLE_N_P = 100
+IAPWS95_TABLE_N_T = 100
+IAPWS95_TABLE_RTOL = 1e-6
+
+IAPWS95_TABLE_LIQUID = 0
+IAPWS95_TABLE_GAS = 1
+IAPWS95_TABLE_SUPERCRITICAL = 2
+_IAPWS95_TABLE_FORMAT = 2
+
+IAPWS95_TABLE_CHECK_POINTS = ((0.5, 0.5), (0.25, 0.25), (0.25, 0.75), (0.75, 0.25), (0.75, 0.75))
+'''Positions within each cell of :obj:`IAPWS95SplineTable`, as fractions of
+the cell along the pressure and temperature axes, at which the table is
+checked against IAPWS-95 when it is built, [-]'''
+
+IAPWS95_TABLE_SAFETY = 0.5
+'''Fraction of the tolerance of :obj:`IAPWS95SplineTable` that the errors
+found at :obj:`IAPWS95_TABLE_CHECK_POINTS` must be within for a cell to be
+used; the error between the check points can be somewhat larger, [-]'''
+
+_iapws95_spline_tables = {}
+
+def _iapws95_spline_table_path(n_P, n_T, cache_dir):
+    if cache_dir is None:
+        from thermo.base import data_dir as cache_dir
+    if not cache_dir:
+        return None
+    return os.path.join(cache_dir, 'IAPWS95SplineTable_%d_%d_%d.npz' %(_IAPWS95_TABLE_FORMAT, n_P, n_T))
+
+def _load_iapws95_spline_table_data(path):
+    if path is None or not os.path.exists(path):
+        return None
+    try:
+        with np.load(path) as f:
+            return {k: f[k] for k in f.files}
+    except Exception:
+        return None
+
+def iapws95_spline_table(n_P=IAPWS95_TABLE_N_P, n_T=IAPWS95_TABLE_N_T,
+                         rtol=IAPWS95_TABLE_RTOL, cache_dir=None, save=True):
+    r'''Return the :obj:`IAPWS95SplineTable` with the given resolution and
+    error tolerance, building it if it has not been built before. Building
+    evaluates IAPWS-95 at every node and check point of the table, which
+    takes about a minute at the default resolution.
+
+    Tables are kept in memory once created. The node data is also stored in
+    `cache_dir` (unless `save` is False), so later sessions can load it
+    instead of building the table again. This function is the only place a
+    table is built; :obj:`IAPWS95Table` phases only use tables which are
+    already in memory or in the `thermo` user data folder.
+
+    Parameters
+    ----------
+    n_P : int, optional
+        Number of pressure nodes in each region of the table, [-]
+    n_T : int, optional
+        Number of temperature nodes in each region of the table, [-]
+    rtol : float, optional
+        Maximum dimensionless error of a lookup versus IAPWS-95; cells of the
+        table which do not meet it are evaluated with IAPWS-95 instead, [-]
+    cache_dir : str, optional
+        Folder the node data is read from and saved to; defaults to the
+        `thermo` user data folder (if `appdirs` is installed), [-]
+    save : bool, optional
+        Whether to save the node data of a newly built table to `cache_dir`,
+        [-]
+
+    Returns
+    -------
+    table : :obj:`IAPWS95SplineTable`
+        Lookup table, [-]
+    '''
+    key = (n_P, n_T, rtol)
+    table = _iapws95_spline_tables.get(key, None)
+    if table is not None:
+        return table
+    path = _iapws95_spline_table_path(n_P, n_T, cache_dir)
+    data = _load_iapws95_spline_table_data(path)
+    if data is None:
+        data = IAPWS95SplineTable.build_data(n_P, n_T)
+        if save and path is not None:
+            try:
+                np.savez(path, **data)
+            except Exception:
+                pass
+    _iapws95_spline_tables[key] = table = IAPWS95SplineTable(data, rtol)
+    return table
+
+def _loaded_iapws95_spline_table(n_P, n_T, rtol):
+    # Table for the phases; never builds one. Tables not found in the user
+    # data folder are remembered as None until built by iapws95_spline_table
+    key = (n_P, n_T, rtol)
+    try:
+        return _iapws95_spline_tables[key]
+    except KeyError:
+        pass
+    data = _load_iapws95_spline_table_data(_iapws95_spline_table_path(n_P, n_T, None))
+    table = None if data is None else IAPWS95SplineTable(data, rtol)
+    _iapws95_spline_tables[key] = table
+    return table
+
+
+def _iapws95_table_state(ref, T, P, sat=None, derivatives=False):
+    if sat is None:
+        phase = ref.to_TP_zs(T=T, P=P, zs=ref.zs)
+    else:
+        rho_mass = iapws.iapws95_rhol_sat(T) if sat == 'l' else iapws.iapws95_rhog_sat(T)
+        phase = ref.to(T=T, V=rho_to_Vm(rho_mass, ref._MW), zs=ref.zs)
+    values = (log(phase._rho_mass), phase.H(), phase.S())
+    if not derivatives:
+        return values
+    V_inv, Cp = 1.0/phase.V(), phase.Cp()
+    return (values, (-phase.dV_dT()*V_inv, Cp, Cp/T),
+            (-phase.dV_dP()*V_inv, phase.dH_dP(), phase.dS_dP()))
+
+
+class IAPWS95SplineTable(object):
+    r'''Spline-based lookup table for the IAPWS-95 formulation of water,
+    following the ideas of the spline-based table look-up method (SBTL) of
+    [1]_. The (T, P) plane between :obj:`IAPWS95_TABLE_T_MIN` and
+    :obj:`IAPWS95_TABLE_T_MAX` and between :obj:`IAPWS95_TABLE_P_MIN` and
+    :obj:`IAPWS95_TABLE_P_MAX` is split into a subcritical liquid region, a
+    subcritical gas region, and a supercritical region, each bounded by the
+    saturation curve where it applies. In each region the logarithm of
+    density, the molar enthalpy and the molar entropy are stored as bicubic
+    Hermite splines in the coordinates :math:`\ln P` and the fraction of the
+    temperature span of the region at that pressure; the saturation
+    temperature is a cubic Hermite spline in :math:`\ln P`.
+
+    Lookups are available for (T, P), (P, H) and (P, S). The inverse lookups
+    solve the cubic of a single spline cell rather than iterating on
+    IAPWS-95, which makes them two to three orders of magnitude faster.
+
+    Every cell of the table (and every interval of the saturation curve) is
+    compared against IAPWS-95 at :obj:`IAPWS95_TABLE_CHECK_POINTS` (the
+    centre and the quarter points) when the table is built. Cells where the
+    largest of :math:`|\Delta \rho|/\rho`, :math:`|\Delta H|/(RT)`,
+    :math:`|\Delta S|/R` and :math:`|\Delta T_{sat}|/T_{sat}` at those points
+    exceeds :obj:`IAPWS95_TABLE_SAFETY` times `rtol` are marked as unusable, and lookups in them return None so that the
+    caller can fall back to IAPWS-95; in practice these are the cells around
+    the critical point.
+
+    Normally created with :obj:`iapws95_spline_table`, which builds tables
+    and caches them in memory and on disk.
+
+    Parameters
+    ----------
+    data : dict[str, numpy.ndarray]
+        Node data as created by :obj:`IAPWS95SplineTable.build_data`, [-]
+    rtol : float, optional
+        Maximum dimensionless error of a lookup versus IAPWS-95, [-]
+
+    Attributes
+    ----------
+    max_error : float
+        Largest dimensionless error found at the check points of the
+        cells accepted for use, [-]
+    usable_fraction : float
+        Fraction of the cells of the table accepted for use, [-]
+
+    Examples
+    --------
+    >>> table = iapws95_spline_table() # doctest: +SKIP
+    >>> table.TP(300.0, 1e5) # doctest: +SKIP
+    (996.55634040, 2029.48623030, 7.08112508)
+
+    References
+    ----------
+    .. [1] Kunick, M., H.-J. Kretzschmar, F. di Mare, and U. Gampe. "CFD
+       Analysis of Steam Turbines with the IAPWS Standard on the Spline-Based
+       Table Look-Up Method (SBTL) for the Fast Calculation of Real Fluid
+       Properties." In ASME Turbo Expo 2015. ASME, 2015.
+    '''
+    T_min = IAPWS95_TABLE_T_MIN
+    T_max = IAPWS95_TABLE_T_MAX
+    P_min = IAPWS95_TABLE_P_MIN
+    P_max = IAPWS95_TABLE_P_MAX
+    Pc = iapws.iapws95_Pc
+    Tc = iapws.iapws95_Tc
+
+    def __init__(self, data, rtol=IAPWS95_TABLE_RTOL):
+        self.rtol = rtol
+        self.n_P = n_P = int(data['n_P'])
+        self.n_T = n_T = int(data['n_T'])
+        self.x0_sub = log(self.P_min)
+        self.x0_super = log(self.Pc)
+        self.inv_hx_sub = (n_P - 1)/(log(self.Pc) - self.x0_sub)
+        self.inv_hx_super = (n_P - 1)/(log(self.P_max) - self.x0_super)
+
+        self.Tsats = data['Tsats'].tolist()
+        self.dTsats = data['dTsats'].tolist()
+        self.Tsat_ok = (data['Tsat_errs'] <= IAPWS95_TABLE_SAFETY*rtol).tolist()
+
+        self.regions = regions = []
+        max_error, usable = 0.0, 0
+        for r in range(3):
+            nodes = data['nodes_%d' %r]
+            props = []
+            for p in range(3):
+                props.append(tuple(nodes[p, d].ravel().tolist() for d in range(4)))
+            errs = data['errs_%d' %r]
+            if r != IAPWS95_TABLE_SUPERCRITICAL:
+                # A bad saturation temperature spoils the whole row of cells
+                errs = np.maximum(errs, data['Tsat_errs'][:, None])
+            ok = errs <= IAPWS95_TABLE_SAFETY*rtol
+            usable += int(ok.sum())
+            if ok.any():
+                max_error = max(max_error, float(errs[ok].max()))
+            regions.append((props, ok.ravel().tolist()))
+        self.max_error = max_error
+        self.usable_fraction = usable/(3.0*(n_P - 1)*(n_T - 1))
+
+    @staticmethod
+    def build_data(n_P=IAPWS95_TABLE_N_P, n_T=IAPWS95_TABLE_N_T):
+        r'''Evaluate IAPWS-95 at the nodes and check points of a new table.
+        This takes about a minute at the default resolution.
+
+        Parameters
+        ----------
+        n_P : int, optional
+            Number of pressure nodes in each region of the table, [-]
+        n_T : int, optional
+            Number of temperature nodes in each region of the table, [-]
+
+        Returns
+        -------
+        data : dict[str, numpy.ndarray]
+            Node data, derivatives, and validation errors, [-]
+        '''
+        ref = IAPWS95(T=300.0, P=1e5)
+        cls = IAPWS95SplineTable
+        Pc, Tc, T_min, T_max = cls.Pc, cls.Tc, cls.T_min, cls.T_max
+        x_sub = np.linspace(log(cls.P_min), log(Pc), n_P)
+        x_super = np.linspace(log(Pc), log(cls.P_max), n_P)
+        us = np.linspace(0.0, 1.0, n_T)
+        hx_sub, hu = x_sub[1] - x_sub[0], us[1]
+
+        Tsats = np.array([iapws.iapws95_Tsat(exp(x)) for x in x_sub[:-1]] + [Tc])
+        dTsats = np.array([exp(x)/iapws.iapws95_dPsat_dT(T)[0] for x, T in zip(x_sub, Tsats)])*hx_sub
+        data = {'n_P': np.array(n_P), 'n_T': np.array(n_T), 'Tsats': Tsats, 'dTsats': dTsats}
+
+        def T_bounds(r, i):
+            # Temperature span and its derivative with respect to ln P
+            if r == IAPWS95_TABLE_LIQUID:
+                return T_min, Tsats[i], 0.0, dTsats[i]/hx_sub
+            elif r == IAPWS95_TABLE_GAS:
+                return Tsats[i], T_max, dTsats[i]/hx_sub, 0.0
+            return T_min, T_max, 0.0, 0.0
+
+        for r in range(3):
+            xs = x_super if r == IAPWS95_TABLE_SUPERCRITICAL else x_sub
+            hx = xs[1] - xs[0]
+            # Node values and their exact derivatives along both table axes
+            values, dxs, dus = np.zeros((3, 3, n_P, n_T))
+            for i in range(n_P):
+                P = exp(xs[i])
+                T_low, T_high, dT_low, dT_high = T_bounds(r, i)
+                for j in range(n_T):
+                    sat = None
+                    if r == IAPWS95_TABLE_LIQUID and j == n_T - 1:
+                        sat = 'l'
+                    elif r == IAPWS95_TABLE_GAS and j == 0:
+                        sat = 'g'
+                    # The gas region has more nodes close to saturation
+                    if r == IAPWS95_TABLE_GAS:
+                        f, df_du = us[j]*us[j], 2.0*us[j]
+                    else:
+                        f, df_du = us[j], 1.0
+                    T, dT_du = T_low + f*(T_high - T_low), df_du*(T_high - T_low)
+                    v, dT, dP = _iapws95_table_state(ref, T, P, sat, derivatives=True)
+                    dT_dx = dT_low + f*(dT_high - dT_low)
+                    for p in range(3):
+                        values[p, i, j] = v[p]
+                        dxs[p, i, j] = P*dP[p] + dT[p]*dT_dx
+                        dus[p, i, j] = dT[p]*dT_du
+            # The derivatives are infinite at the critical point
+            dxs[~np.isfinite(dxs)] = 0.0
+            dus[~np.isfinite(dus)] = 0.0
+            nodes = np.zeros((3, 4, n_P, n_T))
+            nodes[:, 0] = values
+            nodes[:, 1] = dxs*hx
+            nodes[:, 2] = dus*hu
+            # Local differences for the cross derivative so the critical
+            # point cannot spread through a global spline fit
+            nodes[:, 3] = 0.5*(np.gradient(dus, xs, axis=1, edge_order=2)*hx*hu
+                               + np.gradient(dxs, us, axis=2, edge_order=2)*hx*hu)
+            data['nodes_%d' %r] = nodes
+            data['errs_%d' %r] = np.zeros((n_P - 1, n_T - 1))
+        data['Tsat_errs'] = np.zeros(n_P - 1)
+
+        # Validate against IAPWS-95 at the centre of every interval and cell,
+        # and at the quarter points around it
+        table = cls(data)
+        Tsat_errs = np.zeros(n_P - 1)
+        for i in range(n_P - 1):
+            if i == n_P - 2:
+                # IAPWS-95 saturation solver is not reliable this close to Pc
+                Tsat_errs[i] = float('inf')
+                continue
+            for a in (0.25, 0.5, 0.75):
+                P = exp(x_sub[i] + a*hx_sub)
+                Tsat = iapws.iapws95_Tsat(P)
+                Tsat_errs[i] = max(Tsat_errs[i], abs(table.Tsat(P) - Tsat)/Tsat)
+        data['Tsat_errs'] = Tsat_errs
+
+        for r in range(3):
+            xs = x_super if r == IAPWS95_TABLE_SUPERCRITICAL else x_sub
+            errs = np.zeros((n_P - 1, n_T - 1))
+            for i in range(n_P - 1):
+                for j in range(n_T - 1):
+                    for a, b in IAPWS95_TABLE_CHECK_POINTS:
+                        P = exp(xs[i] + a*(xs[1] - xs[0]))
+                        T, values = table._lookup_Pu(r, P, (j + b)*hu)
+                        try:
+                            exact = _iapws95_table_state(ref, T, P)
+                            err = max(abs(exp(values[0] - exact[0]) - 1.0),
+                                      abs(values[1] - exact[1])/(ref.R*T),
+                                      abs(values[2] - exact[2])/ref.R)
+                        except Exception:
+                            err = float('inf')
+                        if not err <= errs[i, j]:
+                            errs[i, j] = err
+            data['errs_%d' %r] = errs
+        return data
+
+    def _locate(self, P):
+        # Pressure cell index and position within it
+        n_P = self.n_P
+        if P < self.Pc:
+            q = (log(P) - self.x0_sub)*self.inv_hx_sub
+        else:
+            q = (log(P) - self.x0_super)*self.inv_hx_super
+        i = int(q)
+        if i > n_P - 2:
+            i = n_P - 2
+        t = q - i
+        return i, t
+
+    def Tsat(self, P):
+        r'''Look up the saturation temperature of water.
+
+        Parameters
+        ----------
+        P : float
+            Pressure, [Pa]
+
+        Returns
+        -------
+        Tsat : float
+            Saturation temperature, [K]
+        '''
+        i, t = self._locate(P)
+        t2 = t*t
+        t3 = t*t2
+        Tsats, dTsats = self.Tsats, self.dTsats
+        return ((2.0*t3 - 3.0*t2 + 1.0)*Tsats[i] + (t3 - 2.0*t2 + t)*dTsats[i]
+                + (3.0*t2 - 2.0*t3)*Tsats[i+1] + (t3 - t2)*dTsats[i+1])
+
+    def _lookup_Pu(self, region, P, u):
+        # Unchecked evaluation at a fractional position along the temperature
+        # span of a region; used for validation
+        i, t = self._locate(P)
+        if region == IAPWS95_TABLE_SUPERCRITICAL:
+            T_low, T_high = self.T_min, self.T_max
+        elif region == IAPWS95_TABLE_LIQUID:
+            T_low, T_high = self.T_min, self.Tsat(P)
+        else:
+            T_low, T_high = self.Tsat(P), self.T_max
+        q = u*(self.n_T - 1)
+        j = min(int(q), self.n_T - 2)
+        f = u*u if region == IAPWS95_TABLE_GAS else u
+        return T_low + f*(T_high - T_low), self._evaluate(region, i, t, j, q - j, check=False)
+
+    def _evaluate(self, region, i, t, j, s, check=True):
+        n_T = self.n_T
+        props, ok = self.regions[region]
+        if check and not ok[i*(n_T - 1) + j]:
+            return None
+        t2 = t*t
+        t3 = t*t2
+        h00, h10, h01, h11 = 2.0*t3 - 3.0*t2 + 1.0, t3 - 2.0*t2 + t, 3.0*t2 - 2.0*t3, t3 - t2
+        s2 = s*s
+        s3 = s*s2
+        g00, g10, g01, g11 = 2.0*s3 - 3.0*s2 + 1.0, s3 - 2.0*s2 + s, 3.0*s2 - 2.0*s3, s3 - s2
+        k = i*n_T + j
+        k1 = k + n_T
+        values = []
+        for F, FX, FU, FXU in props:
+            a0 = h00*F[k] + h10*FX[k] + h01*F[k1] + h11*FX[k1]
+            a1 = h00*F[k+1] + h10*FX[k+1] + h01*F[k1+1] + h11*FX[k1+1]
+            b0 = h00*FU[k] + h10*FXU[k] + h01*FU[k1] + h11*FXU[k1]
+            b1 = h00*FU[k+1] + h10*FXU[k+1] + h01*FU[k1+1] + h11*FXU[k1+1]
+            values.append(g00*a0 + g10*b0 + g01*a1 + g11*b1)
+        return values
+
+    def TP(self, T, P):
+        r'''Look up the stable state of water at a specified temperature and
+        pressure.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+
+        Returns
+        -------
+        state : tuple[float, float, float] or None
+            Mass density [kg/m^3], molar enthalpy [J/mol] and molar entropy
+            [J/mol/K]; None if the point is outside the table or in a cell
+            which does not meet the tolerance, [-]
+        '''
+        if not (self.P_min <= P <= self.P_max and self.T_min <= T <= self.T_max):
+            return None
+        i, t = self._locate(P)
+        if P >= self.Pc:
+            region, T_low, T_high = IAPWS95_TABLE_SUPERCRITICAL, self.T_min, self.T_max
+        else:
+            if not self.Tsat_ok[i]:
+                return None
+            t2 = t*t
+            t3 = t*t2
+            Tsats, dTsats = self.Tsats, self.dTsats
+            Tsat = ((2.0*t3 - 3.0*t2 + 1.0)*Tsats[i] + (t3 - 2.0*t2 + t)*dTsats[i]
+                    + (3.0*t2 - 2.0*t3)*Tsats[i+1] + (t3 - t2)*dTsats[i+1])
+            if T < Tsat:
+                region, T_low, T_high = IAPWS95_TABLE_LIQUID, self.T_min, Tsat
+            else:
+                region, T_low, T_high = IAPWS95_TABLE_GAS, Tsat, self.T_max
+        u = (T - T_low)/(T_high - T_low)
+        if region == IAPWS95_TABLE_GAS:
+            u = sqrt(u)
+        q = u*(self.n_T - 1)
+        j = int(q)
+        if j > self.n_T - 2:
+            j = self.n_T - 2
+        values = self._evaluate(region, i, t, j, q - j)
+        if values is None:
+            return None
+        return exp(values[0]), values[1], values[2]
+
+    def _flash_P(self, P, spec_val, prop):
+        if not (self.P_min <= P <= self.P_max):
+            return None
+        i, t = self._locate(P)
+        n_T = self.n_T
+        t2 = t*t
+        t3 = t*t2
+        h00, h10, h01, h11 = 2.0*t3 - 3.0*t2 + 1.0, t3 - 2.0*t2 + t, 3.0*t2 - 2.0*t3, t3 - t2
+        k0 = i*n_T
+        k1 = k0 + n_T
+        if P >= self.Pc:
+            region, T_low, T_high = IAPWS95_TABLE_SUPERCRITICAL, self.T_min, self.T_max
+        else:
+            if not self.Tsat_ok[i]:
+                return None
+            Tsats, dTsats = self.Tsats, self.dTsats
+            Tsat = h00*Tsats[i] + h10*dTsats[i] + h01*Tsats[i+1] + h11*dTsats[i+1]
+            # Saturated values are on the edges of the liquid and gas regions
+            F, FX = self.regions[IAPWS95_TABLE_LIQUID][0][prop][0:2]
+            k, kn = k1 - 1, k1 + n_T - 1
+            spec_l = h00*F[k] + h10*FX[k] + h01*F[kn] + h11*FX[kn]
+            F, FX = self.regions[IAPWS95_TABLE_GAS][0][prop][0:2]
+            spec_g = h00*F[k0] + h10*FX[k0] + h01*F[k1] + h11*FX[k1]
+            if spec_val < spec_l:
+                region, T_low, T_high = IAPWS95_TABLE_LIQUID, self.T_min, Tsat
+            elif spec_val > spec_g:
+                region, T_low, T_high = IAPWS95_TABLE_GAS, Tsat, self.T_max
+            else:
+                liquid = self._evaluate(IAPWS95_TABLE_LIQUID, i, t, n_T - 2, 1.0)
+                gas = self._evaluate(IAPWS95_TABLE_GAS, i, t, 0, 0.0)
+                if liquid is None or gas is None:
+                    return None
+                VF = (spec_val - spec_l)/(spec_g - spec_l)
+                return (Tsat, VF, (exp(liquid[0]), liquid[1], liquid[2]),
+                        (exp(gas[0]), gas[1], gas[2]))
+
+        # Bisect on the temperature nodes at this pressure, then solve the
+        # cubic of the bracketing cell
+        F, FX, FU, FXU = self.regions[region][0][prop]
+        lo, hi = 0, n_T - 1
+        if spec_val < h00*F[k0] + h10*FX[k0] + h01*F[k1] + h11*FX[k1]:
+            return None
+        k, kn = k0 + hi, k1 + hi
+        if spec_val > h00*F[k] + h10*FX[k] + h01*F[kn] + h11*FX[kn]:
+            return None
+        while hi - lo > 1:
+            mid = (lo + hi) >> 1
+            k, kn = k0 + mid, k1 + mid
+            if h00*F[k] + h10*FX[k] + h01*F[kn] + h11*FX[kn] > spec_val:
+                hi = mid
+            else:
+                lo = mid
+        j = lo
+        if not self.regions[region][1][i*(n_T - 1) + j]:
+            return None
+        k, kn = k0 + j, k1 + j
+        a0 = h00*F[k] + h10*FX[k] + h01*F[kn] + h11*FX[kn]
+        a1 = h00*F[k+1] + h10*FX[k+1] + h01*F[kn+1] + h11*FX[kn+1]
+        b0 = h00*FU[k] + h10*FXU[k] + h01*FU[kn] + h11*FXU[kn]
+        b1 = h00*FU[k+1] + h10*FXU[k+1] + h01*FU[kn+1] + h11*FXU[kn+1]
+        c0, c1 = a0 - spec_val, b0
+        c2 = 3.0*(a1 - a0) - 2.0*b0 - b1
+        c3 = 2.0*(a0 - a1) + b0 + b1
+        s_low, s_high = 0.0, 1.0
+        s = -c0/(a1 - a0) if a1 != a0 else 0.5
+        for _ in range(50):
+            err = ((c3*s + c2)*s + c1)*s + c0
+            if err == 0.0:
+                break
+            elif err < 0.0:
+                s_low = s
+            else:
+                s_high = s
+            derr = (3.0*c3*s + 2.0*c2)*s + c1
+            s_new = s - err/derr if derr > 0.0 else -1.0
+            if not (s_low <= s_new <= s_high):
+                s_new = 0.5*(s_low + s_high)
+            if abs(s_new - s) < 1e-14:
+                s = s_new
+                break
+            s = s_new
+        values = self._evaluate(region, i, t, j, s, check=False)
+        u = (j + s)/(n_T - 1)
+        if region == IAPWS95_TABLE_GAS:
+            u *= u
+        T = T_low + u*(T_high - T_low)
+        state = (exp(values[0]), values[1], values[2])
+        if region == IAPWS95_TABLE_GAS or (region == IAPWS95_TABLE_SUPERCRITICAL and T > self.Tc):
+            return T, 1.0, None, state
+        return T, 0.0, state, None
+
+    def PH(self, P, H):
+        r'''Look up the stable state of water at a specified pressure and
+        molar enthalpy.
+
+        Parameters
+        ----------
+        P : float
+            Pressure, [Pa]
+        H : float
+            Molar enthalpy, [J/mol]
+
+        Returns
+        -------
+        T : float
+            Temperature, [K]
+        VF : float
+            Molar vapor fraction; supercritical states above the critical
+            temperature count as gas, [-]
+        liquid : tuple[float, float, float] or None
+            Mass density [kg/m^3], molar enthalpy [J/mol] and molar entropy
+            [J/mol/K] of the liquid, if present, [-]
+        gas : tuple[float, float, float] or None
+            Mass density [kg/m^3], molar enthalpy [J/mol] and molar entropy
+            [J/mol/K] of the gas, if present, [-]
+
+        Notes
+        -----
+        None is returned instead if the point is outside the table or in a
+        cell which does not meet the tolerance.
+        '''
+        return self._flash_P(P, H, 1)
+
+    def PS(self, P, S):
+        r'''Look up the stable state of water at a specified pressure and
+        molar entropy. The result is in the same format as
+        :obj:`IAPWS95SplineTable.PH`.
+
+        Parameters
+        ----------
+        P : float
+            Pressure, [Pa]
+        S : float
+            Molar entropy, [J/mol/K]
+
+        Returns
+        -------
+        result : tuple or None
+            (T, VF, liquid, gas) as in :obj:`IAPWS95SplineTable.PH`, [-]
+        '''
+        return self._flash_P(P, S, 2)
+
+
+class IAPWS95Table(IAPWS95):
+    r'''IAPWS-95 phase whose density, enthalpy and entropy at a specified
+    temperature and pressure come from a :obj:`IAPWS95SplineTable` rather
+    than from iteratively solving the Helmholtz equation. The remaining
+    properties are evaluated from IAPWS-95 at the tabulated density. Points
+    which cannot be looked up within the tolerance of the table, and
+    temperature-volume or pressure-volume specifications, use IAPWS-95
+    directly.
+
+    When used in :obj:`FlashPureVLS <thermo.flash.FlashPureVLS>`, P-H and
+    P-S flashes are also answered from the table.
+
+    The table is not built by this phase; it must first be created with
+    :obj:`iapws95_spline_table` (or saved in the `thermo` user data folder
+    by an earlier session). Until then, this phase behaves exactly like
+    :obj:`IAPWS95`.
+
+    Parameters
+    ----------
+    T : float, optional
+        Temperature, [K]
+    P : float, optional
+        Pressure, [Pa]
+    zs : list[float], optional
+        Mole fractions, [-]
+    table_n_P : int, optional
+        Number of pressure nodes in each region of the table, [-]
+    table_n_T : int, optional
+        Number of temperature nodes in each region of the table, [-]
+    table_rtol : float, optional
+        Maximum dimensionless error of a lookup versus IAPWS-95, [-]
+
+    Examples
+    --------
+    >>> table = iapws95_spline_table() # doctest: +SKIP
+    >>> liquid = IAPWS95TableLiquid(T=300, P=1e5, zs=[1]) # doctest: +SKIP
+    '''
+    model_name = 'iapws95_table'
+    model_attributes = ('model_name', 'table_n_P', 'table_n_T', 'table_rtol')
+
+    def __init__(self, T=None, P=None, zs=None, table_n_P=IAPWS95_TABLE_N_P,
+                 table_n_T=IAPWS95_TABLE_N_T, table_rtol=IAPWS95_TABLE_RTOL):
+        self.table_n_P = table_n_P
+        self.table_n_T = table_n_T
+        self.table_rtol = table_rtol
+        if T is None or P is None:
+            # Template phase only, for use with `to`
+            self.T = T
+            self.P = P
+            return
+        table = self.table
+        state = None if table is None else table.TP(T, P)
+        if state is None:
+            IAPWS95.__init__(self, T=T, P=P, zs=zs)
+        else:
+            self._set_table_state(T, P, *state)
+
+    @property
+    def table(self):
+        r'''The :obj:`IAPWS95SplineTable` used by this phase, or None if it
+        has not been built with :obj:`iapws95_spline_table`.'''
+        return _loaded_iapws95_spline_table(self.table_n_P, self.table_n_T, self.table_rtol)
+
+    def _set_table_state(self, T, P, rho_mass, H, S):
+        self.T = T
+        self.P = P
+        self._rho_mass = rho_mass
+        self._V = rho_to_Vm(rho=rho_mass, MW=self._MW)
+        self._H = H
+        self._S = S
+        self.tau = tau = self.Tc/T
+        self.delta = delta = rho_mass*self.rhoc_mass_inv
+        self.A0, self.dA0_dtau, self.d2A0_dtau2, self.d3A0_dtau3 = iapws.iapws95_A0_tau_derivatives(tau, delta)
+
+    def from_table(self, T, P, rho_mass, H, S, zs=None):
+        r'''Create a new phase of the same type and table from a state
+        looked up in the table.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+        rho_mass : float
+            Mass density, [kg/m^3]
+        H : float
+            Molar enthalpy, [J/mol]
+        S : float
+            Molar entropy, [J/mol/K]
+        zs : list[float], optional
+            Mole fractions, [-]
+
+        Returns
+        -------
+        new : :obj:`IAPWS95Table`
+            New phase, [-]
+        '''
+        new = self.__class__.__new__(self.__class__)
+        new.zs = self.zs if zs is None else zs
+        new.table_n_P = self.table_n_P
+        new.table_n_T = self.table_n_T
+        new.table_rtol = self.table_rtol
+        new._set_table_state(T, P, rho_mass, H, S)
+        return new
+
+    def to_TP_zs(self, T, P, zs):
+        table = self.table
+        state = None if table is None else table.TP(T, P)
+        if state is None:
+            new = IAPWS95.to_TP_zs(self, T, P, zs)
+            new.table_n_P = self.table_n_P
+            new.table_n_T = self.table_n_T
+            new.table_rtol = self.table_rtol
+            return new
+        return self.from_table(T, P, state[0], state[1], state[2], zs)
+
+    def to(self, zs, T=None, P=None, V=None):
+        if T is not None and P is not None:
+            return self.to_TP_zs(T, P, zs)
+        new = IAPWS95.to(self, zs, T=T, P=P, V=V)
+        new.table_n_P = self.table_n_P
+        new.table_n_T = self.table_n_T
+        new.table_rtol = self.table_rtol
+        return new
+
+
+class IAPWS95TableGas(IAPWS95Table, IAPWS95Gas):
+    pass
+
+class IAPWS95TableLiquid(IAPWS95Table, IAPWS95Liquid):
+    pass
+
+
 class IAPWS97(Phase):
     model_name = 'iapws97'
     model_attributes = ('model_name',)
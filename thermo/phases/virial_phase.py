@@ -23,19 +23,71 @@ SOFTWARE.
 '''
 __all__ = ['VirialCorrelationsPitzerCurl', 'VirialGas']
 
-from fluids.numerics import newton
-from chemicals.utils import log 
+from fluids.numerics import newton, numpy as np
+from chemicals.utils import log
 from thermo.heat_capacity import HeatCapacityGas
 from .phase import Phase
 
 from chemicals.virial import BVirial_Pitzer_Curl, Z_from_virial_density_form
+
+VIRIAL_COEFFICIENTS_CACHE_SIZE = 32
+'''Maximum number of (parameter set, temperature) entries kept in the cache of
+virial coefficient matrices shared by all :obj:`VirialCorrelationsPitzerCurl`
+instances; set to 0 to disable.'''
+
+_virial_coefficients_cache = {}
+
+
 class VirialCorrelationsPitzerCurl(object):
+    '''Pure component second virial coefficients from the Pitzer-Curl
+    correlation; cross coefficients and third virial coefficients are zero.
+
+    The coefficient matrices and their temperature derivatives depend only on
+    temperature, so they are calculated once per temperature and kept in a
+    cache shared by every instance with the same parameters, up to
+    `VIRIAL_COEFFICIENTS_CACHE_SIZE` temperatures. Phases created from each
+    other with :obj:`VirialGas.to` at the same temperature - the usual case
+    inside a flash - therefore do not recalculate them. The returned arrays
+    are shared, and so are read-only.
+
+    Parameters
+    ----------
+    Tcs : list[float]
+        Critical temperatures of all compounds, [K]
+    Pcs : list[float]
+        Critical pressures of all compounds, [Pa]
+    omegas : list[float]
+        Acentric factor of all compounds, [-]
+    '''
 
     def __init__(self, Tcs, Pcs, omegas):
         self.Tcs = Tcs
         self.Pcs = Pcs
         self.omegas = omegas
         self.N = len(Tcs)
+        self._cache_hash = hash((self.__class__.__name__, tuple(Tcs),
+                                 tuple(Pcs), tuple(omegas)))
+
+    def _cached(self, name, T, calc):
+        # Look up a temperature-only term in the shared cache, calculating and
+        # storing it if missing; the oldest temperature is evicted when full
+        key = (self._cache_hash, T)
+        try:
+            return _virial_coefficients_cache[key][name]
+        except KeyError:
+            pass
+        value = calc(T)
+        # Shared between phases; make any modification an error
+        for arr in (value if type(value) is tuple else (value,)):
+            arr.flags.writeable = False
+        if VIRIAL_COEFFICIENTS_CACHE_SIZE:
+            try:
+                _virial_coefficients_cache[key][name] = value
+            except KeyError:
+                if len(_virial_coefficients_cache) >= VIRIAL_COEFFICIENTS_CACHE_SIZE:
+                    del _virial_coefficients_cache[next(iter(_virial_coefficients_cache))]
+                _virial_coefficients_cache[key] = {name: value}
+        return value
 
     def C_pures(self, T):
         return [0.0]*self.N
@@ -67,6 +119,22 @@ class VirialCorrelationsPitzerCurl(object):
         Cijj = [[0.0]*N for i in range(N)]
         return Ciij, Cijj
 
+    def C_terms(self, T):
+        r'''Return the pure, `Ciij` and `Cijj` third virial coefficients as
+        arrays, from the cache when available.'''
+        return self._cached('C_terms', T, lambda T: tuple(
+            np.array(v) for v in (self.C_pures(T),) + tuple(self.C_interactions(T))))
+
+    def dC_dT_terms(self, T):
+        r'''Return the first temperature derivatives of :obj:`C_terms`.'''
+        return self._cached('dC_dT_terms', T, lambda T: tuple(
+            np.array(v) for v in (self.dC_dT_pures(T),) + tuple(self.dC_dT_interactions(T))))
+
+    def d2C_dT2_terms(self, T):
+        r'''Return the second temperature derivatives of :obj:`C_terms`.'''
+        return self._cached('d2C_dT2_terms', T, lambda T: tuple(
+            np.array(v) for v in (self.d2C_dT2_pures(T),) + tuple(self.d2C_dT2_interactions(T))))
+
     def B_pures(self, T):
         Tcs, Pcs, omegas = self.Tcs, self.Pcs, self.omegas
         return [BVirial_Pitzer_Curl(T, Tcs[i], Pcs[i], omegas[i]) for i in range(self.N)]
@@ -75,6 +143,10 @@ class VirialCorrelationsPitzerCurl(object):
         Tcs, Pcs, omegas = self.Tcs, self.Pcs, self.omegas
         return [BVirial_Pitzer_Curl(T, Tcs[i], Pcs[i], omegas[i], 1) for i in range(self.N)]
 
+    def d2B_dT2_pures(self, T):
+        Tcs, Pcs, omegas = self.Tcs, self.Pcs, self.omegas
+        return [BVirial_Pitzer_Curl(T, Tcs[i], Pcs[i], omegas[i], 2) for i in range(self.N)]
+
     def B_interactions(self, T):
         N = self.N
         return [[0.0]*N for i in range(N)]
@@ -83,55 +155,32 @@ class VirialCorrelationsPitzerCurl(object):
         N = self.N
         return [[0.0]*N for i in range(N)]
 
-    def B_matrix(self, T):
-        N = self.N
-        B_mat = [[0.0]*N for i in range(N)]
-        pures = self.B_pures(T)
-        B_interactions = self.B_interactions(T)
-        for i in range(N):
-            B_mat[i][i] = pures[i]
-        for i in range(N):
-            for j in range(i):
-                B_mat[i][j] = B_interactions[i][j]
-                B_mat[j][i] = B_interactions[j][i]
-
-        return B_mat
-
-    def dB_dT_matrix(self, T):
+    def d2B_dT2_interactions(self, T):
         N = self.N
-        B_mat = [[0.0]*N for i in range(N)]
-        pures = self.dB_dT_pures(T)
-        B_interactions = self.dB_dT_interactions(T)
-        for i in range(N):
-            B_mat[i][i] = pures[i]
-        for i in range(N):
-            for j in range(i):
-                B_mat[i][j] = B_interactions[i][j]
-                B_mat[j][i] = B_interactions[j][i]
+        return [[0.0]*N for i in range(N)]
 
+    @staticmethod
+    def _fill_matrix(pures, interactions):
+        # Pure coefficients on the diagonal, cross coefficients elsewhere
+        B_mat = np.array(interactions, dtype=float)
+        np.fill_diagonal(B_mat, pures)
         return B_mat
 
+    def B_matrix(self, T):
+        r'''Return the matrix of second virial coefficients, with the pure
+        component values on the diagonal, from the cache when available.'''
+        return self._cached('B_matrix', T, lambda T: self._fill_matrix(
+            self.B_pures(T), self.B_interactions(T)))
 
-    def d2B_dT2_pures(self, T):
-        Tcs, Pcs, omegas = self.Tcs, self.Pcs, self.omegas
-        return [BVirial_Pitzer_Curl(T, Tcs[i], Pcs[i], omegas[i], 2) for i in range(self.N)]
-    def d2B_dT2_interactions(self, T):
-        N = self.N
-        return [[0.0]*N for i in range(N)]
+    def dB_dT_matrix(self, T):
+        r'''Return the first temperature derivative of :obj:`B_matrix`.'''
+        return self._cached('dB_dT_matrix', T, lambda T: self._fill_matrix(
+            self.dB_dT_pures(T), self.dB_dT_interactions(T)))
 
     def d2B_dT2_matrix(self, T):
-        N = self.N
-        B_mat = [[0.0]*N for i in range(N)]
-        pures = self.d2B_dT2_pures(T)
-        B_interactions = self.d2B_dT2_interactions(T)
-        for i in range(N):
-            B_mat[i][i] = pures[i]
-        for i in range(N):
-            for j in range(i):
-                B_mat[i][j] = B_interactions[i][j]
-                B_mat[j][i] = B_interactions[j][i]
-
-        return B_mat
+        r'''Return the second temperature derivative of :obj:`B_matrix`.'''
+        return self._cached('d2B_dT2_matrix', T, lambda T: self._fill_matrix(
+            self.d2B_dT2_pures(T), self.d2B_dT2_interactions(T)))
 
 
 class VirialGas(Phase):
@@ -142,6 +191,7 @@ class VirialGas(Phase):
     ideal_gas_basis = True
     pure_references = ('HeatCapacityGases',)
     pure_reference_types = (HeatCapacityGas, )
+    model_attributes = ('Hfs', 'Gfs', 'Sfs', 'model') + pure_references
 
     def __init__(self, model, HeatCapacityGases=None, Hfs=None, Gfs=None, 
                  T=None, P=None, zs=None):
@@ -269,10 +319,10 @@ class VirialGas(Phase):
         r'''
 
         .. math::
-           H_{dep} = \frac{R T^{2} \left(2 V \frac{d}{d T} B{\left(T \right)}
-           + \frac{d}{d T} C{\left(T \right)}\right)}{2 V^{2}} - R T \left(-1
-            + \frac{V^{2} + V B{\left(T \right)} + C{\left(T \right)}}{V^{2}}
-            \right)
+           H_{dep} = R T \left(-1 + \frac{V^{2} + V B{\left(T \right)}
+           + C{\left(T \right)}}{V^{2}}\right) - \frac{R T^{2} \left(2 V
+           \frac{d}{d T} B{\left(T \right)} + \frac{d}{d T} C{\left(T \right)}
+           \right)}{2 V^{2}}
 
         '''
         '''
@@ -284,8 +334,8 @@ class VirialGas(Phase):
         Z = P_sln*V/(R*T)
 
         # Two ways to compute H_dep
-        Hdep2 = R*T - P_sln*V + integrate(P_sln - T*diff(P_sln, T), (V, oo, V))
-        Hdep = -R*T*(Z-1) -integrate(diff(Z, T)/V, (V, oo, V))*R*T**2
+        Hdep2 = P_sln*V - R*T + integrate(P_sln - T*diff(P_sln, T), (V, oo, V))
+        Hdep = R*T*(Z-1) - integrate(diff(Z, T)/V, (V, oo, V))*R*T**2
         '''
         try:
             return self._H_dep
@@ -295,18 +345,19 @@ class VirialGas(Phase):
         T, V = self.T, self._V
         V2 = V*V
         RT = self.R*T
-        self._H_dep = H_dep = RT*(T*(2.0*V*self.dB_dT() + self.dC_dT())/(2.0*V2)
-               - (-1.0 + (V2 + V*self.B() + self.C())/V2))
+        self._H_dep = H_dep = RT*((-1.0 + (V2 + V*self.B() + self.C())/V2)
+               - T*(2.0*V*self.dB_dT() + self.dC_dT())/(2.0*V2))
         return H_dep
 
     def dH_dep_dT(self):
         r'''
 
         .. math::
-           \frac{\partial H_{dep}}{\partial T} = \frac{R \left(2 T^{2} V
-           \frac{d^{2}}{d T^{2}} B{\left(T \right)} + T^{2} \frac{d^{2}}{d T^{2}}
-           C{\left(T \right)} + 2 T V \frac{d}{d T} B{\left(T \right)}
-           - 2 V B{\left(T \right)} - 2 C{\left(T \right)}\right)}{2 V^{2}}
+           \left(\frac{\partial H_{dep}}{\partial T}\right)_V = -\frac{R
+           \left(2 T^{2} V \frac{d^{2}}{d T^{2}} B{\left(T \right)} + T^{2}
+           \frac{d^{2}}{d T^{2}} C{\left(T \right)} + 2 T V \frac{d}{d T}
+           B{\left(T \right)} - 2 V B{\left(T \right)} - 2 C{\left(T \right)}
+           \right)}{2 V^{2}}
 
         '''
         try:
@@ -314,7 +365,7 @@ class VirialGas(Phase):
         except:
             pass
         T, V = self.T, self._V
-        self._dH_dep_dT = dH_dep_dT = (self.R*(2.0*T*T*V*self.d2B_dT2() + T*T*self.d2C_dT2()
+        self._dH_dep_dT = dH_dep_dT = -(self.R*(2.0*T*T*V*self.d2B_dT2() + T*T*self.d2C_dT2()
             + 2.0*T*V*self.dB_dT() - 2.0*V*self.B() - 2.0*self.C())/(2.0*V*V))
         return dH_dep_dT
 
@@ -429,26 +480,20 @@ class VirialGas(Phase):
 
         return new
 
+    def _zs_array(self):
+        try:
+            return self._zs_arr
+        except AttributeError:
+            pass
+        self._zs_arr = zs = np.array(self.zs, dtype=float)
+        return zs
+
     def B(self):
         try:
             return self._B
         except:
             pass
-        N = self.N
-        T = self.T
-        if N == 1:
-            return self.model.B_pures(T)[0]
-        zs = self.zs
-        B_matrix = self.model.B_matrix(T)
-        B = 0.0
-        for i in range(N):
-            B_tmp = 0.0
-            row = B_matrix[i]
-            for j in range(N):
-                B += zs[j]*row[j]
-            B += zs[i]*B_tmp
-
-        self._B = B
+        self._B = B = _virial_B_mix(self._zs_array(), self.model.B_matrix(self.T))
         return B
 
     def dB_dT(self):
@@ -456,21 +501,7 @@ class VirialGas(Phase):
             return self._dB_dT
         except:
             pass
-        N = self.N
-        T = self.T
-        if N == 1:
-            return self.model.dB_dT_pures(T)[0]
-        zs = self.zs
-        dB_dT_matrix = self.model.dB_dT_matrix(T)
-        dB_dT = 0.0
-        for i in range(N):
-            dB_dT_tmp = 0.0
-            row = dB_dT_matrix[i]
-            for j in range(N):
-                dB_dT += zs[j]*row[j]
-            dB_dT += zs[i]*dB_dT_tmp
-
-        self._dB_dT = dB_dT
+        self._dB_dT = dB_dT = _virial_B_mix(self._zs_array(), self.model.dB_dT_matrix(self.T))
         return dB_dT
 
     def d2B_dT2(self):
@@ -478,21 +509,7 @@ class VirialGas(Phase):
             return self._d2B_dT2
         except:
             pass
-        N = self.N
-        T = self.T
-        if N == 1:
-            return self.model.d2B_dT2_pures(T)[0]
-        zs = self.zs
-        d2B_dT2_matrix = self.model.d2B_dT2_matrix(T)
-        d2B_dT2 = 0.0
-        for i in range(N):
-            d2B_dT2_tmp = 0.0
-            row = d2B_dT2_matrix[i]
-            for j in range(N):
-                d2B_dT2 += zs[j]*row[j]
-            d2B_dT2 += zs[i]*d2B_dT2_tmp
-
-        self._d2B_dT2 = d2B_dT2
+        self._d2B_dT2 = d2B_dT2 = _virial_B_mix(self._zs_array(), self.model.d2B_dT2_matrix(self.T))
         return d2B_dT2
 
     def C(self):
@@ -500,24 +517,7 @@ class VirialGas(Phase):
             return self._C
         except:
             pass
-        T = self.T
-        zs = self.zs
-        C_pures = self.model.C_pures(T)
-        Ciij, Cijj = self.model.C_interactions(T)
-        C = 0.0
-        N = self.N
-        for i in range(N):
-            for j in range(N):
-                # poling 5-4.3b should be able to be used to take out the k loop?
-                for k in range(N):
-                    if i == j == k:
-                        Cval = C_pures[i]
-                    elif i == j:
-                        Cval = Ciij[i][j]
-                    else:
-                        Cval = Cijj[i][j]
-                    C += zs[i]*zs[j]*zs[k]*Cval
-        self._C = C
+        self._C = C = _virial_C_mix(self._zs_array(), *self.model.C_terms(self.T))
         return C
 
     def dC_dT(self):
@@ -525,24 +525,7 @@ class VirialGas(Phase):
             return self._dC_dT
         except:
             pass
-        T = self.T
-        zs = self.zs
-        dC_dT_pures = self.model.dC_dT_pures(T)
-        dC_dTiij, dC_dTijj = self.model.dC_dT_interactions(T)
-        dC_dT = 0.0
-        N = self.N
-        for i in range(N):
-            for j in range(N):
-                # poling 5-4.3b should be able to be used to take out the k loop?
-                for k in range(N):
-                    if i == j == k:
-                        dC_dTval = dC_dT_pures[i]
-                    elif i == j:
-                        dC_dTval = dC_dTiij[i][j]
-                    else:
-                        dC_dTval = dC_dTijj[i][j]
-                    dC_dT += zs[i]*zs[j]*zs[k]*dC_dTval
-        self._dC_dT = dC_dT
+        self._dC_dT = dC_dT = _virial_C_mix(self._zs_array(), *self.model.dC_dT_terms(self.T))
         return dC_dT
 
     def d2C_dT2(self):
@@ -550,22 +533,100 @@ class VirialGas(Phase):
             return self._d2C_dT2
         except:
             pass
-        T = self.T
-        zs = self.zs
-        d2C_dT2_pures = self.model.d2C_dT2_pures(T)
-        d2C_dT2iij, d2C_dT2ijj = self.model.d2C_dT2_interactions(T)
-        d2C_dT2 = 0.0
-        N = self.N
-        for i in range(N):
-            for j in range(N):
-                # poling 5-4.3b should be able to be used to take out the k loop?
-                for k in range(N):
-                    if i == j == k:
-                        d2C_dT2val = d2C_dT2_pures[i]
-                    elif i == j:
-                        d2C_dT2val = d2C_dT2iij[i][j]
-                    else:
-                        d2C_dT2val = d2C_dT2ijj[i][j]
-                    d2C_dT2 += zs[i]*zs[j]*zs[k]*d2C_dT2val
-        self._d2C_dT2 = d2C_dT2
+        self._d2C_dT2 = d2C_dT2 = _virial_C_mix(self._zs_array(), *self.model.d2C_dT2_terms(self.T))
         return d2C_dT2
+
+    def lnphis(self):
+        r'''Method to calculate and return the log of fugacity coefficients of
+        each component in the phase, from the density form of the virial
+        equation truncated after the third coefficient.
+
+        .. math::
+            \ln \phi_i = \frac{1}{V}\frac{1}{n}\frac{\partial (n^2 B)}
+            {\partial n_i} + \frac{1}{2V^2}\frac{1}{n^2}
+            \frac{\partial (n^3 C)}{\partial n_i} - \ln Z
+
+        The mole number derivatives are found from :obj:`dB_dzs` and
+        :obj:`dC_dzs`, so phases which provide their own `B` and `C` only
+        need to provide those as well.
+
+        Returns
+        -------
+        lnphis : list[float]
+            Log fugacity coefficients, [-]
+        '''
+        try:
+            return self._lnphis
+        except AttributeError:
+            pass
+        T, V, zs = self.T, self._V, self.zs
+        B, C = self.B(), self.C()
+        dB_dzs, dC_dzs = self.dB_dzs(), self.dC_dzs()
+        # Mole number derivatives from the mole fraction ones, which may be
+        # taken with the other mole fractions held constant
+        z_dB_dzs = z_dC_dzs = 0.0
+        for i in range(self.N):
+            z_dB_dzs += zs[i]*dB_dzs[i]
+            z_dC_dzs += zs[i]*dC_dzs[i]
+        lnZ = log(self.P*V/(self.R*T))
+        x0 = (2.0*B - z_dB_dzs)/V + 0.5*(3.0*C - z_dC_dzs)/(V*V) - lnZ
+        x1 = 1.0/V
+        x2 = 0.5*x1*x1
+        self._lnphis = lnphis = [x0 + x1*dB_dzs[i] + x2*dC_dzs[i] for i in range(self.N)]
+        return lnphis
+
+    def dB_dzs(self):
+        r'''Method to calculate and return the mole fraction derivatives of
+        the second virial coefficient of the phase.
+
+        Returns
+        -------
+        dB_dzs : list[float]
+            Mole fraction derivatives of `B`, [m^3/mol]
+        '''
+        try:
+            return self._dB_dzs
+        except AttributeError:
+            pass
+        self._dB_dzs = dB_dzs = self.model.B_matrix(self.T).sum(axis=0).tolist()
+        return dB_dzs
+
+    def dC_dzs(self):
+        r'''Method to calculate and return the mole fraction derivatives of
+        the third virial coefficient of the phase.
+
+        Returns
+        -------
+        dC_dzs : list[float]
+            Mole fraction derivatives of `C`, [m^6/mol^2]
+        '''
+        try:
+            return self._dC_dzs
+        except AttributeError:
+            pass
+        self._dC_dzs = dC_dzs = _virial_dC_mix_dzs(self._zs_array(), *self.model.C_terms(self.T)).tolist()
+        return dC_dzs
+
+
+def _virial_B_mix(zs, B_mat):
+    # Equal to the sum over i and j of zs[j]*B_mat[i][j]
+    return float(np.dot(B_mat.sum(axis=0), zs))
+
+def _virial_C_mix(zs, pures, Ciij, Cijj):
+    # Equal to the sum over i, j and k of zs[i]*zs[j]*zs[k] times the pure
+    # value when i == j == k, Ciij[i][i] when only i == j and Cijj[i][j]
+    # otherwise
+    z_sum = zs.sum()
+    zs2 = zs*zs
+    return float(np.dot(zs2*zs, pures) + np.dot(zs2*(z_sum - zs), np.diag(Ciij))
+                 + z_sum*(np.dot(zs, np.dot(Cijj, zs)) - np.dot(zs2, np.diag(Cijj))))
+
+def _virial_dC_mix_dzs(zs, pures, Ciij, Cijj):
+    # Mole fraction derivatives of the mixing rule in `_virial_C_mix`, which
+    # is homogeneous of degree 3 in them and so equal to its mole number ones
+    z_sum = zs.sum()
+    zs2 = zs*zs
+    Ciis, Cjjs = np.diag(Ciij), np.diag(Cijj)
+    return (3.0*zs2*pures + 2.0*zs*Ciis*(z_sum - zs) - zs2*Ciis + np.dot(zs2, Ciis)
+            + np.dot(zs, np.dot(Cijj, zs)) - np.dot(zs2, Cjjs)
+            + z_sum*(np.dot(Cijj + Cijj.T, zs) - 2.0*zs*Cjjs))
@@ -142,6 +142,56 @@ def regular_solution_gammas(T, xs, Vs, SPs, lambda_coeffs, N,
         gammas[i] = exp(gammas[i])
     return gammas
 
+def regular_solution_gammas_many(T, xs_matrix, Vs, SPs, lambda_coeffs, N,
+                                 gammas_many=None):
+    M = len(xs_matrix)
+    if gammas_many is None:
+        gammas_many = [[0.0]*N for _ in range(M)] # numba: delete
+#        gammas_many = zeros((M, N)) # numba: uncomment
+
+    xsVs = [0.0]*N
+    Hi_sums = [0.0]*N
+    dGE_dxs = [0.0]*N
+    for m in range(M):
+        regular_solution_gammas(T, xs_matrix[m], Vs, SPs, lambda_coeffs, N,
+                                xsVs, Hi_sums, dGE_dxs, gammas_many[m])
+    return gammas_many
+
+def regular_solution_GE_many(xs_matrix, Vs, SPs, lambda_coeffs, N, GE_many=None):
+    M = len(xs_matrix)
+    if GE_many is None:
+        GE_many = [0.0]*M
+
+    xsVs = [0.0]*N
+    for m in range(M):
+        xs = xs_matrix[m]
+        xsVs_sum = 0.0
+        for i in range(N):
+            xsVs[i] = xs[i]*Vs[i]
+            xsVs_sum += xsVs[i]
+        GE_many[m] = regular_solution_GE(SPs, xsVs, lambda_coeffs, N, 1.0/xsVs_sum)
+    return GE_many
+
+def regular_solution_dGE_dxs_many(xs_matrix, Vs, SPs, lambda_coeffs, N, dGE_dxs_many=None):
+    M = len(xs_matrix)
+    if dGE_dxs_many is None:
+        dGE_dxs_many = [[0.0]*N for _ in range(M)] # numba: delete
+#        dGE_dxs_many = zeros((M, N)) # numba: uncomment
+
+    xsVs = [0.0]*N
+    Hi_sums = [0.0]*N
+    for m in range(M):
+        xs = xs_matrix[m]
+        xsVs_sum = 0.0
+        for i in range(N):
+            xsVs[i] = xs[i]*Vs[i]
+            xsVs_sum += xsVs[i]
+        xsVs_sum_inv = 1.0/xsVs_sum
+        GE = regular_solution_GE(SPs, xsVs, lambda_coeffs, N, xsVs_sum_inv)
+        regular_solution_Hi_sums(SPs, Vs, xsVs, lambda_coeffs, N, Hi_sums)
+        regular_solution_dGE_dxs(Vs, Hi_sums, N, xsVs_sum_inv, GE, dGE_dxs_many[m])
+    return dGE_dxs_many
+
 
 def regular_solution_d2GE_dxixjs(Vs, SPs, Hi_sums, dGE_dxs, N, GE, coeffs, xsVs_sum_inv, d2GE_dxixjs=None):
     if d2GE_dxixjs is None:
@@ -515,6 +565,22 @@ class RegularSolution(GibbsExcess):
         self._Hi_sums = Hi_sums
         return Hi_sums
 
+    def gammas_many(self, T, xs_matrix):
+        # The model has no temperature dependent terms, so no object is needed
+        # at `T` at all
+        return regular_solution_gammas_many(T, xs_matrix, self.Vs, self.SPs, self.lambda_coeffs,
+                                            self.N, self._zeros_many(len(xs_matrix)))
+
+    def GE_many(self, T, xs_matrix):
+        M = len(xs_matrix)
+        GE_many = [0.0]*M if self.scalar else zeros(M)
+        return regular_solution_GE_many(xs_matrix, self.Vs, self.SPs, self.lambda_coeffs,
+                                        self.N, GE_many)
+
+    def dGE_dxs_many(self, T, xs_matrix):
+        return regular_solution_dGE_dxs_many(xs_matrix, self.Vs, self.SPs, self.lambda_coeffs,
+                                             self.N, self._zeros_many(len(xs_matrix)))
+
     def d2GE_dxixjs(self):
         r'''Calculate and return the second mole fraction derivatives of excess
         Gibbs energy of a liquid phase using the regular solution model.
@@ -22,7 +22,8 @@ SOFTWARE.'''
 
 from __future__ import division
 
-__all__ = ['Stream', 'EnergyTypes', 'EnergyStream', 'StreamArgs', 'EquilibriumStream', 'mole_balance', 'energy_balance']
+__all__ = ['Stream', 'EnergyTypes', 'EnergyStream', 'StreamArgs', 'EquilibriumStream', 'mole_balance', 'energy_balance',
+           'flowsheet_balance']
 
 #import enum
 try:
@@ -31,6 +32,7 @@ except:
     pass
 
 from fluids.constants import R
+from fluids.numerics import numpy as np
 from chemicals.utils import property_molar_to_mass, property_mass_to_molar, solve_flow_composition_mix
 from chemicals.exceptions import OverspeficiedError
 from chemicals.volume import ideal_gas
@@ -498,14 +500,8 @@ class StreamArgs(object):
             if zs is not None:
                 Q_TP = self.Q_TP
                 if Q_TP is not None:
-                    if len(Q_TP) == 2 or (len(Q_TP) == 3 and not Q_TP[-1]):
-                        # Calculate the volume via the property package
-                        expensive_flash = self.pkg.flash(zs=zs, T=Q_TP[0], P=Q_TP[1])
-                        V = expensive_flash.V()
-                    if Q_TP[-1] == 'l':
-                        V = self.pkg.liquids[0].to(T=Q_TP[0], P=Q_TP[1], zs=zs).V()
-                    elif Q_TP[-1] == 'g':
-                        V = self.pkg.gas.to(T=Q_TP[0], P=Q_TP[1], zs=zs).V()
+                    # Calculate the volume via the property package
+                    V = self.pkg.V_reference(zs, Q_TP[0], Q_TP[1], Q_TP[2] if len(Q_TP) == 3 else None)
                 else:
                     mixture = self.mixture
                     if mixture is not None:
@@ -1034,7 +1030,9 @@ class StreamArgs(object):
                      Vf_TP=self.Vf_TP, Q_TP=self.Q_TP, energy=self.energy,
                      pkg=self.property_package)
 
-    def flash_state(self, hot_start=None):
+    def _flash_state_specs(self):
+        # State and composition to flash at, as (T, P, H, S, VF, zs), or None
+        # if the stream is not yet specified well enough to be flashed
         if self.composition_specified and self.state_specified:
             s = self.specifications
             # Flash call only takes `zs`
@@ -1073,16 +1071,18 @@ class StreamArgs(object):
                     if MW is not None:
                         S = property_mass_to_molar(S_mass, MW)
                         spec_count += 1
+            return (T, P, H, S, VF, tuple(zs))
 
-
-            state_cache = (T, P, H, S, VF, tuple(zs))
+    def flash_state(self, hot_start=None):
+        state_cache = self._flash_state_specs()
+        if state_cache is not None:
             if state_cache == self._state_cache:
                 try:
                     return self._mixture
                 except:
                     pass
-
-            m = self.property_package.flash(T=T, P=P, zs=zs, H=H, S=S, VF=VF, hot_start=hot_start)
+            T, P, H, S, VF, zs = state_cache
+            m = self.property_package.flash(T=T, P=P, zs=list(zs), H=H, S=S, VF=VF, hot_start=hot_start)
             self._mixture = m
             self._state_cache = state_cache
             return m
@@ -1763,8 +1763,7 @@ class EquilibriumStream(EquilibriumState):
             if Vfls is None:
                 Vfls = normalize(Qls)
             if Vf_TP is not None and Vf_TP != (None, None):
-                VolumeObjects = flasher.properties.VolumeLiquids
-                Vms_TP = [i(T_vf, P_vf) for i in VolumeObjects]
+                Vms_TP = flasher.Vms_liquid_reference(Vf_TP[0], Vf_TP[1])
             else:
                 Vms_TP = constants.Vml_STPs
             zs = Vfs_to_zs(Vfls, Vms_TP)
@@ -1818,14 +1817,9 @@ class EquilibriumStream(EquilibriumState):
         elif Q is not None:
             try:
                 if Q_TP is not None:
-                    if len(Q_TP) == 2 or (len(Q_TP) == 3 and not Q_TP[-1]):
-                        # Calculate the volume via the property package
-                        expensive_flash = flasher.flash(zs=zs, T=Q_TP[0], P=Q_TP[1])
-                        V = expensive_flash.V()
-                    if Q_TP[-1] == 'l':
-                        V = flasher.liquids[0].to(T=Q_TP[0], P=Q_TP[1], zs=zs).V()
-                    elif Q_TP[-1] == 'g':
-                        V = flasher.gas.to(T=Q_TP[0], P=Q_TP[1], zs=zs).V()
+                    # Calculate the volume via the property package; cached
+                    # for repeated compositions and reference conditions
+                    V = flasher.V_reference(zs, Q_TP[0], Q_TP[1], Q_TP[2] if len(Q_TP) == 3 else None)
                 else:
                     V = self.V()
                 n = Q/V
@@ -2277,4 +2271,250 @@ def energy_balance(inlets, outlets):
                 set_energy -= v
         inlets[in_unknown_idx].energy = set_energy
         return True
-    return False
\ No newline at end of file
+    return False
+
+def _solve_balance_system(rows, cols, values, rhs, unknown_count, what):
+    # Solve the sparse system of linear balances for the unknowns; the
+    # balances must determine all of them, consistently
+    import warnings
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.linalg import spsolve, MatrixRankWarning
+    equation_count = len(rhs)
+    if equation_count < unknown_count:
+        raise ValueError("The %s balances are underspecified: %d unknowns with "
+                         "only %d equations" %(what, unknown_count, equation_count))
+    A = csr_matrix((values, (rows, cols)), shape=(equation_count, unknown_count))
+    b = np.array(rhs)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', MatrixRankWarning)
+        try:
+            if equation_count == unknown_count:
+                x = spsolve(A.tocsc(), b)
+            else:
+                # Redundant balances; they must still agree with each other
+                AT = A.T.tocsc()
+                x = spsolve(AT.dot(A).tocsc(), AT.dot(b))
+        except MatrixRankWarning:
+            raise ValueError("The %s balances do not determine every unknown flow" %(what))
+    x = np.atleast_1d(x)
+    scale = np.abs(b).max() if equation_count else 0.0
+    if not np.all(np.isfinite(x)) or np.abs(A.dot(x) - b).max() > 1e-9*(scale + 1.0):
+        raise ValueError("The %s balances are inconsistent or do not determine "
+                         "every unknown flow" %(what))
+    return x.tolist()
+
+
+def _flash_streams(streams):
+    # Flash all streams whose state is specified but not yet flashed, with one
+    # flash per distinct property package and state; a stream's previous
+    # flash, if any, is used as the initial guess
+    flashed = {}
+    for f in streams:
+        if not isinstance(f, StreamArgs) or not f.equilibrium_pkg:
+            continue
+        state = f._flash_state_specs()
+        if state is None or state == f._state_cache:
+            continue
+        key = (id(f.property_package), state)
+        try:
+            m = flashed[key]
+        except KeyError:
+            try:
+                hot_start = f._mixture
+            except AttributeError:
+                hot_start = None
+            T, P, H, S, VF, zs = state
+            m = flashed[key] = f.property_package.flash(T=T, P=P, zs=list(zs), H=H, S=S,
+                                                        VF=VF, hot_start=hot_start)
+        f._mixture = m
+        f._state_cache = state
+    return len(flashed)
+
+
+def flowsheet_balance(units, compounds, energy=True, flash=False):
+    r'''Solve the component mole balances, and optionally the energy
+    balances, of every unit of a flowsheet at once.
+
+    Whereas :obj:`mole_balance` and :obj:`energy_balance` close one unit at a
+    time and have to be called repeatedly until no more progress is made -
+    which for a recycle loop may never happen - this function assembles the
+    balances of all units into one sparse linear system, solves it, and
+    writes the calculated flows back into the streams.
+
+    The unknowns are each component flow of a material stream which is not
+    specified, either directly or through `n` and `zs`. A stream whose
+    composition is specified but not its flow rate contributes the
+    equations :math:`n_j = z_j \sum_k n_k`, and one whose total flow is
+    specified but not its composition contributes :math:`\sum_k n_k = n`.
+
+    The energy balances are solved after the mole balances; the unknowns are
+    the duty of any :obj:`EnergyStream` without `Q` and the `energy` of any
+    material stream whose enthalpy cannot be calculated. Calculated energies
+    are set as specifications of the streams, so a stream with a known
+    pressure becomes fully specified.
+
+    Parameters
+    ----------
+    units : list[tuple(list, list)]
+        The inlet and outlet streams of each unit, as would be given to
+        :obj:`mole_balance`; a stream leaving one unit and entering another
+        is the same object in both, [-]
+    compounds : int
+        Number of components, [-]
+    energy : bool, optional
+        Whether or not to also solve the energy balances, [-]
+    flash : bool, optional
+        Whether or not to flash the streams whose states become specified,
+        before the energy balance and again after it, [-]
+
+    Returns
+    -------
+    progress : bool
+        Whether or not any flow or energy was calculated, [-]
+
+    Notes
+    -----
+    The balances must determine every unknown; a `ValueError` is raised if
+    they do not, or if they contradict each other.
+
+    Calculated component flows are set as new lists; lists of partially
+    specified flows given by the caller are not modified.
+
+    The flashes with `flash` are not vectorized; the streams are flashed one
+    at a time, but streams with the same property package and state share a
+    single flash, and each flash starts from the stream's previous result.
+
+    Examples
+    --------
+    A mixer, a heater and a splitter with a recycle of known flow back to the
+    mixer:
+
+    >>> feed = StreamArgs(ns=[1.0, 2.0])
+    >>> recycle = StreamArgs(ns=[0.5, 0.5])
+    >>> mixed, heated, product = StreamArgs(), StreamArgs(), StreamArgs()
+    >>> units = [([feed, recycle], [mixed]), ([mixed], [heated]),
+    ...          ([heated], [product, recycle])]
+    >>> flowsheet_balance(units, compounds=2, energy=False)
+    True
+    >>> mixed.ns, product.ns
+    ([1.5, 2.5], [1.0, 2.0])
+    '''
+    streams, stream_idxs = [], {}
+    for inlets, outlets in units:
+        for f in inlets + outlets:
+            if not isinstance(f, EnergyStream) and id(f) not in stream_idxs:
+                stream_idxs[id(f)] = len(streams)
+                streams.append(f)
+
+    # Component flows, with the index of the unknown in place of missing ones
+    known_ns, unknown_ns = [], []
+    rows, cols, values, rhs = [], [], [], []
+    unknown_count = 0
+    for f in streams:
+        try:
+            ns = f.specifications['ns']
+        except:
+            ns = f.ns
+        if ns is None:
+            ns = f.ns_calc
+        if ns is not None:
+            # Results are set as new lists; the caller's are not modified
+            ns = list(ns)
+        if ns is not None and None not in ns:
+            known_ns.append(ns)
+            unknown_ns.append(None)
+            continue
+        idxs = [None]*compounds
+        for j in range(compounds):
+            if ns is None or ns[j] is None:
+                idxs[j] = unknown_count
+                unknown_count += 1
+        known_ns.append(ns)
+        unknown_ns.append(idxs)
+        if ns is not None:
+            continue
+        specs = getattr(f, 'specifications', None)
+        zs = f.zs_calc if specs is not None else None
+        n = specs['n'] if specs is not None else None
+        if zs is not None and None not in zs:
+            for j in range(compounds - 1):
+                row = len(rhs)
+                for k in range(compounds):
+                    rows.append(row)
+                    cols.append(idxs[k])
+                    values.append((1.0 if j == k else 0.0) - zs[j])
+                rhs.append(0.0)
+        elif n is not None:
+            row = len(rhs)
+            for k in range(compounds):
+                rows.append(row)
+                cols.append(idxs[k])
+                values.append(1.0)
+            rhs.append(n)
+
+    progress = False
+    if unknown_count:
+        for inlets, outlets in units:
+            for j in range(compounds):
+                row = len(rhs)
+                v = 0.0
+                for f, sign in [(f, 1.0) for f in inlets] + [(f, -1.0) for f in outlets]:
+                    if isinstance(f, EnergyStream):
+                        continue
+                    i = stream_idxs[id(f)]
+                    idxs = unknown_ns[i]
+                    if idxs is not None and idxs[j] is not None:
+                        rows.append(row)
+                        cols.append(idxs[j])
+                        values.append(sign)
+                    else:
+                        v -= sign*known_ns[i][j]
+                if len(rows) and rows[-1] == row:
+                    rhs.append(v)
+        solution = _solve_balance_system(rows, cols, values, rhs, unknown_count, 'mole')
+        for f, ns, idxs in zip(streams, known_ns, unknown_ns):
+            if idxs is None:
+                continue
+            f.ns = [solution[idx] if idx is not None else ns[j]
+                    for j, idx in enumerate(idxs)]
+        progress = True
+
+    if flash:
+        _flash_streams(streams)
+    if not energy:
+        return progress
+
+    energies, unknown_energies = {}, {}
+    for inlets, outlets in units:
+        for f in inlets + outlets:
+            if id(f) in energies:
+                continue
+            Q = f.energy
+            if Q is None:
+                Q = f.energy_calc
+            energies[id(f)] = Q
+            if Q is None:
+                unknown_energies[id(f)] = (len(unknown_energies), f)
+    if not unknown_energies:
+        return progress
+
+    rows, cols, values, rhs = [], [], [], []
+    for inlets, outlets in units:
+        row = len(rhs)
+        v = 0.0
+        for f, sign in [(f, 1.0) for f in inlets] + [(f, -1.0) for f in outlets]:
+            Q = energies[id(f)]
+            if Q is None:
+                rows.append(row)
+                cols.append(unknown_energies[id(f)][0])
+                values.append(sign)
+            else:
+                v -= sign*Q
+        if len(rows) and rows[-1] == row:
+            rhs.append(v)
+    solution = _solve_balance_system(rows, cols, values, rhs, len(unknown_energies), 'energy')
+    for idx, f in unknown_energies.values():
+        f.energy = solution[idx]
+    if flash:
+        _flash_streams(streams)
+    return True
@@ -79,6 +79,30 @@ def check_np_output_activity(model, modelnp, modelnp2):
             assert type(getattr(modelnp, attr)()) is np.ndarray
             assert type(getattr(modelnp2, attr)()) is np.ndarray
 
+def check_many_output_activity(model, modelnp, T, xs_matrix):
+    # model is flat, scalar, list-based model
+    # modelnp is the same model with numpy inputs
+    # every `_many` method must match one `to_T_xs` object per composition
+    xs_matrix_np = np.array(xs_matrix)
+    for attr in ('gammas', 'dGE_dxs'):
+        calc = getattr(model, attr + '_many')(T, xs_matrix)
+        calc_np = getattr(modelnp, attr + '_many')(T, xs_matrix_np)
+        assert type(calc) is list
+        assert type(calc_np) is np.ndarray
+        assert calc_np.shape == (len(xs_matrix), model.N)
+        for xs, v, v_np in zip(xs_matrix, calc, calc_np):
+            expect = getattr(model.to_T_xs(T, xs), attr)()
+            assert_close1d(v, expect, rtol=1e-13)
+            assert_close1d(v_np, expect, rtol=1e-13)
+
+    calc = model.GE_many(T, xs_matrix)
+    calc_np = modelnp.GE_many(T, xs_matrix_np)
+    assert type(calc) is list
+    assert type(calc_np) is np.ndarray
+    expect = [model.to_T_xs(T, xs).GE() for xs in xs_matrix]
+    assert_close1d(calc, expect, rtol=1e-12)
+    assert_close1d(calc_np, expect, rtol=1e-12)
+
 
 def plot_unsupported(reason, color='r'):
     '''Helper function - draw a plot with an `x` over it displaying a message
@@ -118,8 +118,9 @@ __all__ = [
 
 import os
 
-from fluids.numerics import horner
+from fluids.numerics import horner, numpy as np
 from fluids.constants import R, R_inv, N_A, k
+from math import nan
 from chemicals.utils import log, exp, sqrt
 from chemicals.utils import mixing_simple, none_and_length_check
 from chemicals.dippr import EQ100, EQ102
@@ -646,6 +647,7 @@ class ThermalConductivityLiquidMixture(MixtureProperty):
     '''Maximum valid value of liquid thermal conductivity. Generous limit.'''
 
     ranked_methods = [MAGOMEDOV, DIPPR_9H, LINEAR, FILIPPOV]
+    vectorized_methods = (DIPPR_9H, LINEAR, FILIPPOV)
 
     pure_references = ('ThermalConductivityLiquids',)
     pure_reference_types = (ThermalConductivityLiquid,)
@@ -743,6 +745,22 @@ class ThermalConductivityLiquidMixture(MixtureProperty):
         else:
             raise Exception('Method not valid')
 
+    def calculate_many(self, Ts, Ps, zs_2d, ws_2d, method):
+        r'''Vectorized form of :obj:`calculate` for many states; see
+        :obj:`mixture_property_many <thermo.utils.MixtureProperty.mixture_property_many>`.
+        '''
+        ks = self._pure_many(self.ThermalConductivityLiquids, Ts, Ps)
+        if method == LINEAR:
+            return (zs_2d*ks).sum(axis=1)
+        elif method == DIPPR_9H:
+            return 1.0/np.sqrt((ws_2d/(ks*ks)).sum(axis=1))
+        elif method == FILIPPOV:
+            if ks.shape[1] != 2:
+                return np.full(Ts.size, nan)
+            k1, k2, w1, w2 = ks[:, 0], ks[:, 1], ws_2d[:, 0], ws_2d[:, 1]
+            return w1*k1 + w2*k2 - 0.72*w1*w2*(k2 - k1)
+        raise ValueError('Method not valid')
+
     def test_method_validity(self, T, P, zs, ws, method):
         r'''Method to test the validity of a specified method for the given
         conditions. If **MAGOMEDOV** is applicable (electrolyte system), no
@@ -1299,6 +1317,7 @@ class ThermalConductivityGasMixture(MixtureProperty):
     '''Maximum valid value of gas thermal conductivity. Generous limit.'''
 
     ranked_methods = [LINDSAY_BROMLEY, LINEAR]
+    vectorized_methods = (LINDSAY_BROMLEY, LINEAR)
 
     pure_references = ('ViscosityGases', 'ThermalConductivityGases')
     pure_reference_types = (ViscosityGas, ThermalConductivityGas)
@@ -1396,6 +1415,26 @@ class ThermalConductivityGasMixture(MixtureProperty):
         else:
             raise Exception('Method not valid')
 
+    def calculate_many(self, Ts, Ps, zs_2d, ws_2d, method):
+        r'''Vectorized form of :obj:`calculate` for many states; see
+        :obj:`mixture_property_many <thermo.utils.MixtureProperty.mixture_property_many>`.
+        '''
+        ks = self._pure_many(self.ThermalConductivityGases, Ts, Ps)
+        if method == LINEAR:
+            return (zs_2d*ks).sum(axis=1)
+        elif method == LINDSAY_BROMLEY:
+            mus = self._pure_many(self.ViscosityGases, Ts, Ps)
+            Ss = 1.5*np.array(self.Tbs)
+            S_roots = np.sqrt(Ss)
+            T_Ss = Ts[:, None] + Ss
+            rt05MWs = np.sqrt(self.MWs)
+            bigis = np.sqrt(T_Ss*mus/(rt05MWs*np.sqrt(rt05MWs)))
+            x0s = (Ts[:, None]/T_Ss)[:, :, None] + (S_roots/T_Ss)[:, :, None]*S_roots
+            bigs = 1.0 + bigis[:, :, None]/bigis[:, None, :]
+            dens = np.einsum('mj,mij->mi', zs_2d, bigs*bigs*x0s)
+            return 4.0*(zs_2d*ks/dens).sum(axis=1)
+        raise ValueError('Method not valid')
+
     def test_method_validity(self, T, P, zs, ws, method):
         r'''Method to test the validity of a specified method for the given
         conditions. No methods have implemented checks or strict ranges of
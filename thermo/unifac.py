@@ -3195,6 +3195,36 @@ def unifac_gammas_at_T(xs, N, N_groups, vs, rs, qs, Qs,
             gammas[i] = exp(lngammas_r[i] + lngammas_c[i])
     return gammas
 
+def unifac_gammas_many(xs_matrix, N, N_groups, vs, rs, qs, Qs,
+                       psis, lnGammas_subgroups_pure, # Depends on T only
+                       version, rs_34, gammas_many=None):
+    M = len(xs_matrix)
+    if gammas_many is None:
+        gammas_many = [[0.0]*N for _ in range(M)] # numba: delete
+#        gammas_many = zeros((M, N)) # numba: uncomment
+    for m in range(M):
+        unifac_gammas_at_T(xs_matrix[m], N, N_groups, vs, rs, qs, Qs, psis,
+                           lnGammas_subgroups_pure, version, rs_34, gammas_many[m])
+    return gammas_many
+
+def unifac_GE_many(T, xs_matrix, N, N_groups, vs, rs, qs, Qs,
+                   psis, lnGammas_subgroups_pure, # Depends on T only
+                   version, rs_34, GE_many=None):
+    M = len(xs_matrix)
+    if GE_many is None:
+        GE_many = [0.0]*M
+    gammas = [0.0]*N
+    RT = R*T
+    for m in range(M):
+        xs = xs_matrix[m]
+        unifac_gammas_at_T(xs, N, N_groups, vs, rs, qs, Qs, psis,
+                           lnGammas_subgroups_pure, version, rs_34, gammas)
+        GE = 0.0
+        for i in range(N):
+            GE += xs[i]*log(gammas[i])
+        GE_many[m] = GE*RT
+    return GE_many
+
 def unifac_dgammas_dxs(N, xs, gammas, dlngammas_r_dxs, dlngammas_c_dxs, dgammas_dxs=None):
     if dgammas_dxs is None:
         dgammas_dxs = [[0.0]*N for _ in range(N)] # numba: delete
@@ -6459,6 +6489,26 @@ class UNIFAC(GibbsExcess):
         self._gammas = gammas
         return gammas
 
+    def _many_args(self, T):
+        # `psis` and the pure-component subgroup terms depend on temperature
+        # only and are shared by every composition
+        model = self._model_at_T(T)
+        try:
+            rs_34 = self.rs_34
+        except AttributeError:
+            rs_34 = self.rs
+        return (self.N, self.N_groups, self.vs, self.rs, self.qs, self.Qs,
+                model.psis(), model.lnGammas_subgroups_pure(), self.version, rs_34)
+
+    def gammas_many(self, T, xs_matrix):
+        return unifac_gammas_many(xs_matrix, *self._many_args(T),
+                                  gammas_many=self._zeros_many(len(xs_matrix)))
+
+    def GE_many(self, T, xs_matrix):
+        M = len(xs_matrix)
+        GE_many = [0.0]*M if self.scalar else zeros(M)
+        return unifac_GE_many(T, xs_matrix, *self._many_args(T), GE_many=GE_many)
+
     def dgammas_dT(self):
         r'''Calculates the first temperature derivative of activity
         coefficients with the UNIFAC model.
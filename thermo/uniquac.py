@@ -49,7 +49,7 @@ from __future__ import division
 from math import log, exp
 from fluids.numerics import numpy as np, trunc_exp
 from fluids.constants import R
-from thermo.activity import GibbsExcess, interaction_exp, dinteraction_exp_dT, d2interaction_exp_dT2, d3interaction_exp_dT3
+from thermo.activity import GibbsExcess, interaction_exp, dinteraction_exp_dT, d2interaction_exp_dT2, d3interaction_exp_dT3, gibbs_excess_gammas
 
 __all__ = ['UNIQUAC', 'UNIQUAC_gammas', 'UNIQUAC_gammas_binary', 'UNIQUAC_gammas_binaries']
 
@@ -305,6 +305,69 @@ def uniquac_d2GE_dTdxs(N, T, xs, qs, taus, phis, phis_inv, dphis_dxs, thetas, dt
         d2GE_dTdxs[i] = R*(-T*Ttot + tot)
     return d2GE_dTdxs
 
+def uniquac_GE_many(xs_matrix, N, T, z, rs, qs, taus, GE_many=None):
+    M = len(xs_matrix)
+    if GE_many is None:
+        GE_many = [0.0]*M
+
+    phis = [0.0]*N
+    thetas = [0.0]*N
+    thetaj_taus_jis = [0.0]*N
+    for m in range(M):
+        xs = xs_matrix[m]
+        uniquac_phis(N, xs, rs, phis)
+        uniquac_phis(N, xs, qs, thetas)
+        uniquac_thetaj_taus_jis(N, taus, thetas, thetaj_taus_jis)
+        GE_many[m] = uniquac_GE(T, N, z, xs, qs, phis, thetas, thetaj_taus_jis)
+    return GE_many
+
+def uniquac_dGE_dxs_many(xs_matrix, N, T, rs, qs, taus, dGE_dxs_many=None):
+    M = len(xs_matrix)
+    if dGE_dxs_many is None:
+        dGE_dxs_many = [[0.0]*N for _ in range(M)] # numba: delete
+#        dGE_dxs_many = zeros((M, N)) # numba: uncomment
+
+    dphis_dxs = [[0.0]*N for _ in range(N)] # numba: delete
+    dthetas_dxs = [[0.0]*N for _ in range(N)] # numba: delete
+#    dphis_dxs = zeros((N, N)) # numba: uncomment
+#    dthetas_dxs = zeros((N, N)) # numba: uncomment
+    phis = [0.0]*N
+    phis_inv = [0.0]*N
+    thetas = [0.0]*N
+    thetaj_taus_jis = [0.0]*N
+    thetaj_taus_jis_inv = [0.0]*N
+    vec0 = [0.0]*N
+    for m in range(M):
+        xs = xs_matrix[m]
+        phis, rsxs_sum_inv = uniquac_phis(N, xs, rs, phis)
+        thetas, qsxs_sum_inv = uniquac_phis(N, xs, qs, thetas)
+        uniquac_dphis_dxs(N, rs, phis, rsxs_sum_inv, dphis_dxs, vec0)
+        uniquac_dphis_dxs(N, qs, thetas, qsxs_sum_inv, dthetas_dxs, vec0)
+        uniquac_thetaj_taus_jis(N, taus, thetas, thetaj_taus_jis)
+        for i in range(N):
+            phis_inv[i] = 1.0/phis[i]
+            thetaj_taus_jis_inv[i] = 1.0/thetaj_taus_jis[i]
+        uniquac_dGE_dxs(N, T, xs, qs, taus, phis, phis_inv, dphis_dxs, thetas, dthetas_dxs,
+                        thetaj_taus_jis, thetaj_taus_jis_inv, dGE_dxs_many[m])
+    return dGE_dxs_many
+
+def uniquac_gammas_many(xs_matrix, N, T, z, rs, qs, taus, gammas_many=None):
+    M = len(xs_matrix)
+    if gammas_many is None:
+        gammas_many = [[0.0]*N for _ in range(M)] # numba: delete
+#        gammas_many = zeros((M, N)) # numba: uncomment
+
+    GE_many = uniquac_GE_many(xs_matrix, N, T, z, rs, qs, taus)
+    # The derivatives are written into the output and overwritten row by row
+    uniquac_dGE_dxs_many(xs_matrix, N, T, rs, qs, taus, gammas_many)
+    dGE_dxs = [0.0]*N
+    for m in range(M):
+        gammas = gammas_many[m]
+        for i in range(N):
+            dGE_dxs[i] = gammas[i]
+        gibbs_excess_gammas(xs_matrix[m], dGE_dxs, GE_many[m], T, gammas)
+    return gammas_many
+
 class UNIQUAC(GibbsExcess):
     r'''Class for representing an a liquid with excess gibbs energy represented
     by the UNIQUAC equation. This model is capable of representing VL and LL
@@ -1321,6 +1384,24 @@ class UNIQUAC(GibbsExcess):
         self._dGE_dxs = dGE_dxs
         return dGE_dxs
 
+    def gammas_many(self, T, xs_matrix):
+        # `taus` depend on temperature only and are shared by every
+        # composition
+        taus = self._model_at_T(T).taus()
+        return uniquac_gammas_many(xs_matrix, self.N, T, self.z, self.rs, self.qs, taus,
+                                   self._zeros_many(len(xs_matrix)))
+
+    def GE_many(self, T, xs_matrix):
+        taus = self._model_at_T(T).taus()
+        M = len(xs_matrix)
+        GE_many = [0.0]*M if self.scalar else zeros(M)
+        return uniquac_GE_many(xs_matrix, self.N, T, self.z, self.rs, self.qs, taus, GE_many)
+
+    def dGE_dxs_many(self, T, xs_matrix):
+        taus = self._model_at_T(T).taus()
+        return uniquac_dGE_dxs_many(xs_matrix, self.N, T, self.rs, self.qs, taus,
+                                    self._zeros_many(len(xs_matrix)))
+
     def d2GE_dTdxs(self):
         r'''Calculate and return the temperature derivative of mole fraction
         derivatives of excess Gibbs energy using the UNIQUAC model.
@@ -20,28 +20,39 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
+
 from __future__ import division
 
 __all__ = ['u']
+import os
+import sys
 import types
-import re
-import inspect
-import functools
-import collections
+import json
+import hashlib
+from importlib.util import find_spec
 import thermo
-import numpy as np
-try:
-    import pint
-    from pint import _DEFAULT_REGISTRY as u
-    from pint import DimensionalityError
-
-except ImportError: # pragma: no cover
+if find_spec('pint') is None: # pragma: no cover
     raise ImportError('The unit handling in fluids requires the installation '
                       'of the package pint, available on pypi or from '
                       'https://github.com/hgrecco/pint')
-from fluids.units import wraps_numpydoc, wrap_numpydoc_obj
+import pint
+from pint import _DEFAULT_REGISTRY as u
+from pint import DimensionalityError
+
+# Parsing the docstrings of every class took longer than importing thermo
+# itself, so classes are only wrapped when they are first accessed (through
+# the module `__getattr__`); `fluids.units`, which wraps all of fluids when it
+# is imported, is likewise only loaded then. Wrapping is made faster still by
+# the unit signatures that `setup.py` stores in `unit_signatures_path` with
+# `generate_unit_signatures` when the package is built; the file is not kept
+# in the repository, and a class without a signature or whose docstrings no
+# longer match its stored fingerprint is parsed as before.
+_fluids_units_names = ('wraps_numpydoc', 'wrap_numpydoc_obj', 'UnitAwareClass',
+                       'parse_expression_cached')
+unit_signatures_path = os.path.join(os.path.dirname(__file__), 'unit_signatures.json')
 
 __funcs = {}
+__wrappable = {}
 
 failed_wrapping = False
 
@@ -64,13 +75,9 @@ for name in dir(thermo):
         if obj in (thermo.eos_mix.PSRKMixingRules, thermo.eos_mix.PSRK):
             # Not yet implemented
             continue
-        try:
-            obj = wrap_numpydoc_obj(obj)
-        except Exception as e:
-            failed_wrapping = True
-            print('Current implementation of %s contains documentation not '
-                  'parseable and cound not be wrapped to use pint:' %str(obj))
-            print(e)
+        __all__.append(name)
+        __wrappable[name] = obj
+        continue
     elif isinstance(obj, str):
         continue
     if name == '__all__':
@@ -79,3 +86,239 @@ for name in dir(thermo):
     __funcs.update({name: obj})
 
 globals().update(__funcs)
+
+
+def docstring_fingerprint(obj):
+    r'''Compute a hash of every docstring read by `wrap_numpydoc_obj` when it
+    wraps a class. A stored unit signature remains valid for as long as the
+    fingerprint of the class does not change.
+
+    Parameters
+    ----------
+    obj : type
+        Class to fingerprint, [-]
+
+    Returns
+    -------
+    fingerprint : str
+        Hexadecimal MD5 digest of the docstrings, [-]
+    '''
+    h = hashlib.md5()
+    h.update(str(getattr(obj, 'units', None)).encode('utf-8'))
+    for prop in dir(obj):
+        attr = getattr(obj, prop)
+        if type(attr) is property:
+            doc = attr.__doc__
+            if doc is None and attr.fget is not None:
+                doc = attr.fget.__doc__
+        elif isinstance(attr, (types.FunctionType, types.MethodType)):
+            doc = attr.__doc__
+        else:
+            continue
+        h.update(prop.encode('utf-8'))
+        h.update(str(doc).encode('utf-8'))
+    for inherited in obj.__mro__[0:-1]:
+        h.update(str(inherited.__doc__).encode('utf-8'))
+    return h.hexdigest()
+
+
+def _fluids_units():
+    import fluids.units
+    return fluids.units
+
+
+def _unit_to_json(unit):
+    if isinstance(unit, (u.Quantity, u.Unit)):
+        return str(unit)
+    # The raw parsed lists of an "Attributes" section of a method can end up
+    # in the map as well; keep them as they are
+    return {'raw': unit}
+
+
+def _unit_from_json(unit):
+    if type(unit) is dict:
+        return unit['raw']
+    return _fluids_units().parse_expression_cached(unit, u)
+
+
+def unit_signature(obj):
+    r'''Parse the docstrings of a class and return the information needed to
+    build its pint-wrapped version, in a JSON-serializable form.
+
+    Parameters
+    ----------
+    obj : type
+        Class to compute the unit signature of, [-]
+
+    Returns
+    -------
+    signature : dict
+        Unit signature of the class, [-]
+    '''
+    wrapped = _fluids_units().wrap_numpydoc_obj(obj)
+    return {'fingerprint': docstring_fingerprint(obj),
+            'property_units': {k: _unit_to_json(v) for k, v in wrapped.property_units.items()},
+            'method_units': {k: list(v) for k, v in wrapped.method_units.items()},
+            'static_methods': sorted(wrapped.static_methods),
+            'class_methods': sorted(wrapped.class_methods)}
+
+
+def generate_unit_signatures(path=None):
+    r'''Compute the unit signatures of every class wrapped by this module and
+    write them to a JSON file. This is run by `setup.py` when the package is
+    built; in a source checkout, it can be run by hand to speed up wrapping.
+    Classes without a signature, or whose documentation has changed since
+    it was generated, still work but are slower to wrap.
+
+    Parameters
+    ----------
+    path : str, optional
+        File to write the signatures to; defaults to `unit_signatures_path`,
+        [-]
+
+    Returns
+    -------
+    signatures : dict[str, dict]
+        Unit signatures of each class, indexed by class name, [-]
+    '''
+    if path is None:
+        path = unit_signatures_path
+    signatures = {}
+    for name, obj in __wrappable.items():
+        try:
+            signatures[name] = unit_signature(obj)
+        except Exception:
+            # Reported by `wrap_thermo_obj` when the class is accessed
+            pass
+
+    # Most methods and properties are inherited and have the same signature
+    # in many classes; store each one only once
+    pools = {'method_units': {}, 'property_units': {}}
+    classes = {}
+    for name, signature in signatures.items():
+        stored = signature.copy()
+        for key, pool in pools.items():
+            indexes = []
+            for item in signature[key].items():
+                item_key = json.dumps(item, sort_keys=True)
+                if item_key not in pool:
+                    pool[item_key] = len(pool)
+                indexes.append(pool[item_key])
+            stored[key] = indexes
+        classes[name] = stored
+    data = {'classes': classes}
+    for key, pool in pools.items():
+        data[key] = [json.loads(k) for k in sorted(pool, key=pool.get)]
+    with open(path, 'w') as f:
+        json.dump(data, f, sort_keys=True, separators=(',', ':'))
+    return signatures
+
+
+_unit_signatures = None
+
+def load_unit_signatures():
+    global _unit_signatures
+    if _unit_signatures is None:
+        try:
+            with open(unit_signatures_path) as f:
+                data = json.load(f)
+            _unit_signatures = data['classes']
+            for signature in _unit_signatures.values():
+                for key in ('method_units', 'property_units'):
+                    pool = data[key]
+                    signature[key] = dict(pool[i] for i in signature[key])
+        except Exception:
+            _unit_signatures = {}
+    return _unit_signatures
+
+
+def stale_unit_signatures():
+    r'''Return the names of the classes wrapped by this module whose unit
+    signature is missing from `unit_signatures_path` or was generated from
+    documentation which has since changed. These are wrapped by parsing
+    their docstrings until `generate_unit_signatures` is run again.
+
+    Returns
+    -------
+    names : list[str]
+        Names of the classes with missing or stale unit signatures, [-]
+    '''
+    signatures = load_unit_signatures()
+    stale = []
+    for name, obj in __wrappable.items():
+        signature = signatures.get(name)
+        if signature is None or signature['fingerprint'] != docstring_fingerprint(obj):
+            stale.append(name)
+    return stale
+
+
+def wrap_from_signature(obj, signature):
+    r'''Build the pint-wrapped version of a class from a unit signature as
+    returned by `unit_signature`. The result is the same as that of
+    `wrap_numpydoc_obj`, without parsing any docstrings.
+
+    Parameters
+    ----------
+    obj : type
+        Class to wrap, [-]
+    signature : dict
+        Unit signature of the class, [-]
+
+    Returns
+    -------
+    wrapped : type
+        Wrapped class, [-]
+    '''
+    UnitAwareClass = _fluids_units().UnitAwareClass
+    static_methods = set(signature['static_methods'])
+    class_methods = set(signature['class_methods'])
+    classkwargs = {'wrapped': obj,
+                   'property_units': {k: _unit_from_json(v) for k, v in signature['property_units'].items()},
+                   'method_units': {k: tuple(v) for k, v in signature['method_units'].items()},
+                   'static_methods': static_methods, 'class_methods': class_methods,
+                   '__module__': UnitAwareClass.__module__}
+    fun = type(obj.__name__, (UnitAwareClass,), classkwargs)
+    for m in static_methods:
+        setattr(fun, m, staticmethod(fun._another_getattr(m)))
+    for m in class_methods:
+        setattr(fun, m, classmethod(fun._another_getattr(m)))
+    return fun
+
+
+def wrap_thermo_obj(obj):
+    global failed_wrapping
+    signature = load_unit_signatures().get(obj.__name__)
+    try:
+        if signature is not None and signature['fingerprint'] == docstring_fingerprint(obj):
+            return wrap_from_signature(obj, signature)
+        return _fluids_units().wrap_numpydoc_obj(obj)
+    except Exception as e:
+        failed_wrapping = True
+        print('Current implementation of %s contains documentation not '
+              'parseable and cound not be wrapped to use pint:' %str(obj))
+        print(e)
+        return obj
+
+
+def __getattr__(name):
+    if name in _fluids_units_names:
+        return getattr(_fluids_units(), name)
+    try:
+        obj = __wrappable[name]
+    except KeyError:
+        raise AttributeError("module %s has no attribute %s" %(__name__, name))
+    obj = wrap_thermo_obj(obj)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__wrappable))
+
+
+if sys.version_info < (3, 7):
+    # Module `__getattr__` (PEP 562) is not supported; wrap everything now
+    for name in _fluids_units_names:
+        globals()[name] = getattr(_fluids_units(), name)
+    for name, obj in __wrappable.items():
+        globals()[name] = wrap_thermo_obj(obj)
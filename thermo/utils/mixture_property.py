@@ -27,6 +27,7 @@ from chemicals.utils import (hash_any_primitive, ws_to_zs, zs_to_ws,
 from fluids.numerics import linspace, derivative
 from thermo.utils import has_matplotlib, POLY_FIT
 from thermo.eos_mix import GCEOSMIX
+from math import nan
 import numpy as np
 
 class MixtureProperty(object):
@@ -53,6 +54,12 @@ class MixtureProperty(object):
     specified conditions. Saves a little time.
     '''
 
+    vectorized_methods = ()
+    '''Methods which :obj:`calculate_many` can evaluate for many states with
+    array operations; others are evaluated one state at a time by
+    :obj:`mixture_property_many`.
+    '''
+
     def __init_subclass__(cls):
         cls.__full_path__ = "%s.%s" %(cls.__module__, cls.__qualname__)
 
@@ -339,6 +346,181 @@ class MixtureProperty(object):
         elif self.RAISE_PROPERTY_CALCULATION_ERROR:
             raise RuntimeError("%s method '%s' is not valid at T=%s K and P=%s Pa" %(self.name, method, T, P))
 
+    def _complete_zs_ws_many(self, zs_2d, ws_2d):
+        if zs_2d is None and ws_2d is None:
+            raise Exception('No Composition Specified')
+        MWs = np.array(self.MWs)
+        if zs_2d is None:
+            ws_2d = np.atleast_2d(np.asarray(ws_2d, dtype=float))
+            zs_2d = ws_2d/MWs
+            zs_2d /= zs_2d.sum(axis=1)[:, None]
+        elif ws_2d is None:
+            zs_2d = np.atleast_2d(np.asarray(zs_2d, dtype=float))
+            ws_2d = zs_2d*MWs
+            ws_2d /= ws_2d.sum(axis=1)[:, None]
+        else:
+            zs_2d = np.atleast_2d(np.asarray(zs_2d, dtype=float))
+            ws_2d = np.atleast_2d(np.asarray(ws_2d, dtype=float))
+        return zs_2d, ws_2d
+
+    def mixture_property_many(self, Ts, Ps, zs_2d=None, ws_2d=None):
+        r'''Method to calculate the property at many states at once with
+        the selected :obj:`method`, giving the same results as calling
+        :obj:`mixture_property <thermo.utils.MixtureProperty.mixture_property>`
+        for each state.
+
+        Methods listed in :obj:`vectorized_methods` evaluate the pure-component
+        properties once per unique temperature (or temperature and pressure)
+        and apply the mixing rule with array operations; other methods are
+        evaluated one state at a time. States whose vectorized result fails
+        the property range check are also evaluated one at a time if
+        :obj:`RAISE_PROPERTY_CALCULATION_ERROR` or
+        :obj:`skip_prop_validity_check` is set, and are otherwise NaN.
+        One or both of `zs_2d` and `ws_2d` are required.
+
+        Parameters
+        ----------
+        Ts : float or list[float]
+            Temperatures at which to calculate the property, [K]
+        Ps : float or list[float]
+            Pressures at which to calculate the property, [Pa]
+        zs_2d : list[list[float]], optional
+            Mole fractions of all species in the mixture, one row per state
+            or a single row for all states, [-]
+        ws_2d : list[list[float]], optional
+            Weight fractions of all species in the mixture, one row per state
+            or a single row for all states, [-]
+
+        Returns
+        -------
+        props : ndarray
+            Calculated property, NaN where
+            :obj:`mixture_property <thermo.utils.MixtureProperty.mixture_property>`
+            would return None, [`units`]
+        '''
+        zs_2d, ws_2d = self._complete_zs_ws_many(zs_2d, ws_2d)
+        Ts = np.asarray(Ts, dtype=float).ravel()
+        Ps = np.asarray(Ps, dtype=float).ravel()
+        M = max(Ts.size, Ps.size, zs_2d.shape[0])
+        Ts, Ps = np.broadcast_to(Ts, (M,)), np.broadcast_to(Ps, (M,))
+        zs_2d, ws_2d = np.broadcast_to(zs_2d, (M, zs_2d.shape[1])), np.broadcast_to(ws_2d, (M, ws_2d.shape[1]))
+
+        method = self._method
+        # mixture_property only consults test_method_validity when
+        # skip_method_validity_check is set; keep that per state
+        if method in self.vectorized_methods and not self.skip_method_validity_check:
+            with np.errstate(all='ignore'):
+                props = np.array(self.calculate_many(Ts, Ps, zs_2d, ws_2d, method), dtype=float)
+            if self.skip_prop_validity_check:
+                redo = np.isnan(props)
+            else:
+                redo = ~((props >= self.property_min) & (props <= self.property_max))
+                if not self.RAISE_PROPERTY_CALCULATION_ERROR:
+                    # The scalar calculation would fail or be rejected as well
+                    props[redo] = nan
+                    redo[:] = False
+        else:
+            props = np.empty(M)
+            redo = np.ones(M, dtype=bool)
+        mixture_property = self.mixture_property
+        for k in np.flatnonzero(redo).tolist():
+            prop = mixture_property(float(Ts[k]), float(Ps[k]), zs_2d[k].tolist(), ws_2d[k].tolist())
+            props[k] = nan if prop is None else prop
+        return props
+
+    def calculate_many(self, Ts, Ps, zs_2d, ws_2d, method):
+        r'''Method to calculate the property at many states with a given
+        method, one of :obj:`vectorized_methods`. Failed or invalid states may
+        be returned as NaN or any other value; see
+        :obj:`mixture_property_many` for the handling of those.
+
+        Parameters
+        ----------
+        Ts : ndarray
+            Temperatures at which to calculate the property, [K]
+        Ps : ndarray
+            Pressures at which to calculate the property, [Pa]
+        zs_2d : ndarray
+            Mole fractions of all species in the mixture, one row per
+            state, [-]
+        ws_2d : ndarray
+            Weight fractions of all species in the mixture, one row per
+            state, [-]
+        method : str
+            Name of the method to use
+
+        Returns
+        -------
+        props : ndarray
+            Calculated property, [`units`]
+        '''
+        raise NotImplementedError("%s has no vectorized implementation of method '%s'" %(self.__class__.__name__, method))
+
+    @staticmethod
+    def _pure_T_many(objs, Ts):
+        # T_dependent_property of each of `objs`, once per unique temperature
+        Ts_unique, inverse = np.unique(Ts, return_inverse=True)
+        inverse = inverse.ravel()
+        props = np.empty((Ts.size, len(objs)))
+        for i, obj in enumerate(objs):
+            props[:, i] = obj.T_dependent_property_many(Ts_unique)[inverse]
+        return props
+
+    @staticmethod
+    def _pure_TP_many(objs, Ts, Ps, T_fallback=True):
+        # TP_dependent_property of each of `objs`, once per unique (T, P);
+        # with `T_fallback` failures are replaced by T_dependent_property
+        props = np.empty((Ts.size, len(objs)))
+        if Ps.size and Ps.min() == Ps.max():
+            # A single pressure - the unique temperatures are enough
+            Ts_unique, inverse = np.unique(Ts, return_inverse=True)
+            P = float(Ps[0])
+            TPs_unique = [(T, P) for T in Ts_unique.tolist()]
+        else:
+            TPs_unique, inverse = np.unique(np.stack([Ts, Ps], axis=1), axis=0, return_inverse=True)
+            TPs_unique = TPs_unique.tolist()
+        inverse = inverse.ravel()
+        for i, obj in enumerate(objs):
+            if obj._method_P is None and not obj.RAISE_PROPERTY_CALCULATION_ERROR:
+                # Every TP_dependent_property call would return None
+                if T_fallback:
+                    props[:, i] = MixtureProperty._pure_T_many([obj], Ts)[:, 0]
+                else:
+                    props[:, i] = nan
+                continue
+            col = []
+            for T, P in TPs_unique:
+                prop = obj.TP_dependent_property(T, P)
+                if prop is None and T_fallback:
+                    prop = obj.T_dependent_property(T)
+                col.append(nan if prop is None else prop)
+            props[:, i] = np.array(col)[inverse]
+        return props
+
+    def _pure_many(self, objs, Ts, Ps):
+        # Pure-component properties as used by the `calculate` methods which
+        # honour `correct_pressure_pure`
+        if self._correct_pressure_pure:
+            return self._pure_TP_many(objs, Ts, Ps)
+        return self._pure_T_many(objs, Ts)
+
+    def _pure_poly_fit_many(self, Ts):
+        # Vectorized form of the `all_poly_fit` evaluation with linear
+        # extrapolation used by the viscosity `calculate` methods
+        poly_fit_data = self.poly_fit_data
+        Tmins, Tmaxs, coeffs = poly_fit_data[0], poly_fit_data[3], poly_fit_data[6]
+        Ts_unique, inverse = np.unique(Ts, return_inverse=True)
+        props = np.empty((Ts_unique.size, len(Tmins)))
+        for i in range(len(Tmins)):
+            v = np.zeros(Ts_unique.size)
+            for c in coeffs[i]:
+                v = v*Ts_unique + c
+            low, high = Ts_unique < Tmins[i], Ts_unique > Tmaxs[i]
+            v[low] = (Ts_unique[low] - Tmins[i])*poly_fit_data[1][i] + poly_fit_data[2][i]
+            v[high] = (Ts_unique[high] - Tmaxs[i])*poly_fit_data[4][i] + poly_fit_data[5][i]
+            props[:, i] = v
+        return props[inverse.ravel()]
+
     def excess_property(self, T, P, zs=None, ws=None):
         r'''Method to calculate the excess property with sanity checking and
         without specifying a specific method. This requires the calculation of
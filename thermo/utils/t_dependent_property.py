@@ -30,7 +30,7 @@ try:
     from random import uniform
 except: # pragma: no cover
     pass
-from math import inf, exp, log
+from math import inf, nan, exp, log
 
 from fluids.numerics import (quad, brenth, secant, linspace, newton,
                              polyint, polyint_over_x, derivative, 
@@ -2330,6 +2330,77 @@ class TDependentProperty(object):
             elif self.RAISE_PROPERTY_CALCULATION_ERROR: 
                 raise RuntimeError("%s method '%s' is not valid at T=%s K for component with CASRN '%s'" %(self.name, method, T, self.CASRN))
     
+    def T_dependent_property_many(self, Ts):
+        r'''Method to calculate the property at many temperatures at once,
+        with the same results as calling
+        :obj:`T_dependent_property <thermo.utils.TDependentProperty.T_dependent_property>`
+        at each temperature.
+
+        Polynomial fits within their range and the 'DIPPR101_ABC' and
+        'AntoineAB' extrapolations are evaluated over the whole array; other
+        methods, extrapolations and values failing
+        :obj:`test_property_validity` are evaluated one temperature at a time.
+
+        Parameters
+        ----------
+        Ts : ndarray
+            Temperatures at which to calculate the property, [K]
+
+        Returns
+        -------
+        props : ndarray
+            Calculated property, NaN where
+            :obj:`T_dependent_property <thermo.utils.TDependentProperty.T_dependent_property>`
+            would return None, [`units`]
+        '''
+        Ts = np.asarray(Ts, dtype=float).ravel()
+        method = self._method
+        values = np.empty(Ts.size)
+        slow = np.ones(Ts.size, dtype=bool)
+        if method == POLY_FIT or method == EXP_POLY_FIT:
+            T_low, T_high = self.T_limits[method]
+            in_range = (Ts >= T_low) & (Ts <= T_high)
+            if in_range.any():
+                Ts_in = Ts[in_range]
+                fast = np.zeros(Ts_in.size)
+                for c in (self.poly_fit_coeffs if method == POLY_FIT else self.exp_poly_fit_coeffs):
+                    fast = fast*Ts_in + c
+                if method == EXP_POLY_FIT:
+                    # math.exp element by element matches the scalar path exactly
+                    fast = np.array([trunc_exp(v, inf) for v in fast.tolist()])
+                valid = (fast >= self.property_min) & (fast <= self.property_max)
+                idxs = np.flatnonzero(in_range)[valid]
+                values[idxs] = fast[valid]
+                slow[idxs] = False
+            if self._extrapolation is not None:
+                for low, outside in ((True, (Ts < T_low) & (Ts > 0.0)), (False, Ts > T_high)):
+                    extrapolation = self._extrapolation_low if low else self._extrapolation_high
+                    if extrapolation not in ('DIPPR101_ABC', 'AntoineAB') or not outside.any():
+                        continue
+                    key = (extrapolation, method, low)
+                    extrapolation_coeffs = self.extrapolation_coeffs
+                    if key in extrapolation_coeffs:
+                        coeffs = extrapolation_coeffs[key]
+                    else:
+                        extrapolation_coeffs[key] = coeffs = self._get_extrapolation_coeffs(*key)
+                    Ts_out = Ts[outside].tolist()
+                    if extrapolation == 'DIPPR101_ABC':
+                        A, B, C = coeffs
+                        fast = [trunc_exp(A + B*(1.0/T) + C*log(T) + 0.0) for T in Ts_out]
+                    else:
+                        A, B = coeffs
+                        try:
+                            fast = [e**(A - B/T) for T in Ts_out]
+                        except OverflowError:
+                            continue
+                    values[outside] = fast
+                    slow[outside] = False
+        T_dependent_property = self.T_dependent_property
+        for k in np.flatnonzero(slow).tolist():
+            value = T_dependent_property(float(Ts[k]))
+            values[k] = value if value is not None else nan
+        return values
+
     def calculate_transform(self, T, method, transform):
         if transform == PROPERTY_TRANSFORM_LN:
             if method == EXP_POLY_FIT:
@@ -1091,6 +1091,7 @@ class ViscosityLiquidMixture(MixtureProperty):
     the value is that of bitumen in a Pitch drop experiment.'''
 
     ranked_methods = [LALIBERTE_MU, MIXING_LOG_MOLAR, MIXING_LOG_MASS, LINEAR]
+    vectorized_methods = (MIXING_LOG_MOLAR, MIXING_LOG_MASS, LINEAR)
 
     pure_references = ('ViscosityLiquids',)
     pure_reference_types = (ViscosityLiquid, )
@@ -1234,6 +1235,24 @@ class ViscosityLiquidMixture(MixtureProperty):
         else:
             raise Exception('Method not valid')
 
+    def calculate_many(self, Ts, Ps, zs_2d, ws_2d, method):
+        r'''Vectorized form of :obj:`calculate` for many states; see
+        :obj:`mixture_property_many <thermo.utils.MixtureProperty.mixture_property_many>`.
+        '''
+        if self._correct_pressure_pure:
+            mus = self._pure_TP_many(self.ViscosityLiquids, Ts, Ps)
+        elif self.all_poly_fit:
+            mus = np.exp(self._pure_poly_fit_many(Ts))
+        else:
+            mus = self._pure_T_many(self.ViscosityLiquids, Ts)
+        if method == MIXING_LOG_MOLAR:
+            return np.exp((zs_2d*np.log(mus)).sum(axis=1))
+        elif method == MIXING_LOG_MASS:
+            return np.exp((ws_2d*np.log(mus)).sum(axis=1))
+        elif method == LINEAR:
+            return (zs_2d*mus).sum(axis=1)
+        raise ValueError('Method not valid')
+
     def test_method_validity(self, T, P, zs, ws, method):
         r'''Method to test the validity of a specified method for the given
         conditions. If **Laliberte** is applicable, all other methods are
@@ -1334,6 +1353,7 @@ class ViscosityGasMixture(MixtureProperty):
     '''Maximum valid value of gas viscosity. Might be too high, or too low.'''
 
     ranked_methods = [BROKAW, HERNING_ZIPPERER, LINEAR, WILKE]
+    vectorized_methods = (BROKAW, HERNING_ZIPPERER, LINEAR, WILKE)
 
     pure_references = ('ViscosityGases',)
     pure_reference_types = (ViscosityGas, )
@@ -1447,6 +1467,46 @@ class ViscosityGasMixture(MixtureProperty):
         else:
             raise ValueError('Method not valid')
 
+    def calculate_many(self, Ts, Ps, zs_2d, ws_2d, method):
+        r'''Vectorized form of :obj:`calculate` for many states; see
+        :obj:`mixture_property_many <thermo.utils.MixtureProperty.mixture_property_many>`.
+        '''
+        if self._correct_pressure_pure:
+            mus = self._pure_TP_many(self.ViscosityGases, Ts, Ps)
+        elif self.all_poly_fit:
+            mus = self._pure_poly_fit_many(Ts)
+        else:
+            mus = self._pure_T_many(self.ViscosityGases, Ts)
+        if method == LINEAR:
+            return (zs_2d*mus).sum(axis=1)
+        elif method == HERNING_ZIPPERER:
+            vs = zs_2d*np.array(self.MW_roots)
+            return (vs*mus).sum(axis=1)/vs.sum(axis=1)
+        elif method == WILKE:
+            mu_roots = np.sqrt(mus)
+            phis = (mus[:, :, None]/mus[:, None, :]*np.array(self.Wilke_t0s)
+                    + mu_roots[:, :, None]/mu_roots[:, None, :]*np.array(self.Wilke_t1s)
+                    + np.array(self.Wilke_t2s))
+            tots = np.einsum('mj,mij->mi', zs_2d, phis)
+            return (zs_2d*mus/tots).sum(axis=1)
+        elif method == BROKAW:
+            MWs, MDs = np.array(self.MWs), np.array(self.molecular_diameters)
+            Tsts = Ts[:, None]/np.array(self.Stockmayers)
+            Tstrs = np.sqrt(Tsts)
+            den_roots = np.sqrt(1.0 + Tsts + 0.25*MDs*MDs)
+            Sijs = ((1.0 + Tstrs[:, :, None]*Tstrs[:, None, :] + np.outer(MDs, MDs)/4.)
+                    /den_roots[:, :, None]/den_roots[:, None, :])
+            small = MDs <= 0.1
+            Sijs[:, np.outer(small, small)] = 1.0
+            Mijs = np.outer(MWs, 1.0/MWs)
+            Mij45s = Mijs**0.45
+            mijs = (4./((1.0 + 1.0/Mijs)*(1.0 + Mijs)))**0.25
+            Aijs = mijs*Mijs**-0.5*(1.0 + (Mijs - Mij45s)/(2.0*(1.0 + Mijs)
+                    + (1.0 + Mij45s)*mijs**-0.5/(1.0 + mijs)))
+            phis = np.sqrt(mus[:, :, None]/mus[:, None, :])*Sijs*Aijs
+            return (zs_2d*mus/np.einsum('mj,mij->mi', zs_2d, phis)).sum(axis=1)
+        raise ValueError('Method not valid')
+
     def test_method_validity(self, T, P, zs, ws, method):
         r'''Method to test the validity of a specified method for the given
         conditions. No methods have implemented checks or strict ranges of
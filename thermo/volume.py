@@ -1087,6 +1087,7 @@ class VolumeLiquidMixture(MixtureProperty):
 
     ranked_methods = [LALIBERTE, LINEAR, COSTALD_MIXTURE_FIT,
                       RACKETT_PARAMETERS, COSTALD_MIXTURE, RACKETT]
+    vectorized_methods = (LINEAR,)
 
     pure_references = ('VolumeLiquids',)
     pure_reference_types = (VolumeLiquid, )
@@ -1229,6 +1230,14 @@ class VolumeLiquidMixture(MixtureProperty):
         else:
             raise Exception('Method not valid')
 
+    def calculate_many(self, Ts, Ps, zs_2d, ws_2d, method):
+        r'''Vectorized form of :obj:`calculate` for many states; see
+        :obj:`mixture_property_many <thermo.utils.MixtureProperty.mixture_property_many>`.
+        '''
+        if method == LINEAR:
+            return (zs_2d*self._pure_many(self.VolumeLiquids, Ts, Ps)).sum(axis=1)
+        raise ValueError('Method not valid')
+
     def test_method_validity(self, T, P, zs, ws, method):
         r'''Method to test the validity of a specified method for the given
         conditions. No methods have implemented checks or strict ranges of
@@ -1619,6 +1628,7 @@ class VolumeGasMixture(MixtureProperty):
     at 1 Pa and 2 billion K.'''
 
     ranked_methods = [EOS, LINEAR, IDEAL, LINEAR_MISSING_IDEAL]
+    vectorized_methods = (LINEAR, IDEAL, LINEAR_MISSING_IDEAL)
 
     pure_references = ('VolumeGases',)
     pure_reference_types = (VolumeGas, )
@@ -1697,6 +1707,21 @@ class VolumeGasMixture(MixtureProperty):
         else:
             raise ValueError('Method not valid')
 
+    def calculate_many(self, Ts, Ps, zs_2d, ws_2d, method):
+        r'''Vectorized form of :obj:`calculate` for many states; see
+        :obj:`mixture_property_many <thermo.utils.MixtureProperty.mixture_property_many>`.
+        '''
+        if method == IDEAL:
+            return R*Ts/Ps
+        Vms = self._pure_TP_many(self.VolumeGases, Ts, Ps, T_fallback=False)
+        if method == LINEAR_MISSING_IDEAL:
+            V_ideals = np.broadcast_to((R*Ts/Ps)[:, None], Vms.shape)
+            missing = np.isnan(Vms)
+            Vms[missing] = V_ideals[missing]
+        elif method != LINEAR:
+            raise ValueError('Method not valid')
+        return (zs_2d*Vms).sum(axis=1)
+
     def test_method_validity(self, T, P, zs, ws, method):
         r'''Method to test the validity of a specified method for the given
         conditions. No methods have implemented checks or strict ranges of
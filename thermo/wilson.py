@@ -209,6 +209,56 @@ def wilson_gammas(xs, N, lambdas, xj_Lambda_ijs_inv, gammas=None, vec0=None):
 
     return gammas
 
+def wilson_gammas_many(xs_matrix, N, lambdas, gammas_many=None):
+    M = len(xs_matrix)
+    if gammas_many is None:
+        gammas_many = [[0.0]*N for _ in range(M)] # numba: delete
+#        gammas_many = zeros((M, N)) # numba: uncomment
+
+    xj_Lambda_ijs = [0.0]*N
+    vec0 = [0.0]*N
+    for m in range(M):
+        xs = xs_matrix[m]
+        wilson_xj_Lambda_ijs(xs, lambdas, N, xj_Lambda_ijs)
+        for i in range(N):
+            xj_Lambda_ijs[i] = 1.0/xj_Lambda_ijs[i]
+        wilson_gammas(xs, N, lambdas, xj_Lambda_ijs, gammas_many[m], vec0)
+    return gammas_many
+
+def wilson_GE_many(xs_matrix, N, T, lambdas, GE_many=None):
+    M = len(xs_matrix)
+    if GE_many is None:
+        GE_many = [0.0]*M
+
+    xj_Lambda_ijs = [0.0]*N
+    mRT = -R*T
+    for m in range(M):
+        xs = xs_matrix[m]
+        wilson_xj_Lambda_ijs(xs, lambdas, N, xj_Lambda_ijs)
+        GE = 0.0
+        for i in range(N):
+            GE += xs[i]*log(xj_Lambda_ijs[i])
+        GE_many[m] = mRT*GE
+    return GE_many
+
+def wilson_dGE_dxs_many(xs_matrix, N, T, lambdas, dGE_dxs_many=None):
+    M = len(xs_matrix)
+    if dGE_dxs_many is None:
+        dGE_dxs_many = [[0.0]*N for _ in range(M)] # numba: delete
+#        dGE_dxs_many = zeros((M, N)) # numba: uncomment
+
+    xj_Lambda_ijs = [0.0]*N
+    xj_Lambda_ijs_inv = [0.0]*N
+    log_xj_Lambda_ijs = [0.0]*N
+    for m in range(M):
+        xs = xs_matrix[m]
+        wilson_xj_Lambda_ijs(xs, lambdas, N, xj_Lambda_ijs)
+        for i in range(N):
+            xj_Lambda_ijs_inv[i] = 1.0/xj_Lambda_ijs[i]
+            log_xj_Lambda_ijs[i] = log(xj_Lambda_ijs[i])
+        wilson_dGE_dxs(xs, T, N, log_xj_Lambda_ijs, lambdas, xj_Lambda_ijs_inv, dGE_dxs_many[m])
+    return dGE_dxs_many
+
 MIN_LAMBDA_WILSON = 1e-20
 
 def wilson_gammas_binaries(xs, lambda12, lambda21, calc=None):
@@ -1591,6 +1641,24 @@ class Wilson(GibbsExcess):
         self._gammas = gammas
         return gammas
 
+    def gammas_many(self, T, xs_matrix):
+        # `lambdas` depend on temperature only and are shared by every
+        # composition
+        lambdas = self._model_at_T(T).lambdas()
+        return wilson_gammas_many(xs_matrix, self.N, lambdas,
+                                  self._zeros_many(len(xs_matrix)))
+
+    def GE_many(self, T, xs_matrix):
+        lambdas = self._model_at_T(T).lambdas()
+        M = len(xs_matrix)
+        GE_many = [0.0]*M if self.scalar else zeros(M)
+        return wilson_GE_many(xs_matrix, self.N, T, lambdas, GE_many)
+
+    def dGE_dxs_many(self, T, xs_matrix):
+        lambdas = self._model_at_T(T).lambdas()
+        return wilson_dGE_dxs_many(xs_matrix, self.N, T, lambdas,
+                                   self._zeros_many(len(xs_matrix)))
+
     @classmethod
     def regress_binary_parameters(cls, gammas, xs, use_numba=False,
                                   do_statistics=True, **kwargs):